@@ -1,12 +1,13 @@
 # 1:1 DM REST: 방별 메시지 커서 페이지네이션.
 
 from typing import Annotated
+from uuid import UUID
 
 from fastapi import APIRouter, Depends, Path, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import CurrentUser, get_current_user, get_master_db, get_slave_db
-from app.common import ApiCode, ApiResponse, PublicId, api_response
+from app.common import ApiCode, ApiResponse, PublicId, api_etag_response, api_response
 from app.common.exceptions import InvalidRequestException
 from app.core.ids import parse_public_id_value
 from app.domain.chat.schema import (
@@ -21,6 +22,15 @@ from app.domain.chat.service import ChatService
 router = APIRouter(prefix="/chat", tags=["chat"])
 
 
+def _parse_message_id(raw: str | None, label: str) -> UUID | None:
+    if raw is None or not raw.strip():
+        return None
+    try:
+        return parse_public_id_value(raw.strip())
+    except ValueError as e:
+        raise InvalidRequestException(message=f"유효하지 않은 {label} 입니다.") from e
+
+
 @router.get(
     "/rooms/direct/{peer_user_id}",
     status_code=200,
@@ -90,19 +100,22 @@ async def list_room_messages(
     user: CurrentUser = Depends(get_current_user),
     cursor: str | None = Query(None, description="이전 응답의 next_cursor (더 과거 메시지)"),
     limit: int = Query(30, ge=1, le=100, description="한 번에 가져올 최대 개수"),
+    since: str | None = Query(
+        None,
+        description="폴링: 클라이언트가 가진 가장 최근 메시지 공개 ID. 그보다 새 메시지만 최신순으로, "
+        "next_cursor가 있으면 limit보다 많아 잘린 것(그 cursor + 같은 since로 이어 받는다)",
+    ),
     db: AsyncSession = Depends(get_slave_db),
 ):
-    cursor_id = None
-    if cursor is not None and cursor.strip():
-        try:
-            cursor_id = parse_public_id_value(cursor.strip())
-        except ValueError as e:
-            raise InvalidRequestException(message="유효하지 않은 cursor 입니다.") from e
+    cursor_id = _parse_message_id(cursor, "cursor")
     data = await ChatService.list_room_messages(
         db,
         room_id=room_id,
         user_id=user.id,
         cursor_message_id=cursor_id,
         limit=limit,
+        since_message_id=_parse_message_id(since, "since"),
     )
+    if cursor_id is None:
+        return api_etag_response(request, code=ApiCode.OK, data=data)
     return api_response(request, code=ApiCode.OK, data=data)
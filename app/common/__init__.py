@@ -2,7 +2,13 @@
 from .codes import ApiCode
 from .enums import DogGender, UserStatus
 from .logging_config import setup_logging
-from .responses import api_response, dump_api_response, get_request_id
+from .responses import (
+    api_etag_response,
+    api_json_response,
+    api_response,
+    dump_api_response,
+    get_request_id,
+)
 from .schemas import (
     ApiResponse,
     BaseSchema,
@@ -17,6 +23,8 @@ from .validators import UtcDatetime, ensure_utc_datetime
 __all__ = [
     "ApiCode",
     "ApiResponse",
+    "api_etag_response",
+    "api_json_response",
     "api_response",
     "BaseSchema",
     "CursorPage",
@@ -1,7 +1,9 @@
 # ApiResponse 팩토리. Request.state.request_id 주입(X-Request-ID와 동일 값).
+import hashlib
 from typing import Any
 
 from starlette.requests import Request
+from starlette.responses import Response
 
 from app.common.codes import ApiCode
 from app.common.schemas import ApiResponse
@@ -37,3 +39,59 @@ def dump_api_response(
     return api_response(request, code=code, data=data, message=message).model_dump(
         mode="json", by_alias=True
     )
+
+
+def api_json_response(
+    request: Request,
+    *,
+    code: ApiCode | str = ApiCode.OK,
+    data: Any = None,
+    message: str | None = None,
+    status_code: int = 200,
+) -> Response:
+    """핫 경로용: ApiResponse를 pydantic-core로 한 번만 JSON 직렬화해 Response로 돌려준다.
+
+    라우트가 Response를 반환하면 FastAPI는 response_model 재검증·jsonable 변환·json.dumps를 건너뛴다.
+    데코레이터의 response_model은 OpenAPI 스키마용으로 그대로 두고, data는 이미 검증된 응답 스키마
+    인스턴스여야 한다(재검증이 없으니 response_model의 필드 필터링도 없다).
+    """
+    out = api_response(request, code=code, data=data, message=message)
+    return Response(
+        content=out.__pydantic_serializer__.to_json(out, by_alias=True),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match 약한 비교(RFC 9110 13.1.2) — 목록·`*`·W/ 접두를 허용한다."""
+    if not if_none_match:
+        return False
+    opaque = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+def api_etag_response(
+    request: Request,
+    *,
+    code: ApiCode | str = ApiCode.OK,
+    data: Any,
+) -> Response:
+    """폴링 목록용: api_json_response + 약한 ETag. If-None-Match가 맞으면 본문 없이 304.
+
+    ETag는 data 직렬화의 해시다 — 봉투의 request_id는 요청마다 달라 제외한다. GZip이 본문 바이트를
+    바꾸므로 약한(W/) 태그다. ``Cache-Control: private, no-cache``로 브라우저가 저장 후 매번
+    재검증(조건부 요청)하게 한다. data는 이미 검증된 응답 스키마 인스턴스여야 한다.
+    """
+    payload = data.__pydantic_serializer__.to_json(data, by_alias=True)
+    etag = f'W/"{hashlib.blake2b(payload, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    response = api_json_response(request, code=code, data=data)
+    response.headers.update(headers)
+    return response
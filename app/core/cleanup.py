@@ -78,6 +78,58 @@ async def run_once(redis: RedisLike | None = None) -> None:
     except Exception as e:
         log.warning("notification_purge_failed task_id=%s error=%s", task_id, e)
 
+    # 5) 트렌딩 ZSET 컴팩션(식은 멤버·24h 창 밖 글 제거). 멱등이라 인스턴스마다 돌아도 무방.
+    try:
+        from app.domain.posts.trending_rank import compact_trending
+
+        removed = await compact_trending(redis)
+        if removed:
+            log.info("trending_compact_done task_id=%s removed_count=%s", task_id, removed)
+    except Exception as e:
+        log.warning("trending_compact_failed task_id=%s error=%s", task_id, e)
+
+    # 6) 게시글 검색 문서 백필(ADR 0015). 기존 글은 마이그레이션 013이 채웠고, 여기서는 문서가 빠진 글
+    #    (롤링 배포 중 구버전 앱이 쓴 글 등)을 최신순으로 배치마다 커밋하며 채운다. 틱당 상한이 있어
+    #    기동 시 run_once도 오래 붙잡지 않는다. 다 채우면 빈 조회 1회로 끝.
+    try:
+        from app.domain.posts.repository import PostsModel
+
+        filled = 0
+        for _ in range(settings.POST_SEARCH_BACKFILL_MAX_BATCHES):
+            async with get_connection() as db:
+                async with db.begin():
+                    n = await PostsModel.backfill_search_documents(
+                        settings.POST_SEARCH_BACKFILL_BATCH_SIZE, db=db
+                    )
+            filled += n
+            if n < settings.POST_SEARCH_BACKFILL_BATCH_SIZE:
+                break
+        if filled:
+            log.info("post_search_backfill_done task_id=%s filled_count=%s", task_id, filled)
+    except Exception as e:
+        log.warning("post_search_backfill_failed task_id=%s error=%s", task_id, e)
+
+    # 7) 트렌딩 해시태그 시간 버킷 재빌드(ADR 0017). fresh 마커가 없을 때(콜드 스타트·Redis 유실·
+    #    재빌드 주기 경과)만 창 범위 SQL 집계로 버킷을 통째 교체. 인스턴스 간 중복은 락이 거른다.
+    try:
+        from app.db.session import get_reader_connection
+        from app.domain.posts.repository import PostsModel
+        from app.domain.posts.trending_hashtags import (
+            rebuild_trending_hashtags,
+            trending_hashtags_fresh,
+        )
+
+        if not await trending_hashtags_fresh(redis):
+
+            async def _load_rows(since_hour: int):
+                async with get_reader_connection() as db, db.begin():
+                    return await PostsModel.get_hashtag_hourly_counts(since_hour, db=db)
+
+            if await rebuild_trending_hashtags(redis, _load_rows):
+                log.info("trending_hashtags_rebuilt task_id=%s", task_id)
+    except Exception as e:
+        log.warning("trending_hashtags_rebuild_failed task_id=%s error=%s", task_id, e)
+
 
 async def run_loop_async(stop_event: asyncio.Event, redis: RedisLike | None = None) -> None:
     interval = max(60, settings.SIGNUP_IMAGE_CLEANUP_INTERVAL)
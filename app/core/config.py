@@ -28,6 +28,20 @@ _MIN_FLOORS: dict[str, int] = {
     "IDEMPOTENCY_POST_CREATE_LOCK_TTL_SECONDS": 5,
     "VIEW_BUFFER_FLUSH_INTERVAL_SECONDS": 60,
     "VIEW_FLUSH_LOCK_SECONDS": 30,
+    "VIEW_FLUSH_BATCH_SIZE": 1,
+    "VIEW_BUFFER_SHARDS": 1,
+    "VIEW_AGGREGATOR_MAX_POSTS": 1,
+    "VIEW_AGGREGATOR_SPILL_SECONDS": 1,
+    "VIEW_DEDUP_BLOOM_BITS": 1024,
+    "VIEW_DEDUP_BLOOM_HASHES": 1,
+    "COUNTER_FLUSH_LOCK_SECONDS": 30,
+    "COUNTER_FLUSH_BATCH_SIZE": 1,
+    "COUNTER_RECONCILE_BATCH_SIZE": 1,
+    "POST_SEARCH_BACKFILL_BATCH_SIZE": 1,
+    "HASHTAG_TRENDING_WINDOW_HOURS": 1,
+    "HASHTAG_TRENDING_REBUILD_INTERVAL_SECONDS": 60,
+    "CACHE_L1_MAX_ENTRIES": 1,
+    "COMMENT_REPLY_PREVIEW_SIZE": 1,
 }
 
 
@@ -100,6 +114,10 @@ class Settings(BaseSettings):
     IDEMPOTENCY_POST_CREATE_TTL_SECONDS: int = 3600
     IDEMPOTENCY_POST_CREATE_LOCK_TTL_SECONDS: int = 120
 
+    # ----- 캐시 L1 (프로세스 로컬, Redis 앞단 — 디코딩된 객체. TTL은 캐시별 호출부 상수) -----
+    CACHE_L1_ENABLED: bool = True
+    CACHE_L1_MAX_ENTRIES: int = 1024
+
     # ----- Proxy·Trusted Host (Nginx/ALB 뒤 배포 시) -----
     TRUST_X_FORWARDED_FOR: bool = False
     TRUSTED_PROXY_IPS: _CsvList = []
@@ -157,8 +175,69 @@ class Settings(BaseSettings):
     # ----- 조회수 Write-behind (Redis HINCRBY → 주기적 DB flush) -----
     VIEW_BUFFER_FLUSH_INTERVAL_SECONDS: int = 300
     VIEW_FLUSH_LOCK_SECONDS: int = 120
+    # flush 집합 UPDATE 한 문장에 싣는 글 수(unnest 배열 길이). 틱당 문장 수 = ceil(글 수 / 이 값).
+    VIEW_FLUSH_BATCH_SIZE: int = 1000
+    # 버퍼 해시 샤드 수(post_id로 분산). 클러스터에서 조회 트래픽을 여러 슬롯·노드로 나눈다.
+    # 줄일 때는 먼저 flush로 비워야 한다 — 범위 밖 샤드는 더 이상 drain되지 않는다.
+    VIEW_BUFFER_SHARDS: int = 16
+    # 워커 내 사전 집계기 → Redis 버퍼 파이프라인 push 주기(ms). 0 = 끔(조회마다 HINCRBY).
+    VIEW_AGGREGATOR_FLUSH_INTERVAL_MS: int = 250
+    # Redis 불능 시 메모리에 모으는 distinct 글 수 상한 / 가장 오래된 delta 나이 — 넘으면 DB 일괄 spill.
+    VIEW_AGGREGATOR_MAX_POSTS: int = 10000
+    VIEW_AGGREGATOR_SPILL_SECONDS: int = 10
     # 조회수 dedup 키 TTL(SET NX EX). 0 이하 = dedup 끔(같은 viewer도 매 조회 집계).
     VIEW_CACHE_TTL_SECONDS: int = 3600
+    # dedup Bloom 비트맵 크기(샤드·시간 버킷당 비트)와 해시 수. 필터는 샤드의 모든 글이 함께 쓰므로
+    # 오탐률은 샤드·버킷당 고유 (글, 뷰어) 쌍 수로 정해진다. 기본 2^23비트(1MiB)·7이면 약 87만 쌍까지
+    # 1% 이하, 130만 쌍이면 약 5%, 175만 쌍이면 약 16%. 전체 메모리 = 비트/8 × 샤드 수 × 2.
+    VIEW_DEDUP_BLOOM_BITS: int = 1 << 23
+    VIEW_DEDUP_BLOOM_HASHES: int = 7
+    # 샤드·버킷당 예상 고유 쌍 수(피크 시간 기준). >0이면 BLOOM_BITS 대신 이 값에서 오탐 1% 크기를
+    # 계산한다(쌍당 약 9.6비트, 상한 2^32비트). 포화는 view_dedup_false_positive_ratio로 본다.
+    VIEW_DEDUP_EXPECTED_PAIRS: int = 0
+
+    # ----- 좋아요·댓글 수 Write-behind (ADR 0023) -----
+    # 카운터 delta 버퍼 → DB flush 주기(초). 0 = 끔(기존처럼 요청 트랜잭션에서 행 UPDATE).
+    # 화면에 바로 보이는 수라 조회수보다 짧게 둔다. 상세·좋아요 응답·댓글 페이지는 pending으로 보정.
+    COUNTER_BUFFER_FLUSH_INTERVAL_SECONDS: int = 10
+    COUNTER_FLUSH_LOCK_SECONDS: int = 60
+    # flush 집합 UPDATE 한 문장에 싣는 행 수(테이블별 unnest 배열 길이).
+    COUNTER_FLUSH_BATCH_SIZE: int = 1000
+    # 원장(post_likes·comments·comment_likes)으로 카운터를 다시 세는 주기(초). 0 = 끔.
+    # flush와 별개 루프·락이다. 주기당 인스턴스 1대가 테이블별 BATCH_SIZE × MAX_BATCHES 행씩 id 순으로
+    # 훑고 다음 주기에 이어서 돈다. 배치마다 flush 락을 잠깐 잡으므로 flush는 배치 하나만큼만 밀린다.
+    COUNTER_RECONCILE_INTERVAL_SECONDS: int = 3600
+    COUNTER_RECONCILE_BATCH_SIZE: int = 500
+    COUNTER_RECONCILE_MAX_BATCHES: int = 20
+
+    # ----- 댓글 대댓글 미리보기·페이지 캐시 (ADR 0026·0027) -----
+    # 댓글 페이지에서 루트마다 싣는 대댓글 수. 나머지는 루트별 replies 엔드포인트(keyset)로 더 읽는다.
+    COMMENT_REPLY_PREVIEW_SIZE: int = 3
+    # 댓글 페이지 캐시(ADR 0027)를 켜는 글 — 전체 트렌딩 ZSET 상위 N개. 0 = 끔(항상 DB).
+    COMMENT_PAGE_CACHE_HOT_POSTS: int = 50
+
+    # ----- 게시글 검색 (ADR 0015) -----
+    # ranked = 검색 문서(2-gram tsvector) 랭킹 경로, ilike = 기존 토큰별 ILIKE(롤백·비교용).
+    # 기존 글 문서는 마이그레이션 013이 채우므로 배포 직후에도 검색된다. 그 밖의 값은 기동 실패.
+    POST_SEARCH_ENGINE: str = "ranked"
+    # 문서가 빠진 글(롤링 배포 중 구버전 앱이 쓴 글 등)을 cleanup 틱마다 채우는 글 수(배치
+    # 1트랜잭션)와 배치 횟수. 0 배치 = 백필 끔.
+    POST_SEARCH_BACKFILL_BATCH_SIZE: int = 500
+    POST_SEARCH_BACKFILL_MAX_BATCHES: int = 20
+
+    # ----- 게시글 목록 하이드레이션 (ADR 0018) -----
+    # core = 응답 컬럼만 Core select(해시태그·첨부 배열/JSON 집계, 왕복 1회) → 행에서 바로 응답.
+    # orm = 기존 엔티티 eager load 경로(롤백·비교용).
+    POST_LIST_HYDRATION: str = "core"
+
+    # ----- 해시태그 자동완성·트렌딩 (ADR 0016·0017) -----
+    # 프로세스 로컬 접두사 인덱스를 DB 스냅샷으로 통째 교체하는 주기(초). 사이 증감은 pub/sub으로
+    # 반영하고 유실분은 이 주기가 상한. 0 = 인덱스 끔(자동완성이 매번 DB 접두사 검색).
+    HASHTAG_SUGGEST_REBUILD_INTERVAL_SECONDS: int = 600
+    # 트렌딩 해시태그 창(시간, 24 = 하루·168 = 일주일) — 글 작성 시각 시간 버킷 Redis 카운터의 합.
+    HASHTAG_TRENDING_WINDOW_HOURS: int = 24
+    # 버킷 카운터를 SQL 집계로 통째 재빌드하는 주기(초). 이벤트 유실·경합으로 어긋난 수의 상한.
+    HASHTAG_TRENDING_REBUILD_INTERVAL_SECONDS: int = 3600
 
     @field_validator(
         "CORS_ORIGINS", "TRUSTED_PROXY_IPS", "TRUSTED_HOSTS", "ALLOWED_IMAGE_TYPES", mode="before"
@@ -174,6 +253,20 @@ class Settings(BaseSettings):
     def _normalize_environment(cls, v: str) -> str:
         return v.strip().lower() or "development"
 
+    @field_validator("POST_SEARCH_ENGINE", mode="after")
+    @classmethod
+    def _normalize_search_engine(cls, v: str) -> str:
+        # 오타를 ranked로 삼키면 롤백 스위치(ilike)가 조용히 무시된다 — 기동에서 막는다.
+        engine = v.strip().lower()
+        if engine not in ("ranked", "ilike"):
+            raise ValueError(f"POST_SEARCH_ENGINE은 ranked 또는 ilike여야 합니다: {v!r}")
+        return engine
+
+    @field_validator("POST_LIST_HYDRATION", mode="after")
+    @classmethod
+    def _normalize_list_hydration(cls, v: str) -> str:
+        return "orm" if v.strip().lower() == "orm" else "core"
+
     @field_validator("LOG_LEVEL", mode="after")
     @classmethod
     def _upper(cls, v: str) -> str:
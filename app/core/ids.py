@@ -1,6 +1,7 @@
 # 엔티티 PK: UUID v7(PostgreSQL native). 비엔티티 토큰·추적 ID는 ULID 문자열 유지(jti, request_id 등).
 # 공개 ID는 Base62(UUID 인코딩). UUID 문자열도 수용하되 레거시 ULID 공개 ID는 더 이상 받지 않는다.
 
+from functools import lru_cache
 from typing import cast
 from uuid import UUID
 
@@ -19,15 +20,27 @@ def new_ulid_str() -> str:
     return str(ULID())
 
 
+# 직렬화 핫 경로(PublicId — 응답의 UUID마다 호출). 128비트 정수를 62^8 청크(< 2^48)로 먼저 나누고
+# 청크는 2자리 조회표로 푼다 — 자리마다 큰 정수 divmod 22회보다 빠르다. 목록·상세 응답은 캐시된 같은
+# 글·작성자 id를 요청마다 다시 직렬화하므로 최근 변환을 작은 LRU(수 MB)에 둔다.
+_BASE62_PAIRS = tuple(a + b for a in _BASE62 for b in _BASE62)
+_PAIR = 62 * 62
+_CHUNK = 62**8
+_BASE62_CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=_BASE62_CACHE_SIZE)
 def uuid_to_base62(u: UUID) -> str:
-    n = u.int
-    if n == 0:
-        return _BASE62[0]
+    hi, lo = divmod(u.int, _CHUNK)
+    top, mid = divmod(hi, _CHUNK)
+    p = _BASE62_PAIRS
     out: list[str] = []
-    while n:
-        n, r = divmod(n, 62)
-        out.append(_BASE62[r])
-    return "".join(reversed(out))
+    for r in (top, mid, lo):
+        a, r = divmod(r, _PAIR**3)
+        b, r = divmod(r, _PAIR**2)
+        c, d = divmod(r, _PAIR)
+        out.append(p[a] + p[b] + p[c] + p[d])
+    return "".join(out).lstrip(_BASE62[0]) or _BASE62[0]
 
 
 def base62_to_uuid(s: str) -> UUID:
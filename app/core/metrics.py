@@ -1,7 +1,7 @@
 # 도메인(서비스 계층) Prometheus 메트릭. 운영 봉투 가정을 /metrics로 실측한다(ADR 0006).
 # http RED 지표는 전송 계층이라 middleware/metrics.py에 둔다. 여기 카운터는 default registry에
 # 등록돼 같은 /metrics로 함께 노출된다.
-from prometheus_client import Counter
+from prometheus_client import Counter, Gauge, Histogram
 
 # rate limit 429 — 어떤 한도(login·signup_upload·global)가 압력을 받는지.
 RATE_LIMIT_REJECTIONS = Counter(
@@ -11,9 +11,11 @@ RATE_LIMIT_REJECTIONS = Counter(
 )
 
 # 캐시 hit/miss — 읽기 폭주 경로 캐시가 실제로 얼마나 먹히는지(hit ratio).
+# result: hit/miss = Redis(L2), l1_hit/l1_miss = 프로세스 로컬 L1,
+# stale = soft TTL 지난 값을 SWR로 서빙, refresh = SWR 갱신(조기·stale) 실행.
 CACHE_EVENTS = Counter(
     "cache_events_total",
-    "캐시 조회 결과(hit/miss)",
+    "캐시 조회 결과(hit/miss, l1_hit/l1_miss, stale/refresh)",
     ["cache", "result"],
 )
 
@@ -22,3 +24,71 @@ VIEW_BUFFER_FLUSHED_VIEWS = Counter(
     "view_buffer_flushed_views_total",
     "조회수 버퍼 flush로 DB에 반영된 view 총합",
 )
+
+# flush 1회(락 획득 후 drain → DB 커밋) 소요 — 집합 UPDATE로 O(청크)가 되는지 실측.
+VIEW_BUFFER_FLUSH_DURATION = Histogram(
+    "view_buffer_flush_duration_seconds",
+    "조회수 버퍼 flush 1회 소요 시간(초, 커밋 성공분)",
+)
+
+# flush로 갱신된 posts 행 수(삭제된 글 제외) — 틱당 distinct 글 수의 실측.
+VIEW_BUFFER_FLUSHED_ROWS = Counter(
+    "view_buffer_flushed_rows_total",
+    "조회수 버퍼 flush로 갱신된 posts 행 수",
+)
+
+# 워커 내 조회수 집계기 — 아직 Redis·DB로 안 나간 distinct 글 수(Redis 장애 시 상한까지 차오른다).
+VIEW_AGGREGATOR_PENDING_POSTS = Gauge(
+    "view_aggregator_pending_posts",
+    "워커 내 조회수 집계기에 보관 중인 distinct 글 수",
+)
+
+# Redis 불능으로 집계기가 DB에 직접 spill한 view 합 — 0이 아니면 Redis 장애 구간이 있었다.
+VIEW_AGGREGATOR_SPILLED_VIEWS = Counter(
+    "view_aggregator_spilled_views_total",
+    "Redis 불능으로 조회수 집계기가 DB에 직접 반영한 view 총합",
+)
+
+# 조회수 dedup Bloom 버킷(샤드별 현재·직전)의 바이트 합 — 뷰어 수와 무관하게 상한에 머무는지 실측.
+VIEW_DEDUP_MEMORY_BYTES = Gauge(
+    "view_dedup_memory_bytes",
+    "조회수 뷰어 dedup Bloom 비트맵의 현재 메모리(바이트)",
+)
+
+# dedup Bloom 포화도 — 샤드·버킷 중 가장 찬 필터의 BITCOUNT로 추정한 오탐률과 든 (글, 뷰어) 쌍 수.
+# 오탐률이 1%를 넘으면 VIEW_DEDUP_EXPECTED_PAIRS(또는 샤드 수)를 올릴 때다.
+VIEW_DEDUP_FALSE_POSITIVE_RATIO = Gauge(
+    "view_dedup_false_positive_ratio",
+    "조회수 뷰어 dedup Bloom 필터의 추정 오탐률(가장 찬 샤드·버킷)",
+)
+VIEW_DEDUP_ESTIMATED_PAIRS = Gauge(
+    "view_dedup_estimated_pairs",
+    "조회수 뷰어 dedup Bloom 필터에 든 고유 (글, 뷰어) 쌍 추정치(가장 찬 샤드·버킷)",
+)
+
+# 좋아요·댓글 수 write-behind(ADR 0023) — flush로 DB에 반영된 delta 절댓값 합(카운터 종류별).
+COUNTER_BUFFER_FLUSHED_DELTAS = Counter(
+    "counter_buffer_flushed_deltas_total",
+    "카운터 버퍼 flush로 DB에 반영된 delta 절댓값 합",
+    ["counter"],
+)
+
+# reconcile이 원장과 달라 고친 행 수 — 0이 아니면 유실·이중 반영·경합 드리프트가 있었다.
+COUNTER_RECONCILED_ROWS = Counter(
+    "counter_reconciled_rows_total",
+    "카운터 reconcile로 원장 값에 맞춘 행 수",
+    ["table"],
+)
+
+# 해시태그 자동완성 접두사 인덱스에 실린 이름 수(프로세스별) — 0이면 콜드 스타트로 DB 폴백 중.
+HASHTAG_INDEX_SIZE = Gauge(
+    "hashtag_index_size",
+    "해시태그 자동완성 프로세스 로컬 인덱스의 이름 수",
+)
+
+# 자동완성 요청이 어디서 서빙됐는지(index = 프로세스 메모리, db = 콜드 스타트 폴백).
+HASHTAG_SUGGEST_REQUESTS = Counter(
+    "hashtag_suggest_requests_total",
+    "해시태그 자동완성 요청 수(서빙 경로별)",
+    ["source"],
+)
@@ -7,7 +7,7 @@ from .engine import (
     reader_engine,
     writer_engine,
 )
-from .session import get_connection
+from .session import get_connection, get_reader_connection
 
 __all__ = [
     "AsyncSessionLocal",
@@ -17,6 +17,7 @@ __all__ = [
     "close_database",
     "engine",
     "get_connection",
+    "get_reader_connection",
     "init_database",
     "reader_engine",
     "utc_now",
@@ -7,6 +7,12 @@ from app.domain.dogs.model import DogProfile  # noqa: F401
 from app.domain.likes.model import PostLike  # noqa: F401
 from app.domain.media.model import Image  # noqa: F401
 from app.domain.notifications.model import Notification  # noqa: F401
-from app.domain.posts.model import Category, Hashtag, Post, PostImage  # noqa: F401
+from app.domain.posts.model import (  # noqa: F401
+    Category,
+    Hashtag,
+    Post,
+    PostImage,
+    PostSearchDocument,
+)
 from app.domain.reports.model import Report  # noqa: F401
 from app.domain.users.model import User, UserBlock  # noqa: F401
@@ -1,7 +1,7 @@
 # 비요청 스코프용 세션. get_connection(cleanup/exception 등). 요청 스코프용 get_master_db/get_slave_db는 app.api.dependencies.db.
 from contextlib import asynccontextmanager
 
-from app.db.engine import AsyncSessionLocal
+from app.db.engine import AsyncSessionLocal, AsyncSessionLocalReader
 
 
 @asynccontextmanager
@@ -12,3 +12,13 @@ async def get_connection():
             yield db
         finally:
             await db.close()
+
+
+@asynccontextmanager
+async def get_reader_connection():
+    """비요청 스코프 조회용 Reader 세션(캐시 백그라운드 갱신 등 — 요청 세션과 수명 분리)."""
+    async with AsyncSessionLocalReader() as db:
+        try:
+            yield db
+        finally:
+            await db.close()
@@ -7,7 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.common.enums import TargetType
 from app.domain.comments.model import Comment
-from app.domain.posts.model import Post
+from app.domain.posts.model import Post, PostStats
 
 
 class AdminReportsModel:
@@ -21,15 +21,19 @@ class AdminReportsModel:
         정렬·LIMIT/OFFSET 한다. 인메모리 병합·정렬·cap 없이 페이지 경계·total이 정확하다.
         저자가 없는(SET NULL) 신고 콘텐츠는 표시하지 않으므로 total에서도 제외한다.
         """
-        post_sel = select(
-            literal(TargetType.POST.value).label("target_type"),
-            Post.id.label("target_id"),
-            Post.report_count.label("rc"),
-            Post.created_at.label("ca"),
-        ).where(
-            Post.deleted_at.is_(None),
-            Post.report_count > 0,
-            Post.user_id.isnot(None),
+        post_sel = (
+            select(
+                literal(TargetType.POST.value).label("target_type"),
+                Post.id.label("target_id"),
+                PostStats.report_count.label("rc"),
+                Post.created_at.label("ca"),
+            )
+            .join(PostStats, PostStats.post_id == Post.id)
+            .where(
+                Post.deleted_at.is_(None),
+                PostStats.report_count > 0,
+                Post.user_id.isnot(None),
+            )
         )
         comment_sel = select(
             literal(TargetType.COMMENT.value).label("target_type"),
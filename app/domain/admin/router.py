@@ -90,7 +90,8 @@ async def unblind_post(
     post_id: Annotated[PublicId, Path(..., description="게시글 공개 ID (Base62)")],
     db: AsyncSession = Depends(get_master_db),
 ):
-    await AdminService.unblind_post(post_id, db=db)
+    redis = get_app_redis(request.app)
+    await AdminService.unblind_post(post_id, db=db, redis=redis)
     return api_response(request, code=ApiCode.OK, data=UnblindedResponse())
 
 
@@ -104,7 +105,8 @@ async def reset_post_reports(
     post_id: Annotated[PublicId, Path(..., description="게시글 공개 ID (Base62)")],
     db: AsyncSession = Depends(get_master_db),
 ):
-    await AdminService.reset_post_reports(post_id, db=db)
+    redis = get_app_redis(request.app)
+    await AdminService.reset_post_reports(post_id, db=db, redis=redis)
     return api_response(request, code=ApiCode.OK, data=ResetReportsResponse())
 
 
@@ -148,7 +150,8 @@ async def blind_post(
     post_id: Annotated[PublicId, Path(..., description="게시글 공개 ID (Base62)")],
     db: AsyncSession = Depends(get_master_db),
 ):
-    await AdminService.blind_post(post_id, db=db)
+    redis = get_app_redis(request.app)
+    await AdminService.blind_post(post_id, db=db, redis=redis)
     return api_response(request, code=ApiCode.OK, data=BlindedResponse())
 
 
@@ -162,7 +165,8 @@ async def delete_post_admin(
     post_id: Annotated[PublicId, Path(..., description="게시글 공개 ID (Base62)")],
     db: AsyncSession = Depends(get_master_db),
 ):
-    await AdminService.delete_post(post_id, db=db)
+    redis = get_app_redis(request.app)
+    await AdminService.delete_post(post_id, db=db, redis=redis)
     return api_response(request, code=ApiCode.OK, data=None)
 
 
@@ -176,7 +180,8 @@ async def unblind_comment(
     comment_id: Annotated[PublicId, Path(..., description="댓글 공개 ID (Base62)")],
     db: AsyncSession = Depends(get_master_db),
 ):
-    await AdminService.unblind_comment(comment_id, db=db)
+    redis = get_app_redis(request.app)
+    await AdminService.unblind_comment(comment_id, db=db, redis=redis)
     return api_response(request, code=ApiCode.OK, data=UnblindedResponse())
 
 
@@ -190,7 +195,8 @@ async def blind_comment(
     comment_id: Annotated[PublicId, Path(..., description="댓글 공개 ID (Base62)")],
     db: AsyncSession = Depends(get_master_db),
 ):
-    await AdminService.blind_comment(comment_id, db=db)
+    redis = get_app_redis(request.app)
+    await AdminService.blind_comment(comment_id, db=db, redis=redis)
     return api_response(request, code=ApiCode.OK, data=BlindedResponse())
 
 
@@ -204,7 +210,8 @@ async def reset_comment_reports(
     comment_id: Annotated[PublicId, Path(..., description="댓글 공개 ID (Base62)")],
     db: AsyncSession = Depends(get_master_db),
 ):
-    await AdminService.reset_comment_reports(comment_id, db=db)
+    redis = get_app_redis(request.app)
+    await AdminService.reset_comment_reports(comment_id, db=db, redis=redis)
     return api_response(request, code=ApiCode.OK, data=ResetReportsResponse())
 
 
@@ -219,5 +226,6 @@ async def delete_comment_admin(
     comment_id: Annotated[PublicId, Path(..., description="댓글 공개 ID (Base62)")],
     db: AsyncSession = Depends(get_master_db),
 ):
-    await AdminService.delete_comment(post_id, comment_id, db=db)
+    redis = get_app_redis(request.app)
+    await AdminService.delete_comment(post_id, comment_id, db=db, redis=redis)
     return api_response(request, code=ApiCode.OK, data=None)
@@ -19,7 +19,11 @@ from app.domain.admin.model import AdminReportsModel
 from app.domain.admin.schema import ReportedPostAuthorInfo, ReportedPostItem
 from app.domain.auth.service import AuthService
 from app.domain.comments.model import CommentsModel
+from app.domain.comments.page_cache import invalidate_comment_pages
+from app.domain.posts.counter_buffer import counter_buffering, settle_counter
+from app.domain.posts.post_cache import invalidate_post_caches
 from app.domain.posts.repository import PostsModel
+from app.domain.posts.services import HashtagService
 from app.domain.reports.model import ReportsModel
 from app.domain.users.model import UsersModel
 
@@ -134,26 +138,48 @@ class AdminService:
             return items, total
 
     @classmethod
-    async def unblind_post(cls, post_id: UUID, db: AsyncSession) -> None:
+    async def unblind_post(cls, post_id: UUID, db: AsyncSession, redis: Any | None = None) -> None:
         async with db.begin():
+            category_id = await PostsModel.get_post_category_id(post_id, db=db)
+            was_public = await PostsModel.get_public_hashtag_names(post_id, db=db) is not None
             try:
                 ok = await PostsModel.unblind_post(post_id, db=db)
             except StaleDataError as e:
                 raise ConcurrentUpdateException() from e
+            revealed = (
+                await PostsModel.get_public_hashtag_names(post_id, db=db)
+                if ok and not was_public
+                else None
+            )
         if not ok:
             raise PostNotFoundException()
+        await invalidate_post_caches(redis, post_id, category_id)
+        if revealed:
+            await HashtagService.record_post_hashtags(post_id, [], revealed, redis=redis)
 
     @classmethod
-    async def reset_post_reports(cls, post_id: UUID, db: AsyncSession) -> None:
+    async def reset_post_reports(
+        cls, post_id: UUID, db: AsyncSession, redis: Any | None = None
+    ) -> None:
         async with db.begin():
+            category_id = await PostsModel.get_post_category_id(post_id, db=db)
             await ReportsModel.delete_by_post_id(post_id, db=db)
             await db.flush()  # delete 반영 후 reset_reports 실행해 재신고 시 목록 노출 보장
+            was_public = await PostsModel.get_public_hashtag_names(post_id, db=db) is not None
             try:
                 ok = await PostsModel.reset_reports(post_id, db=db)
             except StaleDataError as e:
                 raise ConcurrentUpdateException() from e
+            revealed = (
+                await PostsModel.get_public_hashtag_names(post_id, db=db)
+                if ok and not was_public
+                else None
+            )
         if not ok:
             raise PostNotFoundException()
+        await invalidate_post_caches(redis, post_id, category_id)
+        if revealed:
+            await HashtagService.record_post_hashtags(post_id, [], revealed, redis=redis)
 
     @classmethod
     async def suspend_user(cls, user_id: UUID, db: AsyncSession, redis: Any | None = None) -> None:
@@ -183,49 +209,74 @@ class AdminService:
         await AuthService.invalidate_user_status_cache(redis, user_id)
 
     @classmethod
-    async def blind_post(cls, post_id: UUID, db: AsyncSession) -> None:
+    async def blind_post(cls, post_id: UUID, db: AsyncSession, redis: Any | None = None) -> None:
         async with db.begin():
+            category_id = await PostsModel.get_post_category_id(post_id, db=db)
+            # 이미 블라인드된 글이면 None — 감소를 두 번 내지 않는다.
+            hidden = await PostsModel.get_public_hashtag_names(post_id, db=db)
             try:
                 ok = await PostsModel.set_blinded(post_id, db=db)
             except StaleDataError as e:
                 raise ConcurrentUpdateException() from e
         if not ok:
             raise PostNotFoundException()
+        await invalidate_post_caches(redis, post_id, category_id)
+        if hidden:
+            await HashtagService.record_post_hashtags(post_id, hidden, [], redis=redis)
 
     @classmethod
-    async def delete_post(cls, post_id: UUID, db: AsyncSession) -> None:
+    async def delete_post(cls, post_id: UUID, db: AsyncSession, redis: Any | None = None) -> None:
         # NOTE: AsyncSessionLocal(autobegin=False)이므로, 모든 DB I/O는 명시적 트랜잭션 내부에서 수행.
         #       또한 삭제는 단일 트랜잭션에서 원자적으로 처리(연관 댓글/좋아요/이미지 정리 포함).
         async with db.begin():
+            category_id = await PostsModel.get_post_category_id(post_id, db=db)
+            public_tags = await PostsModel.get_public_hashtag_names(post_id, db=db)
             success, _image_ids = await PostsModel.delete_post(post_id, db=db)
             if not success:
                 raise PostNotFoundException()
+        await invalidate_post_caches(redis, post_id, category_id)
+        if public_tags:
+            await HashtagService.record_post_hashtags(post_id, public_tags, [], redis=redis)
 
     @classmethod
-    async def unblind_comment(cls, comment_id: UUID, db: AsyncSession) -> None:
+    async def unblind_comment(
+        cls, comment_id: UUID, db: AsyncSession, redis: Any | None = None
+    ) -> None:
         async with db.begin():
-            ok = await CommentsModel.unblind_comment(comment_id, db=db)
-        if not ok:
+            post_id = await CommentsModel.unblind_comment(comment_id, db=db)
+        if post_id is None:
             raise CommentNotFoundException()
+        await invalidate_comment_pages(redis, post_id)
 
     @classmethod
-    async def blind_comment(cls, comment_id: UUID, db: AsyncSession) -> None:
+    async def blind_comment(
+        cls, comment_id: UUID, db: AsyncSession, redis: Any | None = None
+    ) -> None:
         async with db.begin():
-            ok = await CommentsModel.set_blinded(comment_id, db=db)
-        if not ok:
+            post_id = await CommentsModel.set_blinded(comment_id, db=db)
+        if post_id is None:
             raise CommentNotFoundException()
+        await invalidate_comment_pages(redis, post_id)
 
     @classmethod
-    async def reset_comment_reports(cls, comment_id: UUID, db: AsyncSession) -> None:
+    async def reset_comment_reports(
+        cls, comment_id: UUID, db: AsyncSession, redis: Any | None = None
+    ) -> None:
         async with db.begin():
             await ReportsModel.delete_by_comment_id(comment_id, db=db)
             await db.flush()
-            ok = await CommentsModel.reset_reports(comment_id, db=db)
-        if not ok:
+            post_id = await CommentsModel.reset_reports(comment_id, db=db)
+        if post_id is None:
             raise CommentNotFoundException()
+        await invalidate_comment_pages(redis, post_id)
 
     @classmethod
-    async def delete_comment(cls, post_id: UUID, comment_id: UUID, db: AsyncSession) -> None:
+    async def delete_comment(
+        cls, post_id: UUID, comment_id: UUID, db: AsyncSession, redis: Any | None = None
+    ) -> None:
+        # 버퍼가 켜져 있으면 댓글 수는 작성자 삭제와 같게 커밋 후 delta로 보낸다(ADR 0023) — 여기서
+        # 행을 직접 줄이면 버퍼를 거친 증가와 순서가 어긋나고 인기글 행 잠금 줄도 다시 생긴다.
+        buffered = counter_buffering(redis)
         async with db.begin():
             # 삭제는 멱등이 아니므로, 먼저 대상 존재 확인 후 삭제/카운트 감소를 같은 트랜잭션에서 처리.
             if await CommentsModel.get_comment_by_id(comment_id, db=db) is None:
@@ -233,7 +284,11 @@ class AdminService:
             deleted = await CommentsModel.delete_comment(post_id, comment_id, db=db)
             if not deleted:
                 raise CommentNotFoundException()
-            try:
-                await PostsModel.decrement_comment_count(post_id, db=db)
-            except StaleDataError as e:
-                raise ConcurrentUpdateException() from e
+            if not buffered:
+                try:
+                    await PostsModel.decrement_comment_count(post_id, db=db)
+                except StaleDataError as e:
+                    raise ConcurrentUpdateException() from e
+        await invalidate_comment_pages(redis, post_id)
+        if buffered:
+            await settle_counter(redis, "post_comment", post_id, base=0, delta=-1, db=db)
@@ -2,6 +2,7 @@
 
 import json
 import logging
+from datetime import datetime
 from uuid import UUID
 
 from sqlalchemy import case, func, or_, select, tuple_, update
@@ -37,6 +38,22 @@ log = logging.getLogger(__name__)
 DM_SAME_USER = "dm_same_user"
 
 
+async def _message_keyset(
+    db: AsyncSession, room_id: UUID, message_id: UUID, label: str
+) -> tuple[datetime, UUID]:
+    """cursor·since 메시지의 (created_at, id) keyset. 다른 방·없는 메시지면 400."""
+    res = await db.execute(
+        select(ChatMessage.created_at, ChatMessage.id).where(
+            ChatMessage.id == message_id,
+            ChatMessage.room_id == room_id,
+        )
+    )
+    row = res.one_or_none()
+    if row is None:
+        raise InvalidRequestException(message=f"유효하지 않은 {label} 입니다.")
+    return row[0], row[1]
+
+
 class ChatService:
     @classmethod
     async def resolve_direct_room(
@@ -176,7 +193,10 @@ class ChatService:
         user_id: UUID,
         cursor_message_id: UUID | None,
         limit: int,
+        since_message_id: UUID | None = None,
     ) -> ChatMessagesPageData:
+        """방 메시지 최신순 페이지. since_message_id가 있으면 그 메시지보다 새 메시지만(폴링) —
+        next_cursor가 있으면 limit보다 많아 잘린 것이고, 그 커서 + 같은 since로 이어 받는다."""
         async with db.begin():
             # 메시지 조회 앞의 authz 가드. 전체 엔티티 대신 멤버 판정에 필요한 두 컬럼만 로드한다.
             rres = await db.execute(
@@ -186,20 +206,13 @@ class ChatService:
             if room is None or user_id not in (room.user1_id, room.user2_id):
                 raise ForbiddenException(message="이 채팅방에 접근할 수 없습니다.")
             stmt = select(ChatMessage).where(ChatMessage.room_id == room_id)
+            keyset = tuple_(ChatMessage.created_at, ChatMessage.id)
             if cursor_message_id is not None:
-                cur = await db.execute(
-                    select(ChatMessage.created_at, ChatMessage.id).where(
-                        ChatMessage.id == cursor_message_id,
-                        ChatMessage.room_id == room_id,
-                    )
-                )
-                cur_row = cur.one_or_none()
-                if cur_row is None:
-                    raise InvalidRequestException(message="유효하지 않은 cursor 입니다.")
-                c_at, c_id = cur_row[0], cur_row[1]
-                stmt = stmt.where(
-                    tuple_(ChatMessage.created_at, ChatMessage.id) < tuple_(c_at, c_id),
-                )
+                c_at, c_id = await _message_keyset(db, room_id, cursor_message_id, "cursor")
+                stmt = stmt.where(keyset < tuple_(c_at, c_id))
+            if since_message_id is not None:
+                s_at, s_id = await _message_keyset(db, room_id, since_message_id, "since")
+                stmt = stmt.where(keyset > tuple_(s_at, s_id))
             stmt = stmt.order_by(ChatMessage.created_at.desc(), ChatMessage.id.desc()).limit(
                 limit + 1
             )
@@ -1,21 +1,28 @@
 # 댓글 CRUD. Comment ORM 반환, Controller/매퍼에서 Schema로 직렬화. AsyncSession.
 
+from collections.abc import Collection, Sequence
 from datetime import datetime
-from typing import NamedTuple
+from typing import Any, NamedTuple
 from uuid import UUID
 
 from sqlalchemy import (
+    ARRAY,
+    CTE,
     Boolean,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     Text,
     and_,
+    bindparam,
+    case,
     delete,
     exists,
     func,
     or_,
     select,
+    true,
     update,
 )
 from sqlalchemy.dialects.postgresql import insert as pg_insert
@@ -29,11 +36,13 @@ from sqlalchemy.orm import (
     selectinload,
 )
 
+from app.common.enums import NotificationKind
 from app.core.ids import new_uuid7
 from app.db.base_class import PG_UUID, Base, utc_now
 from app.domain.dogs.model import DogProfile
+from app.domain.likes.model import LikeOutcome, execute_like_outcome, like_notification_cte
 from app.domain.posts.model import Post
-from app.domain.users.model import User, UserBlock
+from app.domain.users.model import User, author_not_blocked
 
 
 class CommentAuthorPermissionRow(NamedTuple):
@@ -53,16 +62,23 @@ class Comment(Base):
         PG_UUID, ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True
     )
     parent_id: Mapped[UUID | None] = mapped_column(
-        PG_UUID, ForeignKey("comments.id", ondelete="CASCADE"), nullable=True, index=True
+        PG_UUID, ForeignKey("comments.id", ondelete="CASCADE"), nullable=True
     )
     content: Mapped[str] = mapped_column(Text, nullable=False)
     like_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    # 표시 가능한(미삭제·미블라인드) 대댓글 수. 루트에만 의미가 있고, 상태 변경 문장이 함께 맞춘다.
+    reply_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     report_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     is_blinded: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     deleted_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
+    __table_args__ = (
+        # 루트별 대댓글 keyset(WHERE parent_id ORDER BY id LIMIT) — 미리보기 LATERAL과 더보기가 공유.
+        Index("ix_comments_parent_recent", "parent_id", "id"),
+    )
+
     author: Mapped[User | None] = relationship(User, foreign_keys=[author_id], lazy="raise_on_sql")
     parent: Mapped["Comment | None"] = relationship(
         "Comment",
@@ -96,6 +112,8 @@ class CommentLike(Base):
     )
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
+    __table_args__ = (Index("idx_comment_likes_user_recent", "user_id", created_at.desc()),)
+
     comment: Mapped[Comment] = relationship(Comment, back_populates="likes", lazy="raise_on_sql")
     user: Mapped[User] = relationship(User, foreign_keys=[user_id], lazy="raise_on_sql")
 
@@ -115,29 +133,28 @@ def _comment_author_loads():
     )
 
 
-def _author_not_blocked(author_col, current_user_id: UUID | None):
-    """current_user가 차단한 작성자를 제외하는 조건(대상 없으면 None)."""
-    if current_user_id is None:
-        return None
-    return ~exists(1).where(
-        UserBlock.blocker_id == current_user_id,
-        UserBlock.blocked_id == author_col,
-    )
-
-
-def _reply_visible_conditions(reply, current_user_id: UUID | None) -> list:
+def _reply_visible_conditions(reply, blocked_ids: Collection[UUID]) -> list:
     """표시 가능한 대댓글 조건: 미삭제·미블라인드·(차단 작성자 제외).
 
     루트의 'EXISTS 대댓글이 있으면 삭제 루트를 placeholder로 유지' 판정과
     get_replies_for_roots가 이 술어를 공유해, 삭제 루트 placeholder 시맨틱이 어긋나지 않게 한다.
     """
     conds = [reply.deleted_at.is_(None), reply.is_blinded.is_(False)]
-    not_blocked = _author_not_blocked(reply.author_id, current_user_id)
+    not_blocked = author_not_blocked(reply.author_id, blocked_ids)
     if not_blocked is not None:
         conds.append(not_blocked)
     return conds
 
 
+def _is_listed(c) -> Any:
+    """reply_count가 세는 상태(미삭제·미블라인드). 차단은 보는 사람마다 달라 세지 않는다."""
+    return and_(c.deleted_at.is_(None), c.is_blinded.is_(False))
+
+
+def _reply_order(reply, sort: str) -> Any:
+    return reply.id.asc() if sort == "oldest" else reply.id.desc()
+
+
 class CommentsModel:
     @classmethod
     async def load_comment_author_permission_row(
@@ -195,6 +212,13 @@ class CommentsModel:
         )
         db.add(c)
         await db.flush()
+        if parent_id is not None:
+            await db.execute(
+                update(Comment)
+                .where(Comment.id == parent_id)
+                .values(reply_count=Comment.reply_count + 1)
+                .execution_options(synchronize_session=False)
+            )
         return c
 
     @classmethod
@@ -216,29 +240,33 @@ class CommentsModel:
         db: AsyncSession,
         cursor: UUID | None = None,
         sort: str = "latest",
-        current_user_id: UUID | None = None,
+        blocked_ids: Collection[UUID] = (),
     ) -> list[Comment]:
         """루트 댓글을 keyset로 조회한다(size+1건으로 has_more 판정).
 
         삭제된 루트는 표시 가능한 대댓글이 하나라도 있을 때만 placeholder로 살린다
-        (EXISTS를 SQL에서 걸어 페이지 크기를 정확히 유지). 대댓글은 get_replies_for_roots가
+        (SQL에서 걸어 페이지 크기를 정확히 유지). 차단 집합이 없으면 비정규화된 reply_count로
+        판정하고, 있으면 차단 작성자를 뺀 EXISTS로 판정한다. 대댓글은 get_replies_for_roots가
         부모별로 배치 로드한다.
         """
-        reply = aliased(Comment)
-        reply_exists = exists(1).where(
-            reply.parent_id == Comment.id, *_reply_visible_conditions(reply, current_user_id)
-        )
+        if blocked_ids:
+            reply = aliased(Comment)
+            has_visible_reply: Any = exists(1).where(
+                reply.parent_id == Comment.id, *_reply_visible_conditions(reply, blocked_ids)
+            )
+        else:
+            has_visible_reply = Comment.reply_count > 0
         stmt = (
             select(Comment)
             .where(
                 Comment.post_id == post_id,
                 Comment.parent_id.is_(None),
                 Comment.is_blinded.is_(False),
-                or_(Comment.deleted_at.is_(None), reply_exists),
+                or_(Comment.deleted_at.is_(None), has_visible_reply),
             )
             .options(*_comment_author_loads())
         )
-        root_not_blocked = _author_not_blocked(Comment.author_id, current_user_id)
+        root_not_blocked = author_not_blocked(Comment.author_id, blocked_ids)
         if root_not_blocked is not None:
             stmt = stmt.where(root_not_blocked)
         if sort == "oldest":
@@ -259,25 +287,79 @@ class CommentsModel:
         root_ids: list[UUID],
         *,
         db: AsyncSession,
-        current_user_id: UUID | None = None,
+        per_root: int,
+        sort: str = "latest",
+        blocked_ids: Collection[UUID] = (),
     ) -> list[Comment]:
-        """주어진 루트들의 대댓글을 한 번에 배치 로드한다(부모별 하드리밋 없음).
+        """루트마다 정렬 순서 앞쪽 대댓글을 최대 per_root+1건씩 한 번에 로드한다(LATERAL).
 
-        정렬은 _build_comment_tree가 부모별로 다시 하므로 여기선 SQL ORDER BY를 두지 않는다.
+        루트별로 (parent_id, id) 인덱스를 LIMIT까지만 훑으므로 대댓글이 수천 개인 루트도
+        페이지 비용이 루트 수 × per_root로 묶인다. +1건은 루트별 더보기 판정용이다.
+        루트 간 순서는 보장하지 않는다 — _build_comment_tree가 부모별로 다시 정렬한다.
         """
         if not root_ids:
             return []
+        roots = (
+            func.unnest(bindparam("root_ids", root_ids, type_=ARRAY(PG_UUID)))
+            .table_valued("id")
+            .render_derived(name="r")
+        )
+        reply = aliased(Comment)
+        first = (
+            select(reply.id)
+            .where(reply.parent_id == roots.c.id, *_reply_visible_conditions(reply, blocked_ids))
+            .order_by(_reply_order(reply, sort))
+            .limit(per_root + 1)
+            .lateral("first_replies")
+        )
         stmt = (
             select(Comment)
-            .where(
-                Comment.parent_id.in_(root_ids),
-                *_reply_visible_conditions(Comment, current_user_id),
-            )
+            .select_from(roots)
+            .join(first, true())
+            .join(Comment, Comment.id == first.c.id)
+            .options(*_comment_author_loads())
+        )
+        result = await db.execute(stmt)
+        return list(result.unique().scalars().all())
+
+    @classmethod
+    async def get_replies_page(
+        cls,
+        root_id: UUID,
+        size: int,
+        *,
+        db: AsyncSession,
+        cursor: UUID | None = None,
+        sort: str = "latest",
+        blocked_ids: Collection[UUID] = (),
+    ) -> list[Comment]:
+        """루트 하나의 대댓글을 keyset로 조회한다(size+1건으로 has_more 판정). 미리보기 다음부터는
+        미리보기의 마지막 id를 cursor로 넘긴다."""
+        stmt = (
+            select(Comment)
+            .where(Comment.parent_id == root_id, *_reply_visible_conditions(Comment, blocked_ids))
             .options(*_comment_author_loads())
         )
+        if cursor is not None:
+            stmt = stmt.where(Comment.id > cursor if sort == "oldest" else Comment.id < cursor)
+        stmt = stmt.order_by(_reply_order(Comment, sort)).limit(size + 1)
         result = await db.execute(stmt)
         return list(result.unique().scalars().all())
 
+    @classmethod
+    async def root_is_listed(cls, post_id: UUID, comment_id: UUID, *, db: AsyncSession) -> bool:
+        """대댓글 더보기 대상 루트가 이 글의 목록에 나올 수 있는지(루트·미블라인드). 삭제된 루트는
+        placeholder로 남으므로 허용한다 — 대댓글이 없으면 빈 페이지다."""
+        stmt = select(
+            exists(1).where(
+                Comment.id == comment_id,
+                Comment.post_id == post_id,
+                Comment.parent_id.is_(None),
+                Comment.is_blinded.is_(False),
+            )
+        )
+        return bool((await db.execute(stmt)).scalar())
+
     @classmethod
     async def update_comment(
         cls, post_id: UUID, comment_id: UUID, content: str, db: AsyncSession
@@ -296,23 +378,59 @@ class CommentsModel:
 
     @classmethod
     async def delete_comment(cls, post_id: UUID, comment_id: UUID, db: AsyncSession) -> bool:
-        r = await db.execute(
+        changed = await cls._change_state(
+            comment_id,
+            where=(Comment.post_id == post_id, Comment.deleted_at.is_(None)),
+            values={"deleted_at": utc_now()},
+            db=db,
+        )
+        return changed is not None
+
+    @staticmethod
+    async def _change_state(
+        comment_id: UUID, *, where: Sequence[Any], values: dict[str, Any], db: AsyncSession
+    ) -> UUID | None:
+        """댓글 한 행의 삭제·블라인드 상태를 바꾸고, 대댓글이면 표시 여부가 바뀐 만큼 부모의
+        reply_count를 같은 문장(데이터 변경 CTE)에서 맞춘다. 바뀐 행의 post_id(댓글 페이지 캐시
+        무효화용), 없으면 None.
+
+        이전 표시 여부는 문장 스냅샷에서 읽는다. 같은 행을 동시에 바꾸는 드문 경합으로 생긴 오차는
+        카운터 reconcile(ADR 0023)이 원장 기준으로 되돌린다.
+        """
+        before = (
+            select(Comment.id, _is_listed(Comment).label("was_listed"))
+            .where(Comment.id == comment_id, *where)
+            .cte("before")
+        )
+        changed = (
+            update(Comment)
+            .where(Comment.id == before.c.id)
+            .values(**values)
+            .returning(
+                Comment.id,
+                Comment.post_id,
+                Comment.parent_id,
+                before.c.was_listed,
+                _is_listed(Comment).label("is_listed"),
+            )
+            .cte("changed")
+        )
+        parent = (
             update(Comment)
             .where(
-                Comment.id == comment_id,
-                Comment.post_id == post_id,
-                Comment.deleted_at.is_(None),
+                Comment.id == changed.c.parent_id,
+                changed.c.is_listed.is_distinct_from(changed.c.was_listed),
+            )
+            .values(
+                reply_count=func.greatest(
+                    Comment.reply_count + case((changed.c.is_listed, 1), else_=-1), 0
+                )
             )
-            .values(deleted_at=utc_now())
             .returning(Comment.id)
+            .cte("parent")
         )
-        return r.scalar_one_or_none() is not None
-
-    @classmethod
-    async def get_like_count(cls, comment_id: UUID, db: AsyncSession) -> int:
-        result = await db.execute(select(Comment.like_count).where(Comment.id == comment_id))
-        row = result.scalar_one_or_none()
-        return row or 0
+        result = await db.execute(select(changed.c.post_id).add_cte(parent))
+        return result.scalar_one_or_none()
 
     @classmethod
     async def get_reported_by_ids(
@@ -342,34 +460,28 @@ class CommentsModel:
         return row[0] if row is not None else None
 
     @classmethod
-    async def set_blinded(cls, comment_id: UUID, db: AsyncSession) -> bool:
-        r = await db.execute(
-            update(Comment)
-            .where(Comment.id == comment_id)
-            .values(is_blinded=True, updated_at=utc_now())
-            .returning(Comment.id)
+    async def set_blinded(cls, comment_id: UUID, db: AsyncSession) -> UUID | None:
+        return await cls._change_state(
+            comment_id, where=(), values={"is_blinded": True, "updated_at": utc_now()}, db=db
         )
-        return r.scalar_one_or_none() is not None
 
     @classmethod
-    async def unblind_comment(cls, comment_id: UUID, db: AsyncSession) -> bool:
-        r = await db.execute(
-            update(Comment)
-            .where(Comment.id == comment_id, Comment.deleted_at.is_(None))
-            .values(is_blinded=False, updated_at=utc_now())
-            .returning(Comment.id)
+    async def unblind_comment(cls, comment_id: UUID, db: AsyncSession) -> UUID | None:
+        return await cls._change_state(
+            comment_id,
+            where=(Comment.deleted_at.is_(None),),
+            values={"is_blinded": False, "updated_at": utc_now()},
+            db=db,
         )
-        return r.scalar_one_or_none() is not None
 
     @classmethod
-    async def reset_reports(cls, comment_id: UUID, db: AsyncSession) -> bool:
-        r = await db.execute(
-            update(Comment)
-            .where(Comment.id == comment_id, Comment.deleted_at.is_(None))
-            .values(report_count=0, is_blinded=False, updated_at=utc_now())
-            .returning(Comment.id)
+    async def reset_reports(cls, comment_id: UUID, db: AsyncSession) -> UUID | None:
+        return await cls._change_state(
+            comment_id,
+            where=(Comment.deleted_at.is_(None),),
+            values={"report_count": 0, "is_blinded": False, "updated_at": utc_now()},
+            db=db,
         )
-        return r.scalar_one_or_none() is not None
 
     @classmethod
     async def increment_like_count(cls, comment_id: UUID, db: AsyncSession) -> int:
@@ -393,6 +505,100 @@ class CommentsModel:
         row = result.one_or_none()
         return row[0] if row is not None else 0
 
+    @classmethod
+    async def apply_like_count_deltas_bulk(
+        cls, deltas: Sequence[tuple[UUID, int]], db: AsyncSession
+    ) -> list[UUID]:
+        """댓글 좋아요 수 flush용 집합 UPDATE(ADR 0023). updated_at은 건드리지 않는다(수정 표시 기준).
+
+        갱신한 행마다 그 댓글의 post_id를 돌려준다 — flush 후 댓글 페이지 캐시(ADR 0027) 무효화용.
+        """
+        if not deltas:
+            return []
+        d = (
+            func.unnest(
+                bindparam("ids", [cid for cid, _ in deltas], type_=ARRAY(PG_UUID)),
+                bindparam("likes", [n for _, n in deltas], type_=ARRAY(Integer)),
+            )
+            .table_valued("id", "likes")
+            .render_derived(name="d")
+        )
+        result = await db.execute(
+            update(Comment)
+            .where(Comment.id == d.c.id)
+            .values(like_count=func.greatest(Comment.like_count + d.c.likes, 0))
+            .returning(Comment.post_id)
+            .execution_options(synchronize_session=False)
+        )
+        return list(result.scalars().all())
+
+    @classmethod
+    async def counter_reconcile_ids(
+        cls, after: UUID | None, limit: int, *, db: AsyncSession
+    ) -> list[UUID]:
+        """reconcile 배치 — id 순으로 after 다음 limit개 댓글 id."""
+        batch = select(Comment.id).order_by(Comment.id).limit(limit)
+        if after is not None:
+            batch = batch.where(Comment.id > after)
+        return list((await db.execute(batch)).scalars().all())
+
+    @classmethod
+    async def counter_ledger_counts(
+        cls, comment_ids: Sequence[UUID], *, db: AsyncSession
+    ) -> list[tuple[UUID, int]]:
+        """댓글들의 (id, 원장 좋아요 수)(ADR 0023 reconcile). id 순서 그대로."""
+        if not comment_ids:
+            return []
+        likes = (
+            select(func.count())
+            .select_from(CommentLike)
+            .where(CommentLike.comment_id == Comment.id)
+            .scalar_subquery()
+        )
+        rows = (
+            await db.execute(
+                select(Comment.id, likes).where(Comment.id.in_(comment_ids)).order_by(Comment.id)
+            )
+        ).all()
+        return [(cid, int(n)) for cid, n in rows]
+
+    @classmethod
+    async def reconcile_counters(
+        cls, targets: Sequence[tuple[UUID, int]], *, db: AsyncSession
+    ) -> int:
+        """댓글들의 like_count를 ``(comment_id, 좋아요)`` 목표값으로, reply_count를 원장으로 맞춘다.
+
+        like_count 목표값은 PostsModel과 같게 호출부가 원장 수 − 버퍼 pending으로 준다. reply_count는
+        버퍼를 거치지 않아 이 문장 안에서 대댓글 행을 센다. 고친 행 수 반환.
+        """
+        if not targets:
+            return 0
+        d = (
+            func.unnest(
+                bindparam("ids", [cid for cid, _ in targets], type_=ARRAY(PG_UUID)),
+                bindparam("likes", [n for _, n in targets], type_=ARRAY(Integer)),
+            )
+            .table_valued("id", "likes")
+            .render_derived(name="d")
+        )
+        reply = aliased(Comment)
+        replies = (
+            select(func.count())
+            .select_from(reply)
+            .where(reply.parent_id == Comment.id, _is_listed(reply))
+            .scalar_subquery()
+        )
+        result = await db.execute(
+            update(Comment)
+            .where(
+                Comment.id == d.c.id,
+                or_(Comment.like_count != d.c.likes, Comment.reply_count != replies),
+            )
+            .values(like_count=d.c.likes, reply_count=replies)
+            .execution_options(synchronize_session=False)
+        )
+        return int(getattr(result, "rowcount", 0) or 0)
+
 
 class CommentLikesModel:
     @classmethod
@@ -410,37 +616,113 @@ class CommentLikesModel:
         return set(r[0] for r in rows)
 
     @classmethod
-    async def create(cls, comment_id: UUID, user_id: UUID, db: AsyncSession) -> bool:
-        stmt = (
-            pg_insert(CommentLike)
-            .values(comment_id=comment_id, user_id=user_id, created_at=utc_now())
-            .on_conflict_do_nothing(index_elements=[CommentLike.comment_id, CommentLike.user_id])
-            .returning(CommentLike.comment_id)
+    async def get_recent_likes(
+        cls, user_id: UUID, limit: int, *, db: AsyncSession
+    ) -> list[tuple[UUID, datetime]]:
+        """최근 댓글 좋아요 (comment_id, created_at) 최신순 limit건(liked_cache 창 적재)."""
+        result = await db.execute(
+            select(CommentLike.comment_id, CommentLike.created_at)
+            .where(CommentLike.user_id == user_id)
+            .order_by(CommentLike.created_at.desc())
+            .limit(limit)
         )
-        result = await db.execute(stmt)
-        return result.scalar_one_or_none() is not None
+        return [(r[0], r[1]) for r in result.all()]
 
     @classmethod
-    async def delete(cls, comment_id: UUID, user_id: UUID, db: AsyncSession) -> bool:
-        r = await db.execute(
-            delete(CommentLike)
+    async def has_like(cls, comment_id: UUID, user_id: UUID, db: AsyncSession) -> bool:
+        stmt = (
+            select(CommentLike.comment_id)
             .where(
                 CommentLike.comment_id == comment_id,
                 CommentLike.user_id == user_id,
             )
+            .limit(1)
+        )
+        result = await db.execute(stmt)
+        return result.scalar_one_or_none() is not None
+
+    @staticmethod
+    def _live_comment_cte(comment_id: UUID) -> CTE:
+        return (
+            select(Comment.id, Comment.post_id, Comment.author_id)
+            .where(Comment.id == comment_id, Comment.deleted_at.is_(None))
+            .cte("target")
+        )
+
+    @classmethod
+    async def like(
+        cls, comment_id: UUID, user_id: UUID, *, bump_count: bool, db: AsyncSession
+    ) -> LikeOutcome:
+        """댓글 좋아요 한 문장 — PostLikesModel.like와 같은 모양(댓글 존재·삽입·카운터·알림)."""
+        target = cls._live_comment_cte(comment_id)
+        inserted = (
+            pg_insert(CommentLike)
+            .from_select(
+                ["comment_id", "user_id", "created_at"],
+                select(
+                    target.c.id,
+                    bindparam("actor_id", user_id, type_=PG_UUID),
+                    bindparam("liked_at", utc_now(), type_=DateTime(timezone=True)),
+                ),
+            )
+            .on_conflict_do_nothing(index_elements=[CommentLike.comment_id, CommentLike.user_id])
             .returning(CommentLike.comment_id)
+            .cte("inserted")
+        )
+        current = select(Comment.like_count).where(Comment.id == comment_id).scalar_subquery()
+        like_count: Any = current
+        if bump_count:
+            bumped = (
+                update(Comment)
+                .where(Comment.id == inserted.c.comment_id)
+                .values(like_count=Comment.like_count + 1)
+                .returning(Comment.like_count)
+                .cte("bumped")
+            )
+            like_count = func.coalesce(select(bumped.c.like_count).scalar_subquery(), current)
+        source = target.join(inserted, true()).select().subquery("source")
+        notified = like_notification_cte(
+            source,
+            kind=NotificationKind.LIKE_COMMENT,
+            actor_id=user_id,
+            post_id=source.c.post_id,
+            comment_id=source.c.id,
+        )
+        return await execute_like_outcome(
+            db,
+            target=target,
+            changed=inserted,
+            like_count=like_count,
+            post_id=target.c.post_id,
+            notified=notified,
         )
-        return r.scalar_one_or_none() is not None
 
     @classmethod
-    async def has_like(cls, comment_id: UUID, user_id: UUID, db: AsyncSession) -> bool:
-        stmt = (
-            select(CommentLike.comment_id)
+    async def unlike(
+        cls, comment_id: UUID, user_id: UUID, *, bump_count: bool, db: AsyncSession
+    ) -> LikeOutcome:
+        """댓글 좋아요 취소 한 문장 — 댓글 존재 확인, 삭제, (삭제됐으면) 카운터 -1(0 하한)."""
+        target = cls._live_comment_cte(comment_id)
+        removed = (
+            delete(CommentLike)
             .where(
-                CommentLike.comment_id == comment_id,
+                CommentLike.comment_id.in_(select(target.c.id)),
                 CommentLike.user_id == user_id,
             )
-            .limit(1)
+            .returning(CommentLike.comment_id)
+            .cte("removed")
+        )
+        current = select(Comment.like_count).where(Comment.id == comment_id).scalar_subquery()
+        like_count: Any = current
+        if bump_count:
+            bumped = (
+                update(Comment)
+                .where(Comment.id == removed.c.comment_id)
+                .values(like_count=func.greatest(Comment.like_count - 1, 0))
+                .returning(Comment.like_count)
+                .cte("bumped")
+            )
+            like_count = func.coalesce(select(bumped.c.like_count).scalar_subquery(), current)
+        return await execute_like_outcome(
+            db, target=target, changed=removed, like_count=like_count, post_id=target.c.post_id
         )
-        result = await db.execute(stmt)
-        return result.scalar_one_or_none() is not None
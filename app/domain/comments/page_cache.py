@@ -0,0 +1,126 @@
+# 인기글 댓글 첫 페이지 캐시(ADR 0027)의 키·TTL·인기 판정·무효화 조각. 트렌딩 상위 글만 (글, 정렬)별로
+# 차단 무관 루트 풀(루트 + 대댓글 미리보기)을 캐시하고, 좋아요 여부·차단 필터·pending 좋아요 수는
+# 요청마다 얹는다. 댓글 서비스와 쓰기 경로(관리자·신고 블라인드, 글 삭제·블라인드, 작성자 프로필 변경)가
+# 함께 쓰는 계약이라 공개 모듈로 둔다. Redis 장애는 전부 fail-open — 남은 값은 짧은 TTL로 만료된다.
+import logging
+import time
+from collections.abc import Iterable
+from uuid import UUID
+
+from pydantic import BaseModel, TypeAdapter
+
+from app.core.config import settings
+from app.domain.comments.schema import CommentResponse
+from app.domain.posts.trending_rank import read_trending_ids
+from app.infra.cache import invalidate_json
+from app.infra.redis import RedisLike
+
+log = logging.getLogger(__name__)
+
+_CACHE_PREFIX = "cache:comment_page:"
+_SORTS = ("latest", "oldest")
+# 정렬별 앞쪽 루트 풀. 기본 size(10) 기준 앞 몇 페이지 + 차단 필터 headroom.
+COMMENT_PAGE_POOL_SIZE = 30
+# 작성·수정·삭제·블라인드·프로필 변경은 명시적 무효화로 끊는다. 무효화 없이 바뀌는 댓글 like_count
+# (write-behind가 꺼진 경우)의 지연 상한이 이 TTL이다.
+COMMENT_PAGE_CACHE_TTL_SECONDS = 30
+COMMENT_PAGE_L1_TTL_SECONDS = 3
+# 작성자 인덱스(author → 그 작성자가 풀에 있는 post_id SET). 풀 키보다 길게 둬 무효화가 먼저 사라지지 않게.
+_AUTHOR_INDEX_TTL_SECONDS = COMMENT_PAGE_CACHE_TTL_SECONDS * 4
+# 트렌딩 상위 집합을 프로세스에 들고 있는 시간 — 요청마다 ZREVRANGE를 치르지 않게.
+_HOT_SET_TTL_SECONDS = 10
+
+# (만료 monotonic, 트렌딩 상위 post_id 집합). 단일 이벤트 루프라 락이 없다.
+_hot_posts: tuple[float, frozenset[UUID]] = (0.0, frozenset())
+
+
+class CommentPagePool(BaseModel):
+    """차단·좋아요 무관 댓글 풀. items는 keyset 순서의 루트(대댓글 미리보기 포함), exhaustive는
+    루트가 풀 크기 이하라 풀이 전부인지."""
+
+    post_author_id: UUID | None = None
+    items: list[CommentResponse]
+    exhaustive: bool
+
+
+COMMENT_PAGE_POOL_ADAPTER = TypeAdapter(CommentPagePool)
+
+
+def comment_page_cache_key(post_id: UUID, sort: str) -> str:
+    return f"{_CACHE_PREFIX}{post_id}:{sort}"
+
+
+def _author_index_key(user_id: UUID) -> str:
+    return f"{_CACHE_PREFIX}author:{user_id}"
+
+
+def reset_hot_posts() -> None:
+    """프로세스의 트렌딩 상위 집합을 비운다(테스트·설정 변경용)."""
+    global _hot_posts
+    _hot_posts = (0.0, frozenset())
+
+
+async def is_hot_post(redis_client: RedisLike | None, post_id: UUID) -> bool:
+    """전체 트렌딩 ZSET 상위 ``COMMENT_PAGE_CACHE_HOT_POSTS``개에 드는 글인지. 0이면 캐시를 끈다.
+
+    상위 집합은 프로세스에 ``_HOT_SET_TTL_SECONDS``만큼 들고 있는다. 읽기 실패는 빈 집합(캐시 안 씀).
+    """
+    global _hot_posts
+    limit = settings.COMMENT_PAGE_CACHE_HOT_POSTS
+    if redis_client is None or limit <= 0:
+        return False
+    expires_at, ids = _hot_posts
+    now = time.monotonic()
+    if now >= expires_at:
+        ids = frozenset(await read_trending_ids(redis_client, None, limit))
+        _hot_posts = (now + _HOT_SET_TTL_SECONDS, ids)
+    return post_id in ids
+
+
+async def register_comment_page_authors(
+    redis_client: RedisLike | None, post_id: UUID, author_ids: Iterable[UUID]
+) -> None:
+    """풀에 실린 작성자마다 post_id를 인덱스에 등록(SADD + EXPIRE, 파이프라인 1왕복). 실패는 무시."""
+    authors = sorted(set(author_ids))
+    if redis_client is None or not authors:
+        return
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for author_id in authors:
+                index_key = _author_index_key(author_id)
+                pipe.sadd(index_key, str(post_id))
+                pipe.expire(index_key, _AUTHOR_INDEX_TTL_SECONDS)
+            await pipe.execute()
+    except Exception as e:
+        log.warning("comment_page author index register failed (ttl fallback): %s", e)
+
+
+async def invalidate_comment_pages(redis_client: RedisLike | None, *post_ids: UUID) -> None:
+    """글들의 댓글 풀(정렬 전부)을 끊는다. 댓글 작성·수정·삭제·블라인드 커밋 후 호출."""
+    keys = [comment_page_cache_key(p, s) for p in dict.fromkeys(post_ids) for s in _SORTS]
+    await invalidate_json(redis_client, *keys)
+
+
+async def invalidate_author_comment_pages(redis_client: RedisLike | None, user_id: UUID) -> None:
+    """작성자 프로필(닉네임·프로필 이미지·대표견·탈퇴)이 바뀌면 그 작성자가 실린 댓글 풀을 끊는다."""
+    if redis_client is None:
+        return
+    index_key = _author_index_key(user_id)
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.smembers(index_key)
+            (members,) = await pipe.execute()
+    except Exception as e:
+        log.warning("comment_page author index lookup failed (ttl fallback): %s", e)
+        return
+    post_ids: list[UUID] = []
+    for m in members or ():
+        try:
+            post_ids.append(UUID(m.decode() if isinstance(m, (bytes, bytearray)) else str(m)))
+        except ValueError:
+            continue
+    if not post_ids:
+        return
+    # 인덱스도 함께 지운다 — 끊긴 풀의 post_id가 인덱스에 남아 쌓이지 않게.
+    keys = [comment_page_cache_key(p, s) for p in post_ids for s in _SORTS]
+    await invalidate_json(redis_client, *keys, index_key)
@@ -22,6 +22,7 @@ from app.common import (
     CursorPage,
     OptionalPublicId,
     PublicId,
+    api_json_response,
     api_response,
 )
 from app.domain.comments.schema import CommentIdData, CommentResponse, CommentUpsertRequest
@@ -58,6 +59,7 @@ async def get_comments(
     sort: str | None = Query(None, description="정렬: latest|oldest"),
     db: AsyncSession = Depends(get_slave_db),
     current_user: CurrentUser | None = Depends(get_current_user_optional),
+    redis: RedisLike | None = Depends(get_optional_redis),
 ):
     result, has_more = await CommentService.get_comments(
         post_id,
@@ -66,8 +68,47 @@ async def get_comments(
         sort=sort,
         cursor=cursor,
         current_user_id=current_user.id if current_user else None,
+        redis=redis,
+    )
+    return api_json_response(
+        request, code=ApiCode.OK, data=CursorPage(items=result, has_more=has_more)
+    )
+
+
+@router.get(
+    "/{comment_id}/replies",
+    status_code=200,
+    response_model=ApiResponse[CursorPage[CommentResponse]],
+)
+async def get_replies(
+    request: Request,
+    post_id: Annotated[PublicId, Path(..., description="게시글 공개 ID (Base62)")],
+    comment_id: Annotated[PublicId, Path(..., description="루트 댓글 공개 ID (Base62)")],
+    cursor: Annotated[
+        OptionalPublicId,
+        Query(
+            description="더보기: 직전 응답(또는 미리보기)의 마지막 대댓글 id(공개 ID). 미지정 시 처음부터."
+        ),
+    ] = None,
+    size: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    sort: str | None = Query(None, description="정렬: latest|oldest (댓글 목록과 같게)"),
+    db: AsyncSession = Depends(get_slave_db),
+    current_user: CurrentUser | None = Depends(get_current_user_optional),
+    redis: RedisLike | None = Depends(get_optional_redis),
+):
+    result, has_more = await CommentService.get_replies(
+        post_id,
+        comment_id,
+        size,
+        db=db,
+        sort=sort,
+        cursor=cursor,
+        current_user_id=current_user.id if current_user else None,
+        redis=redis,
+    )
+    return api_json_response(
+        request, code=ApiCode.OK, data=CursorPage(items=result, has_more=has_more)
     )
-    return api_response(request, code=ApiCode.OK, data=CursorPage(items=result, has_more=has_more))
 
 
 @router.patch("/{comment_id}", status_code=200, response_model=ApiResponse[None])
@@ -76,9 +117,10 @@ async def update_comment(
     comment_data: CommentUpsertRequest,
     author_ctx: CommentAuthorContext = Depends(require_comment_author),
     db: AsyncSession = Depends(get_master_db),
+    redis: RedisLike | None = Depends(get_optional_redis),
 ):
     await CommentService.update_comment(
-        author_ctx.post_id, author_ctx.comment_id, comment_data, db=db
+        author_ctx.post_id, author_ctx.comment_id, comment_data, db=db, redis=redis
     )
     return api_response(request, code=ApiCode.OK, data=None)
 
@@ -88,6 +130,9 @@ async def delete_comment(
     request: Request,
     author_ctx: CommentAuthorContext = Depends(require_comment_author_for_delete),
     db: AsyncSession = Depends(get_master_db),
+    redis: RedisLike | None = Depends(get_optional_redis),
 ):
-    await CommentService.delete_comment(author_ctx.post_id, author_ctx.comment_id, db=db)
+    await CommentService.delete_comment(
+        author_ctx.post_id, author_ctx.comment_id, db=db, redis=redis
+    )
     return api_response(request, code=ApiCode.OK, data=None)
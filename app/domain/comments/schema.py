@@ -49,10 +49,14 @@ class CommentResponse(BaseSchema):
     post_id: OptionalPublicId = None
     parent_id: OptionalPublicId = None
     like_count: int = 0
+    # 루트의 표시 가능한 대댓글 수(차단 작성자 포함 — 보는 사람에 따라 replies보다 클 수 있다).
+    reply_count: int = 0
     is_liked: bool = False
     is_edited: bool = False
     is_deleted: bool = False
     replies: list["CommentResponse"] = Field(default_factory=list)
+    # replies가 미리보기로 잘렸으면 True — 마지막 대댓글 id를 cursor로 replies 엔드포인트를 부른다.
+    has_more_replies: bool = False
 
 
 CommentResponse.model_rebuild()
@@ -1,5 +1,8 @@
 # 댓글 비즈니스 로직. Full-Async. 생성/삭제 시 게시글 comment_count 조정은 서비스에서 조율.
+# Redis가 있으면 comment_count·댓글 like_count는 커밋 후 write-behind 버퍼로 간다(ADR 0023).
+# 트렌딩 상위 글의 댓글 첫 페이지는 차단 무관 풀로 캐시하고 요청마다 overlay한다(ADR 0027).
 
+from collections.abc import Collection
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -11,15 +14,32 @@ from app.common.exceptions import (
     ConcurrentUpdateException,
     PostNotFoundException,
 )
-from app.domain.comments.model import CommentLikesModel, CommentsModel
+from app.core.config import settings
+from app.domain.comments.model import CommentsModel
+from app.domain.comments.page_cache import (
+    COMMENT_PAGE_CACHE_TTL_SECONDS,
+    COMMENT_PAGE_L1_TTL_SECONDS,
+    COMMENT_PAGE_POOL_ADAPTER,
+    COMMENT_PAGE_POOL_SIZE,
+    CommentPagePool,
+    comment_page_cache_key,
+    invalidate_comment_pages,
+    is_hot_post,
+    register_comment_page_authors,
+)
 from app.domain.comments.schema import (
     CommentIdData,
     CommentResponse,
     CommentUpsertRequest,
 )
+from app.domain.likes.liked_cache import LikeWindow, get_like_window, resolve_liked_comment_ids
 from app.domain.notifications.model import NotificationsModel
 from app.domain.notifications.service import NotificationService
+from app.domain.posts.counter_buffer import counter_buffering, get_counter_pending, settle_counter
 from app.domain.posts.repository import PostsModel
+from app.domain.posts.trending_rank import COMMENT_WEIGHT, bump_trending
+from app.domain.users.block_cache import get_blocked_user_ids
+from app.infra.cache import get_or_compute_json
 from app.infra.redis import RedisLike
 
 
@@ -34,9 +54,9 @@ async def _decrement_post_comment_count(post_id: UUID, db: AsyncSession) -> None
 async def _ensure_post_visible(
     post_id: UUID,
     db: AsyncSession,
-    current_user_id: UUID | None = None,
+    blocked_ids: Collection[UUID] = (),
 ) -> None:
-    if not await PostsModel.post_is_visible(post_id, db=db, current_user_id=current_user_id):
+    if not await PostsModel.post_is_visible(post_id, db=db, blocked_ids=blocked_ids):
         raise PostNotFoundException()
 
 
@@ -56,6 +76,7 @@ def _comment_to_response(
         post_id=c.post_id,
         parent_id=c.parent_id,
         like_count=c.like_count,
+        reply_count=c.reply_count,
         is_liked=c.id in liked_ids,
         is_edited=is_edited,
         is_deleted=is_deleted,
@@ -68,8 +89,13 @@ def _build_comment_tree(
     replies: list,
     liked_ids: set,
     sort: str = "latest",
+    per_root: int | None = None,
 ) -> list[CommentResponse]:
-    """루트 순서는 keyset로 이미 확정돼 있으므로 보존하고, 대댓글만 부모에 붙여 정렬한다."""
+    """루트 순서는 keyset로 이미 확정돼 있으므로 보존하고, 대댓글만 부모에 붙여 정렬한다.
+
+    per_root가 있으면 루트마다 앞쪽 per_root개만 남기고, 잘린 루트는 has_more_replies로 표시한다
+    (get_replies_for_roots가 per_root+1건까지 싣는다).
+    """
     root_resps = [_comment_to_response(r, liked_ids) for r in roots]
     by_id = {r.id: resp for r, resp in zip(roots, root_resps)}
     for rp in replies:
@@ -79,9 +105,25 @@ def _build_comment_tree(
     reverse = sort != "oldest"
     for resp in root_resps:
         resp.replies.sort(key=lambda x: x.id, reverse=reverse)
+        if per_root is not None and len(resp.replies) > per_root:
+            resp.has_more_replies = True
+            del resp.replies[per_root:]
     return root_resps
 
 
+async def _overlay_pending_like_counts(
+    tree: list[CommentResponse], redis: RedisLike | None
+) -> None:
+    """버퍼에 쌓인(아직 flush 전) 좋아요 delta를 페이지 댓글 like_count에 더한다 — HMGET 1왕복."""
+    if not tree or not counter_buffering(redis):
+        return
+    flat = [c for root in tree for c in (root, *root.replies)]
+    pending = await get_counter_pending(redis, "comment_like", [c.id for c in flat])
+    for c, p in zip(flat, pending):
+        if p:
+            c.like_count = max(c.like_count + p, 0)
+
+
 class CommentService:
     @classmethod
     async def create_comment(
@@ -95,8 +137,10 @@ class CommentService:
         notify: (
             tuple[UUID, UUID, NotificationKind, UUID | None, UUID | None, UUID | None] | None
         ) = None
+        blocked = await get_blocked_user_ids(user_id, db=db, redis=redis)
+        buffered = counter_buffering(redis)
         async with db.begin():
-            await _ensure_post_visible(post_id, db=db, current_user_id=user_id)
+            await _ensure_post_visible(post_id, db=db, blocked_ids=blocked)
             parent_id = getattr(data, "parent_id", None)
             if parent_id is not None:
                 parent = await CommentsModel.get_comment_by_id(parent_id, db=db)
@@ -107,10 +151,11 @@ class CommentService:
             comment = await CommentsModel.create_comment(
                 post_id, user_id, data.content, db=db, parent_id=parent_id
             )
-            try:
-                await _increment_post_comment_count(post_id, db=db)
-            except StaleDataError as e:
-                raise ConcurrentUpdateException() from e
+            if not buffered:
+                try:
+                    await _increment_post_comment_count(post_id, db=db)
+                except StaleDataError as e:
+                    raise ConcurrentUpdateException() from e
             comment_id = comment.id
             post_author_id = await PostsModel.get_post_author_id(post_id, db=db)
             if post_author_id and post_author_id != user_id:
@@ -130,6 +175,8 @@ class CommentService:
                     post_id,
                     comment_id,
                 )
+        if buffered:
+            await settle_counter(redis, "post_comment", post_id, base=0, delta=1, db=db)
         if notify is not None:
             rec, nid, kind, act, pid, cid = notify
             await NotificationService.publish_after_commit(
@@ -141,6 +188,8 @@ class CommentService:
                 post_id=pid,
                 comment_id=cid,
             )
+        await invalidate_comment_pages(redis, post_id)
+        await bump_trending(redis, {post_id: COMMENT_WEIGHT})
         return CommentIdData(id=comment_id)
 
     @classmethod
@@ -152,35 +201,191 @@ class CommentService:
         sort: str | None = None,
         cursor: UUID | None = None,
         current_user_id: UUID | None = None,
+        redis: RedisLike | None = None,
     ) -> tuple[list[CommentResponse], bool]:
         sort_mode = sort if sort in ("latest", "oldest") else "latest"
+        blocked = await get_blocked_user_ids(current_user_id, db=db, redis=redis)
+        like_window = (
+            await get_like_window("comment", current_user_id, db=db, redis=redis)
+            if current_user_id is not None
+            else None
+        )
+        if await is_hot_post(redis, post_id):
+            cached = await cls._get_comments_from_page_cache(
+                post_id,
+                size,
+                db,
+                sort=sort_mode,
+                cursor=cursor,
+                current_user_id=current_user_id,
+                blocked_ids=blocked,
+                like_window=like_window,
+                redis=redis,
+            )
+            if cached is not None:
+                return cached
         async with db.begin():
-            if not await PostsModel.post_is_visible(
-                post_id, db=db, current_user_id=current_user_id
-            ):
-                raise PostNotFoundException()
+            await _ensure_post_visible(post_id, db=db, blocked_ids=blocked)
             fetched = await CommentsModel.get_root_comments(
                 post_id,
                 size,
                 db=db,
                 cursor=cursor,
                 sort=sort_mode,
-                current_user_id=current_user_id,
+                blocked_ids=blocked,
             )
             has_more = len(fetched) > size
             roots = fetched[:size]
+            per_root = settings.COMMENT_REPLY_PREVIEW_SIZE
             replies = await CommentsModel.get_replies_for_roots(
-                [r.id for r in roots], db=db, current_user_id=current_user_id
+                [r.id for r in roots],
+                db=db,
+                per_root=per_root,
+                sort=sort_mode,
+                blocked_ids=blocked,
             )
             comment_ids = [c.id for c in roots] + [c.id for c in replies]
             liked_ids = (
-                await CommentLikesModel.get_liked_comment_ids_for_user(
-                    current_user_id, comment_ids, db=db
+                await resolve_liked_comment_ids(current_user_id, comment_ids, like_window, db=db)
+                if current_user_id is not None and comment_ids
+                else set()
+            )
+            result = _build_comment_tree(
+                roots, replies, liked_ids, sort=sort_mode, per_root=per_root
+            )
+        await _overlay_pending_like_counts(result, redis)
+        return result, has_more
+
+    @classmethod
+    async def _get_comments_from_page_cache(
+        cls,
+        post_id: UUID,
+        size: int,
+        db: AsyncSession,
+        *,
+        sort: str,
+        cursor: UUID | None,
+        current_user_id: UUID | None,
+        blocked_ids: Collection[UUID],
+        like_window: LikeWindow | None,
+        redis: RedisLike | None,
+    ) -> tuple[list[CommentResponse], bool] | None:
+        """캐시된 루트 풀(차단·좋아요 무관)에서 페이지를 잘라낸다. 풀로 페이지를 확정할 수 없으면
+        (커서가 풀 밖·차단 필터 후 부족·페이지에 차단 작성자 대댓글) None — 호출부가 DB로 폴백한다."""
+        per_root = settings.COMMENT_REPLY_PREVIEW_SIZE
+
+        async def loader() -> CommentPagePool:
+            async with db.begin():
+                await _ensure_post_visible(post_id, db=db)
+                post_author_id = await PostsModel.get_post_author_id(post_id, db=db)
+                fetched = await CommentsModel.get_root_comments(
+                    post_id, COMMENT_PAGE_POOL_SIZE, db=db, sort=sort
+                )
+                roots = fetched[:COMMENT_PAGE_POOL_SIZE]
+                replies = await CommentsModel.get_replies_for_roots(
+                    [r.id for r in roots], db=db, per_root=per_root, sort=sort
+                )
+                items = _build_comment_tree(roots, replies, set(), sort=sort, per_root=per_root)
+            await register_comment_page_authors(
+                redis,
+                post_id,
+                [c.author.id for root in items for c in (root, *root.replies) if c.author],
+            )
+            return CommentPagePool(
+                post_author_id=post_author_id,
+                items=items,
+                exhaustive=len(fetched) <= COMMENT_PAGE_POOL_SIZE,
+            )
+
+        key = comment_page_cache_key(post_id, sort)
+        pool = await get_or_compute_json(
+            redis=redis,
+            key=key,
+            lock_key=f"{key}:lock",
+            ttl_seconds=COMMENT_PAGE_CACHE_TTL_SECONDS,
+            adapter=COMMENT_PAGE_POOL_ADAPTER,
+            loader=loader,
+            cache_name="comment_page",
+            l1_ttl_seconds=COMMENT_PAGE_L1_TTL_SECONDS,
+        )
+        if pool.post_author_id is not None and pool.post_author_id in blocked_ids:
+            raise PostNotFoundException()
+        # 풀은 get_root_comments와 같은 keyset 순서 — 커서 조건도 그대로 적용한다.
+        items = pool.items
+        if cursor is not None:
+            items = [c for c in items if (c.id > cursor if sort == "oldest" else c.id < cursor)]
+        visible = [c for c in items if c.author is None or c.author.id not in blocked_ids]
+        if len(visible) <= size and not pool.exhaustive:
+            return None
+        page = visible[:size]
+        # 차단 작성자 대댓글은 미리보기 구성·삭제 루트 placeholder 판정을 바꾼다 — DB에 맡긴다.
+        if blocked_ids and any(
+            rp.author is not None and rp.author.id in blocked_ids
+            for root in page
+            for rp in root.replies
+        ):
+            return None
+        comment_ids = [c.id for root in page for c in (root, *root.replies)]
+        liked_ids: set[UUID] = set()
+        if current_user_id is not None and comment_ids:
+            async with db.begin():
+                liked_ids = await resolve_liked_comment_ids(
+                    current_user_id, comment_ids, like_window, db=db
+                )
+        # 풀 객체는 요청 간 공유(L1) — 원본을 바꾸지 않고 복사본에 is_liked·pending 보정을 얹는다.
+        result = [
+            root.model_copy(
+                update={
+                    "is_liked": root.id in liked_ids,
+                    "replies": [
+                        rp.model_copy(update={"is_liked": rp.id in liked_ids})
+                        for rp in root.replies
+                    ],
+                }
+            )
+            for root in page
+        ]
+        await _overlay_pending_like_counts(result, redis)
+        return result, len(visible) > size
+
+    @classmethod
+    async def get_replies(
+        cls,
+        post_id: UUID,
+        comment_id: UUID,
+        size: int,
+        db: AsyncSession,
+        sort: str | None = None,
+        cursor: UUID | None = None,
+        current_user_id: UUID | None = None,
+        redis: RedisLike | None = None,
+    ) -> tuple[list[CommentResponse], bool]:
+        """루트 하나의 대댓글 더보기(keyset). 정렬·차단·is_liked·pending 보정은 목록과 같다."""
+        sort_mode = sort if sort in ("latest", "oldest") else "latest"
+        blocked = await get_blocked_user_ids(current_user_id, db=db, redis=redis)
+        like_window = (
+            await get_like_window("comment", current_user_id, db=db, redis=redis)
+            if current_user_id is not None
+            else None
+        )
+        async with db.begin():
+            await _ensure_post_visible(post_id, db=db, blocked_ids=blocked)
+            if not await CommentsModel.root_is_listed(post_id, comment_id, db=db):
+                raise CommentNotFoundException()
+            fetched = await CommentsModel.get_replies_page(
+                comment_id, size, db=db, cursor=cursor, sort=sort_mode, blocked_ids=blocked
+            )
+            has_more = len(fetched) > size
+            replies = fetched[:size]
+            liked_ids = (
+                await resolve_liked_comment_ids(
+                    current_user_id, [c.id for c in replies], like_window, db=db
                 )
-                if current_user_id is not None
+                if current_user_id is not None and replies
                 else set()
             )
-            result = _build_comment_tree(roots, replies, liked_ids, sort=sort_mode)
+            result = [_comment_to_response(c, liked_ids) for c in replies]
+        await _overlay_pending_like_counts(result, redis)
         return result, has_more
 
     @classmethod
@@ -190,14 +395,23 @@ class CommentService:
         comment_id: UUID,
         data: CommentUpsertRequest,
         db: AsyncSession,
+        redis: RedisLike | None = None,
     ) -> None:
         async with db.begin():
             affected = await CommentsModel.update_comment(post_id, comment_id, data.content, db=db)
             if affected == 0:
                 raise CommentNotFoundException()
+        await invalidate_comment_pages(redis, post_id)
 
     @classmethod
-    async def delete_comment(cls, post_id: UUID, comment_id: UUID, db: AsyncSession) -> None:
+    async def delete_comment(
+        cls,
+        post_id: UUID,
+        comment_id: UUID,
+        db: AsyncSession,
+        redis: RedisLike | None = None,
+    ) -> None:
+        buffered = counter_buffering(redis)
         async with db.begin():
             comment = await CommentsModel.get_comment_by_id(comment_id, db=db, include_deleted=True)
             if comment is None or comment.post_id != post_id:
@@ -207,7 +421,11 @@ class CommentService:
             deleted = await CommentsModel.delete_comment(post_id, comment_id, db=db)
             if not deleted:
                 raise CommentNotFoundException()
-            try:
-                await _decrement_post_comment_count(post_id, db=db)
-            except StaleDataError as e:
-                raise ConcurrentUpdateException() from e
+            if not buffered:
+                try:
+                    await _decrement_post_comment_count(post_id, db=db)
+                except StaleDataError as e:
+                    raise ConcurrentUpdateException() from e
+        await invalidate_comment_pages(redis, post_id)
+        if buffered:
+            await settle_counter(redis, "post_comment", post_id, base=0, delta=-1, db=db)
@@ -2,11 +2,17 @@
 from fastapi import APIRouter, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import CurrentUser, get_current_user, get_master_db
+from app.api.dependencies import (
+    CurrentUser,
+    get_current_user,
+    get_master_db,
+    get_optional_redis,
+)
 from app.common import ApiCode, ApiResponse, api_response
 from app.domain.dogs.schema import SetRepresentativeDogRequest
 from app.domain.dogs.service import DogService
 from app.domain.users.schema import UserProfileResponse
+from app.infra.redis import RedisLike
 
 router = APIRouter(prefix="/users/me/dogs", tags=["dogs"])
 
@@ -17,6 +23,7 @@ async def set_representative_dog(
     body: SetRepresentativeDogRequest,  # JSON: dogId → dog_id (BaseSchema alias)
     user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_master_db),
+    redis: RedisLike | None = Depends(get_optional_redis),
 ):
-    data = await DogService.set_representative_dog(user.id, body.dog_id, db=db)
+    data = await DogService.set_representative_dog(user.id, body.dog_id, db=db, redis=redis)
     return api_response(request, code=ApiCode.DOG_UPDATED, data=data)
@@ -11,10 +11,12 @@ from app.common.exceptions import (
     NotFoundException,
 )
 from app.db import utc_now
+from app.domain.comments.page_cache import invalidate_author_comment_pages
 from app.domain.dogs.model import DogProfilesModel
 from app.domain.dogs.schema import DogProfileUpsertItem
 from app.domain.users.model import UsersModel
 from app.domain.users.schema import UserProfileResponse
+from app.infra.redis import RedisLike
 
 
 class DogService:
@@ -103,7 +105,7 @@ class DogService:
 
     @classmethod
     async def set_representative_dog(
-        cls, owner_id: UUID, dog_id: UUID, db: AsyncSession
+        cls, owner_id: UUID, dog_id: UUID, db: AsyncSession, redis: RedisLike | None = None
     ) -> UserProfileResponse:
         """대표 강아지 설정. dog_id가 해당 owner_id 소유가 아니면 NotFoundException. 반환: 갱신된 사용자 프로필."""
         async with db.begin():
@@ -115,4 +117,7 @@ class DogService:
             user = await UsersModel.get_user_by_id_with_dogs(owner_id, db=db)
             if not user:
                 raise InternalServerErrorException()
-            return UserProfileResponse.model_validate(user)
+            result = UserProfileResponse.model_validate(user)
+        # 댓글 작성자 정보에 대표견이 실린다(ADR 0027).
+        await invalidate_author_comment_pages(redis, owner_id)
+        return result
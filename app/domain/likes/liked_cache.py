@@ -0,0 +1,127 @@
+# 사용자별 최근 좋아요 창 캐시(ADR 0020). 피드·검색·상세·댓글 페이지의 is_liked를 채우려 페이지마다
+# 돌던 `post_id IN (...)`·EXISTS 조회 대신, 사용자의 최근 좋아요 N건(id 집합 + 하한 시각)을 L1 + Redis에
+# 두고 페이지 id를 로컬에서 판정한다. 창 밖일 수 있는 id만 기존 IN 조회로 폴백한다.
+#
+# 판정 근거: 엔티티 PK는 UUIDv7이라 상위 48비트가 생성 시각(ms)이다. 좋아요는 대상이 생긴 뒤에만 가능하므로
+# 대상 생성 시각이 창 하한(창에서 잘린 가장 최근 좋아요 시각)보다 뒤면, 그 대상의 좋아요는 있다면 반드시
+# 창 안에 있다. 사용자의 좋아요가 N건 이하면 창이 전부라(floor=None) 모든 id를 로컬에서 판정한다.
+from datetime import UTC, datetime, timedelta
+from typing import Literal
+from uuid import UUID
+
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.comments.model import CommentLikesModel
+from app.domain.likes.model import PostLikesModel
+from app.infra.cache import get_or_compute_json, invalidate_json
+from app.infra.redis import RedisLike
+
+LikeTarget = Literal["post", "comment"]
+
+_CACHE_PREFIX = "cache:liked:"
+# 창 크기 — 사용자 키 하나가 대략 N × 40B(JSON). 피드 앞쪽 글은 거의 항상 창 하한보다 새롭다.
+LIKE_WINDOW_SIZE = 500
+# 좋아요·취소는 커밋 후 명시적 무효화 — TTL은 DEL 실패·경합 시 옛 창이 남는 상한.
+LIKED_CACHE_TTL_SECONDS = 300
+LIKED_L1_TTL_SECONDS = 10
+# 대상 id(UUIDv7) 시각과 좋아요 created_at은 서로 다른 인스턴스 시계에서 온다 — 시계 오차 여유.
+_CLOCK_SKEW = timedelta(seconds=60)
+
+
+class LikeWindow(BaseModel):
+    """최근 좋아요 id 집합. floor가 None이면 사용자의 좋아요 전부, 아니면 floor 초과 좋아요 전부."""
+
+    ids: frozenset[UUID]
+    floor: datetime | None = None
+
+    def split(self, target_ids: list[UUID]) -> tuple[set[UUID], list[UUID]]:
+        """(창으로 좋아요 확정된 id, 창으로 판정할 수 없어 DB로 확인할 id)."""
+        liked: set[UUID] = set()
+        undecided: list[UUID] = []
+        for tid in target_ids:
+            if tid in self.ids:
+                liked.add(tid)
+            elif not self._covers(tid):
+                undecided.append(tid)
+        return liked, undecided
+
+    def _covers(self, target_id: UUID) -> bool:
+        if self.floor is None:
+            return True
+        if target_id.version != 7:
+            return False
+        created = datetime.fromtimestamp((target_id.int >> 80) / 1000, tz=UTC)
+        return created > self.floor + _CLOCK_SKEW
+
+
+_ADAPTER = TypeAdapter(LikeWindow)
+
+
+def liked_cache_key(target: LikeTarget, user_id: UUID) -> str:
+    return f"{_CACHE_PREFIX}{target}:{user_id}"
+
+
+async def get_like_window(
+    target: LikeTarget, user_id: UUID, *, db: AsyncSession, redis: RedisLike | None
+) -> LikeWindow | None:
+    """사용자의 최근 좋아요 창. Redis가 없으면 None — 호출부는 기존 IN 조회만 쓴다(적재 왕복 절약).
+
+    미스면 자체 트랜잭션으로 읽으므로 세션 트랜잭션 밖(``db.begin()`` 전)에서 부른다.
+    """
+    if redis is None:
+        return None
+
+    async def loader() -> LikeWindow:
+        model = PostLikesModel if target == "post" else CommentLikesModel
+        async with db.begin():
+            rows = await model.get_recent_likes(user_id, LIKE_WINDOW_SIZE + 1, db=db)
+        if len(rows) <= LIKE_WINDOW_SIZE:
+            return LikeWindow(ids=frozenset(tid for tid, _ in rows))
+        # 잘린 첫 행의 시각이 하한 — 그보다 뒤의 좋아요는 전부 창 안에 있다(동시각은 창 밖 취급).
+        return LikeWindow(
+            ids=frozenset(tid for tid, _ in rows[:LIKE_WINDOW_SIZE]),
+            floor=rows[LIKE_WINDOW_SIZE][1],
+        )
+
+    key = liked_cache_key(target, user_id)
+    return await get_or_compute_json(
+        redis=redis,
+        key=key,
+        lock_key=f"{key}:lock",
+        ttl_seconds=LIKED_CACHE_TTL_SECONDS,
+        adapter=_ADAPTER,
+        loader=loader,
+        cache_name=f"liked_{target}s",
+        l1_ttl_seconds=LIKED_L1_TTL_SECONDS,
+    )
+
+
+async def resolve_liked_post_ids(
+    user_id: UUID, post_ids: list[UUID], window: LikeWindow | None, *, db: AsyncSession
+) -> set[UUID]:
+    """페이지 글 중 좋아요한 id. 창으로 못 가린 id만 IN 조회(세션 트랜잭션 안에서 호출)."""
+    if window is None:
+        return await PostLikesModel.get_liked_post_ids_for_user(user_id, post_ids, db=db)
+    liked, undecided = window.split(post_ids)
+    if undecided:
+        liked |= await PostLikesModel.get_liked_post_ids_for_user(user_id, undecided, db=db)
+    return liked
+
+
+async def resolve_liked_comment_ids(
+    user_id: UUID, comment_ids: list[UUID], window: LikeWindow | None, *, db: AsyncSession
+) -> set[UUID]:
+    if window is None:
+        return await CommentLikesModel.get_liked_comment_ids_for_user(user_id, comment_ids, db=db)
+    liked, undecided = window.split(comment_ids)
+    if undecided:
+        liked |= await CommentLikesModel.get_liked_comment_ids_for_user(user_id, undecided, db=db)
+    return liked
+
+
+async def invalidate_like_window(
+    redis: RedisLike | None, target: LikeTarget, user_id: UUID
+) -> None:
+    """좋아요·취소 커밋 후 호출(실제로 행이 바뀐 경우만)."""
+    await invalidate_json(redis, liked_cache_key(target, user_id))
@@ -2,14 +2,34 @@
 # comment_likes·CommentLikesModel은 comments 도메인에 유지(순환 참조 방지).
 
 from datetime import datetime
+from typing import Any, NamedTuple
 from uuid import UUID
 
-from sqlalchemy import DateTime, ForeignKey, delete, select
+from sqlalchemy import (
+    CTE,
+    DateTime,
+    ForeignKey,
+    Index,
+    String,
+    bindparam,
+    delete,
+    exists,
+    func,
+    insert,
+    null,
+    select,
+    true,
+    update,
+)
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapped, mapped_column
 
+from app.common.enums import NotificationKind
+from app.core.ids import new_uuid7
 from app.db.base_class import PG_UUID, Base, utc_now
+from app.domain.notifications.model import Notification
+from app.domain.posts.model import Post, PostStats
 
 
 class PostLike(Base):
@@ -23,6 +43,94 @@ class PostLike(Base):
     )
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
+    __table_args__ = (
+        # 사용자별 최근 좋아요 창(liked_cache) 적재 — PK(post_id, user_id)로는 user 기준 탐색 불가.
+        Index("idx_post_likes_user_recent", "user_id", created_at.desc()),
+    )
+
+
+class LikeOutcome(NamedTuple):
+    """좋아요·취소 한 문장(데이터 변경 CTE)의 결과.
+
+    found=False면 대상이 없거나 안 보여 아무것도 쓰지 않았다. like_count는 카운터를 이 문장에서
+    갱신했으면 갱신 후 값, 아니면(중복·write-behind 모드) 문장 시작 시점 값이다.
+    """
+
+    found: bool
+    changed: bool
+    like_count: int
+    author_id: UUID | None
+    post_id: UUID | None
+    notification_id: UUID | None
+
+
+def like_notification_cte(
+    source: Any,
+    *,
+    kind: NotificationKind,
+    actor_id: UUID,
+    post_id: Any,
+    comment_id: Any,
+) -> CTE:
+    """좋아요가 실제로 생겼고 작성자가 본인이 아니면 알림 한 행을 넣는 CTE(``RETURNING id``).
+
+    ``source``는 작성자(``author_id``)를 가진 대상 CTE와 삽입 CTE의 조인이다 — 삽입이 없으면 행도 없다.
+    알림 id는 다른 알림과 같게 앱이 만든 UUIDv7이다.
+    """
+    actor = bindparam("actor_id", actor_id, type_=PG_UUID)
+    return (
+        insert(Notification)
+        .from_select(
+            ["id", "user_id", "kind", "actor_id", "post_id", "comment_id", "created_at"],
+            select(
+                bindparam("notification_id", new_uuid7(), type_=PG_UUID),
+                source.c.author_id,
+                bindparam("kind", kind.value, type_=String),
+                actor,
+                post_id,
+                comment_id,
+                bindparam("notified_at", utc_now(), type_=DateTime(timezone=True)),
+            ).where(source.c.author_id.is_not(None), source.c.author_id != actor),
+        )
+        .returning(Notification.id)
+        .cte("notified")
+    )
+
+
+async def execute_like_outcome(
+    db: AsyncSession,
+    *,
+    target: CTE,
+    changed: CTE,
+    like_count: Any,
+    post_id: Any,
+    notified: CTE | None = None,
+) -> LikeOutcome:
+    """대상·변경·알림 CTE를 한 SELECT로 묶어 실행한다. 데이터 변경 CTE는 참조와 무관하게 한 번씩 돈다."""
+    stmt = select(
+        exists(select(target.c.author_id)).label("found"),
+        exists(select(changed.c[0])).label("changed"),
+        like_count.label("like_count"),
+        select(target.c.author_id).scalar_subquery().label("author_id"),
+        select(post_id).select_from(target).scalar_subquery().label("post_id"),
+        (
+            select(notified.c.id).scalar_subquery()
+            if notified is not None
+            else null().cast(PG_UUID)
+        ).label("notification_id"),
+    ).add_cte(changed)
+    if notified is not None:
+        stmt = stmt.add_cte(notified)
+    row = (await db.execute(stmt)).one()
+    return LikeOutcome(
+        found=bool(row.found),
+        changed=bool(row.changed),
+        like_count=int(row.like_count or 0),
+        author_id=row.author_id,
+        post_id=row.post_id,
+        notification_id=row.notification_id,
+    )
+
 
 class PostLikesModel:
     @classmethod
@@ -46,28 +154,116 @@ class PostLikesModel:
         return {r[0] for r in result.all()}
 
     @classmethod
-    async def create(cls, post_id: UUID, user_id: UUID, *, db: AsyncSession) -> bool:
-        stmt = (
+    async def get_recent_likes(
+        cls, user_id: UUID, limit: int, *, db: AsyncSession
+    ) -> list[tuple[UUID, datetime]]:
+        """최근 좋아요 (post_id, created_at) 최신순 limit건(liked_cache 창 적재)."""
+        result = await db.execute(
+            select(PostLike.post_id, PostLike.created_at)
+            .where(PostLike.user_id == user_id)
+            .order_by(PostLike.created_at.desc())
+            .limit(limit)
+        )
+        return [(r[0], r[1]) for r in result.all()]
+
+    @classmethod
+    async def delete_by_post_id(cls, post_id: UUID, db: AsyncSession) -> int:
+        r = await db.execute(
+            delete(PostLike).where(PostLike.post_id == post_id).returning(PostLike.post_id)
+        )
+        return len(list(r.scalars().all()))
+
+    @staticmethod
+    def _visible_post_cte(post_id: UUID) -> CTE:
+        return (
+            select(Post.id, Post.user_id.label("author_id"))
+            .where(
+                Post.id == post_id,
+                Post.deleted_at.is_(None),
+                Post.is_blinded.is_(False),
+            )
+            .cte("target")
+        )
+
+    @classmethod
+    async def like(
+        cls, post_id: UUID, user_id: UUID, *, bump_count: bool, db: AsyncSession
+    ) -> LikeOutcome:
+        """좋아요 한 문장 — 가시성 확인, ON CONFLICT 삽입, (삽입됐으면) 카운터 +1·작성자 알림.
+
+        예전 5왕복(가시성·삽입·카운터·작성자·알림)이 1왕복이 되고, ``bump_count``면 post_stats
+        행 잠금도 커밋 직전 한 문장 동안만 쥔다. write-behind 모드(ADR 0023)는 ``bump_count=False``.
+        """
+        target = cls._visible_post_cte(post_id)
+        actor = bindparam("actor_id", user_id, type_=PG_UUID)
+        inserted = (
             pg_insert(PostLike)
-            .values(post_id=post_id, user_id=user_id, created_at=utc_now())
+            .from_select(
+                ["post_id", "user_id", "created_at"],
+                select(
+                    target.c.id,
+                    actor,
+                    bindparam("liked_at", utc_now(), type_=DateTime(timezone=True)),
+                ),
+            )
             .on_conflict_do_nothing(index_elements=[PostLike.post_id, PostLike.user_id])
             .returning(PostLike.post_id)
+            .cte("inserted")
+        )
+        current = select(PostStats.like_count).where(PostStats.post_id == post_id).scalar_subquery()
+        like_count: Any = current
+        if bump_count:
+            bumped = (
+                update(PostStats)
+                .where(PostStats.post_id == inserted.c.post_id)
+                .values(like_count=PostStats.like_count + 1)
+                .returning(PostStats.like_count)
+                .cte("bumped")
+            )
+            like_count = func.coalesce(select(bumped.c.like_count).scalar_subquery(), current)
+        source = target.join(inserted, true()).select().subquery("source")
+        notified = like_notification_cte(
+            source,
+            kind=NotificationKind.LIKE_POST,
+            actor_id=user_id,
+            post_id=source.c.id,
+            comment_id=null(),
+        )
+        return await execute_like_outcome(
+            db,
+            target=target,
+            changed=inserted,
+            like_count=like_count,
+            post_id=target.c.id,
+            notified=notified,
         )
-        result = await db.execute(stmt)
-        return result.scalar_one_or_none() is not None
 
     @classmethod
-    async def delete(cls, post_id: UUID, user_id: UUID, db: AsyncSession) -> bool:
-        r = await db.execute(
+    async def unlike(
+        cls, post_id: UUID, user_id: UUID, *, bump_count: bool, db: AsyncSession
+    ) -> LikeOutcome:
+        """좋아요 취소 한 문장 — 가시성 확인, 삭제, (삭제됐으면) 카운터 -1(0 하한)."""
+        target = cls._visible_post_cte(post_id)
+        removed = (
             delete(PostLike)
-            .where(PostLike.post_id == post_id, PostLike.user_id == user_id)
+            .where(
+                PostLike.post_id.in_(select(target.c.id)),
+                PostLike.user_id == bindparam("actor_id", user_id, type_=PG_UUID),
+            )
             .returning(PostLike.post_id)
+            .cte("removed")
         )
-        return r.scalar_one_or_none() is not None
-
-    @classmethod
-    async def delete_by_post_id(cls, post_id: UUID, db: AsyncSession) -> int:
-        r = await db.execute(
-            delete(PostLike).where(PostLike.post_id == post_id).returning(PostLike.post_id)
+        current = select(PostStats.like_count).where(PostStats.post_id == post_id).scalar_subquery()
+        like_count: Any = current
+        if bump_count:
+            bumped = (
+                update(PostStats)
+                .where(PostStats.post_id == removed.c.post_id)
+                .values(like_count=func.greatest(PostStats.like_count - 1, 0))
+                .returning(PostStats.like_count)
+                .cte("bumped")
+            )
+            like_count = func.coalesce(select(bumped.c.like_count).scalar_subquery(), current)
+        return await execute_like_outcome(
+            db, target=target, changed=removed, like_count=like_count, post_id=target.c.id
         )
-        return len(list(r.scalars().all()))
@@ -36,8 +36,9 @@ async def unlike_post(
     post_id: Annotated[PublicId, Path(..., description="게시글 공개 ID (Base62)")],
     user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_master_db),
+    redis: RedisLike | None = Depends(get_optional_redis),
 ):
-    is_liked, like_count = await LikeService.unlike_post(post_id, user.id, db=db)
+    is_liked, like_count = await LikeService.unlike_post(post_id, user.id, db=db, redis=redis)
     return api_response(
         request,
         code=ApiCode.OK,
@@ -76,8 +77,9 @@ async def unlike_comment(
     comment_id: Annotated[PublicId, Path(..., description="댓글 공개 ID (Base62)")],
     user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_master_db),
+    redis: RedisLike | None = Depends(get_optional_redis),
 ):
-    is_liked, like_count = await LikeService.unlike_comment(comment_id, user.id, db=db)
+    is_liked, like_count = await LikeService.unlike_comment(comment_id, user.id, db=db, redis=redis)
     return api_response(
         request,
         code=ApiCode.OK,
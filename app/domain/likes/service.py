@@ -1,25 +1,44 @@
 # Likes 도메인 서비스. Full-Async. 중복 좋아요는 ON CONFLICT DO NOTHING(inserted=False)으로 처리.
-# 하나의 요청당 하나의 async with db.begin()으로 묶어 Race Condition 방지.
+# 좋아요·취소는 동작마다 데이터 변경 CTE 한 문장(가시성·원장·카운터·알림)을 자체 트랜잭션으로 보낸다.
+# 카운터는 Redis가 있으면 커밋 후 write-behind 버퍼로 보낸다(ADR 0023 — 인기글 행 잠금 줄 제거).
 
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm.exc import StaleDataError
 
 from app.common.enums import NotificationKind
-from app.common.exceptions import (
-    CommentNotFoundException,
-    ConcurrentUpdateException,
-    PostNotFoundException,
-)
-from app.domain.comments.model import CommentLikesModel, CommentsModel
-from app.domain.likes.model import PostLikesModel
-from app.domain.notifications.model import NotificationsModel
+from app.common.exceptions import CommentNotFoundException, PostNotFoundException
+from app.domain.comments.model import CommentLikesModel
+from app.domain.likes.liked_cache import invalidate_like_window
+from app.domain.likes.model import LikeOutcome, PostLikesModel
 from app.domain.notifications.service import NotificationService
-from app.domain.posts.repository import PostsModel
+from app.domain.posts.counter_buffer import counter_buffering, settle_counter
+from app.domain.posts.trending_rank import LIKE_WEIGHT, bump_trending
 from app.infra.redis import RedisLike
 
 
+async def _publish_like_notification(
+    redis: RedisLike | None,
+    outcome: LikeOutcome,
+    kind: NotificationKind,
+    actor_id: UUID,
+    *,
+    comment_id: UUID | None = None,
+) -> None:
+    """CTE가 알림 행을 넣었으면(작성자 ≠ 좋아요한 사람) 커밋 후 실시간 발행."""
+    if outcome.notification_id is None or outcome.author_id is None:
+        return
+    await NotificationService.publish_after_commit(
+        redis,
+        recipient_user_id=outcome.author_id,
+        notification_id=outcome.notification_id,
+        kind=kind,
+        actor_id=actor_id,
+        post_id=outcome.post_id,
+        comment_id=comment_id,
+    )
+
+
 class LikeService:
     @classmethod
     async def is_post_liked(cls, post_id: UUID, user_id: UUID, db: AsyncSession) -> bool:
@@ -33,68 +52,42 @@ class LikeService:
         db: AsyncSession,
         redis: RedisLike | None = None,
     ) -> tuple[bool, int, bool]:
-        notify: (
-            tuple[UUID, UUID, NotificationKind, UUID | None, UUID | None, UUID | None] | None
-        ) = None
-        inserted_out = False
-        like_count_out = 0
+        buffered = counter_buffering(redis)
         async with db.begin():
-            if not await PostsModel.post_is_visible(post_id, db=db):
+            outcome = await PostLikesModel.like(post_id, user_id, bump_count=not buffered, db=db)
+            if not outcome.found:
                 raise PostNotFoundException()
-            try:
-                inserted = await PostLikesModel.create(post_id, user_id, db=db)
-                if inserted:
-                    like_count = await PostsModel.increment_like_count(post_id, db=db)
-                    author_id = await PostsModel.get_post_author_id(post_id, db=db)
-                    if author_id and author_id != user_id:
-                        nid = await NotificationsModel.insert(
-                            user_id=author_id,
-                            kind=NotificationKind.LIKE_POST,
-                            actor_id=user_id,
-                            post_id=post_id,
-                            comment_id=None,
-                            db=db,
-                        )
-                        notify = (
-                            author_id,
-                            nid,
-                            NotificationKind.LIKE_POST,
-                            user_id,
-                            post_id,
-                            None,
-                        )
-                else:
-                    like_count = await PostsModel.get_like_count(post_id, db=db)
-                inserted_out = inserted
-                like_count_out = like_count
-            except StaleDataError as e:
-                raise ConcurrentUpdateException() from e
-        if notify is not None:
-            rec, nid, kind, act, pid, cid = notify
-            await NotificationService.publish_after_commit(
-                redis,
-                recipient_user_id=rec,
-                notification_id=nid,
-                kind=kind,
-                actor_id=act,
-                post_id=pid,
-                comment_id=cid,
+        like_count = outcome.like_count
+        if buffered:
+            like_count = await settle_counter(
+                redis, "post_like", post_id, base=like_count, delta=int(outcome.changed), db=db
             )
-        return (True, like_count_out, inserted_out)
+        await _publish_like_notification(redis, outcome, NotificationKind.LIKE_POST, user_id)
+        if outcome.changed:
+            await invalidate_like_window(redis, "post", user_id)
+            await bump_trending(redis, {post_id: LIKE_WEIGHT})
+        return (True, like_count, outcome.changed)
 
     @classmethod
-    async def unlike_post(cls, post_id: UUID, user_id: UUID, db: AsyncSession) -> tuple[bool, int]:
+    async def unlike_post(
+        cls,
+        post_id: UUID,
+        user_id: UUID,
+        db: AsyncSession,
+        redis: RedisLike | None = None,
+    ) -> tuple[bool, int]:
+        buffered = counter_buffering(redis)
         async with db.begin():
-            if not await PostsModel.post_is_visible(post_id, db=db):
+            outcome = await PostLikesModel.unlike(post_id, user_id, bump_count=not buffered, db=db)
+            if not outcome.found:
                 raise PostNotFoundException()
-            try:
-                deleted = await PostLikesModel.delete(post_id, user_id, db=db)
-                if deleted:
-                    like_count = await PostsModel.decrement_like_count(post_id, db=db)
-                else:
-                    like_count = await PostsModel.get_like_count(post_id, db=db)
-            except StaleDataError as e:
-                raise ConcurrentUpdateException() from e
+        like_count = outcome.like_count
+        if buffered:
+            like_count = await settle_counter(
+                redis, "post_like", post_id, base=like_count, delta=-int(outcome.changed), db=db
+            )
+        if outcome.changed:
+            await invalidate_like_window(redis, "post", user_id)
         return (False, like_count)
 
     @classmethod
@@ -105,69 +98,55 @@ class LikeService:
         db: AsyncSession,
         redis: RedisLike | None = None,
     ) -> tuple[bool, int, bool]:
-        notify: (
-            tuple[UUID, UUID, NotificationKind, UUID | None, UUID | None, UUID | None] | None
-        ) = None
-        inserted_out = False
-        like_count_out = 0
+        buffered = counter_buffering(redis)
         async with db.begin():
-            comment_row = await CommentsModel.get_comment_by_id(comment_id, db=db)
-            if comment_row is None:
+            outcome = await CommentLikesModel.like(
+                comment_id, user_id, bump_count=not buffered, db=db
+            )
+            if not outcome.found:
                 raise CommentNotFoundException()
-            try:
-                inserted = await CommentLikesModel.create(comment_id, user_id, db=db)
-                if inserted:
-                    like_count = await CommentsModel.increment_like_count(comment_id, db=db)
-                    author_id = comment_row.author_id
-                    if author_id and author_id != user_id:
-                        nid = await NotificationsModel.insert(
-                            user_id=author_id,
-                            kind=NotificationKind.LIKE_COMMENT,
-                            actor_id=user_id,
-                            post_id=comment_row.post_id,
-                            comment_id=comment_id,
-                            db=db,
-                        )
-                        notify = (
-                            author_id,
-                            nid,
-                            NotificationKind.LIKE_COMMENT,
-                            user_id,
-                            comment_row.post_id,
-                            comment_id,
-                        )
-                else:
-                    like_count = await CommentsModel.get_like_count(comment_id, db=db)
-                inserted_out = inserted
-                like_count_out = like_count
-            except StaleDataError as e:
-                raise ConcurrentUpdateException() from e
-        if notify is not None:
-            rec, nid, kind, act, pid, cid = notify
-            await NotificationService.publish_after_commit(
+        like_count = outcome.like_count
+        if buffered:
+            like_count = await settle_counter(
                 redis,
-                recipient_user_id=rec,
-                notification_id=nid,
-                kind=kind,
-                actor_id=act,
-                post_id=pid,
-                comment_id=cid,
+                "comment_like",
+                comment_id,
+                base=like_count,
+                delta=int(outcome.changed),
+                db=db,
             )
-        return (True, like_count_out, inserted_out)
+        await _publish_like_notification(
+            redis, outcome, NotificationKind.LIKE_COMMENT, user_id, comment_id=comment_id
+        )
+        if outcome.changed:
+            await invalidate_like_window(redis, "comment", user_id)
+        return (True, like_count, outcome.changed)
 
     @classmethod
     async def unlike_comment(
-        cls, comment_id: UUID, user_id: UUID, db: AsyncSession
+        cls,
+        comment_id: UUID,
+        user_id: UUID,
+        db: AsyncSession,
+        redis: RedisLike | None = None,
     ) -> tuple[bool, int]:
+        buffered = counter_buffering(redis)
         async with db.begin():
-            if await CommentsModel.get_comment_by_id(comment_id, db=db) is None:
+            outcome = await CommentLikesModel.unlike(
+                comment_id, user_id, bump_count=not buffered, db=db
+            )
+            if not outcome.found:
                 raise CommentNotFoundException()
-            try:
-                deleted = await CommentLikesModel.delete(comment_id, user_id, db=db)
-                if deleted:
-                    like_count = await CommentsModel.decrement_like_count(comment_id, db=db)
-                else:
-                    like_count = await CommentsModel.get_like_count(comment_id, db=db)
-            except StaleDataError as e:
-                raise ConcurrentUpdateException() from e
+        like_count = outcome.like_count
+        if buffered:
+            like_count = await settle_counter(
+                redis,
+                "comment_like",
+                comment_id,
+                base=like_count,
+                delta=-int(outcome.changed),
+                db=db,
+            )
+        if outcome.changed:
+            await invalidate_like_window(redis, "comment", user_id)
         return (False, like_count)
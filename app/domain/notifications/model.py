@@ -77,6 +77,7 @@ class NotificationsModel:
         cursor_id: UUID | None,
         size: int,
         db: AsyncSession,
+        since_id: UUID | None = None,
     ) -> tuple[list[Notification], bool]:
         """수신자 알림 keyset 목록(최신순). cursor_id는 직전 페이지 마지막 알림 id.
 
@@ -84,10 +85,13 @@ class NotificationsModel:
         단일 컬럼 keyset(id < cursor, ORDER BY id DESC)을 쓴다. 커서 행을 조회하지 않으므로 커서
         알림이 보관정책으로 삭제돼도 400 없이 다음 페이지를 반환하고, 타 수신자 id를 커서로 넣어도
         내 알림만 필터되어 노출되지 않는다. size+1 조회로 초과분 존재 여부를 판정한다.
+        since_id는 하한(id > since) — 폴링 시 새 알림만, 없으면 인덱스 탐색 한 번으로 끝난다.
         """
         stmt = select(Notification).where(Notification.user_id == user_id)
         if cursor_id is not None:
             stmt = stmt.where(Notification.id < cursor_id)
+        if since_id is not None:
+            stmt = stmt.where(Notification.id > since_id)
         stmt = stmt.order_by(Notification.id.desc()).limit(size + 1)
         rows = list((await db.execute(stmt)).scalars().all())
         has_more = len(rows) > size
@@ -18,6 +18,7 @@ from app.common import (
     ApiResponse,
     CursorPage,
     OptionalPublicId,
+    api_etag_response,
     api_response,
 )
 from app.domain.notifications.schema import (
@@ -62,13 +63,23 @@ async def list_notifications(
         Query(description="무한 스크롤: 직전 응답의 마지막 알림 id(공개 ID). 미지정 시 처음부터."),
     ] = None,
     size: int = Query(20, ge=1, le=100),
+    since: Annotated[
+        OptionalPublicId,
+        Query(
+            description="폴링: 클라이언트가 가진 맨 위 알림 id(공개 ID). 그보다 새 알림만, "
+            "hasMore=true면 size보다 많아 잘린 것."
+        ),
+    ] = None,
     user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_slave_db),
 ):
     items, has_more = await NotificationService.list_notifications(
-        user.id, cursor_id=cursor, size=size, db=db
+        user.id, cursor_id=cursor, size=size, db=db, since_id=since
     )
-    return api_response(request, code=ApiCode.OK, data=CursorPage(items=items, has_more=has_more))
+    data = CursorPage(items=items, has_more=has_more)
+    if cursor is None:
+        return api_etag_response(request, code=ApiCode.OK, data=data)
+    return api_response(request, code=ApiCode.OK, data=data)
 
 
 @router.patch("/read", status_code=200, response_model=ApiResponse[MarkNotificationsReadData])
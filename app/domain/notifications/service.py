@@ -284,10 +284,11 @@ class NotificationService:
         cursor_id: UUID | None,
         size: int,
         db: AsyncSession,
+        since_id: UUID | None = None,
     ) -> tuple[list[NotificationItem], bool]:
         async with db.begin():
             rows, has_more = await NotificationsModel.list_for_user(
-                user_id, cursor_id=cursor_id, size=size, db=db
+                user_id, cursor_id=cursor_id, size=size, db=db, since_id=since_id
             )
         return [cls.row_to_item(r) for r in rows], has_more
 
@@ -0,0 +1,392 @@
+# 좋아요·댓글 수 write-behind(ADR 0023). 조회수 버퍼(ADR 0007)와 같은 모델이다.
+# 좋아요·취소·댓글 작성·삭제는 원장 행(post_likes·comment_likes·comments)만 트랜잭션에서 쓰고, 커밋 후
+# 카운터 delta를 Redis 해시에 HINCRBY로 쌓는다. lifespan 루프가 분산 락 + RENAME drain으로 모아
+# 테이블별 청크 집합 UPDATE로 반영한다 — 인기글 행에 요청마다 걸리던 행 잠금 줄이 사라진다.
+# 상세·좋아요 응답·댓글 페이지는 DB 값에 pending을 더해 보정하고, flush 후에는 상세·댓글 페이지 캐시를
+# 끊는다. Redis 불능이면 DB 직접 반영으로 폴백.
+# 별도 루프의 주기 reconcile이 원장으로 카운터를 다시 세어(버퍼 pending은 빼고) 드리프트를 바로잡는다.
+import asyncio
+import logging
+import secrets
+import time
+from collections.abc import Sequence
+from typing import Literal
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.ids import new_ulid_str
+from app.core.metrics import COUNTER_BUFFER_FLUSHED_DELTAS, COUNTER_RECONCILED_ROWS
+from app.domain.comments.model import CommentsModel
+from app.domain.comments.page_cache import invalidate_comment_pages
+from app.domain.posts.post_cache import invalidate_post_detail_cache
+from app.domain.posts.repository import PostsModel
+from app.domain.posts.view_buffer import RENAME_BUFFER_TO_DRAIN_LUA, merge_drain_into_buffer
+from app.infra.redis import RedisLike, bulk_to_str
+
+log = logging.getLogger(__name__)
+
+CounterKind = Literal["post_like", "post_comment", "comment_like"]
+
+# 필드 = "{종류}:{id}". 세 카운터를 해시 하나에 담아 drain 한 번으로 함께 반영한다.
+_FIELD_PREFIX: dict[CounterKind, str] = {
+    "post_like": "pl",
+    "post_comment": "pc",
+    "comment_like": "cl",
+}
+_KIND_BY_PREFIX: dict[str, CounterKind] = {v: k for k, v in _FIELD_PREFIX.items()}
+
+# {c}는 클러스터 해시 태그 — buffer·락·drain·reconcile 커서가 같은 슬롯이어야 RENAME이 성립한다.
+COUNTER_BUFFER_KEY = "counters:{c}:buffer"
+COUNTER_FLUSH_LOCK_KEY = "counters:{c}:flush:lock"
+COUNTER_RECONCILE_LOCK_KEY = "counters:{c}:reconcile:lock"
+_RECONCILE_DUE_KEY = "counters:{c}:reconcile:due"
+_RECONCILE_TABLES = ("posts", "comments")
+# reconcile 배치가 flush 락을 기다리는 상한·폴링 간격(초).
+_FLUSH_LOCK_WAIT_SECONDS = 5.0
+_FLUSH_LOCK_POLL_SECONDS = 0.05
+# 락 해제 CAS: 내가 건 락일 때만 삭제.
+_RELEASE_LOCK_LUA = (
+    "if redis.call('GET', KEYS[1]) == ARGV[1] then return redis.call('DEL', KEYS[1]) "
+    "else return 0 end"
+)
+
+
+def _reconcile_cursor_key(table: str) -> str:
+    return f"counters:{{c}}:reconcile:{table}"
+
+
+def counter_field(kind: CounterKind, target_id: UUID) -> str:
+    return f"{_FIELD_PREFIX[kind]}:{target_id}"
+
+
+def counter_buffering(redis: RedisLike | None) -> bool:
+    """카운터를 버퍼로 보낼지. False면 호출부가 기존처럼 트랜잭션 안에서 행을 갱신한다."""
+    return redis is not None and settings.COUNTER_BUFFER_FLUSH_INTERVAL_SECONDS > 0
+
+
+async def _pending(redis: RedisLike | None, fields: list[str]) -> list[int]:
+    # HMGET 1왕복. 실패·미사용은 0(fail-open).
+    if not fields or not counter_buffering(redis):
+        return [0] * len(fields)
+    assert redis is not None
+    try:
+        raw = await redis.hmget(COUNTER_BUFFER_KEY, fields)
+    except Exception as e:
+        log.warning("카운터 버퍼 HMGET 실패(Fail-open 0): %s", e)
+        return [0] * len(fields)
+    return [int(v) if v is not None else 0 for v in raw]
+
+
+async def get_counter_pending(
+    redis: RedisLike | None, kind: CounterKind, target_ids: Sequence[UUID]
+) -> list[int]:
+    """아직 DB에 안 나간 delta(id 순서 그대로)."""
+    return await _pending(redis, [counter_field(kind, t) for t in target_ids])
+
+
+async def get_post_counter_pending(redis: RedisLike | None, post_id: UUID) -> tuple[int, int]:
+    """글 상세 보정용 (좋아요 pending, 댓글 pending) — 한 번에 읽는다."""
+    likes, comments = await _pending(
+        redis, [counter_field("post_like", post_id), counter_field("post_comment", post_id)]
+    )
+    return likes, comments
+
+
+async def _apply_db_delta(
+    kind: CounterKind, target_id: UUID, delta: int, *, db: AsyncSession
+) -> int:
+    # 모델 메서드는 호출 시점에 찾는다(테스트 monkeypatch·재정의가 반영되게).
+    if kind == "post_like":
+        if delta > 0:
+            return await PostsModel.increment_like_count(target_id, db=db)
+        return await PostsModel.decrement_like_count(target_id, db=db)
+    if kind == "comment_like":
+        if delta > 0:
+            return await CommentsModel.increment_like_count(target_id, db=db)
+        return await CommentsModel.decrement_like_count(target_id, db=db)
+    if delta > 0:
+        await PostsModel.increment_comment_count(target_id, db=db)
+    else:
+        await PostsModel.decrement_comment_count(target_id, db=db)
+    return 0
+
+
+async def settle_counter(
+    redis: RedisLike | None,
+    kind: CounterKind,
+    target_id: UUID,
+    *,
+    base: int,
+    delta: int,
+    db: AsyncSession,
+) -> int:
+    """원장 커밋 후 호출. delta를 버퍼에 쌓고 응답용 카운터(DB 값 base + pending)를 돌려준다.
+
+    delta=0이면 pending만 읽는다. 버퍼에 못 쌓으면(Redis 오류) 새 트랜잭션으로 DB에 직접 반영하고
+    그 결과를 돌려준다 — 원장은 이미 커밋돼 있어 카운터만 따라가면 된다.
+    """
+    if not delta:
+        return max(base + (await get_counter_pending(redis, kind, [target_id]))[0], 0)
+    if counter_buffering(redis):
+        assert redis is not None
+        try:
+            pending = await redis.hincrby(COUNTER_BUFFER_KEY, counter_field(kind, target_id), delta)
+            return max(base + int(pending), 0)
+        except Exception as e:
+            log.warning("카운터 버퍼 HINCRBY 실패(DB 직접 반영): %s", e)
+    async with db.begin():
+        return await _apply_db_delta(kind, target_id, delta, db=db)
+
+
+async def write_counter_deltas(
+    post_deltas: dict[UUID, tuple[int, int]], comment_deltas: dict[UUID, int]
+) -> tuple[int, set[UUID]]:
+    """drain 한 번 분을 한 트랜잭션에 반영한다(테이블별 청크 집합 UPDATE).
+
+    반환 = (갱신 행 수, 좋아요 수가 바뀐 댓글들의 post_id — 댓글 페이지 캐시 무효화용).
+
+    id 오름차순 — 동시 writer(폴백 경로·관리자 삭제)와 행 잠금 순서를 맞춘다. 실패 시 전체 롤백 후 raise.
+    """
+    from app.db.session import get_connection
+
+    posts = sorted((pid, lk, cm) for pid, (lk, cm) in post_deltas.items() if lk or cm)
+    comments = sorted((cid, d) for cid, d in comment_deltas.items() if d)
+    chunk = settings.COUNTER_FLUSH_BATCH_SIZE
+    updated_rows = 0
+    comment_post_ids: set[UUID] = set()
+    async with get_connection() as db:
+        async with db.begin():
+            for i in range(0, len(posts), chunk):
+                updated_rows += await PostsModel.apply_counter_deltas_bulk(
+                    posts[i : i + chunk], db=db
+                )
+            for i in range(0, len(comments), chunk):
+                post_ids = await CommentsModel.apply_like_count_deltas_bulk(
+                    comments[i : i + chunk], db=db
+                )
+                updated_rows += len(post_ids)
+                comment_post_ids.update(post_ids)
+    return updated_rows, comment_post_ids
+
+
+def _parse_drain(
+    fields: dict,
+) -> tuple[dict[UUID, tuple[int, int]], dict[UUID, int], dict[CounterKind, int]]:
+    post_deltas: dict[UUID, tuple[int, int]] = {}
+    comment_deltas: dict[UUID, int] = {}
+    totals: dict[CounterKind, int] = dict.fromkeys(_FIELD_PREFIX, 0)
+    for raw_field, raw_delta in fields.items():
+        prefix, _, raw_id = (bulk_to_str(raw_field) or "").partition(":")
+        kind = _KIND_BY_PREFIX.get(prefix)
+        delta = int(raw_delta)
+        if kind is None or not delta:
+            continue
+        target_id = UUID(raw_id)
+        totals[kind] += abs(delta)
+        if kind == "comment_like":
+            comment_deltas[target_id] = comment_deltas.get(target_id, 0) + delta
+            continue
+        likes, comments = post_deltas.get(target_id, (0, 0))
+        if kind == "post_like":
+            likes += delta
+        else:
+            comments += delta
+        post_deltas[target_id] = (likes, comments)
+    return post_deltas, comment_deltas, totals
+
+
+async def _flush_drain(redis: RedisLike) -> None:
+    drain_key = f"counters:{{c}}:drain:{new_ulid_str()}"
+    if not int(await redis.eval(RENAME_BUFFER_TO_DRAIN_LUA, 2, COUNTER_BUFFER_KEY, drain_key)):
+        return
+    fields = await redis.hgetall(drain_key)
+    if not fields:
+        await redis.delete(drain_key)
+        return
+    try:
+        post_deltas, comment_deltas, totals = _parse_drain(fields)
+        _, comment_post_ids = await write_counter_deltas(post_deltas, comment_deltas)
+    except Exception:
+        # DB 트랜잭션이 롤백된 경우에만 재병합해야 이중 반영이 없다.
+        await merge_drain_into_buffer(redis, drain_key, COUNTER_BUFFER_KEY)
+        raise
+    for kind, total in totals.items():
+        if total:
+            COUNTER_BUFFER_FLUSHED_DELTAS.labels(counter=kind).inc(total)
+    # 상세 스냅샷의 카운터가 pending 없이 옛 값으로 남지 않게(스냅샷 + 줄어든 pending = 뒤로 감).
+    await invalidate_post_detail_cache(redis, *post_deltas)
+    # 댓글 풀도 같은 이유 — flush로 pending이 빠진 만큼 풀의 like_count가 옛 DB 값으로 뒤로 간다.
+    await invalidate_comment_pages(redis, *sorted(comment_post_ids))
+    # 커밋 후에는 delta가 durable — drain 삭제 실패를 재병합하면 이중 반영이다. best-effort.
+    try:
+        await redis.delete(drain_key)
+    except Exception as e:
+        log.warning("카운터 flush drain 삭제 실패(반영은 완료, stale 키만 잔존): %s", e)
+
+
+async def _buffered_deltas(redis: RedisLike, kind: CounterKind, ids: list[UUID]) -> list[int]:
+    # reconcile 전용 HMGET — 실패를 0으로 삼키면 원장 수가 pending을 또 세게 되므로 배치째 실패시킨다.
+    if not ids:
+        return []
+    raw = await redis.hmget(COUNTER_BUFFER_KEY, [counter_field(kind, t) for t in ids])
+    return [int(v) if v is not None else 0 for v in raw]
+
+
+async def _pending_columns(
+    redis: RedisLike, kinds: tuple[CounterKind, ...], ids: list[UUID]
+) -> dict[UUID, tuple[int, ...]]:
+    columns = [await _buffered_deltas(redis, kind, ids) for kind in kinds]
+    return {t: tuple(col[i] for col in columns) for i, t in enumerate(ids)}
+
+
+def _settled_targets(
+    ledger: dict[UUID, tuple[int, ...]],
+    before: dict[UUID, tuple[int, ...]],
+    after: dict[UUID, tuple[int, ...]],
+) -> dict[UUID, tuple[int, ...]]:
+    """목표값 = 원장 수 − pending. 원장을 세는 동안 pending이 움직인 행은 이번 바퀴에서 뺀다.
+
+    writer는 원장 커밋 후 HINCRBY한다. 집계 중에 커밋된 delta는 원장에 들었는지 한 번의 HMGET으로는
+    알 수 없다 — 집계 앞뒤 pending이 같으면 그 사이 HINCRBY가 없었으므로 pending이 곧 원장이 센 몫이다.
+    """
+    targets: dict[UUID, tuple[int, ...]] = {}
+    for target_id, counts in ledger.items():
+        pending = after[target_id]
+        if pending != before[target_id]:
+            continue
+        targets[target_id] = tuple(max(n - p, 0) for n, p in zip(counts, pending, strict=True))
+    return targets
+
+
+async def _reconcile_batch(
+    redis: RedisLike, table: str, after: UUID | None
+) -> tuple[UUID | None, int]:
+    """배치 id → pending HMGET → 원장 집계 → pending HMGET → 목표값 UPDATE(한 트랜잭션).
+
+    호출부가 flush 락을 쥐고 부른다 — 읽은 pending을 그 사이 drain이 DB로 옮기면 목표값이 그만큼
+    모자란다.
+    """
+    from app.db.session import get_connection
+
+    limit = settings.COUNTER_RECONCILE_BATCH_SIZE
+    async with get_connection() as db:
+        async with db.begin():
+            if table == "posts":
+                kinds: tuple[CounterKind, ...] = ("post_like", "post_comment")
+                ids = await PostsModel.counter_reconcile_ids(after, limit, db=db)
+                before = await _pending_columns(redis, kinds, ids)
+                counted = await PostsModel.counter_ledger_counts(ids, db=db)
+                settled = _settled_targets(
+                    {pid: (lk, cm) for pid, lk, cm in counted},
+                    before,
+                    await _pending_columns(redis, kinds, ids),
+                )
+                fixed = await PostsModel.reconcile_counters(
+                    [(pid, lk, cm) for pid, (lk, cm) in settled.items()], db=db
+                )
+            else:
+                kinds = ("comment_like",)
+                ids = await CommentsModel.counter_reconcile_ids(after, limit, db=db)
+                before = await _pending_columns(redis, kinds, ids)
+                counted = await CommentsModel.counter_ledger_counts(ids, db=db)
+                settled = _settled_targets(
+                    {cid: (lk,) for cid, lk in counted},
+                    before,
+                    await _pending_columns(redis, kinds, ids),
+                )
+                fixed = await CommentsModel.reconcile_counters(
+                    [(cid, lk) for cid, (lk,) in settled.items()], db=db
+                )
+    return (ids[-1] if len(ids) == limit else None), fixed
+
+
+async def _try_lock(redis: RedisLike, key: str, ttl_seconds: int) -> str | None:
+    value = secrets.token_urlsafe(24)
+    return value if await redis.set(key, value, nx=True, ex=ttl_seconds) else None
+
+
+async def _release_lock(redis: RedisLike, key: str, value: str) -> None:
+    try:
+        await redis.eval(_RELEASE_LOCK_LUA, 1, key, value)
+    except Exception as e:
+        log.warning("카운터 락 해제 실패(%s): %s", key, e)
+
+
+async def _wait_flush_lock(redis: RedisLike) -> str | None:
+    # flush 한 번은 보통 수십 ms — 짧게 기다려 보고, 못 잡으면 이번 조각을 접는다(커서는 남는다).
+    deadline = time.monotonic() + _FLUSH_LOCK_WAIT_SECONDS
+    while True:
+        value = await _try_lock(redis, COUNTER_FLUSH_LOCK_KEY, settings.COUNTER_FLUSH_LOCK_SECONDS)
+        if value is not None or time.monotonic() >= deadline:
+            return value
+        await asyncio.sleep(_FLUSH_LOCK_POLL_SECONDS)
+
+
+async def reconcile_counters_slice(redis: RedisLike) -> int:
+    """원장 재계산을 커서에서 이어 한 조각 돈다(테이블별 최대 MAX_BATCHES 배치). 고친 행 수.
+
+    배치마다 flush 락을 잡았다 놓는다 — flush는 조각 전체가 아니라 배치 하나만큼만 밀린다. 락 안이라
+    배치가 pending을 읽는 사이 drain이 그 pending을 DB로 옮기지 않는다. 커서가 없는 테이블은 처음부터
+    다시 훑는다.
+    """
+    fixed_total = 0
+    for table in _RECONCILE_TABLES:
+        key = _reconcile_cursor_key(table)
+        cursor = bulk_to_str(await redis.get(key))
+        after = UUID(cursor) if cursor else None
+        fixed = 0
+        for _ in range(settings.COUNTER_RECONCILE_MAX_BATCHES):
+            lock_value = await _wait_flush_lock(redis)
+            if lock_value is None:
+                break
+            try:
+                next_after, n = await _reconcile_batch(redis, table, after)
+            finally:
+                await _release_lock(redis, COUNTER_FLUSH_LOCK_KEY, lock_value)
+            fixed += n
+            after = next_after
+            if after is None:
+                break
+        if fixed:
+            COUNTER_RECONCILED_ROWS.labels(table=table).inc(fixed)
+            fixed_total += fixed
+        if after is None:
+            await redis.delete(key)
+        else:
+            await redis.set(key, str(after))
+    return fixed_total
+
+
+async def run_counter_reconcile(redis: RedisLike | None) -> int:
+    """reconcile 루프 진입점 — 주기마다 인스턴스 1대만 한 조각 돈다. 고친 행 수.
+
+    due 마커(SET NX EX = 주기)가 주기당 한 번을, reconcile 락이 조각끼리 겹치지 않음을 보장한다.
+    flush 락과는 배치 단위로만 겹친다(``reconcile_counters_slice``).
+    """
+    interval = settings.COUNTER_RECONCILE_INTERVAL_SECONDS
+    if redis is None or interval <= 0:
+        return 0
+    if not await redis.set(_RECONCILE_DUE_KEY, "1", nx=True, ex=interval):
+        return 0
+    lock_value = await _try_lock(redis, COUNTER_RECONCILE_LOCK_KEY, interval)
+    if lock_value is None:
+        return 0
+    try:
+        return await reconcile_counters_slice(redis)
+    finally:
+        await _release_lock(redis, COUNTER_RECONCILE_LOCK_KEY, lock_value)
+
+
+async def flush_counters_to_db(redis: RedisLike | None) -> None:
+    """카운터 버퍼를 DB에 반영한다(틱당 인스턴스 1대 — 분산 락)."""
+    if redis is None:
+        return
+    lock_value = await _try_lock(redis, COUNTER_FLUSH_LOCK_KEY, settings.COUNTER_FLUSH_LOCK_SECONDS)
+    if lock_value is None:
+        return
+    try:
+        await _flush_drain(redis)
+    finally:
+        await _release_lock(redis, COUNTER_FLUSH_LOCK_KEY, lock_value)
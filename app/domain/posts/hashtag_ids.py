@@ -0,0 +1,51 @@
+# 해시태그 이름 → id 프로세스 로컬 캐시(ADR 0022).
+# hashtags 행은 앱이 지우지 않고 name은 unique라 (name, id) 짝은 한 번 보이면 바뀌지 않는다. 그래서 TTL도
+# 무효화 신호도 없이 bounded LRU로만 둔다. 글 작성·수정의 해시태그 동기화는 여기 있는 이름의 upsert를
+# 건너뛴다(충돌 검사·시퀀스 소비 없음). 운영자가 행을 직접 지워 id가 사라졌다면 동기화 문장이
+# 그 id를 못 찾는다. 그때 호출부가 evict하고 upsert 경로로 다시 푼다.
+from collections import OrderedDict
+from collections.abc import Iterable
+
+# 이름 하나가 대략 100B — 상한 1만 개면 1MB 안쪽이다. 인기 태그는 LRU 앞쪽에 남는다.
+_HASHTAG_ID_CACHE_SIZE = 10_000
+
+
+class HashtagIdCache:
+    """이름 → id bounded LRU. 단일 이벤트 루프에서만 만지므로 락이 없다."""
+
+    def __init__(self, max_entries: int = _HASHTAG_ID_CACHE_SIZE) -> None:
+        self._ids: OrderedDict[str, int] = OrderedDict()
+        self._max_entries = max_entries
+
+    def split(self, names: Iterable[str]) -> tuple[dict[str, int], list[str]]:
+        """(캐시에 있는 이름 → id, 캐시에 없는 이름). 없는 이름의 순서는 입력 순서를 따른다."""
+        known: dict[str, int] = {}
+        unknown: list[str] = []
+        for name in names:
+            hid = self._ids.get(name)
+            if hid is None:
+                unknown.append(name)
+            else:
+                self._ids.move_to_end(name)
+                known[name] = hid
+        return known, unknown
+
+    def put_many(self, id_by_name: dict[str, int]) -> None:
+        for name, hid in id_by_name.items():
+            self._ids[name] = hid
+            self._ids.move_to_end(name)
+        while len(self._ids) > self._max_entries:
+            self._ids.popitem(last=False)
+
+    def discard(self, names: Iterable[str]) -> None:
+        for name in names:
+            self._ids.pop(name, None)
+
+    def clear(self) -> None:
+        self._ids.clear()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+hashtag_ids = HashtagIdCache()
@@ -0,0 +1,196 @@
+# 해시태그 자동완성 — 프로세스 로컬 접두사 인덱스(ADR 0016).
+# 이름 정렬 배열 + 사용 수 dict. 접두사 구간을 bisect로 잘라 사용 수 상위 k개를 고른다 — 요청마다
+# DB·Redis 왕복이 없다. 구간이 큰 1–2글자 접두사는 사용 수 상위 목록을 미리 들고 있다. 인덱스는 lifespan 루프가 기동 시·주기마다 DB 스냅샷으로 통째 교체하고,
+# 그 사이 글 작성·수정·삭제의 해시태그 증감은 커밋 후 발행자가 로컬에 바로 반영한 뒤 broadcast
+# 채널로 다른 인스턴스에 전파한다. pub/sub은 at-most-once라 유실분은 다음 재빌드가 바로잡는다.
+# 스냅샷이 아직 없는(콜드 스타트·루프 꺼짐) 프로세스는 호출부가 DB 접두사 검색으로 폴백한다.
+import asyncio
+import heapq
+import json
+import logging
+import re
+import time
+from bisect import bisect_left, insort
+from collections.abc import Iterable
+
+from app.core.config import settings
+from app.core.metrics import HASHTAG_INDEX_SIZE
+from app.infra.pubsub import publish_broadcast
+from app.infra.redis import RedisLike
+
+log = logging.getLogger(__name__)
+
+HASHTAG_INDEX_CHANNEL = "hashtag:index"
+
+# 해시태그 저장 규칙(_normalize_hashtags)과 같은 문자 집합 — 접두사도 같은 공간에서 비교한다.
+_PREFIX_DISALLOWED_RE = re.compile(r"[^0-9a-z가-힣_]")
+# 접두사 구간 상한(이름순 앞에서부터). 3글자 이상 접두사가 수만 개를 훑어 서브 ms 예산을 넘지 않게.
+_MAX_SCAN = 5000
+# 이 길이 이하 접두사는 구간이 커서 이름순 상한으로 자르면 많이 쓰는 태그가 잘린다 — 접두사별
+# 사용 수 상위 _SHORT_TOP_K개를 따로 유지한다(라우터 limit 상한 20보다 크게).
+_SHORT_PREFIX_LEN = 2
+_SHORT_TOP_K = 32
+# 구간 끝 경계: 정규화된 이름 문자(최대 '힣')보다 큰 코드 포인트.
+_RANGE_END = "\uffff"
+_COLD_RETRY_SECONDS = 15
+
+
+def normalize_hashtag_prefix(raw: str) -> str:
+    s = raw.strip()
+    if s.startswith("#"):
+        s = s[1:]
+    return _PREFIX_DISALLOWED_RE.sub("", "".join(s.lower().split()))
+
+
+def hashtag_usage_delta(old: Iterable[str], new: Iterable[str]) -> dict[str, int]:
+    """글 하나의 해시태그 교체 → 이름별 사용 수 증감(+1/-1). 변화 없는 이름은 빠진다."""
+    old_set, new_set = set(old), set(new)
+    delta = dict.fromkeys(new_set - old_set, 1)
+    delta.update(dict.fromkeys(old_set - new_set, -1))
+    return delta
+
+
+def _short_prefixes(name: str) -> list[str]:
+    return [name[:n] for n in range(1, min(len(name), _SHORT_PREFIX_LEN) + 1)]
+
+
+class HashtagPrefixIndex:
+    """이름 정렬 배열 + 사용 수 + 짧은 접두사별 상위 목록. 단일 이벤트 루프에서만 만지므로 락이 없다."""
+
+    def __init__(self) -> None:
+        self._names: list[str] = []
+        self._counts: dict[str, int] = {}
+        # 짧은 접두사 → 사용 수 내림차순(동률은 이름순) 상위 _SHORT_TOP_K개 이름.
+        self._short_top: dict[str, list[str]] = {}
+        self._loaded_at: float | None = None
+
+    @property
+    def ready(self) -> bool:
+        return self._loaded_at is not None
+
+    def replace(self, counts: dict[str, int]) -> None:
+        """DB 스냅샷으로 통째 교체(사용 0 이하는 뺀다)."""
+        self._counts = {name: n for name, n in counts.items() if n > 0}
+        self._names = sorted(self._counts)
+        buckets: dict[str, list[str]] = {}
+        for name in self._names:
+            for p in _short_prefixes(name):
+                buckets.setdefault(p, []).append(name)
+        self._short_top = {p: self._top(names, _SHORT_TOP_K) for p, names in buckets.items()}
+        self._loaded_at = time.monotonic()
+        HASHTAG_INDEX_SIZE.set(len(self._names))
+
+    def apply(self, delta: dict[str, int]) -> None:
+        for name, d in delta.items():
+            old = self._counts.get(name, 0)
+            n = old + d
+            if n > 0:
+                if name not in self._counts:
+                    insort(self._names, name)
+                self._counts[name] = n
+            elif name in self._counts:
+                del self._counts[name]
+                i = bisect_left(self._names, name)
+                if i < len(self._names) and self._names[i] == name:
+                    del self._names[i]
+            for p in _short_prefixes(name):
+                self._update_short_top(p, name, decreased=n < old)
+        HASHTAG_INDEX_SIZE.set(len(self._names))
+
+    def _top(self, names: Iterable[str], limit: int) -> list[str]:
+        counts = self._counts
+        return heapq.nsmallest(limit, names, key=lambda n: (-counts[n], n))
+
+    def _update_short_top(self, prefix: str, name: str, *, decreased: bool) -> None:
+        top = self._short_top.get(prefix, [])
+        if name in top and decreased:
+            # 상위 목록의 이름이 줄면 밖의 이름이 앞설 수 있다 — 그 접두사 구간만 다시 고른다.
+            # 감소(글 삭제·태그 제거)는 드물고, 증가는 아래 삽입만으로 정확하다.
+            self._short_top[prefix] = self._top(self._prefix_range(prefix), _SHORT_TOP_K)
+            return
+        if name in top:
+            top.remove(name)
+        if name in self._counts:
+            top.append(name)
+            self._short_top[prefix] = self._top(top, _SHORT_TOP_K)
+
+    def _prefix_range(self, prefix: str) -> list[str]:
+        lo = bisect_left(self._names, prefix)
+        return self._names[lo : bisect_left(self._names, prefix + _RANGE_END, lo)]
+
+    def suggest(self, prefix: str, limit: int) -> list[tuple[str, int]]:
+        """정규화된 접두사로 시작하는 이름을 사용 수 내림차순(동률은 이름순)으로 limit개."""
+        if not prefix or limit <= 0:
+            return []
+        counts = self._counts
+        if len(prefix) <= _SHORT_PREFIX_LEN and limit <= _SHORT_TOP_K:
+            return [(name, counts[name]) for name in self._short_top.get(prefix, [])[:limit]]
+        lo = bisect_left(self._names, prefix)
+        hi = min(bisect_left(self._names, prefix + _RANGE_END, lo), lo + _MAX_SCAN)
+        return [(name, counts[name]) for name in self._top(self._names[lo:hi], limit)]
+
+    def clear(self) -> None:
+        self._names = []
+        self._counts = {}
+        self._short_top = {}
+        self._loaded_at = None
+        HASHTAG_INDEX_SIZE.set(0)
+
+
+hashtag_index = HashtagPrefixIndex()
+
+
+async def publish_hashtag_usage(
+    redis: RedisLike | None, old: Iterable[str], new: Iterable[str]
+) -> None:
+    """커밋 후 호출: 로컬 인덱스에 먼저 반영하고 다른 인스턴스로 broadcast(실패는 삼킨다)."""
+    delta = hashtag_usage_delta(old, new)
+    if not delta:
+        return
+    if hashtag_index.ready:
+        hashtag_index.apply(delta)
+    await publish_broadcast(redis, HASHTAG_INDEX_CHANNEL, json.dumps(delta, ensure_ascii=False))
+
+
+async def handle_hashtag_usage(payload: str) -> None:
+    """`HASHTAG_INDEX_CHANNEL` 수신 핸들러. 스냅샷 전이면 버린다 — 곧 올 스냅샷이 포함한다."""
+    if not hashtag_index.ready:
+        return
+    try:
+        raw = json.loads(payload)
+        delta = {str(k): int(v) for k, v in raw.items()}
+    except Exception:
+        log.warning("hashtag index event invalid", exc_info=False)
+        return
+    hashtag_index.apply(delta)
+
+
+async def _load_snapshot() -> dict[str, int]:
+    from app.db.session import get_reader_connection
+    from app.domain.posts.repository import PostsModel
+
+    async with get_reader_connection() as db, db.begin():
+        return await PostsModel.get_hashtag_usage_counts(db=db)
+
+
+async def run_hashtag_index_loop(stop_event: asyncio.Event) -> None:
+    """lifespan 루프: 기동 즉시 스냅샷을 싣고 HASHTAG_SUGGEST_REBUILD_INTERVAL_SECONDS마다 교체."""
+    interval = settings.HASHTAG_SUGGEST_REBUILD_INTERVAL_SECONDS
+    while not stop_event.is_set():
+        try:
+            started = time.perf_counter()
+            counts = await _load_snapshot()
+            hashtag_index.replace(counts)
+            log.info(
+                "hashtag_index_rebuilt names=%d elapsed_ms=%.1f",
+                len(counts),
+                (time.perf_counter() - started) * 1000,
+            )
+        except Exception:
+            log.exception("해시태그 인덱스 재빌드 실패 — 기존 인덱스(또는 DB 폴백) 유지")
+        # 첫 스냅샷 전이면 짧게 재시도한다 — 그동안 자동완성이 전부 DB 폴백을 탄다.
+        wait = interval if hashtag_index.ready else min(interval, _COLD_RETRY_SECONDS)
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=wait)
+        except TimeoutError:
+            pass
@@ -0,0 +1,58 @@
+# 게시글 목록 Core 프로젝션 행(PostsModel.get_all_post_rows·get_list_post_rows_by_ids의 Row — 컬럼명
+# 속성 접근) → PostResponse (ADR 0018).
+# ORM 경로는 Post 엔티티 그래프를 from_attributes로 검증한 뒤 is_liked를 얹으려 model_copy를 한 번 더
+# 한다. 여기서는 행 값으로 dict를 바로 만들어 검증 한 번에 is_liked까지 담는다.
+# 비활성 작성자 익명화(AuthorInfo.anonymize_inactive)는 ORM 객체의 status 속성을 보는데, 프로젝션은
+# status를 응답 dict에 싣지 않으므로 같은 규칙을 여기서 적용한다.
+from typing import Any
+
+from app.common import UserStatus
+from app.domain.posts.schemas import PostResponse
+from app.infra.storage import build_url
+
+_ANONYMOUS_NICKNAME = "알수없음"
+
+
+def _author_from_row(row: Any) -> dict[str, Any] | None:
+    author_id = row.author_id
+    if author_id is None:
+        return None
+    if not UserStatus.is_active_value(row.author_status):
+        return {"id": author_id, "nickname": _ANONYMOUS_NICKNAME}
+    key = row.author_profile_image_key
+    dog = None
+    if row.dog_name is not None:
+        dog = {
+            "name": row.dog_name,
+            "breed": row.dog_breed,
+            "gender": row.dog_gender,
+            "birth_date": row.dog_birth_date,
+        }
+    return {
+        "id": author_id,
+        "nickname": row.author_nickname,
+        "profile_image_id": row.author_profile_image_id,
+        "profile_image_url": build_url(key) if key else None,
+        "representative_dog": dog,
+    }
+
+
+def post_response_from_list_row(row: Any, *, is_liked: bool = False) -> PostResponse:
+    """프로젝션 행 하나 → 목록 응답. 해시태그·첨부 집계가 NULL(0건)이면 빈 리스트."""
+    return PostResponse.model_validate(
+        {
+            "id": row.id,
+            "title": row.title,
+            "content": row.content,
+            "view_count": row.view_count,
+            "like_count": row.like_count,
+            "comment_count": row.comment_count,
+            "is_liked": is_liked,
+            "author": _author_from_row(row),
+            "files": row.files or [],
+            "category_id": row.category_id,
+            "hashtags": row.hashtags or [],
+            "version": row.version,
+            "created_at": row.created_at,
+        }
+    )
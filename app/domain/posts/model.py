@@ -15,6 +15,7 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
 )
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.ids import new_uuid7
@@ -71,6 +72,20 @@ class Hashtag(Base):
     )
 
 
+def _stat_property(name: str) -> property:
+    """Post.<카운터> → post_stats 행 위임. stats가 없으면(작성 전 transient) 읽기는 0, 쓰기는 행을 만든다."""
+
+    def fget(post: "Post") -> int:
+        return getattr(post.stats, name) if post.stats is not None else 0
+
+    def fset(post: "Post", value: int) -> None:
+        if post.stats is None:
+            post.stats = PostStats(view_count=0, like_count=0, comment_count=0, report_count=0)
+        setattr(post.stats, name, value)
+
+    return property(fget, fset)
+
+
 class Post(Base):
     __tablename__ = "posts"
 
@@ -83,10 +98,6 @@ class Post(Base):
     category_id: Mapped[int | None] = mapped_column(
         Integer, ForeignKey("categories.id", ondelete="SET NULL"), nullable=True, index=True
     )
-    view_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
-    like_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
-    comment_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
-    report_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     is_blinded: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
@@ -134,16 +145,44 @@ class Post(Base):
         back_populates="posts",
         lazy="raise_on_sql",
     )
+    stats: Mapped["PostStats | None"] = relationship(
+        "PostStats", uselist=False, passive_deletes=True, lazy="raise_on_sql"
+    )
 
     @property
     def author(self):
         return self.user
 
+    # 카운터는 post_stats에 있다(ADR 0024). 응답 스키마·생성자 호환용 위임 — SQL에서는 PostStats 컬럼을 쓴다.
+    view_count = _stat_property("view_count")
+    like_count = _stat_property("like_count")
+    comment_count = _stat_property("comment_count")
+    report_count = _stat_property("report_count")
+
     @property
     def files(self):
         return self.post_images or []
 
 
+class PostStats(Base):
+    """게시글 카운터(ADR 0024). 좋아요·댓글·조회 flush와 신고가 넓은 posts 행(TOAST 본문·GIN 인덱스)을
+    다시 쓰지 않도록 좁은 1:1 테이블로 뺐다. 보조 인덱스가 없고 fillfactor가 낮아 카운터 UPDATE는
+    같은 페이지 안 HOT 갱신으로 끝난다. 글 작성 트랜잭션에서 함께 INSERT한다.
+    fillfactor(50)는 마이그레이션 015가 ``ALTER TABLE ... SET``으로 건다 — 테이블 단위
+    ``postgresql_with``는 고정 버전(SQLAlchemy 2.0)에 없는 옵션이라 모델에 싣지 않는다.
+    """
+
+    __tablename__ = "post_stats"
+
+    post_id: Mapped[UUID] = mapped_column(
+        PG_UUID, ForeignKey("posts.id", ondelete="CASCADE"), primary_key=True
+    )
+    view_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    like_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    comment_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    report_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+
 class PostImage(Base):
     __tablename__ = "post_images"
     __table_args__ = (UniqueConstraint("image_id", name="uq_post_images_image_id"),)
@@ -163,3 +202,27 @@ class PostImage(Base):
     @property
     def file_url(self) -> str | None:
         return self.image.file_url if self.image else None
+
+
+class PostSearchDocument(Base):
+    """게시글 검색 문서(ADR 0015). 제목·해시태그·본문을 2-gram term으로 미리 쪼갠 가중치 tsvector.
+
+    글 작성·수정 트랜잭션에서 upsert하고, 도입 이전 글은 cleanup 루프가 배치로 백필한다.
+    """
+
+    __tablename__ = "post_search_documents"
+
+    post_id: Mapped[UUID] = mapped_column(
+        PG_UUID, ForeignKey("posts.id", ondelete="CASCADE"), primary_key=True
+    )
+    search_vector: Mapped[str] = mapped_column(TSVECTOR, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        Index(
+            "idx_post_search_documents_vector_gin",
+            "search_vector",
+            postgresql_using="gin",
+            postgresql_with={"fastupdate": True},
+        ),
+    )
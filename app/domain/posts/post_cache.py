@@ -0,0 +1,182 @@
+# 게시글 읽기 캐시(ADR 0004)의 키·TTL·무효화 조각 — 상세 엔티티 스냅샷, 첫 페이지 피드 풀, 검색 결과 풀.
+# 게시글 서비스와 쓰기 경로(관리자 블라인드·신고 자동 블라인드)가 함께 쓰는 계약이라 공개 모듈로 둔다.
+import hashlib
+import logging
+from collections.abc import Iterable
+from uuid import UUID
+
+from app.domain.comments.page_cache import comment_page_cache_key
+from app.domain.posts.search_document import search_terms
+from app.infra.cache import invalidate_json
+from app.infra.redis import RedisLike
+
+log = logging.getLogger(__name__)
+
+_CACHE_PREFIX = "cache:post_detail:"
+# 스냅샷은 차단·좋아요·버퍼 조회수와 무관한 부분만 담는다. 본문/블라인드 변경은 명시적 무효화로
+# 즉시 끊고, 좋아요·댓글 수처럼 무효화 없이 바뀌는 카운터의 지연 상한이 이 TTL이다.
+POST_DETAIL_CACHE_TTL_SECONDS = 30
+# L1은 더 짧게 — 무효화 신호 유실 시 인스턴스 간 불일치 창의 상한.
+POST_DETAIL_L1_TTL_SECONDS = 3
+
+_FEED_PREFIX = "cache:post_feed:"
+# 카테고리별(전체 포함) 최신 글 풀. 기본 size(10) 기준 앞 몇 페이지 + 차단 필터 headroom.
+POST_FEED_POOL_SIZE = 60
+POST_FEED_CACHE_TTL_SECONDS = 15
+POST_FEED_L1_TTL_SECONDS = 3
+
+_SEARCH_PREFIX = "cache:post_search:"
+# 검색어별 결과 id 풀(하이드레이션 전). 타이핑 중 같은 검색어 연타·인기 #태그를 흡수하는 정도로 짧게.
+POST_SEARCH_POOL_SIZE = 60
+POST_SEARCH_CACHE_TTL_SECONDS = 10
+POST_SEARCH_L1_TTL_SECONDS = 3
+# 토큰 인덱스(term → 그 term으로 등록된 결과 키 SET). 결과 키보다 길게 둬 무효화가 먼저 사라지지 않게.
+_SEARCH_INDEX_TTL_SECONDS = POST_SEARCH_CACHE_TTL_SECONDS * 6
+# 라틴 접두사 term 길이 상한 — 등록·무효화 양쪽을 같은 길이로 자른다.
+_SEARCH_PREFIX_MAX_LEN = 32
+# 부분 문자열(ILIKE)로 매칭되는 결과 키의 인덱스 — term으로 좁힐 수 없어 글 쓰기마다 통째로 끊는다.
+_SEARCH_SUBSTRING_INDEX_KEY = f"{_SEARCH_PREFIX}substring"
+
+
+def post_detail_cache_key(post_id: UUID) -> str:
+    return f"{_CACHE_PREFIX}{post_id}"
+
+
+def post_detail_lock_key(post_id: UUID) -> str:
+    return f"{_CACHE_PREFIX}{post_id}:lock"
+
+
+def post_feed_cache_key(category_id: int | None) -> str:
+    return f"{_FEED_PREFIX}{category_id if category_id else 'all'}"
+
+
+def normalize_search_tokens(search_q: str) -> list[str]:
+    """검증된 검색어의 정규 토큰 집합(소문자·중복 제거·정렬). 공백 토큰은 AND라 순서와 무관하다.
+
+    ``#태그``는 태그명 하나(``#`` 포함)로 — 일반 검색과 키가 섞이지 않는다.
+    """
+    raw = search_q.strip()
+    if raw.startswith("#"):
+        return ["#" + raw.lstrip("#").strip().lower()]
+    return sorted({t.lower() for t in raw.split() if t})
+
+
+def post_search_cache_key(engine: str, category_id: int | None, search_q: str) -> str:
+    # 엔진마다 결과·순서가 달라(관련도순 vs 최신순) 키를 나눈다. 토큰은 해시로 길이를 고정.
+    tokens = "\x1f".join(normalize_search_tokens(search_q))
+    digest = hashlib.blake2b(tokens.encode(), digest_size=12).hexdigest()
+    return f"{_SEARCH_PREFIX}{engine}:{category_id if category_id else 'all'}:{digest}"
+
+
+def _search_index_key(term: str) -> str:
+    return f"{_SEARCH_PREFIX}term:{term}"
+
+
+def post_search_index_term(search_q: str) -> str | None:
+    """결과 키를 등록할 term 하나. 검색 결과의 모든 글은 질의 term을 전부 가지므로 하나면 충분하다 —
+    가장 긴(대개 가장 선택적인) term을 고른다. ``#태그``는 ``#이름``."""
+    tokens = normalize_search_tokens(search_q)
+    if tokens and tokens[0].startswith("#"):
+        return tokens[0]
+    terms = [t[:_SEARCH_PREFIX_MAX_LEN] for token in tokens for t in search_terms(token)]
+    return max(terms, key=len) if terms else None
+
+
+def post_search_write_terms(title: str, content: str, hashtag_names: Iterable[str]) -> set[str]:
+    """글 하나가 걸릴 수 있는 등록 term 전부 — 작성·수정·삭제 시 이 term들의 결과 키를 끊는다.
+
+    질의는 한글 2-gram은 그대로, 한글 1음절·라틴 단어는 접두사로 매칭하므로 글 쪽은 2-gram과 그
+    첫 음절, 라틴 단어의 모든 접두사를 낸다. 해시태그는 본문 term과 ``#이름`` 둘 다.
+    """
+    names = list(hashtag_names)
+    out: set[str] = {"#" + n for n in names}
+    for text in (title, content, *names):
+        for term in search_terms(text):
+            if "가" <= term[0] <= "힣":
+                out.update((term, term[0]))
+            else:
+                word = term[:_SEARCH_PREFIX_MAX_LEN]
+                out.update(word[:i] for i in range(1, len(word) + 1))
+    return out
+
+
+def _search_register_key(engine: str, search_q: str) -> str | None:
+    """결과 키를 등록할 인덱스. ``ilike`` 엔진의 일반 검색어와 term 없는 검색어(기호뿐 — 어느 엔진이든
+    ILIKE 필터로 돈다)는 부분 문자열 일치라 글의 term으로 찾을 수 없다 — substring 인덱스로 모은다.
+    ``#태그``는 엔진과 무관하게 정확 일치라 term 인덱스."""
+    if not normalize_search_tokens(search_q):
+        return None
+    term = post_search_index_term(search_q)
+    if term is None or (engine == "ilike" and not term.startswith("#")):
+        return _SEARCH_SUBSTRING_INDEX_KEY
+    return _search_index_key(term)
+
+
+async def register_post_search_cache(
+    redis_client: RedisLike | None, key: str, search_q: str, *, engine: str
+) -> None:
+    """결과 키를 인덱스에 등록(SADD + EXPIRE, 파이프라인 1왕복). 실패는 무시 — TTL이 상한."""
+    index_key = _search_register_key(engine, search_q)
+    if redis_client is None or index_key is None:
+        return
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.sadd(index_key, key)
+            pipe.expire(index_key, _SEARCH_INDEX_TTL_SECONDS)
+            await pipe.execute()
+    except Exception as e:
+        log.warning("post_search cache index register failed (ttl fallback): %s", e)
+
+
+async def invalidate_post_search_cache(redis_client: RedisLike | None, terms: set[str]) -> None:
+    """글의 term들에 등록된 검색 결과 키를 끊는다(SMEMBERS 파이프라인 1왕복 → DEL·L1 broadcast).
+
+    substring 인덱스는 글 내용과 무관하게 항상 함께 끊는다 — 엔진을 바꾸는 롤링 배포 중에도 다른
+    인스턴스가 등록한 ILIKE 결과가 남지 않게. 쓰기 커밋 후 호출. Redis 장애는 fail-open — 남은 결과는
+    짧은 TTL로 만료된다.
+    """
+    if redis_client is None or not terms:
+        return
+    index_keys = [*(_search_index_key(t) for t in sorted(terms)), _SEARCH_SUBSTRING_INDEX_KEY]
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for index_key in index_keys:
+                pipe.smembers(index_key)
+            members = await pipe.execute()
+    except Exception as e:
+        log.warning("post_search cache invalidate lookup failed (ttl fallback): %s", e)
+        return
+    keys = {
+        m.decode() if isinstance(m, (bytes, bytearray)) else str(m)
+        for found in members
+        for m in found or ()
+    }
+    # 비어 있지 않던 인덱스도 함께 지운다 — 끊긴 결과 키가 인덱스에 남아 쌓이지 않게.
+    doomed = [*sorted(keys), *(k for k, found in zip(index_keys, members, strict=True) if found)]
+    await invalidate_json(redis_client, *doomed)
+
+
+async def invalidate_post_detail_cache(redis_client: RedisLike | None, *post_ids: UUID) -> None:
+    """조회수 flush 커밋 후 상세 스냅샷을 제거한다(피드 풀은 DB 조회수를 그대로 보여 무관).
+
+    Redis 장애 시 로그만 남기고 무시한다(``invalidate_json``이 fail-open) — 남은 값은 TTL로 만료.
+    """
+    await invalidate_json(redis_client, *(post_detail_cache_key(p) for p in post_ids))
+
+
+async def invalidate_post_caches(
+    redis_client: RedisLike | None,
+    post_id: UUID | None,
+    *category_ids: int | None,
+) -> None:
+    """게시글 작성·수정·삭제·블라인드(해제) 커밋 후 상세 스냅샷·피드 풀·댓글 풀을 함께 끊는다.
+
+    피드는 전체 풀과 글이 속한(속했던) 카테고리 풀만 — 수정으로 카테고리가 바뀌면 양쪽을 넘긴다.
+    작성은 아직 스냅샷이 없으므로 ``post_id=None``.
+    """
+    keys = {post_feed_cache_key(None), *(post_feed_cache_key(c) for c in category_ids)}
+    if post_id is not None:
+        keys.add(post_detail_cache_key(post_id))
+        # 삭제·블라인드된 글의 댓글 풀(ADR 0027)도 함께 — 풀 히트가 글 가시성 확인을 건너뛰므로.
+        keys.update(comment_page_cache_key(post_id, s) for s in ("latest", "oldest"))
+    await invalidate_json(redis_client, *sorted(keys))
@@ -1,19 +1,54 @@
 # 게시글·post_images 데이터 접근. ORM은 .model 참조.
 
-from datetime import timedelta
+from collections.abc import Collection, Sequence
+from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
-from sqlalchemy import Select, and_, delete, exists, false, func, literal, or_, select, update
+from sqlalchemy import (
+    ARRAY,
+    Integer,
+    Select,
+    String,
+    and_,
+    any_,
+    bindparam,
+    delete,
+    exists,
+    false,
+    func,
+    literal,
+    or_,
+    select,
+    tuple_,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import JSON, aggregate_order_by
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm import aliased, contains_eager, joinedload, selectinload
 
 from app.common.exceptions import InvalidRequestException
 from app.db.base_class import utc_now
+from app.domain.comments.model import Comment
 from app.domain.dogs.model import DogProfile
-from app.domain.users.model import User, UserBlock
-
-from .model import Category, Hashtag, Post, PostImage, post_hashtags
+from app.domain.likes.model import PostLike
+from app.domain.media.model import Image
+from app.domain.users.model import User, author_not_blocked
+
+from .hashtag_ids import hashtag_ids
+from .model import (
+    Category,
+    Hashtag,
+    Post,
+    PostImage,
+    PostSearchDocument,
+    PostStats,
+    post_hashtags,
+)
+from .search_document import search_tsquery, search_vector
 
 # pg_trgm: 라틴 3자 미만·한글 1음절·숫자 1자리는 인덱스 효율 저하 → 앱 레벨 거부.
 POST_SEARCH_MIN_TOKEN_LEN = 3
@@ -76,6 +111,14 @@ def _escape_ilike_token(token: str) -> str:
     return token.replace(_ILIKE_ESCAPE, _ILIKE_ESCAPE * 2).replace("%", "\\%").replace("_", "\\_")
 
 
+# 해시태그별 공개 글 수(트렌딩·자동완성 공통 집계).
+_HASHTAG_USAGE_COUNT = func.count(post_hashtags.c.post_id).label("count")
+
+
+def _hour_start(epoch_hour: int) -> datetime:
+    return datetime.fromtimestamp(epoch_hour * 3600, tz=UTC)
+
+
 def _hashtag_partial_exists(pattern: str):
     return exists(
         select(literal(1))
@@ -121,6 +164,74 @@ def _apply_post_list_search_filter(stmt, *, search_q: str | None):
     return stmt.where(and_(*(_token_match_clause(token) for token in tokens)))
 
 
+def _ranked_search_query(search_q: str | None):
+    """랭킹 경로용 tsquery. #태그 정확 매칭·term 없는 검색어(기호뿐)는 None → 기존 필터 경로."""
+    if not search_q or not (raw := search_q.strip()) or raw.startswith("#"):
+        return None
+    return search_tsquery(raw)
+
+
+def _apply_ranked_search(stmt, query, *, cursor: UUID | None):
+    """검색 문서 @@ tsquery(GIN) + ts_rank_cd 내림차순, 동점은 id 내림차순.
+
+    keyset은 (rank, id). API 커서 계약(직전 페이지 마지막 글 id)은 그대로 두고, 커서 글의 rank를
+    같은 질의로 다시 계산해 비교한다 — 같은 문서·같은 질의면 rank가 결정적이라 경계가 흔들리지 않는다.
+    커서 글의 문서가 사라졌으면(하드 삭제) 비교가 NULL이라 빈 페이지로 끝난다.
+
+    EXPLAIN 검증 예:
+      EXPLAIN (ANALYZE, BUFFERS)
+      SELECT p.id FROM posts p JOIN post_search_documents d ON d.post_id = p.id
+      WHERE d.search_vector @@ to_tsquery('simple', '불닭')
+      ORDER BY ts_rank_cd(d.search_vector, to_tsquery('simple', '불닭')) DESC, p.id DESC LIMIT 21;
+    → Bitmap Index Scan on idx_post_search_documents_vector_gin.
+    """
+    vector = PostSearchDocument.search_vector
+    rank = func.ts_rank_cd(vector, query)
+    stmt = stmt.join(PostSearchDocument, PostSearchDocument.post_id == Post.id).where(
+        vector.op("@@")(query)
+    )
+    if cursor is not None:
+        # 별칭 — 바깥 FROM의 검색 문서와 자동 상관(correlate)되지 않게 커서 글 행을 따로 읽는다.
+        cursor_doc = aliased(PostSearchDocument)
+        cursor_rank = (
+            select(func.ts_rank_cd(cursor_doc.search_vector, query))
+            .where(cursor_doc.post_id == cursor)
+            .scalar_subquery()
+        )
+        stmt = stmt.where(tuple_(rank, Post.id) < tuple_(cursor_rank, cursor))
+    return stmt.order_by(rank.desc(), Post.id.desc())
+
+
+def _apply_post_list_filters(
+    stmt,
+    *,
+    cursor: UUID | None,
+    search_q: str | None,
+    category_id: int | None,
+    blocked_ids: Collection[UUID],
+    ranked_search: bool,
+    since: UUID | None = None,
+):
+    """목록 공통: 가시성·차단·카테고리·검색 필터와 keyset 순서. 엔티티·id 조회가 같은 조건을 쓴다.
+
+    since는 id 순서 경로의 하한(`id > since`) — 폴링 클라이언트가 가진 맨 위 글보다 새 글만.
+    """
+    stmt = stmt.where(Post.deleted_at.is_(None), Post.is_blinded.is_(False))
+    if (not_blocked := author_not_blocked(Post.user_id, blocked_ids)) is not None:
+        stmt = stmt.where(not_blocked)
+    if category_id is not None:
+        stmt = stmt.where(Post.category_id == category_id)
+    query = _ranked_search_query(search_q) if ranked_search else None
+    if query is not None:
+        return _apply_ranked_search(stmt, query, cursor=cursor)
+    stmt = _apply_post_list_search_filter(stmt, search_q=search_q)
+    if cursor is not None:
+        stmt = stmt.where(Post.id < cursor)
+    if since is not None:
+        stmt = stmt.where(Post.id > since)
+    return stmt.order_by(Post.id.desc())
+
+
 def _post_author_and_content_loads():
     """목록·상세 공통 eager load. 작성자 강아지는 대표견 1마리만 로드한다.
 
@@ -134,11 +245,136 @@ def _post_author_and_content_loads():
             selectinload(User.representative_dog).joinedload(DogProfile.profile_image),
         ),
         joinedload(Post.category),
+        joinedload(Post.stats, innerjoin=True),
         selectinload(Post.hashtags),
         selectinload(Post.post_images).joinedload(PostImage.image),
     )
 
 
+def _post_list_projection() -> Select:
+    """목록 응답(PostResponse) 모양에 필요한 컬럼만 Core로 — 엔티티·identity map·eager load 없음.
+
+    작성자·프로필 이미지·대표견은 LEFT JOIN, 해시태그는 array_agg, 첨부는 PostImage.id 순 json_agg
+    상관 서브쿼리라 페이지 하나가 왕복 1회다(ORM 경로는 selectinload마다 왕복이 붙는다).
+    행 → 응답 변환은 ``list_projection.post_response_from_list_row``.
+    """
+    author_image = aliased(Image)
+    hashtags = (
+        select(func.array_agg(Hashtag.name))
+        .select_from(post_hashtags.join(Hashtag, Hashtag.id == post_hashtags.c.hashtag_id))
+        .where(post_hashtags.c.post_id == Post.id)
+        .scalar_subquery()
+    )
+    files = (
+        select(
+            func.json_agg(
+                aggregate_order_by(
+                    func.json_build_object(
+                        "id",
+                        PostImage.id,
+                        "file_url",
+                        Image.file_url,
+                        "image_id",
+                        PostImage.image_id,
+                    ),
+                    PostImage.id,
+                ),
+                type_=JSON,
+            )
+        )
+        .select_from(PostImage)
+        .outerjoin(Image, Image.id == PostImage.image_id)
+        .where(PostImage.post_id == Post.id)
+        .scalar_subquery()
+    )
+    return (
+        select(
+            Post.id,
+            Post.title,
+            Post.content,
+            PostStats.view_count,
+            PostStats.like_count,
+            PostStats.comment_count,
+            Post.category_id,
+            Post.version,
+            Post.created_at,
+            User.id.label("author_id"),
+            User.nickname.label("author_nickname"),
+            User.status.label("author_status"),
+            User.profile_image_id.label("author_profile_image_id"),
+            author_image.file_key.label("author_profile_image_key"),
+            DogProfile.name.label("dog_name"),
+            DogProfile.breed.label("dog_breed"),
+            DogProfile.gender.label("dog_gender"),
+            DogProfile.birth_date.label("dog_birth_date"),
+            hashtags.label("hashtags"),
+            files.label("files"),
+        )
+        .select_from(Post)
+        .join(PostStats, PostStats.post_id == Post.id)
+        .outerjoin(User, User.id == Post.user_id)
+        .outerjoin(author_image, author_image.id == User.profile_image_id)
+        .outerjoin(
+            DogProfile,
+            and_(DogProfile.owner_id == User.id, DogProfile.is_representative.is_(True)),
+        )
+    )
+
+
+def _prune_post_hashtags(post_id: UUID, keep_names: list[str]):
+    """글의 링크 중 keep_names 밖의 것을 지운다 — 읽어 둔 현재 집합과 무관하게 목표 집합으로 수렴한다."""
+    keep = select(Hashtag.id).where(Hashtag.name == any_(literal(keep_names, ARRAY(String))))
+    return delete(post_hashtags).where(
+        post_hashtags.c.post_id == post_id,
+        post_hashtags.c.hashtag_id.not_in(keep),
+    )
+
+
+def _sync_post_hashtags_stmt(
+    post_id: UUID,
+    target_names: list[str],
+    known: dict[str, int],
+    unknown: list[str],
+    *,
+    prune: bool,
+) -> Select:
+    """해시태그 diff 동기화 한 문장(ADR 0022). 새로 연결한 태그의 (id, name)을 돌려준다.
+
+    - pruned: 목표 밖 링크 삭제(빠진 이름이 있을 때만).
+    - inserted: 캐시에 없는 이름만 upsert. 충돌분은 RETURNING에 안 나오므로 tags가 기존 행을 따로 읽는다.
+    - tags: 새 행 ∪ 기존 행(캐시 밖 이름·캐시 id). 캐시 id도 hashtags에서 다시 확인해 사라진 id를 거른다.
+    - linked: 글 ↔ 태그 링크 삽입.
+    """
+    existing = []
+    if unknown:
+        existing.append(Hashtag.name == any_(literal(unknown, ARRAY(String))))
+    if known:
+        existing.append(Hashtag.id == any_(literal(list(known.values()), ARRAY(Integer))))
+    parts: list[Select] = [select(Hashtag.id, Hashtag.name).where(or_(*existing))]
+    if unknown:
+        inserted = (
+            pg_insert(Hashtag)
+            .from_select(
+                ["name"], select(func.unnest(literal(unknown, ARRAY(String))).label("name"))
+            )
+            .on_conflict_do_nothing(index_elements=[Hashtag.name])
+            .returning(Hashtag.id, Hashtag.name)
+            .cte("inserted")
+        )
+        parts.append(select(inserted.c.id, inserted.c.name))
+    tags = union_all(*parts).cte("tags")
+    linked = (
+        pg_insert(post_hashtags)
+        .from_select(["post_id", "hashtag_id"], select(literal(post_id, PG_UUID), tags.c.id))
+        .on_conflict_do_nothing(index_elements=["post_id", "hashtag_id"])
+        .cte("linked")
+    )
+    stmt = select(tags.c.id, tags.c.name)
+    if prune:
+        stmt = stmt.add_cte(_prune_post_hashtags(post_id, target_names).cte("pruned"))
+    return stmt.add_cte(linked)
+
+
 class PostsModel:
     MAX_POST_IMAGES = 5
 
@@ -153,7 +389,7 @@ class PostsModel:
         post_id: UUID,
         *,
         db: AsyncSession,
-        current_user_id: UUID | None = None,
+        blocked_ids: Collection[UUID] = (),
     ) -> bool:
         """삭제·블라인드·차단 관계만 확인. 상세 조회용 eager load 없음."""
         visible_where = [
@@ -161,12 +397,8 @@ class PostsModel:
             Post.deleted_at.is_(None),
             Post.is_blinded.is_(False),
         ]
-        if current_user_id is not None:
-            block_exists = exists(1).where(
-                UserBlock.blocker_id == current_user_id,
-                UserBlock.blocked_id == Post.user_id,
-            )
-            visible_where.append(~block_exists)
+        if (not_blocked := author_not_blocked(Post.user_id, blocked_ids)) is not None:
+            visible_where.append(not_blocked)
         r = await db.execute(select(exists().where(*visible_where)))
         return bool(r.scalar())
 
@@ -177,35 +409,133 @@ class PostsModel:
         hashtag_names: list[str],
         *,
         db: AsyncSession,
+        current_names: Collection[str] | None = None,
     ) -> None:
-        await db.execute(delete(post_hashtags).where(post_hashtags.c.post_id == post_id))
-
-        if not hashtag_names:
+        """글의 해시태그 링크를 hashtag_names로 맞춘다(ADR 0022).
+
+        current_names(지금 연결된 이름)를 넘기면 조회를 건너뛴다 — 새 글은 빈 집합, 수정은 이미
+        읽어 둔 post.hashtags. 바뀐 이름이 없으면 아무 문장도 보내지 않는다.
+        """
+        if current_names is None:
+            current_names = await cls._get_hashtag_names(post_id, db=db)
+        target = list(dict.fromkeys(hashtag_names))
+        current = set(current_names)
+        added = [n for n in target if n not in current]
+        prune = not current.issubset(target)
+        if not added and not prune:
             return
+        if not added:
+            await db.execute(_prune_post_hashtags(post_id, target))
+            return
+
+        known, unknown = hashtag_ids.split(added)
+        rows = (
+            await db.execute(_sync_post_hashtags_stmt(post_id, target, known, unknown, prune=prune))
+        ).all()
+        id_by_name = {name: hid for hid, name in rows}
+        hashtag_ids.put_many(id_by_name)
+        missing = [n for n in added if n not in id_by_name]
+        if missing:
+            # 문장 시작 뒤 커밋된 동시 삽입분(스냅샷 밖이라 안 보임)이나 지워진 캐시 id — 드물다.
+            hashtag_ids.discard(missing)
+            await cls._link_hashtags(post_id, missing, db=db)
 
-        # 전체 이름을 멱등 upsert 후 id를 한 번에 조회한다. ON CONFLICT DO NOTHING의
-        # RETURNING은 충돌(기존)분을 돌려주지 않으므로, 재조회 대신 upsert→SELECT 순으로
-        # 두면 동시 삽입분까지 committed 상태로 모두 잡혀 태그 누락이 없다(5→4왕복).
+    @classmethod
+    async def _link_hashtags(cls, post_id: UUID, names: list[str], *, db: AsyncSession) -> None:
+        # 이름 upsert와 id 조회를 다른 문장으로 나눈다. ON CONFLICT DO NOTHING의 RETURNING은 충돌(기존)분을
+        # 돌려주지 않지만, 다음 SELECT는 새 스냅샷이라 동시 삽입분까지 committed 상태로 잡혀 누락이 없다.
         await db.execute(
             pg_insert(Hashtag)
-            .values([{"name": n} for n in hashtag_names])
+            .values([{"name": n} for n in names])
             .on_conflict_do_nothing(index_elements=[Hashtag.name])
         )
         rows = (
-            await db.execute(
-                select(Hashtag.id, Hashtag.name).where(Hashtag.name.in_(hashtag_names))
-            )
+            await db.execute(select(Hashtag.id, Hashtag.name).where(Hashtag.name.in_(names)))
         ).all()
         id_by_name = {name: hid for hid, name in rows}
-        hashtag_ids = [id_by_name[n] for n in hashtag_names if n in id_by_name]
-
-        if hashtag_ids:
+        hashtag_ids.put_many(id_by_name)
+        if id_by_name:
             await db.execute(
                 pg_insert(post_hashtags)
-                .values([{"post_id": post_id, "hashtag_id": hid} for hid in hashtag_ids])
+                .values([{"post_id": post_id, "hashtag_id": hid} for hid in id_by_name.values()])
                 .on_conflict_do_nothing(index_elements=["post_id", "hashtag_id"])
             )
 
+    @classmethod
+    async def _get_hashtag_names(cls, post_id: UUID, *, db: AsyncSession) -> list[str]:
+        rows = await db.execute(
+            select(Hashtag.name)
+            .join(post_hashtags, Hashtag.id == post_hashtags.c.hashtag_id)
+            .where(post_hashtags.c.post_id == post_id)
+        )
+        return list(rows.scalars().all())
+
+    @classmethod
+    async def upsert_search_document(
+        cls,
+        post_id: UUID,
+        title: str,
+        content: str,
+        hashtag_names: list[str],
+        *,
+        db: AsyncSession,
+    ) -> None:
+        """검색 문서(ADR 0015)를 글 쓰기와 같은 트랜잭션에서 갱신 — 커밋된 글은 곧바로 검색된다."""
+        now = utc_now()
+        vector = search_vector(title, content, hashtag_names)
+        await db.execute(
+            pg_insert(PostSearchDocument)
+            .values(post_id=post_id, search_vector=vector, updated_at=now)
+            .on_conflict_do_update(
+                index_elements=[PostSearchDocument.post_id],
+                set_={"search_vector": vector, "updated_at": now},
+            )
+        )
+
+    @classmethod
+    async def backfill_search_documents(cls, limit: int, *, db: AsyncSession) -> int:
+        """검색 문서가 없는 글을 최신순으로 최대 limit건 채운다. 채운 건수 반환.
+
+        작성·수정 경로가 먼저 upsert한 문서가 더 최신이므로 충돌 시 덮어쓰지 않는다(DO NOTHING).
+        """
+        missing = ~exists(1).where(PostSearchDocument.post_id == Post.id)
+        rows = (
+            await db.execute(
+                select(Post.id, Post.title, Post.content)
+                .where(Post.deleted_at.is_(None), missing)
+                .order_by(Post.id.desc())
+                .limit(limit)
+            )
+        ).all()
+        if not rows:
+            return 0
+        tag_rows = await db.execute(
+            select(post_hashtags.c.post_id, Hashtag.name)
+            .join(Hashtag, Hashtag.id == post_hashtags.c.hashtag_id)
+            .where(post_hashtags.c.post_id.in_([r.id for r in rows]))
+        )
+        tags_by_post: dict[UUID, list[str]] = {}
+        for pid, name in tag_rows.all():
+            tags_by_post.setdefault(pid, []).append(name)
+        now = utc_now()
+        await db.execute(
+            pg_insert(PostSearchDocument)
+            .values(
+                [
+                    {
+                        "post_id": r.id,
+                        "search_vector": search_vector(
+                            r.title, r.content, tags_by_post.get(r.id, [])
+                        ),
+                        "updated_at": now,
+                    }
+                    for r in rows
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=[PostSearchDocument.post_id])
+        )
+        return len(rows)
+
     @classmethod
     async def create_post(
         cls,
@@ -228,6 +558,7 @@ class PostsModel:
             created_at=now,
             updated_at=now,
             deleted_at=None,
+            stats=PostStats(view_count=0, like_count=0, comment_count=0, report_count=0),
         )
         db.add(post)
         await db.flush()
@@ -235,7 +566,8 @@ class PostsModel:
         if limited:
             db.add_all(PostImage(post_id=post.id, image_id=iid, created_at=now) for iid in limited)
         if hashtag_names is not None:
-            await cls.sync_post_hashtags(post.id, hashtag_names, db=db)
+            await cls.sync_post_hashtags(post.id, hashtag_names, db=db, current_names=())
+        await cls.upsert_search_document(post.id, title, content, hashtag_names or [], db=db)
         return post.id
 
     @classmethod
@@ -243,7 +575,7 @@ class PostsModel:
         cls,
         post_id: UUID,
         db: AsyncSession,
-        current_user_id: UUID | None = None,
+        blocked_ids: Collection[UUID] = (),
     ) -> Post | None:
         stmt = (
             select(Post)
@@ -254,12 +586,8 @@ class PostsModel:
             )
             .options(*_post_author_and_content_loads())
         )
-        if current_user_id is not None:
-            block_exists = exists(1).where(
-                UserBlock.blocker_id == current_user_id,
-                UserBlock.blocked_id == Post.user_id,
-            )
-            stmt = stmt.where(~block_exists)
+        if (not_blocked := author_not_blocked(Post.user_id, blocked_ids)) is not None:
+            stmt = stmt.where(not_blocked)
         result = await db.execute(stmt)
         return result.scalars().one_or_none()
 
@@ -269,6 +597,7 @@ class PostsModel:
         post_id: UUID,
         user_id: UUID,
         db: AsyncSession,
+        blocked_ids: Collection[UUID] = (),
     ) -> tuple[Post, bool] | None:
         from app.domain.likes.model import PostLike
 
@@ -284,11 +613,8 @@ class PostsModel:
             )
             .options(*_post_author_and_content_loads())
         )
-        block_exists = exists(1).where(
-            UserBlock.blocker_id == user_id,
-            UserBlock.blocked_id == Post.user_id,
-        )
-        stmt = stmt.where(~block_exists)
+        if (not_blocked := author_not_blocked(Post.user_id, blocked_ids)) is not None:
+            stmt = stmt.where(not_blocked)
         result = await db.execute(stmt)
         row = result.unique().one_or_none()
         if row is None:
@@ -302,6 +628,44 @@ class PostsModel:
         )
         return result.scalar_one_or_none()
 
+    @classmethod
+    async def get_post_search_fields(
+        cls, post_id: UUID, db: AsyncSession
+    ) -> tuple[str, str, list[str]] | None:
+        """(제목, 본문, 해시태그명) — 삭제 전 검색 결과 캐시 무효화 term 산출용."""
+        row = (
+            await db.execute(
+                select(Post.title, Post.content).where(
+                    Post.id == post_id, Post.deleted_at.is_(None)
+                )
+            )
+        ).one_or_none()
+        if row is None:
+            return None
+        return row.title, row.content, await cls._get_hashtag_names(post_id, db=db)
+
+    @classmethod
+    async def get_public_hashtag_names(cls, post_id: UUID, db: AsyncSession) -> list[str] | None:
+        """공개 글(미삭제·미블라인드)의 해시태그명. 비공개·없는 글은 None — 트렌딩 증감 산출용."""
+        visible = (
+            await db.execute(
+                select(Post.id).where(
+                    Post.id == post_id, Post.deleted_at.is_(None), Post.is_blinded.is_(False)
+                )
+            )
+        ).scalar_one_or_none()
+        if visible is None:
+            return None
+        return await cls._get_hashtag_names(post_id, db=db)
+
+    @classmethod
+    async def get_post_category_id(cls, post_id: UUID, db: AsyncSession) -> int | None:
+        """피드 캐시 무효화 대상 카테고리 확인용(삭제·블라인드 전 조회)."""
+        result = await db.execute(
+            select(Post.category_id).where(Post.id == post_id, Post.deleted_at.is_(None))
+        )
+        return result.scalar_one_or_none()
+
     @classmethod
     async def get_titles_by_ids(cls, post_ids: list[UUID], db: AsyncSession) -> dict[UUID, str]:
         if not post_ids:
@@ -320,31 +684,112 @@ class PostsModel:
         cursor: UUID | None = None,
         search_q: str | None = None,
         category_id: int | None = None,
-        current_user_id: UUID | None = None,
+        blocked_ids: Collection[UUID] = (),
+        ranked_search: bool = False,
+        since: UUID | None = None,
     ) -> list[Post]:
         # UUIDv7 PK: ORDER BY id DESC + id < cursor는 PK B-Tree만으로 범위 스캔(추가 인덱스 불필요).
-        fetch_limit = size + 1
+        # ranked_search면 일반 검색어(#태그 제외)는 검색 문서 랭킹 경로로 간다(ADR 0015).
+        stmt = _apply_post_list_filters(
+            select(Post).options(*_post_author_and_content_loads()),
+            cursor=cursor,
+            search_q=search_q,
+            category_id=category_id,
+            blocked_ids=blocked_ids,
+            ranked_search=ranked_search,
+            since=since,
+        )
+        result = await db.execute(stmt.limit(size + 1))
+        rows = result.unique().scalars().all()
+        return list(rows)
+
+    @classmethod
+    async def get_all_post_rows(
+        cls,
+        size: int = 20,
+        *,
+        db: AsyncSession,
+        cursor: UUID | None = None,
+        search_q: str | None = None,
+        category_id: int | None = None,
+        blocked_ids: Collection[UUID] = (),
+        ranked_search: bool = False,
+        since: UUID | None = None,
+    ) -> list[Row]:
+        """``get_all_posts``와 같은 필터·keyset·순서를 Core 프로젝션으로(POST_LIST_HYDRATION=core)."""
+        stmt = _apply_post_list_filters(
+            _post_list_projection(),
+            cursor=cursor,
+            search_q=search_q,
+            category_id=category_id,
+            blocked_ids=blocked_ids,
+            ranked_search=ranked_search,
+            since=since,
+        )
+        result = await db.execute(stmt.limit(size + 1))
+        return list(result.all())
+
+    @classmethod
+    async def get_search_post_ids(
+        cls,
+        limit: int,
+        *,
+        db: AsyncSession,
+        search_q: str,
+        category_id: int | None = None,
+        ranked_search: bool = False,
+    ) -> list[UUID]:
+        """검색 결과 캐시 풀용 — 목록과 같은 필터·순서로 id만(eager load 없음). 차단 무관."""
+        stmt = _apply_post_list_filters(
+            select(Post.id),
+            cursor=None,
+            search_q=search_q,
+            category_id=category_id,
+            blocked_ids=(),
+            ranked_search=ranked_search,
+        )
+        result = await db.execute(stmt.limit(limit))
+        return list(result.scalars().all())
+
+    @classmethod
+    async def get_list_posts_by_ids(
+        cls,
+        post_ids: list[UUID],
+        *,
+        db: AsyncSession,
+        blocked_ids: Collection[UUID] = (),
+    ) -> list[Post]:
+        """캐시된 id 풀 하이드레이션 — 목록과 같은 eager load·가시성·차단 필터. 순서 미보장."""
+        if not post_ids:
+            return []
         stmt = (
             select(Post)
-            .where(Post.deleted_at.is_(None), Post.is_blinded.is_(False))
+            .where(Post.id.in_(post_ids), Post.deleted_at.is_(None), Post.is_blinded.is_(False))
             .options(*_post_author_and_content_loads())
         )
-        if current_user_id is not None:
-            block_exists = exists(1).where(
-                UserBlock.blocker_id == current_user_id,
-                UserBlock.blocked_id == Post.user_id,
-            )
-            stmt = stmt.where(~block_exists)
-        stmt = _apply_post_list_search_filter(stmt, search_q=search_q)
-        if category_id is not None:
-            stmt = stmt.where(Post.category_id == category_id)
-        if cursor is not None:
-            stmt = stmt.where(Post.id < cursor)
-        stmt = stmt.order_by(Post.id.desc())
-        stmt = stmt.limit(fetch_limit)
+        if (not_blocked := author_not_blocked(Post.user_id, blocked_ids)) is not None:
+            stmt = stmt.where(not_blocked)
         result = await db.execute(stmt)
-        rows = result.unique().scalars().all()
-        return list(rows)
+        return list(result.unique().scalars().all())
+
+    @classmethod
+    async def get_list_post_rows_by_ids(
+        cls,
+        post_ids: list[UUID],
+        *,
+        db: AsyncSession,
+        blocked_ids: Collection[UUID] = (),
+    ) -> list[Row]:
+        """``get_list_posts_by_ids``의 Core 프로젝션판. 순서 미보장."""
+        if not post_ids:
+            return []
+        stmt = _post_list_projection().where(
+            Post.id.in_(post_ids), Post.deleted_at.is_(None), Post.is_blinded.is_(False)
+        )
+        if (not_blocked := author_not_blocked(Post.user_id, blocked_ids)) is not None:
+            stmt = stmt.where(not_blocked)
+        result = await db.execute(stmt)
+        return list(result.all())
 
     @classmethod
     async def get_trending_hashtags(
@@ -352,17 +797,57 @@ class PostsModel:
         *,
         db: AsyncSession,
         limit: int = 10,
+        since_hour: int | None = None,
     ) -> list[tuple[str, int]]:
-        count_expr = func.count(post_hashtags.c.post_id).label("count")
-        stmt = (
-            select(Hashtag.name, count_expr)
+        """트렌딩 해시태그 SQL 경로(버킷 카운터 재빌드 전 폴백). since_hour = 창 첫 시(epoch 시)."""
+        stmt = cls._hashtag_usage_query()
+        if since_hour is not None:
+            stmt = stmt.where(Post.created_at >= _hour_start(since_hour))
+        stmt = stmt.order_by(_HASHTAG_USAGE_COUNT.desc()).limit(limit)
+        rows = (await db.execute(stmt)).all()
+        return [(str(r[0]), int(r[1] or 0)) for r in rows]
+
+    @staticmethod
+    def _hashtag_usage_query() -> Select:
+        return (
+            select(Hashtag.name, _HASHTAG_USAGE_COUNT)
             .join(post_hashtags, Hashtag.id == post_hashtags.c.hashtag_id)
             .join(Post, Post.id == post_hashtags.c.post_id)
             .where(Post.deleted_at.is_(None), Post.is_blinded.is_(False))
             .group_by(Hashtag.id, Hashtag.name)
-            .order_by(count_expr.desc())
-            .limit(limit)
         )
+
+    @classmethod
+    async def get_hashtag_usage_counts(cls, *, db: AsyncSession) -> dict[str, int]:
+        """자동완성 인덱스 스냅샷: 공개 글에 쓰인 해시태그 이름 → 사용 글 수."""
+        rows = (await db.execute(cls._hashtag_usage_query())).all()
+        return {str(r[0]): int(r[1] or 0) for r in rows}
+
+    @classmethod
+    async def get_hashtag_hourly_counts(
+        cls, since_hour: int, *, db: AsyncSession
+    ) -> list[tuple[int, str, int]]:
+        """트렌딩 해시태그 재빌드: (작성 시각의 epoch 시, 해시태그명, 공개 글 수). since_hour 이후 글만."""
+        hour_expr = func.floor(func.extract("epoch", Post.created_at) / 3600).label("hour")
+        stmt = (
+            cls._hashtag_usage_query()
+            .add_columns(hour_expr)
+            .where(Post.created_at >= _hour_start(since_hour))
+            .group_by(hour_expr)
+        )
+        rows = (await db.execute(stmt)).all()
+        # 열 순서 = (name, count, hour). Row.count는 tuple 메서드와 이름이 겹쳐 위치로 푼다.
+        return [(int(hour), str(name), int(count or 0)) for name, count, hour in rows]
+
+    @classmethod
+    async def suggest_hashtags(
+        cls, prefix: str, limit: int, *, db: AsyncSession
+    ) -> list[tuple[str, int]]:
+        """인덱스 콜드 스타트 폴백: 이름 접두사 LIKE(trgm GIN) + 사용 수 내림차순."""
+        stmt = cls._hashtag_usage_query().where(
+            Hashtag.name.like(f"{_escape_ilike_token(prefix)}%", escape=_ILIKE_ESCAPE)
+        )
+        stmt = stmt.order_by(_HASHTAG_USAGE_COUNT.desc(), Hashtag.name).limit(limit)
         rows = (await db.execute(stmt)).all()
         return [(str(r[0]), int(r[1] or 0)) for r in rows]
 
@@ -372,39 +857,39 @@ class PostsModel:
         *,
         window_hours: int | None = 24,
         category_id: int | None = None,
-        current_user_id: UUID | None = None,
+        blocked_ids: Collection[UUID] = (),
         limit: int = 10,
         use_time_decay: bool = True,
     ) -> Select[tuple[Post]]:
         # created_at 하한을 최상단에 두어 idx_posts_feed_latest(created_at DESC, partial) 범위 스캔 유도.
         # window_hours=None 이면 기간 제한 없음(최종 fallback용).
-        stmt = select(Post).where(
-            Post.deleted_at.is_(None),
-            Post.is_blinded.is_(False),
+        stmt = (
+            select(Post)
+            .join(PostStats, PostStats.post_id == Post.id)
+            .where(
+                Post.deleted_at.is_(None),
+                Post.is_blinded.is_(False),
+            )
         )
         if window_hours is not None:
             cutoff = utc_now() - timedelta(hours=window_hours)
             stmt = stmt.where(Post.created_at >= cutoff)
-        stmt = stmt.options(selectinload(Post.category))
+        stmt = stmt.options(selectinload(Post.category), contains_eager(Post.stats))
         if category_id is not None:
             stmt = stmt.where(Post.category_id == category_id)
-        if current_user_id is not None:
-            block_exists = exists(1).where(
-                UserBlock.blocker_id == current_user_id,
-                UserBlock.blocked_id == Post.user_id,
-            )
-            stmt = stmt.where(~block_exists)
+        if (not_blocked := author_not_blocked(Post.user_id, blocked_ids)) is not None:
+            stmt = stmt.where(not_blocked)
 
         if use_time_decay:
             age_hours = func.extract("epoch", func.now() - Post.created_at) / 3600.0
             score = (
-                Post.comment_count * 3 + Post.like_count * 2 + Post.view_count * 0.1
+                PostStats.comment_count * 3 + PostStats.like_count * 2 + PostStats.view_count * 0.1
             ) / func.power(age_hours + 2, 1.3)
             stmt = stmt.order_by(score.desc(), Post.id.desc())
         else:
             stmt = stmt.order_by(
-                Post.like_count.desc(),
-                Post.comment_count.desc(),
+                PostStats.like_count.desc(),
+                PostStats.comment_count.desc(),
                 Post.id.desc(),
             )
 
@@ -417,14 +902,14 @@ class PostsModel:
         db: AsyncSession,
         window_hours: int | None = 24,
         category_id: int | None = None,
-        current_user_id: UUID | None = None,
+        blocked_ids: Collection[UUID] = (),
         limit: int = 10,
         use_time_decay: bool = True,
     ) -> list[Post]:
         stmt = cls.get_trending_posts_query(
             window_hours=window_hours,
             category_id=category_id,
-            current_user_id=current_user_id,
+            blocked_ids=blocked_ids,
             limit=limit,
             use_time_decay=use_time_decay,
         )
@@ -432,12 +917,20 @@ class PostsModel:
         return list(result.scalars().unique().all())
 
     @classmethod
-    async def get_blocked_author_ids(cls, blocker_id: UUID, *, db: AsyncSession) -> set[UUID]:
-        """blocker가 차단한 유저 id 집합. 캐시된 트렌딩 풀에 차단 필터를 요청별로 오버레이할 때 사용."""
-        rows = await db.execute(
-            select(UserBlock.blocked_id).where(UserBlock.blocker_id == blocker_id)
+    async def get_visible_posts_by_ids(cls, post_ids: list[UUID], db: AsyncSession) -> list[Post]:
+        """ZSET 트렌딩 id 하이드레이션용 — 삭제·블라인드 제외, 평면 컬럼 + 카운터(post_stats 조인). 순서 미보장."""
+        if not post_ids:
+            return []
+        result = await db.execute(
+            select(Post)
+            .where(
+                Post.id.in_(post_ids),
+                Post.deleted_at.is_(None),
+                Post.is_blinded.is_(False),
+            )
+            .options(joinedload(Post.stats, innerjoin=True))
         )
-        return set(rows.scalars().all())
+        return list(result.scalars().all())
 
     @classmethod
     async def update_post(
@@ -450,6 +943,7 @@ class PostsModel:
         hashtag_names: list[str] | None = None,
         *,
         db: AsyncSession,
+        current_hashtag_names: list[str] | None = None,
     ) -> tuple[list[UUID], list[UUID]] | None:
         now = utc_now()
         post_obj = (
@@ -472,7 +966,15 @@ class PostsModel:
         post_obj.updated_at = now
 
         if hashtag_names is not None:
-            await cls.sync_post_hashtags(post_id, hashtag_names, db=db)
+            await cls.sync_post_hashtags(
+                post_id, hashtag_names, db=db, current_names=current_hashtag_names
+            )
+        if title is not None or content is not None or hashtag_names is not None:
+            if hashtag_names is None:
+                hashtag_names = await cls._get_hashtag_names(post_id, db=db)
+            await cls.upsert_search_document(
+                post_id, post_obj.title, post_obj.content, hashtag_names, db=db
+            )
 
         released_ids: list[UUID] = []
         added_ids: list[UUID] = []
@@ -530,42 +1032,168 @@ class PostsModel:
 
     @classmethod
     async def increment_view_count(cls, post_id: UUID, db: AsyncSession) -> bool:
+        # 카운터만 바뀌는 갱신은 post_stats만 쓴다 — posts는 삭제 여부 판정에 읽기만(ADR 0024).
         result = await db.execute(
-            update(Post)
+            update(PostStats)
             .where(
-                Post.id == post_id,
+                PostStats.post_id == post_id,
+                Post.id == PostStats.post_id,
                 Post.deleted_at.is_(None),
             )
-            .values(view_count=Post.view_count + 1, updated_at=utc_now())
-            .returning(Post.id)
+            .values(view_count=PostStats.view_count + 1)
+            .returning(PostStats.post_id)
         )
         return result.scalar_one_or_none() is not None
 
     @classmethod
-    async def increment_view_count_delta(cls, post_id: UUID, delta: int, db: AsyncSession) -> bool:
-        if delta <= 0:
-            return True
+    async def increment_view_counts_bulk(
+        cls, deltas: Sequence[tuple[UUID, int]], db: AsyncSession
+    ) -> int:
+        """조회수 flush용 집합 UPDATE — ``UPDATE post_stats … FROM unnest(ids, deltas), posts`` 1문장.
+
+        id 오름차순으로 정렬해 넘기면 동시 writer와 행 잠금 순서가 일정해 교착을 피한다.
+        반영된 행 수(삭제된 글 제외)를 반환한다.
+        """
+        if not deltas:
+            return 0
+        d = (
+            func.unnest(
+                bindparam("ids", [pid for pid, _ in deltas], type_=ARRAY(PG_UUID(as_uuid=True))),
+                bindparam("deltas", [n for _, n in deltas], type_=ARRAY(Integer)),
+            )
+            .table_valued("id", "delta")
+            .render_derived(name="d")
+        )
         result = await db.execute(
-            update(Post)
+            update(PostStats)
             .where(
-                Post.id == post_id,
+                PostStats.post_id == d.c.id,
+                Post.id == PostStats.post_id,
                 Post.deleted_at.is_(None),
             )
-            .values(view_count=Post.view_count + delta, updated_at=utc_now())
-            .returning(Post.id)
+            .values(view_count=PostStats.view_count + d.c.delta)
+            .execution_options(synchronize_session=False)
         )
-        return result.scalar_one_or_none() is not None
+        return int(getattr(result, "rowcount", 0) or 0)
+
+    @classmethod
+    async def apply_counter_deltas_bulk(
+        cls, deltas: Sequence[tuple[UUID, int, int]], db: AsyncSession
+    ) -> int:
+        """좋아요·댓글 수 flush용 집합 UPDATE(ADR 0023) — ``(post_id, 좋아요 delta, 댓글 delta)``.
+
+        기존 단건 감소와 같게 0 아래로는 내리지 않는다. id 오름차순으로 넘긴다. 갱신 행 수 반환.
+        """
+        if not deltas:
+            return 0
+        d = (
+            func.unnest(
+                bindparam("ids", [pid for pid, _, _ in deltas], type_=ARRAY(PG_UUID(as_uuid=True))),
+                bindparam("likes", [n for _, n, _ in deltas], type_=ARRAY(Integer)),
+                bindparam("comments", [n for _, _, n in deltas], type_=ARRAY(Integer)),
+            )
+            .table_valued("id", "likes", "comments")
+            .render_derived(name="d")
+        )
+        result = await db.execute(
+            update(PostStats)
+            .where(
+                PostStats.post_id == d.c.id,
+                Post.id == PostStats.post_id,
+                Post.deleted_at.is_(None),
+            )
+            .values(
+                like_count=func.greatest(PostStats.like_count + d.c.likes, 0),
+                comment_count=func.greatest(PostStats.comment_count + d.c.comments, 0),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return int(getattr(result, "rowcount", 0) or 0)
+
+    @classmethod
+    async def counter_reconcile_ids(
+        cls, after: UUID | None, limit: int, *, db: AsyncSession
+    ) -> list[UUID]:
+        """reconcile 배치 — id 순으로 after 다음 limit개 글 id."""
+        batch = select(PostStats.post_id).order_by(PostStats.post_id).limit(limit)
+        if after is not None:
+            batch = batch.where(PostStats.post_id > after)
+        return list((await db.execute(batch)).scalars().all())
+
+    @classmethod
+    async def counter_ledger_counts(
+        cls, post_ids: Sequence[UUID], *, db: AsyncSession
+    ) -> list[tuple[UUID, int, int]]:
+        """글들의 (id, 원장 좋아요 수, 원장 댓글 수)(ADR 0023 reconcile). id 순서 그대로.
+
+        댓글 수는 생성·삭제 경로와 같게 소프트 삭제 안 된 댓글만 센다.
+        """
+        if not post_ids:
+            return []
+        likes = (
+            select(func.count())
+            .select_from(PostLike)
+            .where(PostLike.post_id == PostStats.post_id)
+            .scalar_subquery()
+        )
+        comments = (
+            select(func.count())
+            .select_from(Comment)
+            .where(Comment.post_id == PostStats.post_id, Comment.deleted_at.is_(None))
+            .scalar_subquery()
+        )
+        rows = (
+            await db.execute(
+                select(PostStats.post_id, likes, comments)
+                .where(PostStats.post_id.in_(post_ids))
+                .order_by(PostStats.post_id)
+            )
+        ).all()
+        return [(pid, int(n_likes), int(n_comments)) for pid, n_likes, n_comments in rows]
+
+    @classmethod
+    async def reconcile_counters(
+        cls, targets: Sequence[tuple[UUID, int, int]], *, db: AsyncSession
+    ) -> int:
+        """글들의 like_count·comment_count를 ``(post_id, 좋아요, 댓글)`` 목표값으로 맞춘다. 고친 행 수.
+
+        목표값은 호출부가 원장 수에서 버퍼 pending을 뺀 값이다(ADR 0023). 같은 행은 쓰지 않는다.
+        """
+        if not targets:
+            return 0
+        d = (
+            func.unnest(
+                bindparam(
+                    "ids", [pid for pid, _, _ in targets], type_=ARRAY(PG_UUID(as_uuid=True))
+                ),
+                bindparam("likes", [n for _, n, _ in targets], type_=ARRAY(Integer)),
+                bindparam("comments", [n for _, _, n in targets], type_=ARRAY(Integer)),
+            )
+            .table_valued("id", "likes", "comments")
+            .render_derived(name="d")
+        )
+        result = await db.execute(
+            update(PostStats)
+            .where(
+                PostStats.post_id == d.c.id,
+                or_(PostStats.like_count != d.c.likes, PostStats.comment_count != d.c.comments),
+            )
+            .values(like_count=d.c.likes, comment_count=d.c.comments)
+            .execution_options(synchronize_session=False)
+        )
+        return int(getattr(result, "rowcount", 0) or 0)
 
     @classmethod
     async def increment_report_count(cls, post_id: UUID, db: AsyncSession) -> int | None:
         result = await db.execute(
-            update(Post)
+            update(PostStats)
             .where(
-                Post.id == post_id,
+                PostStats.post_id == post_id,
+                Post.id == PostStats.post_id,
                 Post.deleted_at.is_(None),
             )
-            .values(report_count=Post.report_count + 1, updated_at=utc_now())
-            .returning(Post.report_count)
+            .values(report_count=PostStats.report_count + 1)
+            .returning(PostStats.report_count)
         )
         row = result.one_or_none()
         return row[0] if row is not None else None
@@ -604,37 +1232,39 @@ class PostsModel:
                 Post.id == post_id,
                 Post.deleted_at.is_(None),
             )
-            .values(report_count=0, is_blinded=False, updated_at=utc_now())
+            .values(is_blinded=False, updated_at=utc_now())
             .returning(Post.id)
         )
-        return result.scalar_one_or_none() is not None
+        if result.scalar_one_or_none() is None:
+            return False
+        await db.execute(
+            update(PostStats).where(PostStats.post_id == post_id).values(report_count=0)
+        )
+        return True
 
     @classmethod
     async def get_reported_by_ids(cls, post_ids: list[UUID], db: AsyncSession) -> list[Post]:
-        """신고 목록 하이드레이션용 id 배치 조회. 응답은 제목·본문·작성자만 쓰므로
-        작성자+프로필 이미지만 eager-load 한다(정렬·페이지는 UNION 쿼리가 담당)."""
+        """신고 목록 하이드레이션용 id 배치 조회. 응답은 제목·본문·작성자·신고 수만 쓰므로
+        작성자+프로필 이미지와 카운터 행만 eager-load 한다(정렬·페이지는 UNION 쿼리가 담당)."""
         if not post_ids:
             return []
         result = await db.execute(
             select(Post)
             .where(Post.id.in_(post_ids))
-            .options(joinedload(Post.user).joinedload(User.profile_image))
+            .options(
+                joinedload(Post.user).joinedload(User.profile_image),
+                joinedload(Post.stats, innerjoin=True),
+            )
         )
         return list(result.unique().scalars().all())
 
-    @classmethod
-    async def get_like_count(cls, post_id: UUID, db: AsyncSession) -> int:
-        result = await db.execute(select(Post.like_count).where(Post.id == post_id))
-        row = result.scalar_one_or_none()
-        return row or 0
-
     @classmethod
     async def increment_like_count(cls, post_id: UUID, db: AsyncSession) -> int:
         result = await db.execute(
-            update(Post)
-            .where(Post.id == post_id)
-            .values(like_count=Post.like_count + 1, updated_at=utc_now())
-            .returning(Post.like_count)
+            update(PostStats)
+            .where(PostStats.post_id == post_id)
+            .values(like_count=PostStats.like_count + 1)
+            .returning(PostStats.like_count)
         )
         row = result.one_or_none()
         return row[0] if row is not None else 0
@@ -642,10 +1272,10 @@ class PostsModel:
     @classmethod
     async def decrement_like_count(cls, post_id: UUID, db: AsyncSession) -> int:
         result = await db.execute(
-            update(Post)
-            .where(Post.id == post_id)
-            .values(like_count=func.greatest(Post.like_count - 1, 0), updated_at=utc_now())
-            .returning(Post.like_count)
+            update(PostStats)
+            .where(PostStats.post_id == post_id)
+            .values(like_count=func.greatest(PostStats.like_count - 1, 0))
+            .returning(PostStats.like_count)
         )
         row = result.one_or_none()
         return row[0] if row is not None else 0
@@ -653,19 +1283,19 @@ class PostsModel:
     @classmethod
     async def increment_comment_count(cls, post_id: UUID, db: AsyncSession) -> bool:
         result = await db.execute(
-            update(Post)
-            .where(Post.id == post_id)
-            .values(comment_count=Post.comment_count + 1, updated_at=utc_now())
-            .returning(Post.id)
+            update(PostStats)
+            .where(PostStats.post_id == post_id)
+            .values(comment_count=PostStats.comment_count + 1)
+            .returning(PostStats.post_id)
         )
         return result.scalar_one_or_none() is not None
 
     @classmethod
     async def decrement_comment_count(cls, post_id: UUID, db: AsyncSession) -> bool:
         result = await db.execute(
-            update(Post)
-            .where(Post.id == post_id)
-            .values(comment_count=func.greatest(Post.comment_count - 1, 0), updated_at=utc_now())
-            .returning(Post.id)
+            update(PostStats)
+            .where(PostStats.post_id == post_id)
+            .values(comment_count=func.greatest(PostStats.comment_count - 1, 0))
+            .returning(PostStats.post_id)
         )
         return result.scalar_one_or_none() is not None
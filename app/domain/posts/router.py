@@ -1,6 +1,7 @@
 from fastapi import APIRouter
 
 from app.domain.posts.routers.hashtag_router import router as hashtag_router
+from app.domain.posts.routers.hashtag_router import suggest_router as hashtag_suggest_router
 from app.domain.posts.routers.post_router import router as post_router
 from app.domain.posts.routers.trending_router import router as trending_router
 
@@ -12,5 +13,6 @@ from app.domain.posts.routers.trending_router import router as trending_router
 router = APIRouter(tags=["posts"])
 
 router.include_router(hashtag_router)
+router.include_router(hashtag_suggest_router)
 router.include_router(trending_router)
 router.include_router(post_router)
@@ -1,13 +1,15 @@
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import get_slave_db
 from app.common import ApiCode, ApiResponse, api_response
-from app.domain.posts.schemas import TrendingHashtagResponse
+from app.domain.posts.schemas import HashtagSuggestionResponse, TrendingHashtagResponse
 from app.domain.posts.services import HashtagService
 from app.infra.redis import get_app_redis
 
 router = APIRouter(prefix="/posts", tags=["posts"])
+# 자동완성은 게시글 하위 자원이 아니라 /hashtags 아래에 둔다.
+suggest_router = APIRouter(prefix="/hashtags", tags=["hashtags"])
 
 
 @router.get(
@@ -22,3 +24,23 @@ async def get_trending_hashtags(
     redis = get_app_redis(request.app)
     result = await HashtagService.get_trending_hashtags(db=db, redis_client=redis, limit=10)
     return api_response(request, code=ApiCode.OK, data=result)
+
+
+@suggest_router.get(
+    "/suggest",
+    status_code=200,
+    response_model=ApiResponse[list[HashtagSuggestionResponse]],
+)
+async def suggest_hashtags(
+    request: Request,
+    prefix: str = Query(
+        ...,
+        min_length=1,
+        max_length=50,
+        description="해시태그 접두사(앞의 # 허용). 사용 글 수 내림차순으로 제안",
+    ),
+    limit: int = Query(10, ge=1, le=20),
+    db: AsyncSession = Depends(get_slave_db),
+):
+    result = await HashtagService.suggest_hashtags(prefix, db=db, limit=limit)
+    return api_response(request, code=ApiCode.OK, data=result)
@@ -21,6 +21,8 @@ from app.common import (
     CursorPage,
     OptionalPublicId,
     PublicId,
+    api_etag_response,
+    api_json_response,
     api_response,
 )
 from app.domain.posts.schemas import PostCreateRequest, PostIdData, PostResponse, PostUpdateRequest
@@ -42,7 +44,9 @@ async def create_post(
     if cached is not None:
         return cached
     try:
-        post_id = await PostService.create_post(user.id, post_data, db=db)
+        post_id = await PostService.create_post(
+            user.id, post_data, db=db, redis=get_app_redis(request.app)
+        )
         out = api_response(request, code=ApiCode.OK, data=PostIdData(id=post_id))
         await post_create_idempotency_after_success(request, idemp_fp, out)
         return out
@@ -63,9 +67,16 @@ async def get_posts(
     size: int = Query(10, ge=1, le=100, description="페이지 크기"),
     q: str | None = Query(
         None,
-        description="검색어 (제목·본문·해시태그, pg_trgm GIN. 공백=AND, #태그=정확 매칭, 토큰 3자+)",
+        description="검색어 (제목·본문·해시태그 검색 문서, 관련도순. 공백=AND, #태그=정확 매칭·최신순, 토큰 3자+)",
     ),
     category_id: int | None = Query(None, ge=1, description="카테고리 ID 필터"),
+    since: Annotated[
+        OptionalPublicId,
+        Query(
+            description="폴링: 클라이언트가 가진 맨 위 게시글 id(공개 ID). 그보다 새 글만 최신순으로, "
+            "hasMore=true면 size보다 많아 잘린 것(cursor로 이어 받거나 목록을 새로 받는다). q와 함께 쓸 수 없다.",
+        ),
+    ] = None,
     db: AsyncSession = Depends(get_slave_db),
     current_user: CurrentUser | None = Depends(get_current_user_optional),
 ):
@@ -76,12 +87,14 @@ async def get_posts(
         category_id=category_id,
         current_user_id=current_user.id if current_user else None,
         cursor=cursor,
+        redis_client=get_app_redis(request.app),
+        since=since,
     )
-    return api_response(
-        request,
-        code=ApiCode.OK,
-        data=CursorPage(items=result, has_more=has_more),
-    )
+    data = CursorPage(items=result, has_more=has_more)
+    # 폴링 대상(첫 페이지·since)만 ETag — 무한 스크롤 뒤 페이지는 재요청되지 않아 해시 비용만 든다.
+    if cursor is None:
+        return api_etag_response(request, code=ApiCode.OK, data=data)
+    return api_json_response(request, code=ApiCode.OK, data=data)
 
 
 @router.get("/{post_id}", status_code=200, response_model=ApiResponse[PostResponse])
@@ -103,7 +116,7 @@ async def get_post(
         redis_client=redis,
         writer_db=writer_db,
     )
-    return api_response(request, code=ApiCode.OK, data=data)
+    return api_json_response(request, code=ApiCode.OK, data=data)
 
 
 @router.patch(
@@ -118,7 +131,8 @@ async def update_post(
     post_id: Annotated[PublicId, Path(..., description="게시글 공개 ID (Base62)")],
     db: AsyncSession = Depends(get_master_db),
 ):
-    await PostService.update_post(post_id, post_data, db=db)
+    redis = get_app_redis(request.app)
+    await PostService.update_post(post_id, post_data, db=db, redis=redis)
     return api_response(request, code=ApiCode.OK, data=None)
 
 
@@ -133,5 +147,6 @@ async def delete_post(
     post_id: Annotated[PublicId, Path(..., description="게시글 공개 ID (Base62)")],
     db: AsyncSession = Depends(get_master_db),
 ):
-    await PostService.delete_post(post_id, db=db)
+    redis = get_app_redis(request.app)
+    await PostService.delete_post(post_id, db=db, redis=redis)
     return api_response(request, code=ApiCode.OK, data=None)
@@ -1,4 +1,4 @@
-from .hashtag_schema import TrendingHashtagResponse
+from .hashtag_schema import HashtagSuggestionResponse, TrendingHashtagResponse
 from .post_schema import (
     AuthorInfo,
     FileInfo,
@@ -14,6 +14,7 @@ from .trending_post_schema import TrendingPostResponse
 __all__ = [
     "AuthorInfo",
     "FileInfo",
+    "HashtagSuggestionResponse",
     "HashtagsMaxSix",
     "ImageIdsMaxFive",
     "PostCreateRequest",
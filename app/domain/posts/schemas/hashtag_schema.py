@@ -4,3 +4,8 @@ from app.common import BaseSchema
 class TrendingHashtagResponse(BaseSchema):
     name: str
     count: int
+
+
+class HashtagSuggestionResponse(BaseSchema):
+    name: str
+    count: int
@@ -0,0 +1,72 @@
+# 게시글 검색 문서(ADR 0015) — 제목·해시태그·본문을 한 tsvector로 유지하고 랭킹 검색에 쓴다.
+# 'simple' 설정은 형태소 분석이 없어 한글 어절을 통째 한 토큰으로 본다("카보불닭"에서 "불닭" 불일치).
+# 그래서 색인·질의 모두 여기서 같은 규칙으로 미리 쪼갠다: 한글 연속 구간은 겹치는 2-gram
+# (1음절 구간은 그대로), 라틴·숫자는 소문자 단어. 질의는 한글 2-gram을 <->(인접)로 이어
+# 부분 문자열 일치를, 라틴 단어는 접두사(:*)로 기존 ILIKE 의미를 최대한 따른다.
+import re
+
+from sqlalchemy import ColumnElement, func, literal_column
+
+_HANGUL_RUN = re.compile(r"[가-힣]+")
+_TERM_RUN = re.compile(r"[가-힣]+|[^\W_가-힣]+")
+
+# PG 방언의 to_tsvector/to_tsquery는 첫 인자(str)를 REGCONFIG로 캐스팅해 보낸다.
+SEARCH_TS_CONFIG = "simple"
+
+
+def _hangul_bigrams(run: str) -> list[str]:
+    if len(run) == 1:
+        return [run]
+    return [run[i : i + 2] for i in range(len(run) - 1)]
+
+
+def search_terms(text: str) -> list[str]:
+    """색인용 term 목록(등장 순서 유지 — tsvector 위치가 인접 질의 <->의 근거)."""
+    terms: list[str] = []
+    for run in _TERM_RUN.findall(text.lower()):
+        if _HANGUL_RUN.fullmatch(run):
+            terms.extend(_hangul_bigrams(run))
+        else:
+            terms.append(run)
+    return terms
+
+
+def search_tsquery_text(search_q: str) -> str | None:
+    """검색어 → to_tsquery 문자열. 공백 토큰은 AND, 토큰 안 구간도 AND. term이 없으면 None.
+
+    term은 한글·영숫자만 남으므로 따옴표 안에 그대로 넣어도 tsquery 문법과 충돌하지 않는다.
+    한글 1음절 구간은 접두사로 질의한다(그 음절로 시작하는 2-gram 전부).
+    """
+    clauses: list[str] = []
+    for run in _TERM_RUN.findall(search_q.lower()):
+        if _HANGUL_RUN.fullmatch(run):
+            if len(run) == 1:
+                clauses.append(f"'{run}':*")
+            else:
+                phrase = " <-> ".join(f"'{g}'" for g in _hangul_bigrams(run))
+                clauses.append(f"({phrase})" if len(run) > 2 else phrase)
+        else:
+            clauses.append(f"'{run}':*")
+    return " & ".join(clauses) or None
+
+
+def search_tsquery(search_q: str) -> ColumnElement | None:
+    text = search_tsquery_text(search_q)
+    if text is None:
+        return None
+    return func.to_tsquery(SEARCH_TS_CONFIG, text)
+
+
+def _weighted(terms: list[str], weight: str) -> ColumnElement:
+    vector = func.to_tsvector(SEARCH_TS_CONFIG, " ".join(terms))
+    return func.setweight(vector, literal_column(f"'{weight}'"))
+
+
+def search_vector(title: str, content: str, hashtag_names: list[str]) -> ColumnElement:
+    """제목(A)·해시태그(B)·본문(C) 가중치 tsvector 식. ts_rank_cd가 제목 일치를 가장 높게 친다."""
+    tag_terms = [t for name in hashtag_names for t in search_terms(name)]
+    return (
+        _weighted(search_terms(title), "A")
+        .op("||")(_weighted(tag_terms, "B"))
+        .op("||")(_weighted(search_terms(content), "C"))
+    )
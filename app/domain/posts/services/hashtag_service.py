@@ -1,11 +1,27 @@
 import logging
+import time
+from collections.abc import Iterable
 from typing import Any
+from uuid import UUID
 
 from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.domain.posts.schemas import TrendingHashtagResponse
+from app.core.metrics import HASHTAG_SUGGEST_REQUESTS
+from app.domain.posts.hashtag_suggest import (
+    hashtag_index,
+    hashtag_usage_delta,
+    normalize_hashtag_prefix,
+    publish_hashtag_usage,
+)
+from app.domain.posts.schemas import HashtagSuggestionResponse, TrendingHashtagResponse
+from app.domain.posts.trending_hashtags import (
+    bump_trending_hashtags,
+    read_trending_hashtags,
+    trending_window_start_hour,
+)
 from app.infra.cache import get_or_compute_json
+from app.infra.redis import RedisLike
 
 from ..repository import PostsModel
 
@@ -16,9 +32,26 @@ _TRENDING_LIST_ADAPTER = TypeAdapter(list[TrendingHashtagResponse])
 
 class HashtagService:
     CACHE_TRENDING_HASHTAGS_KEY = "cache:trending_hashtags"
-    _TRENDING_HASHTAGS_TTL_SECONDS = 600
+    # 버킷 합산은 Redis 한 왕복이라 TTL을 짧게 — "지금" 트렌딩이 분 단위로 따라온다.
+    _TRENDING_HASHTAGS_TTL_SECONDS = 60
+    _TRENDING_HASHTAGS_L1_TTL_SECONDS = 10
+    _TRENDING_HASHTAGS_STALE_TTL_SECONDS = 60
     _TRENDING_HASHTAGS_LOCK_KEY = "cache:trending_hashtags:lock"
 
+    @classmethod
+    async def _compute_trending(
+        cls, db: AsyncSession, redis_client: Any | None, limit: int
+    ) -> list[TrendingHashtagResponse]:
+        rows = await read_trending_hashtags(redis_client, limit)
+        if rows is None:
+            # 버킷 재빌드 전(콜드 스타트)·Redis 불능 — 같은 창의 SQL 집계.
+            since_hour = trending_window_start_hour(time.time())
+            async with db.begin():
+                rows = await PostsModel.get_trending_hashtags(
+                    db=db, limit=limit, since_hour=since_hour
+                )
+        return [TrendingHashtagResponse(name=name, count=count) for name, count in rows]
+
     @classmethod
     async def get_trending_hashtags(
         cls,
@@ -28,9 +61,13 @@ class HashtagService:
         limit: int = 10,
     ) -> list[TrendingHashtagResponse]:
         async def loader() -> list[TrendingHashtagResponse]:
-            async with db.begin():
-                rows = await PostsModel.get_trending_hashtags(db=db, limit=limit)
-            return [TrendingHashtagResponse(name=name, count=count) for name, count in rows]
+            return await cls._compute_trending(db, redis_client, limit)
+
+        async def refresher() -> list[TrendingHashtagResponse]:
+            from app.db.session import get_reader_connection
+
+            async with get_reader_connection() as own_db:
+                return await cls._compute_trending(own_db, redis_client, limit)
 
         return await get_or_compute_json(
             redis=redis_client,
@@ -40,4 +77,43 @@ class HashtagService:
             adapter=_TRENDING_LIST_ADAPTER,
             loader=loader,
             cache_name="trending_hashtags",
+            l1_ttl_seconds=cls._TRENDING_HASHTAGS_L1_TTL_SECONDS,
+            stale_ttl_seconds=cls._TRENDING_HASHTAGS_STALE_TTL_SECONDS,
+            refresher=refresher,
         )
+
+    @classmethod
+    async def record_post_hashtags(
+        cls,
+        post_id: UUID,
+        old: Iterable[str],
+        new: Iterable[str],
+        *,
+        redis: RedisLike | None,
+    ) -> None:
+        """커밋 후: 글 하나의 **공개** 해시태그 집합 변화(작성·수정·삭제·블라인드·해제)를
+        트렌딩 시간 버킷과 자동완성 인덱스에 반영한다. 비공개 쪽은 빈 집합으로 넘긴다."""
+        old, new = list(old), list(new)
+        await bump_trending_hashtags(redis, post_id, hashtag_usage_delta(old, new))
+        await publish_hashtag_usage(redis, old, new)
+
+    @classmethod
+    async def suggest_hashtags(
+        cls,
+        prefix: str,
+        *,
+        db: AsyncSession,
+        limit: int = 10,
+    ) -> list[HashtagSuggestionResponse]:
+        """접두사 자동완성. 인덱스가 실려 있으면 프로세스 메모리만, 콜드 스타트면 DB 접두사 검색."""
+        normalized = normalize_hashtag_prefix(prefix)
+        if not normalized:
+            return []
+        if hashtag_index.ready:
+            HASHTAG_SUGGEST_REQUESTS.labels(source="index").inc()
+            rows = hashtag_index.suggest(normalized, limit)
+        else:
+            HASHTAG_SUGGEST_REQUESTS.labels(source="db").inc()
+            async with db.begin():
+                rows = await PostsModel.suggest_hashtags(normalized, limit, db=db)
+        return [HashtagSuggestionResponse(name=name, count=count) for name, count in rows]
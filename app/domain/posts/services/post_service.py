@@ -1,9 +1,12 @@
 import logging
 import re
 import secrets
+import time
+from collections.abc import Collection
 from typing import Any
 from uuid import UUID
 
+from pydantic import BaseModel, TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm.exc import StaleDataError
 
@@ -15,25 +18,143 @@ from app.common.exceptions import (
 )
 from app.core.config import settings
 from app.core.ids import new_ulid_str, parse_public_id_value
-from app.core.metrics import VIEW_BUFFER_FLUSHED_VIEWS
+from app.core.metrics import (
+    VIEW_BUFFER_FLUSH_DURATION,
+    VIEW_BUFFER_FLUSHED_ROWS,
+    VIEW_BUFFER_FLUSHED_VIEWS,
+)
+from app.domain.likes.liked_cache import LikeWindow, get_like_window, resolve_liked_post_ids
 from app.domain.likes.model import PostLikesModel
 from app.domain.media.model import MediaModel
+from app.domain.posts.counter_buffer import get_post_counter_pending
+from app.domain.posts.list_projection import post_response_from_list_row
+from app.domain.posts.post_cache import (
+    POST_DETAIL_CACHE_TTL_SECONDS,
+    POST_DETAIL_L1_TTL_SECONDS,
+    POST_FEED_CACHE_TTL_SECONDS,
+    POST_FEED_L1_TTL_SECONDS,
+    POST_FEED_POOL_SIZE,
+    POST_SEARCH_CACHE_TTL_SECONDS,
+    POST_SEARCH_L1_TTL_SECONDS,
+    POST_SEARCH_POOL_SIZE,
+    invalidate_post_caches,
+    invalidate_post_detail_cache,
+    invalidate_post_search_cache,
+    post_detail_cache_key,
+    post_detail_lock_key,
+    post_feed_cache_key,
+    post_search_cache_key,
+    post_search_write_terms,
+    register_post_search_cache,
+)
 from app.domain.posts.schemas import PostCreateRequest, PostResponse, PostUpdateRequest
+from app.domain.posts.trending_rank import VIEW_WEIGHT, bump_trending, register_trending_post
+from app.domain.posts.view_buffer import (
+    RENAME_BUFFER_TO_DRAIN_LUA,
+    merge_drain_into_buffer,
+    view_aggregator,
+    view_buffer_key,
+    view_flush_lock_key,
+    view_shard_for,
+    view_shard_tag,
+    write_view_deltas,
+)
+from app.domain.posts.view_dedup import (
+    bloom_positions,
+    view_dedup_bucket,
+    view_dedup_expire_at,
+    view_dedup_key,
+)
+from app.domain.users.block_cache import get_blocked_user_ids
+from app.infra.cache import get_or_compute_json
+from app.infra.redis import RedisLike
 
 from ..repository import PostsModel, validate_search_query
+from .hashtag_service import HashtagService
 
 log = logging.getLogger(__name__)
 
-VIEW_BUFFER_KEY = "views:{v}:buffer"
-VIEW_FLUSH_LOCK_KEY = "views:{v}:flush:lock"
-_RENAME_BUFFER_TO_DRAIN_LUA = """
-if redis.call('EXISTS', KEYS[1]) == 0 then
-  return 0
+
+# 조회 계정 1왕복. KEYS[1]=현재 Bloom 버킷, KEYS[2]=버퍼 샤드, KEYS[3]=직전 Bloom 버킷;
+# ARGV[1]=post_id 필드, ARGV[2]=1이면 새 조회를 버퍼에 HINCRBY, ARGV[3]=현재 버킷 EXPIREAT,
+# ARGV[4..]=(post, viewer) 비트 위치(없으면 dedup 끔). 두 버킷 중 하나에서 k비트가 모두 서 있으면
+# 본 뷰어. 반환 {새 조회 1|0, 버퍼 pending}.
+_ACCOUNT_VIEW_LUA = """
+local new = 1
+if #ARGV > 3 then
+  local in_cur, in_prev = 1, 1
+  for i = 4, #ARGV do
+    if in_cur == 1 and redis.call('GETBIT', KEYS[1], ARGV[i]) == 0 then
+      in_cur = 0
+    end
+    if in_prev == 1 and redis.call('GETBIT', KEYS[3], ARGV[i]) == 0 then
+      in_prev = 0
+    end
+  end
+  if in_cur == 1 or in_prev == 1 then
+    new = 0
+  else
+    for i = 4, #ARGV do
+      redis.call('SETBIT', KEYS[1], ARGV[i], 1)
+    end
+    redis.call('EXPIREAT', KEYS[1], ARGV[3])
+  end
+end
+local pending
+if new == 1 and ARGV[2] == '1' then
+  pending = redis.call('HINCRBY', KEYS[2], ARGV[1], 1)
+else
+  pending = tonumber(redis.call('HGET', KEYS[2], ARGV[1]) or '0')
 end
-redis.call('RENAME', KEYS[1], KEYS[2])
-return 1
+return {new, pending}
 """
 
+_POST_DETAIL_ADAPTER = TypeAdapter(PostResponse)
+
+
+class _FeedPool(BaseModel):
+    """피드 풀 직렬화용. exhaustive = 풀 뒤에 더 오래된 글이 없음(has_more 판정을 풀만으로 확정)."""
+
+    items: list[PostResponse]
+    exhaustive: bool
+
+
+_FEED_POOL_ADAPTER = TypeAdapter(_FeedPool)
+
+
+class _SearchPool(BaseModel):
+    """검색 결과 풀 직렬화용 — 하이드레이션 전 id만(검색 순서 그대로). exhaustive = 풀 뒤 결과 없음."""
+
+    ids: list[UUID]
+    exhaustive: bool
+
+
+_SEARCH_POOL_ADAPTER = TypeAdapter(_SearchPool)
+
+
+async def _fetch_post_list(size: int, *, db: AsyncSession, **filters: Any) -> list[Any]:
+    """목록 keyset 조회(size+1). POST_LIST_HYDRATION=core면 Core 프로젝션 행, orm이면 Post 엔티티."""
+    if settings.POST_LIST_HYDRATION == "core":
+        return await PostsModel.get_all_post_rows(size, db=db, **filters)
+    return await PostsModel.get_all_posts(size, db=db, **filters)
+
+
+async def _fetch_post_list_by_ids(
+    post_ids: list[UUID], *, db: AsyncSession, blocked_ids: Collection[UUID]
+) -> list[Any]:
+    if settings.POST_LIST_HYDRATION == "core":
+        return await PostsModel.get_list_post_rows_by_ids(post_ids, db=db, blocked_ids=blocked_ids)
+    return await PostsModel.get_list_posts_by_ids(post_ids, db=db, blocked_ids=blocked_ids)
+
+
+def _post_list_response(item: Any, *, is_liked: bool = False) -> PostResponse:
+    """_fetch_post_list* 항목 → 응답. core 행은 검증 한 번에 is_liked까지 담는다(ADR 0018)."""
+    if settings.POST_LIST_HYDRATION == "core":
+        return post_response_from_list_row(item, is_liked=is_liked)
+    response = PostResponse.model_validate(item)
+    return response.model_copy(update={"is_liked": True}) if is_liked else response
+
+
 _HASHTAG_ALLOWED_RE = re.compile(r"[^0-9a-z가-힣_]")
 
 
@@ -60,71 +181,83 @@ def _normalize_hashtags(raw: list[str]) -> list[str]:
     return out
 
 
-def _view_redis_key(post_id: UUID, viewer_key: str) -> str:
-    return f"view:post:{post_id}:viewer:{viewer_key}"
-
+async def _account_view_redis(
+    post_id: UUID, viewer_key: str, redis_client: Any | None, *, increment: bool
+) -> tuple[bool, bool, int]:
+    """Bloom dedup → 버퍼 HINCRBY → pending 읽기를 Lua 1회 왕복으로.
 
-async def _consume_view_if_new_redis(
-    post_id: UUID, viewer_key: str, redis_client: Any | None
-) -> bool:
-    # settings를 직접 읽는다 — 모듈 상수로 스냅샷하면 설정의 진실이 두 곳이 돼
-    # 테스트·런타임 재설정이 조용히 무시된다.
-    ttl_seconds = settings.VIEW_CACHE_TTL_SECONDS
-    if ttl_seconds <= 0:
-        return True  # 0 이하 = dedup 끔(같은 viewer도 매 조회 집계 — 로컬/데모 전용)
+    반환 = (새 조회인가, 버퍼에 흡수됐는가, 버퍼 pending). ``increment=False``면 dedup과 pending
+    읽기만 한다(집계기가 증가분을 맡을 때). Redis 부재·오류는 fail-open — (True, False, 0)으로
+    증가를 허용하고 호출부가 버퍼 대신 집계기·writer로 보낸다.
+    """
     if redis_client is None:
-        return True
-    key = _view_redis_key(post_id, viewer_key)
+        return True, False, 0
+    # settings를 직접 읽는다 — 모듈 상수로 스냅샷하면 설정의 진실이 두 곳이 돼
+    # 테스트·런타임 재설정이 조용히 무시된다. 0 이하 = dedup 끔(로컬/데모 전용).
+    shard = view_shard_for(post_id)
+    positions: list[int] = []
+    bucket = expire_at = 0
+    if settings.VIEW_CACHE_TTL_SECONDS > 0:
+        bucket = view_dedup_bucket()
+        expire_at = view_dedup_expire_at(bucket)
+        positions = bloom_positions(post_id, viewer_key)
     try:
-        created = await redis_client.set(key, "1", nx=True, ex=ttl_seconds)
-        return bool(created)
+        new, pending = await redis_client.eval(
+            _ACCOUNT_VIEW_LUA,
+            3,
+            view_dedup_key(shard, bucket),
+            view_buffer_key(shard),
+            view_dedup_key(shard, bucket - 1),
+            str(post_id),
+            "1" if increment else "0",
+            str(expire_at),
+            *map(str, positions),
+        )
     except Exception as e:
-        log.warning("조회수 dedup Redis 오류(Fail-open, 증가 허용): %s", e)
-        return True
+        log.warning("조회수 계정 Redis 오류(Fail-open, 증가 허용): %s", e)
+        return True, False, 0
+    is_new = bool(int(new))
+    return is_new, is_new and increment, int(pending)
 
 
 async def _get_buffer_pending(redis_client: Any | None, post_id: UUID) -> int:
     if redis_client is None:
         return 0
     try:
-        raw = await redis_client.hget(VIEW_BUFFER_KEY, str(post_id))
+        raw = await redis_client.hget(view_buffer_key(view_shard_for(post_id)), str(post_id))
         return int(raw) if raw is not None else 0
     except Exception as e:
         log.warning("조회수 버퍼 HGET 실패(Fail-open 0): %s", e)
         return 0
 
 
-async def _try_view_increment_in_buffer(post_id: UUID, redis_client: Any | None) -> bool:
-    try:
-        if redis_client is None:
-            raise ConnectionError("redis unavailable")
-        await redis_client.hincrby(VIEW_BUFFER_KEY, str(post_id), 1)
-        return True
-    except Exception as e:
-        log.warning("조회수 버퍼 HINCRBY 실패 Fail-open DB: %s", e)
-        return False
-
-
 async def _apply_view_increment(
     post_id: UUID,
     viewer_key: str,
     redis_client: Any | None,
     writer_db: AsyncSession,
-) -> bool:
+) -> tuple[bool, int]:
     """조회수 증가 안무: dedup → 버퍼 누적 → (버퍼 불가 시) writer 직접 증가 폴백.
 
-    반환 = writer DB에 직접 +1했는가. 버퍼에 흡수된 증가분은 flush 전까지 DB에 없으므로,
-    호출자가 응답 view_count를 보정할 때 pending(버퍼 잔량)과 이 반환값을 함께 쓴다."""
-    if not await _consume_view_if_new_redis(post_id, viewer_key, redis_client):
-        return False
-    if await _try_view_increment_in_buffer(post_id, redis_client):
-        return False
+    반환 = (writer DB에 직접 +1했는가, Redis 버퍼 pending). 버퍼에 흡수된 증가분은 flush 전까지
+    DB에 없으므로, 호출자가 응답 view_count를 보정할 때 pending과 직접 증가분을 함께 쓴다."""
+    # 워커 내 집계기가 돌면 Redis엔 dedup·pending 읽기만 — 증가분은 집계기 flush가 배치로 처리한다.
+    aggregate = view_aggregator.running
+    is_new, buffered, pending = await _account_view_redis(
+        post_id, viewer_key, redis_client, increment=not aggregate
+    )
+    if not is_new:
+        return False, pending
+    if aggregate and view_aggregator.add(post_id):
+        return False, pending
+    if buffered:
+        return False, pending
     async with writer_db.begin():
         try:
             await PostsModel.increment_view_count(post_id, db=writer_db)
         except StaleDataError as e:
             raise ConcurrentUpdateException() from e
-    return True
+    return True, pending
 
 
 class PostService:
@@ -134,6 +267,7 @@ class PostService:
         user_id: UUID,
         data: PostCreateRequest,
         db: AsyncSession,
+        redis: RedisLike | None = None,
     ) -> UUID:
         async with db.begin():
             if data.category_id is not None:
@@ -154,7 +288,13 @@ class PostService:
                 hashtag_names=hashtags,
                 db=db,
             )
-            return post_id
+        await invalidate_post_caches(redis, None, data.category_id)
+        await invalidate_post_search_cache(
+            redis, post_search_write_terms(data.title, data.content, hashtags or [])
+        )
+        await HashtagService.record_post_hashtags(post_id, [], hashtags or [], redis=redis)
+        await register_trending_post(redis, post_id, data.category_id)
+        return post_id
 
     @classmethod
     async def get_posts(
@@ -165,34 +305,215 @@ class PostService:
         category_id: int | None = None,
         current_user_id: UUID | None = None,
         cursor: UUID | None = None,
+        redis_client: Any | None = None,
+        since: UUID | None = None,
     ) -> tuple[list[PostResponse], bool]:
+        """목록 페이지와 has_more. since가 있으면 그 글보다 새 글만(폴링) — has_more는 새 글이
+        size보다 많아 잘렸다는 뜻이고, 클라이언트는 cursor로 이어 받거나 목록을 새로 받는다."""
         search_q = validate_search_query(q)
+        if since is not None and search_q is not None:
+            raise InvalidRequestException("since는 검색어(q)와 함께 쓸 수 없습니다.")
+        # 차단 집합·좋아요 창은 세션 트랜잭션 밖에서(미스면 자체 트랜잭션) 한 번 읽어 모든 경로에 넘긴다.
+        blocked = await get_blocked_user_ids(current_user_id, db=db, redis=redis_client)
+        like_window = (
+            await get_like_window("post", current_user_id, db=db, redis=redis_client)
+            if current_user_id is not None
+            else None
+        )
+        if redis_client is not None:
+            if search_q is None:
+                page = await cls._get_posts_from_feed_pool(
+                    size,
+                    db,
+                    category_id=category_id,
+                    current_user_id=current_user_id,
+                    blocked_ids=blocked,
+                    like_window=like_window,
+                    cursor=cursor,
+                    since=since,
+                    redis_client=redis_client,
+                )
+            else:
+                page = await cls._get_posts_from_search_cache(
+                    size,
+                    db,
+                    search_q=search_q,
+                    category_id=category_id,
+                    current_user_id=current_user_id,
+                    blocked_ids=blocked,
+                    like_window=like_window,
+                    cursor=cursor,
+                    redis_client=redis_client,
+                )
+            if page is not None:
+                return page
         async with db.begin():
             if category_id is not None:
                 ok = await PostsModel.category_exists(category_id, db=db)
                 if not ok:
                     raise InvalidRequestException("존재하지 않는 카테고리입니다.")
-            fetched = await PostsModel.get_all_posts(
+            fetched = await _fetch_post_list(
                 size,
                 db=db,
                 cursor=cursor,
                 search_q=search_q,
                 category_id=category_id,
-                current_user_id=current_user_id,
+                blocked_ids=blocked,
+                ranked_search=settings.POST_SEARCH_ENGINE == "ranked",
+                since=since,
             )
             has_more = len(fetched) > size
             posts = fetched[:size]
             liked_ids: set[UUID] = set()
             if current_user_id is not None and posts:
-                liked_ids = await PostLikesModel.get_liked_post_ids_for_user(
-                    current_user_id, [p.id for p in posts], db=db
+                liked_ids = await resolve_liked_post_ids(
+                    current_user_id, [p.id for p in posts], like_window, db=db
                 )
-            result = [
-                PostResponse.model_validate(p).model_copy(update={"is_liked": p.id in liked_ids})
-                for p in posts
-            ]
+            result = [_post_list_response(p, is_liked=p.id in liked_ids) for p in posts]
         return result, has_more
 
+    @classmethod
+    async def _get_posts_from_feed_pool(
+        cls,
+        size: int,
+        db: AsyncSession,
+        *,
+        category_id: int | None,
+        current_user_id: UUID | None,
+        blocked_ids: Collection[UUID],
+        like_window: LikeWindow | None,
+        cursor: UUID | None,
+        since: UUID | None,
+        redis_client: Any,
+    ) -> tuple[list[PostResponse], bool] | None:
+        """캐시된 최신 글 풀(차단 무관)에서 페이지를 잘라낸다. 풀로 페이지를 확정할 수 없으면
+        (커서가 풀 밖·차단 필터 후 부족) None — 호출부가 DB keyset 조회로 폴백한다.
+
+        since 폴링은 풀이 since까지 내려가면(풀 끝 id <= since) 풀만으로 확정된다 — 새 글이 없는
+        유휴 폴링은 DB를 타지 않는다."""
+
+        async def loader() -> _FeedPool:
+            async with db.begin():
+                if category_id is not None:
+                    ok = await PostsModel.category_exists(category_id, db=db)
+                    if not ok:
+                        raise InvalidRequestException("존재하지 않는 카테고리입니다.")
+                fetched = await _fetch_post_list(
+                    POST_FEED_POOL_SIZE, db=db, category_id=category_id
+                )
+            return _FeedPool(
+                items=[_post_list_response(p) for p in fetched[:POST_FEED_POOL_SIZE]],
+                exhaustive=len(fetched) <= POST_FEED_POOL_SIZE,
+            )
+
+        key = post_feed_cache_key(category_id)
+        pool = await get_or_compute_json(
+            redis=redis_client,
+            key=key,
+            lock_key=f"{key}:lock",
+            ttl_seconds=POST_FEED_CACHE_TTL_SECONDS,
+            adapter=_FEED_POOL_ADAPTER,
+            loader=loader,
+            cache_name="post_feed",
+            l1_ttl_seconds=POST_FEED_L1_TTL_SECONDS,
+        )
+        # 풀은 id DESC 정렬 — keyset(id < cursor)을 그대로 적용한다.
+        items = pool.items if cursor is None else [p for p in pool.items if p.id < cursor]
+        complete = pool.exhaustive
+        if since is not None:
+            items = [p for p in items if p.id > since]
+            complete = complete or (bool(pool.items) and pool.items[-1].id <= since)
+        if current_user_id is None:
+            if len(items) <= size and not complete:
+                return None
+            return items[:size], len(items) > size
+
+        visible = [p for p in items if p.author is None or p.author.id not in blocked_ids]
+        if len(visible) <= size and not complete:
+            return None
+        page = visible[:size]
+        liked_ids: set[UUID] = set()
+        if page:
+            async with db.begin():
+                liked_ids = await resolve_liked_post_ids(
+                    current_user_id, [p.id for p in page], like_window, db=db
+                )
+        # 풀 객체는 요청 간 공유(L1) — 원본을 바꾸지 않고 복사본에 is_liked를 얹는다.
+        result = [p.model_copy(update={"is_liked": p.id in liked_ids}) for p in page]
+        return result, len(visible) > size
+
+    @classmethod
+    async def _get_posts_from_search_cache(
+        cls,
+        size: int,
+        db: AsyncSession,
+        *,
+        search_q: str,
+        category_id: int | None,
+        current_user_id: UUID | None,
+        blocked_ids: Collection[UUID],
+        like_window: LikeWindow | None,
+        cursor: UUID | None,
+        redis_client: Any,
+    ) -> tuple[list[PostResponse], bool] | None:
+        """캐시된 검색 결과 id 풀(차단 무관)에서 페이지 분량만 하이드레이션한다. 풀로 페이지를 확정할
+        수 없으면(커서가 풀 밖·숨김/차단 글로 부족) None — 호출부가 DB 검색으로 폴백한다."""
+        engine = settings.POST_SEARCH_ENGINE
+        key = post_search_cache_key(engine, category_id, search_q)
+
+        async def loader() -> _SearchPool:
+            async with db.begin():
+                if category_id is not None:
+                    ok = await PostsModel.category_exists(category_id, db=db)
+                    if not ok:
+                        raise InvalidRequestException("존재하지 않는 카테고리입니다.")
+                ids = await PostsModel.get_search_post_ids(
+                    POST_SEARCH_POOL_SIZE + 1,
+                    db=db,
+                    search_q=search_q,
+                    category_id=category_id,
+                    ranked_search=engine == "ranked",
+                )
+            await register_post_search_cache(redis_client, key, search_q, engine=engine)
+            return _SearchPool(
+                ids=ids[:POST_SEARCH_POOL_SIZE], exhaustive=len(ids) <= POST_SEARCH_POOL_SIZE
+            )
+
+        pool = await get_or_compute_json(
+            redis=redis_client,
+            key=key,
+            lock_key=f"{key}:lock",
+            ttl_seconds=POST_SEARCH_CACHE_TTL_SECONDS,
+            adapter=_SEARCH_POOL_ADAPTER,
+            loader=loader,
+            cache_name="post_search",
+            l1_ttl_seconds=POST_SEARCH_L1_TTL_SECONDS,
+        )
+        # 풀은 검색 순서(관련도 또는 id) 그대로 — 커서는 풀 안 위치로 자른다.
+        if cursor is None:
+            start = 0
+        elif cursor in pool.ids:
+            start = pool.ids.index(cursor) + 1
+        else:
+            return None
+        window = pool.ids[start : start + size + 1]
+        reaches_end = pool.exhaustive and start + len(window) >= len(pool.ids)
+
+        async with db.begin():
+            posts = await _fetch_post_list_by_ids(window, db=db, blocked_ids=blocked_ids)
+            by_id = {p.id: p for p in posts}
+            visible = [by_id[i] for i in window if i in by_id]
+            if len(visible) <= size and not reaches_end:
+                return None
+            page = visible[:size]
+            liked_ids: set[UUID] = set()
+            if current_user_id is not None and page:
+                liked_ids = await resolve_liked_post_ids(
+                    current_user_id, [p.id for p in page], like_window, db=db
+                )
+            result = [_post_list_response(p, is_liked=p.id in liked_ids) for p in page]
+        return result, len(visible) > size
+
     @classmethod
     async def get_post_detail(
         cls,
@@ -204,41 +525,84 @@ class PostService:
         redis_client: Any | None = None,
         writer_db: AsyncSession | None = None,
     ) -> PostResponse:
-        async with db.begin():
-            if current_user_id is not None:
-                post_with_like = await PostsModel.get_post_by_id_with_like_flag(
-                    post_id, current_user_id, db=db
-                )
-                if not post_with_like:
-                    raise PostNotFoundException()
-                post, is_liked = post_with_like
-                data = PostResponse.model_validate(post).model_copy(update={"is_liked": is_liked})
-            else:
-                post = await PostsModel.get_post_by_id(post_id, db=db, current_user_id=None)
+        async def loader() -> PostResponse:
+            # 차단 무관 스냅샷 — 사용자별 키로 쪼개지 않게 차단 필터 없이 읽는다.
+            async with db.begin():
+                post = await PostsModel.get_post_by_id(post_id, db=db)
                 if not post:
                     raise PostNotFoundException()
-                data = PostResponse.model_validate(post)
+                return PostResponse.model_validate(post)
 
-        extra_db = 0
-        if writer_db is not None and await _apply_view_increment(
-            post_id, viewer_key, redis_client, writer_db
-        ):
-            extra_db = 1
+        data = await get_or_compute_json(
+            redis=redis_client,
+            key=post_detail_cache_key(post_id),
+            lock_key=post_detail_lock_key(post_id),
+            ttl_seconds=POST_DETAIL_CACHE_TTL_SECONDS,
+            adapter=_POST_DETAIL_ADAPTER,
+            loader=loader,
+            cache_name="post_detail",
+            l1_ttl_seconds=POST_DETAIL_L1_TTL_SECONDS,
+        )
 
-        pending = await _get_buffer_pending(redis_client, post_id)
-        return data.model_copy(update={"view_count": data.view_count + pending + extra_db})
+        if current_user_id is not None:
+            # 요청별 오버레이: 차단 저자면 존재하지 않는 글로 취급, is_liked는 스냅샷에 싣지 않는다.
+            blocked = await get_blocked_user_ids(current_user_id, db=db, redis=redis_client)
+            if data.author is not None and data.author.id in blocked:
+                raise PostNotFoundException()
+            # 좋아요 창이 판정하면(창 하한보다 새 글·좋아요가 적은 사용자) EXISTS 왕복 없이 채운다.
+            window = await get_like_window("post", current_user_id, db=db, redis=redis_client)
+            if window is not None and not window.split([post_id])[1]:
+                is_liked = post_id in window.ids
+            else:
+                async with db.begin():
+                    is_liked = await PostLikesModel.has_like(post_id, current_user_id, db=db)
+            data = data.model_copy(update={"is_liked": is_liked})
+
+        if writer_db is not None:
+            applied_db, pending = await _apply_view_increment(
+                post_id, viewer_key, redis_client, writer_db
+            )
+            extra_db = 1 if applied_db else 0
+        else:
+            extra_db, pending = 0, await _get_buffer_pending(redis_client, post_id)
+        pending += view_aggregator.pending(post_id)
+        like_pending, comment_pending = await get_post_counter_pending(redis_client, post_id)
+        return data.model_copy(
+            update={
+                "view_count": data.view_count + pending + extra_db,
+                "like_count": max(data.like_count + like_pending, 0),
+                "comment_count": max(data.comment_count + comment_pending, 0),
+            }
+        )
 
     @classmethod
     async def flush_view_counts_to_db(cls, redis_client: Any | None) -> None:
+        """샤드별로 독립 flush한다(샤드마다 자기 락·drain). 한 샤드 실패가 나머지를 막지 않고,
+        첫 예외는 전 샤드를 돈 뒤 올린다 — 실패 샤드는 재병합돼 다음 틱에 재시도된다."""
         if redis_client is None:
             return
+        first_error: Exception | None = None
+        for shard in range(settings.VIEW_BUFFER_SHARDS):
+            try:
+                await cls._flush_view_shard(redis_client, shard)
+            except Exception as e:
+                log.warning("조회수 flush 샤드 %d 실패(재병합됨, 다음 틱 재시도): %s", shard, e)
+                if first_error is None:
+                    first_error = e
+        if first_error is not None:
+            raise first_error
+
+    @classmethod
+    async def _flush_view_shard(cls, redis_client: Any, shard: int) -> None:
+        buffer_key = view_buffer_key(shard)
+        lock_key = view_flush_lock_key(shard)
         lock_acquired = False
         lock_value = secrets.token_urlsafe(24)
-        drain_key = f"views:{{v}}:drain:{new_ulid_str()}"
+        drain_key = f"views:{{{view_shard_tag(shard)}}}:drain:{new_ulid_str()}"
         try:
             lock_acquired = bool(
                 await redis_client.set(
-                    VIEW_FLUSH_LOCK_KEY,
+                    lock_key,
                     lock_value,
                     nx=True,
                     ex=settings.VIEW_FLUSH_LOCK_SECONDS,
@@ -246,39 +610,38 @@ class PostService:
             )
             if not lock_acquired:
                 return
-            renamed = await redis_client.eval(
-                _RENAME_BUFFER_TO_DRAIN_LUA, 2, VIEW_BUFFER_KEY, drain_key
-            )
+            renamed = await redis_client.eval(RENAME_BUFFER_TO_DRAIN_LUA, 2, buffer_key, drain_key)
             if not int(renamed):
                 return
             fields = await redis_client.hgetall(drain_key)
             if not fields:
                 await redis_client.delete(drain_key)
                 return
-            from app.db.session import get_connection
-
-            flushed_views = 0
+            flushed: dict[UUID, int] = {}
+            started = time.perf_counter()
             try:
-                async with get_connection() as db:
-                    async with db.begin():
-                        for pid, cnt_raw in fields.items():
-                            delta = int(cnt_raw)
-                            if delta > 0:
-                                pk = (
-                                    pid.decode("utf-8")
-                                    if isinstance(pid, (bytes, bytearray))
-                                    else str(pid)
-                                )
-                                await PostsModel.increment_view_count_delta(
-                                    parse_public_id_value(pk), delta, db=db
-                                )
-                                flushed_views += delta
+                for pid, cnt_raw in fields.items():
+                    delta = int(cnt_raw)
+                    if delta > 0:
+                        pk = (
+                            pid.decode("utf-8") if isinstance(pid, (bytes, bytearray)) else str(pid)
+                        )
+                        flushed[parse_public_id_value(pk)] = delta
+                updated_rows = await write_view_deltas(flushed)
             except Exception:
                 # DB 트랜잭션이 롤백된 경우에만 재병합해야 이중 집계가 없다.
-                await cls._merge_drain_into_buffer(redis_client, drain_key, VIEW_BUFFER_KEY)
+                await merge_drain_into_buffer(redis_client, drain_key, buffer_key)
                 raise
             # 커밋 성공분만 계측(롤백 시 위에서 raise되어 여기 안 옴).
-            VIEW_BUFFER_FLUSHED_VIEWS.inc(flushed_views)
+            VIEW_BUFFER_FLUSH_DURATION.observe(time.perf_counter() - started)
+            VIEW_BUFFER_FLUSHED_VIEWS.inc(sum(flushed.values()))
+            VIEW_BUFFER_FLUSHED_ROWS.inc(updated_rows)
+            # 버퍼 pending이 DB로 옮겨졌으니 상세 스냅샷(이전 view_count)을 끊는다 — 안 끊으면
+            # 스냅샷 + 줄어든 pending으로 표시 조회수가 TTL 동안 뒤로 간다.
+            await invalidate_post_detail_cache(redis_client, *flushed)
+            await bump_trending(
+                redis_client, {pid: delta * VIEW_WEIGHT for pid, delta in flushed.items()}
+            )
             # 커밋 성공 후에는 delta가 이미 durable하므로 drain 삭제 실패는 재병합하면 안 된다
             # (재병합 시 커밋분을 다시 더해 이중 집계). best-effort 삭제 — 실패해도 유실 없음.
             try:
@@ -292,34 +655,28 @@ class PostService:
                         "if redis.call('GET', KEYS[1]) == ARGV[1] then "
                         "return redis.call('DEL', KEYS[1]) else return 0 end",
                         1,
-                        VIEW_FLUSH_LOCK_KEY,
+                        lock_key,
                         lock_value,
                     )
                 except Exception as e:
                     log.warning("조회수 flush 락 해제 실패: %s", e)
 
-    @staticmethod
-    async def _merge_drain_into_buffer(redis_client: Any, drain_key: str, buffer_key: str) -> None:
-        fields = await redis_client.hgetall(drain_key)
-        if not fields:
-            await redis_client.delete(drain_key)
-            return
-        for pid, cnt_raw in fields.items():
-            await redis_client.hincrby(buffer_key, pid, int(cnt_raw))
-        await redis_client.delete(drain_key)
-
     @classmethod
     async def update_post(
         cls,
         post_id: UUID,
         data: PostUpdateRequest,
         db: AsyncSession,
+        redis: RedisLike | None = None,
     ) -> None:
         fs = data.model_fields_set
         async with db.begin():
             post = await PostsModel.get_post_by_id(post_id, db=db)
             if not post:
                 raise PostNotFoundException()
+            old_category_id = post.category_id
+            # update_post가 같은 identity의 글을 고치므로 무효화 term용 이전 값을 먼저 떠 둔다.
+            old_search_fields = (post.title, post.content, [h.name for h in post.hashtags])
             if "version" in fs and data.version is not None:
                 if data.version != post.version:
                     raise ConcurrentUpdateException(
@@ -348,16 +705,48 @@ class PostService:
                     category_id=category_id,
                     hashtag_names=hashtags,
                     db=db,
+                    current_hashtag_names=old_search_fields[2],
                 )
             except StaleDataError as e:
                 raise ConcurrentUpdateException() from e
 
             if delta is None:
                 raise PostNotFoundException()
+        await invalidate_post_caches(redis, post_id, old_category_id, category_id)
+        if (
+            title is not None
+            or content is not None
+            or hashtags is not None
+            or category_id is not None
+        ):
+            old_title, old_content, old_tags = old_search_fields
+            terms = post_search_write_terms(old_title, old_content, old_tags)
+            terms |= post_search_write_terms(
+                title if title is not None else old_title,
+                content if content is not None else old_content,
+                hashtags if hashtags is not None else old_tags,
+            )
+            await invalidate_post_search_cache(redis, terms)
+        if hashtags is not None:
+            await HashtagService.record_post_hashtags(
+                post_id, old_search_fields[2], hashtags, redis=redis
+            )
+        if category_id is not None and category_id != old_category_id:
+            await register_trending_post(redis, post_id, category_id)
 
     @classmethod
-    async def delete_post(cls, post_id: UUID, db: AsyncSession) -> None:
+    async def delete_post(
+        cls, post_id: UUID, db: AsyncSession, redis: RedisLike | None = None
+    ) -> None:
         async with db.begin():
+            category_id = await PostsModel.get_post_category_id(post_id, db=db)
+            search_fields = await PostsModel.get_post_search_fields(post_id, db=db)
+            public_tags = await PostsModel.get_public_hashtag_names(post_id, db=db)
             success, _image_ids = await PostsModel.delete_post(post_id, db=db)
             if not success:
                 raise PostNotFoundException()
+        await invalidate_post_caches(redis, post_id, category_id)
+        if search_fields is not None:
+            await invalidate_post_search_cache(redis, post_search_write_terms(*search_fields))
+        if public_tags:
+            await HashtagService.record_post_hashtags(post_id, public_tags, [], redis=redis)
@@ -7,6 +7,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.posts.repository import PostsModel
 from app.domain.posts.schemas import TrendingPostResponse
+from app.domain.posts.trending_rank import (
+    COMMENT_WEIGHT,
+    LIKE_WEIGHT,
+    VIEW_WEIGHT,
+    read_trending_ids,
+    seed_trending,
+)
+from app.domain.users.block_cache import get_blocked_user_ids
 from app.infra.cache import get_or_compute_json
 
 log = logging.getLogger(__name__)
@@ -22,7 +30,14 @@ _FALLBACK_WINDOW_HOURS = 24 * 7
 # 풀은 최대 limit(10)의 headroom 배수만큼 담아, 차단 저자가 상위에 있어도 limit을 채운다.
 _MAX_LIMIT = 10
 _POOL_SIZE = _MAX_LIMIT * 3
-_CACHE_TTL_SECONDS = 300
+# 랭킹은 이벤트로 ZSET에 실시간 누적되고, 풀 계산은 ZREVRANGE + PK 하이드레이션뿐이라 짧게 둔다.
+_CACHE_TTL_SECONDS = 30
+# soft TTL 뒤에도 이만큼 stale 값을 주며 백그라운드로 갱신한다(만료 절벽 제거).
+_STALE_TTL_SECONDS = 60
+# ZSET 상위에서 삭제·블라인드 글이 빠져도 풀을 채우도록 여유분을 더 읽는다.
+_ZSET_READ_SIZE = _POOL_SIZE * 2
+# L1(프로세스 로컬)은 짧게 — 인스턴스 간 풀 불일치 창의 상한.
+_L1_TTL_SECONDS = 10
 
 
 class _TrendingCacheItem(BaseModel):
@@ -36,6 +51,18 @@ class _TrendingCacheItem(BaseModel):
     view_count: int = 0
     author_id: UUID | None = None
 
+    @classmethod
+    def from_post(cls, p: Any) -> "_TrendingCacheItem":
+        return cls(
+            id=p.id,
+            title=p.title,
+            category_id=p.category_id,
+            comment_count=p.comment_count,
+            like_count=p.like_count,
+            view_count=p.view_count,
+            author_id=p.user_id,
+        )
+
 
 _POOL_ADAPTER = TypeAdapter(list[_TrendingCacheItem])
 
@@ -55,7 +82,14 @@ class TrendingPostService:
         cache_key = f"cache:trending_posts:{category_id if category_id else 'all'}"
 
         async def loader() -> list[_TrendingCacheItem]:
-            return await cls._compute_pool(db=db, category_id=category_id)
+            return await cls._load_pool(redis_client, db=db, category_id=category_id)
+
+        async def refresher() -> list[_TrendingCacheItem]:
+            # 백그라운드 갱신은 요청 수명 밖 — 요청 세션 대신 자체 reader 세션.
+            from app.db.session import get_reader_connection
+
+            async with get_reader_connection() as own_db:
+                return await cls._load_pool(redis_client, db=own_db, category_id=category_id)
 
         pool = await get_or_compute_json(
             redis=redis_client,
@@ -65,13 +99,15 @@ class TrendingPostService:
             adapter=_POOL_ADAPTER,
             loader=loader,
             cache_name="trending_posts",
+            l1_ttl_seconds=_L1_TTL_SECONDS,
+            stale_ttl_seconds=_STALE_TTL_SECONDS,
+            refresher=refresher,
         )
 
         # 차단 오버레이: 내가 차단한 저자의 글을 캐시된 풀에서 제거한 뒤 limit만큼 자른다.
-        # 세션은 autobegin=False이므로 조회도 명시적 트랜잭션 안에서 수행한다.
+        # 차단 집합은 사용자별 캐시(users.block_cache) — 미스일 때만 자체 트랜잭션으로 읽는다.
         if current_user_id is not None and pool:
-            async with db.begin():
-                blocked = await PostsModel.get_blocked_author_ids(current_user_id, db=db)
+            blocked = await get_blocked_user_ids(current_user_id, db=db, redis=redis_client)
             if blocked:
                 pool = [it for it in pool if it.author_id not in blocked]
 
@@ -87,18 +123,48 @@ class TrendingPostService:
             for it in pool[:limit]
         ]
 
+    @classmethod
+    async def _load_pool(
+        cls, redis_client: Any | None, *, db: AsyncSession, category_id: int | None
+    ) -> list[_TrendingCacheItem]:
+        """ZSET 상위 id를 하이드레이션한 풀. ZSET이 비었거나(콜드 스타트) 표시 가능한 글이
+        time-decay 최소치에 못 미치면 SQL 재계산으로 폴백하고 결과로 ZSET을 시딩한다."""
+        ids = await read_trending_ids(redis_client, category_id, _ZSET_READ_SIZE)
+        if len(ids) >= _MIN_POSTS_FOR_TIME_DECAY:
+            async with db.begin():
+                posts = await PostsModel.get_visible_posts_by_ids(ids, db=db)
+            by_id = {p.id: p for p in posts}
+            ranked = [by_id[i] for i in ids if i in by_id][:_POOL_SIZE]
+            if len(ranked) >= _MIN_POSTS_FOR_TIME_DECAY:
+                return [_TrendingCacheItem.from_post(p) for p in ranked]
+        pool = await cls._compute_pool(db=db, category_id=category_id)
+        # 시딩은 창(24h) 안의 글만 반영된다 — 7일·전체 fallback 결과는 자연히 걸러진다.
+        await seed_trending(
+            redis_client,
+            (
+                (
+                    it.id,
+                    it.category_id,
+                    it.comment_count * COMMENT_WEIGHT
+                    + it.like_count * LIKE_WEIGHT
+                    + it.view_count * VIEW_WEIGHT,
+                )
+                for it in pool
+            ),
+        )
+        return pool
+
     @classmethod
     async def _compute_pool(
         cls, *, db: AsyncSession, category_id: int | None
     ) -> list[_TrendingCacheItem]:
-        """차단 무관(current_user_id=None) 랭킹 풀을 3단 fallback으로 계산한다."""
+        """차단 무관(blocked_ids 없이) 랭킹 풀을 3단 fallback으로 계산한다(콜드 스타트·폴백 재계산)."""
         async with db.begin():
             posts = await PostsModel.get_trending_posts(
                 db=db,
                 limit=_POOL_SIZE,
                 window_hours=_WINDOW_HOURS,
                 category_id=category_id,
-                current_user_id=None,
                 use_time_decay=True,
             )
             if len(posts) < _MIN_POSTS_FOR_TIME_DECAY:
@@ -113,7 +179,6 @@ class TrendingPostService:
                     limit=_POOL_SIZE,
                     window_hours=_FALLBACK_WINDOW_HOURS,
                     category_id=category_id,
-                    current_user_id=None,
                     use_time_decay=False,
                 )
             if len(posts) == 0:
@@ -123,19 +188,7 @@ class TrendingPostService:
                     limit=_POOL_SIZE,
                     window_hours=None,
                     category_id=category_id,
-                    current_user_id=None,
                     use_time_decay=False,
                 )
 
-        return [
-            _TrendingCacheItem(
-                id=p.id,
-                title=p.title,
-                category_id=p.category_id,
-                comment_count=p.comment_count,
-                like_count=p.like_count,
-                view_count=p.view_count,
-                author_id=p.user_id,
-            )
-            for p in posts
-        ]
+        return [_TrendingCacheItem.from_post(p) for p in posts]
@@ -0,0 +1,155 @@
+# 트렌딩 해시태그(ADR 0017) — 시간 버킷 카운터. 글 작성 시각(UUIDv7)의 시(hour)마다 ZSET 하나
+# (member = 해시태그명, score = 그 시각에 작성된 공개 글 중 태그를 단 글 수)를 두고, 태그 변경·삭제·
+# 블라인드가 커밋 후 ±1을 ZINCRBY한다. 읽기는 창(HASHTAG_TRENDING_WINDOW_HOURS)의 버킷을
+# ZUNIONSTORE로 합쳐 상위 K개만 읽는다 — 요청 경로에 SQL 집계가 없다.
+#
+# 버킷은 "글이 언제 태그됐나"가 아니라 "글이 언제 작성됐나"로 나눈다. 그래야 감소 이벤트가 증가를
+# 받은 버킷을 DB 조회 없이 찾고, SQL 재빌드가 같은 값을 정확히 다시 만든다(작성 시각 GROUP BY).
+# 마커 두 개: seeded(버킷이 한 번이라도 채워졌나 — 없으면 읽기가 SQL로 폴백)와 fresh(TTL = 재빌드
+# 주기). cleanup 틱이 fresh가 없을 때(콜드 스타트·Redis 유실·주기 경과) 재빌드해 유실·경합으로 어긋난
+# 카운트를 바로잡는다 — fresh 만료가 읽기를 SQL로 떨어뜨리지 않게 분리했다. 전부 fail-open.
+import logging
+import time
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from uuid import UUID
+
+from app.core.config import settings
+from app.domain.posts.trending_rank import post_created_at_seconds
+from app.infra.redis import RedisLike
+
+log = logging.getLogger(__name__)
+
+# {h} 해시태그로 전 키를 한 슬롯에 — 클러스터에서도 ZUNIONSTORE가 버킷을 한 노드에서 합친다.
+TRENDING_HASHTAG_BUCKET_PREFIX = "trending:{h}:hashtags:hour:"
+TRENDING_HASHTAG_WINDOW_KEY = "trending:{h}:hashtags:window"
+TRENDING_HASHTAG_SEEDED_KEY = "trending:{h}:hashtags:seeded"
+TRENDING_HASHTAG_FRESH_KEY = "trending:{h}:hashtags:fresh"
+_REBUILD_LOCK_KEY = "trending:{h}:hashtags:rebuild_lock"
+_REBUILD_LOCK_SECONDS = 60
+# 합친 창 ZSET 보관(초). 응답 캐시가 앞에 있어 재사용보다 메모리 상한 용도.
+_WINDOW_KEY_TTL_SECONDS = 60
+_HOUR = 3600
+
+
+def _hour(ts: float) -> int:
+    return int(ts // _HOUR)
+
+
+def trending_hashtag_bucket_key(hour: int) -> str:
+    return f"{TRENDING_HASHTAG_BUCKET_PREFIX}{hour}"
+
+
+def trending_window_start_hour(now: float) -> int:
+    """창 첫 버킷(현재 시 포함 최근 N시간). SQL 폴백·재빌드도 같은 경계를 쓴다."""
+    return _hour(now) - settings.HASHTAG_TRENDING_WINDOW_HOURS + 1
+
+
+def _bucket_ttl_seconds(hour: int, now: float) -> int:
+    # 버킷이 창에서 빠지는 시각 + 1h 여유.
+    expires_at = (hour + settings.HASHTAG_TRENDING_WINDOW_HOURS + 1) * _HOUR
+    return max(int(expires_at - now), 1)
+
+
+async def bump_trending_hashtags(
+    redis_client: RedisLike | None,
+    post_id: UUID,
+    delta: Mapping[str, int],
+    *,
+    now: float | None = None,
+) -> None:
+    """글 하나의 공개 해시태그 증감(+1/−1)을 작성 시각 버킷에 반영한다. 창 밖 글은 무시. 커밋 후 호출."""
+    if redis_client is None or not delta:
+        return
+    ts = time.time() if now is None else now
+    hour = _hour(post_created_at_seconds(post_id))
+    if hour < trending_window_start_hour(ts):
+        return
+    key = trending_hashtag_bucket_key(hour)
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for name, d in delta.items():
+                pipe.zincrby(key, d, name)
+            pipe.expire(key, _bucket_ttl_seconds(hour, ts))
+            await pipe.execute()
+    except Exception as e:
+        log.warning("trending hashtag bump failed (ignored): %s", e)
+
+
+def _decode(member: object) -> str:
+    return member.decode("utf-8") if isinstance(member, (bytes, bytearray)) else str(member)
+
+
+async def read_trending_hashtags(
+    redis_client: RedisLike | None, limit: int, *, now: float | None = None
+) -> list[tuple[str, int]] | None:
+    """창 버킷 합 상위 limit개(사용 수 내림차순). 재빌드 전·Redis 부재·오류는 None(→ SQL 폴백)."""
+    if redis_client is None or limit <= 0:
+        return None
+    ts = time.time() if now is None else now
+    keys = [
+        trending_hashtag_bucket_key(h) for h in range(trending_window_start_hour(ts), _hour(ts) + 1)
+    ]
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.get(TRENDING_HASHTAG_SEEDED_KEY)
+            pipe.zunionstore(TRENDING_HASHTAG_WINDOW_KEY, keys)
+            pipe.zrevrange(TRENDING_HASHTAG_WINDOW_KEY, 0, limit - 1, withscores=True)
+            pipe.expire(TRENDING_HASHTAG_WINDOW_KEY, _WINDOW_KEY_TTL_SECONDS)
+            seeded, _, rows, _ = await pipe.execute()
+    except Exception as e:
+        log.warning("trending hashtag read failed (fallback to sql): %s", e)
+        return None
+    if seeded is None:
+        return None
+    # 0 이하(감소가 증가를 앞지른 경합분)는 뺀다 — 다음 재빌드가 바로잡는다.
+    return [(_decode(m), int(s)) for m, s in rows if int(s) > 0]
+
+
+async def trending_hashtags_fresh(redis_client: RedisLike | None) -> bool:
+    """재빌드 주기 안이면 True(cleanup이 재빌드를 건너뛴다). Redis 부재면 재빌드할 곳이 없어 True."""
+    if redis_client is None:
+        return True
+    return await redis_client.get(TRENDING_HASHTAG_FRESH_KEY) is not None
+
+
+async def rebuild_trending_hashtags(
+    redis_client: RedisLike | None,
+    load_rows: Callable[[int], Awaitable[Iterable[tuple[int, str, int]]]],
+    *,
+    now: float | None = None,
+) -> bool:
+    """SQL 집계((작성 시, 해시태그명, 글 수))로 창 버킷을 통째 교체하고 seeded·fresh 마커를 단다.
+
+    ``load_rows(창 첫 시)``는 락을 잡은 뒤에 부른다 — 인스턴스 간 중복 재빌드(중복 집계 쿼리)는
+    SET NX 락으로 건너뛴다. 교체는 MULTI 한 번이라 읽기가 반쯤 채운 버킷을 보지 않는다.
+    반환: 재빌드 수행 여부.
+    """
+    if redis_client is None:
+        return False
+    ts = time.time() if now is None else now
+    if not await redis_client.set(_REBUILD_LOCK_KEY, "1", nx=True, ex=_REBUILD_LOCK_SECONDS):
+        return False
+    start = trending_window_start_hour(ts)
+    try:
+        by_hour: dict[int, dict[str, int]] = {}
+        for hour, name, count in await load_rows(start):
+            if count > 0:
+                by_hour.setdefault(hour, {})[name] = count
+        async with redis_client.pipeline(transaction=True) as pipe:
+            for hour in range(start, _hour(ts) + 1):
+                key = trending_hashtag_bucket_key(hour)
+                pipe.delete(key)
+                if counts := by_hour.get(hour):
+                    pipe.zadd(key, counts)
+                    pipe.expire(key, _bucket_ttl_seconds(hour, ts))
+            # seeded는 창 길이만큼 — 재빌드가 멈춰도 그동안은 이벤트로 유지되는 버킷을 읽는다.
+            pipe.set(TRENDING_HASHTAG_SEEDED_KEY, "1", ex=_bucket_ttl_seconds(_hour(ts), ts))
+            pipe.set(
+                TRENDING_HASHTAG_FRESH_KEY,
+                "1",
+                ex=settings.HASHTAG_TRENDING_REBUILD_INTERVAL_SECONDS,
+            )
+            await pipe.execute()
+    finally:
+        await redis_client.delete(_REBUILD_LOCK_KEY)
+    return True
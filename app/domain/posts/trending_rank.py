@@ -0,0 +1,237 @@
+# 실시간 트렌딩 랭킹(ADR 0004) — 참여 이벤트(좋아요·댓글·조회수 flush)가 Redis ZSET 점수를 올린다.
+# 게시글·좋아요·댓글 서비스가 함께 쓰는 계약이라 공개 모듈로 둔다. 전부 fail-open — 랭킹 갱신
+# 실패가 본편(좋아요·댓글 커밋)을 막지 않고, 읽기 쪽은 SQL 재계산으로 폴백한다.
+#
+# 점수 = ln Σ wᵢ·e^{(tᵢ−T₀)/τ} (로그 공간 누적). 이벤트 시각이 지수에 들어가 있어 현재 시각 기준
+# 감쇠 순위 Σ wᵢ·e^{−(now−tᵢ)/τ}와 순서가 같고, 공통 인자 e^{(now−T₀)/τ}만 다르다 — 시간이 흘러도
+# 기존 멤버를 재채점할 필요가 없다. 로그 공간이라 지수가 커져도 double이 넘치지 않는다.
+import logging
+import math
+import time
+from collections.abc import Iterable, Mapping
+from uuid import UUID
+
+from app.infra.redis import RedisLike
+
+log = logging.getLogger(__name__)
+
+# {t} 해시태그로 전 키를 한 슬롯에 — Lua가 카테고리 키를 동적으로 조립해도 같은 노드에서 실행된다.
+TRENDING_ALL_KEY = "trending:{t}:posts:all"
+TRENDING_CATEGORY_KEY_PREFIX = "trending:{t}:posts:cat:"
+# post_id → category_id. 이벤트는 post_id만 알므로 카테고리 ZSET 반영에 쓴다(작성·시딩 시 기록).
+TRENDING_POST_CATEGORY_KEY = "trending:{t}:post_category"
+
+# SQL time-decay와 같은 가중치(댓글 3 · 좋아요 2 · 조회 0.1).
+COMMENT_WEIGHT = 3.0
+LIKE_WEIGHT = 2.0
+VIEW_WEIGHT = 0.1
+# 집계 창(SQL과 동일 24h) — 창 밖 글은 이벤트를 무시하고 컴팩션이 제거한다.
+TRENDING_WINDOW_SECONDS = 24 * 3600
+# 감쇠 시간상수 τ. 6h면 하루 전 참여는 e^-4 ≈ 2%만 남는다.
+_DECAY_SECONDS = 6 * 3600
+# 점수 기준 시각 T₀(2024-01-01 UTC) — 지수를 작게 유지해 정밀도를 지킨다.
+_EPOCH_SECONDS = 1_704_067_200
+# 감쇠 후 가중합이 이 값 아래(조회 1회의 1/10)면 컴팩션이 제거한다.
+_COLD_WEIGHT = 0.01
+
+# 로그 공간 누적(log-sum-exp). KEYS[1]=전체 ZSET, KEYS[2]=카테고리 해시, ARGV[1]=카테고리 키 접두사,
+# ARGV[2..]=(member, ln 증분) 쌍. 카테고리는 해시에 기록된 글만 반영된다.
+_BUMP_LUA = """
+local function bump(key, member, inc)
+  local cur = redis.call('ZSCORE', key, member)
+  local new = inc
+  if cur then
+    cur = tonumber(cur)
+    local hi = math.max(cur, inc)
+    new = hi + math.log(math.exp(cur - hi) + math.exp(inc - hi))
+  end
+  redis.call('ZADD', key, new, member)
+end
+for i = 2, #ARGV, 2 do
+  local member = ARGV[i]
+  local inc = tonumber(ARGV[i + 1])
+  bump(KEYS[1], member, inc)
+  local cat = redis.call('HGET', KEYS[2], member)
+  if cat then
+    bump(ARGV[1] .. cat, member, inc)
+  end
+end
+return (#ARGV - 1) / 2
+"""
+
+# 콜드 스타트 시딩: 없는 멤버만 ZADD(이벤트로 이미 쌓인 점수를 덮지 않음) + 카테고리 해시 기록.
+# KEYS[1]=전체 ZSET, KEYS[2]=카테고리 해시, ARGV[1]=카테고리 키 접두사, ARGV[2..]=(member, 점수, 카테고리|"").
+_SEED_LUA = """
+for i = 2, #ARGV, 3 do
+  local member, score, cat = ARGV[i], ARGV[i + 1], ARGV[i + 2]
+  redis.call('ZADD', KEYS[1], 'NX', score, member)
+  if cat ~= '' then
+    redis.call('HSET', KEYS[2], member, cat)
+    redis.call('ZADD', ARGV[1] .. cat, 'NX', score, member)
+  end
+end
+return (#ARGV - 1) / 3
+"""
+
+# 컴팩션: 식은 멤버(점수 < ARGV[2]) 일괄 제거 + 창 밖 글(UUIDv7 앞 48비트 ms < ARGV[3]) 제거.
+# 카테고리 ZSET은 해시 값으로 찾는다. 멤버 수는 창(24h) 안에 참여가 있던 글로 bounded.
+_COMPACT_LUA = """
+local prefix, min_score, cutoff_ms = ARGV[1], ARGV[2], tonumber(ARGV[3])
+local function expired(m)
+  local ms = tonumber(string.sub(m, 1, 8) .. string.sub(m, 10, 13), 16)
+  return ms == nil or ms < cutoff_ms
+end
+local removed = 0
+local function compact(key)
+  removed = removed + redis.call('ZREMRANGEBYSCORE', key, '-inf', '(' .. min_score)
+  for _, m in ipairs(redis.call('ZRANGE', key, 0, -1)) do
+    if expired(m) then
+      removed = removed + redis.call('ZREM', key, m)
+    end
+  end
+end
+compact(KEYS[1])
+local cats = {}
+local h = redis.call('HGETALL', KEYS[2])
+for i = 1, #h, 2 do
+  cats[h[i + 1]] = true
+  if expired(h[i]) then
+    redis.call('HDEL', KEYS[2], h[i])
+  end
+end
+for cat, _ in pairs(cats) do
+  compact(prefix .. cat)
+end
+return removed
+"""
+
+
+def trending_zset_key(category_id: int | None) -> str:
+    return f"{TRENDING_CATEGORY_KEY_PREFIX}{category_id}" if category_id else TRENDING_ALL_KEY
+
+
+def post_created_at_seconds(post_id: UUID) -> float:
+    """UUIDv7 상위 48비트(ms)에서 작성 시각을 읽는다 — 이벤트 경로에서 DB 조회 없이 창 판정."""
+    return (post_id.int >> 80) / 1000.0
+
+
+def _log_score(weight: float, at_seconds: float) -> float:
+    return math.log(max(weight, _COLD_WEIGHT)) + (at_seconds - _EPOCH_SECONDS) / _DECAY_SECONDS
+
+
+def _in_window(post_id: UUID, now: float) -> bool:
+    return now - post_created_at_seconds(post_id) <= TRENDING_WINDOW_SECONDS
+
+
+async def bump_trending(
+    redis_client: RedisLike | None, weights: Mapping[UUID, float], *, now: float | None = None
+) -> None:
+    """참여 이벤트(post_id → 가중치 합)를 ZSET 점수에 누적한다. 창 밖 글·0 이하 가중치는 무시.
+
+    감소 이벤트(좋아요 취소·댓글 삭제)는 반영하지 않는다 — 로그 공간에서 빼기는 정밀도가 깨지고,
+    취소분의 영향은 τ로 감쇠한다. 커밋 후 호출할 것.
+    """
+    if redis_client is None or not weights:
+        return
+    ts = time.time() if now is None else now
+    argv: list[str] = []
+    for post_id, weight in weights.items():
+        if weight > 0 and _in_window(post_id, ts):
+            argv += [str(post_id), repr(_log_score(weight, ts))]
+    if not argv:
+        return
+    try:
+        await redis_client.eval(
+            _BUMP_LUA,
+            2,
+            TRENDING_ALL_KEY,
+            TRENDING_POST_CATEGORY_KEY,
+            TRENDING_CATEGORY_KEY_PREFIX,
+            *argv,
+        )
+    except Exception as e:
+        log.warning("trending bump failed (ignored): %s", e)
+
+
+async def register_trending_post(
+    redis_client: RedisLike | None, post_id: UUID, category_id: int | None
+) -> None:
+    """작성(카테고리 변경) 시 post → category를 기록해 이후 이벤트가 카테고리 ZSET에도 반영되게 한다."""
+    if redis_client is None or not category_id:
+        return
+    try:
+        await redis_client.hset(TRENDING_POST_CATEGORY_KEY, str(post_id), str(category_id))
+    except Exception as e:
+        log.warning("trending category register failed (ignored): %s", e)
+
+
+async def seed_trending(
+    redis_client: RedisLike | None,
+    posts: Iterable[tuple[UUID, int | None, float]],
+) -> None:
+    """SQL 재계산 결과(post_id, category_id, 가중합)로 빈 멤버를 시딩한다(콜드 스타트). 창 밖 글 제외.
+
+    과거 참여를 작성 시각에 몰아 근사한다 — 실제보다 오래된 것으로 보아 보수적으로 채점되고,
+    이후 이벤트가 쌓이면 실제 점수가 덮어쓴다.
+    """
+    if redis_client is None:
+        return
+    ts = time.time()
+    argv: list[str] = []
+    for post_id, category_id, weight in posts:
+        if not _in_window(post_id, ts):
+            continue
+        score = _log_score(weight, post_created_at_seconds(post_id))
+        argv += [str(post_id), repr(score), str(category_id) if category_id else ""]
+    if not argv:
+        return
+    try:
+        await redis_client.eval(
+            _SEED_LUA,
+            2,
+            TRENDING_ALL_KEY,
+            TRENDING_POST_CATEGORY_KEY,
+            TRENDING_CATEGORY_KEY_PREFIX,
+            *argv,
+        )
+    except Exception as e:
+        log.warning("trending seed failed (ignored): %s", e)
+
+
+async def read_trending_ids(
+    redis_client: RedisLike | None, category_id: int | None, limit: int
+) -> list[UUID]:
+    """ZSET 상위 limit개 post_id(점수 내림차순). Redis 부재·오류는 빈 목록(→ SQL 폴백)."""
+    if redis_client is None or limit <= 0:
+        return []
+    try:
+        members = await redis_client.zrevrange(trending_zset_key(category_id), 0, limit - 1)
+    except Exception as e:
+        log.warning("trending read failed (fallback to sql): %s", e)
+        return []
+    out: list[UUID] = []
+    for m in members:
+        try:
+            out.append(UUID(m.decode("utf-8") if isinstance(m, (bytes, bytearray)) else str(m)))
+        except ValueError:
+            continue
+    return out
+
+
+async def compact_trending(redis_client: RedisLike | None, *, now: float | None = None) -> int:
+    """식은 멤버와 창 밖 글을 ZSET·카테고리 해시에서 제거한다(주기 정리 잡). 제거 수 반환."""
+    if redis_client is None:
+        return 0
+    ts = time.time() if now is None else now
+    min_score = _log_score(_COLD_WEIGHT, ts)
+    cutoff_ms = int((ts - TRENDING_WINDOW_SECONDS) * 1000)
+    removed = await redis_client.eval(
+        _COMPACT_LUA,
+        2,
+        TRENDING_ALL_KEY,
+        TRENDING_POST_CATEGORY_KEY,
+        TRENDING_CATEGORY_KEY_PREFIX,
+        repr(min_score),
+        str(cutoff_ms),
+    )
+    return int(removed or 0)
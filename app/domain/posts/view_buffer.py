@@ -0,0 +1,196 @@
+# 조회수 write-behind(ADR 0007)의 버퍼 계약 — 샤드 키, 청크 집합 UPDATE, 워커 내 사전 집계기.
+# 게시글 서비스(조회·flush)와 lifespan(집계기 루프)이 함께 쓰는 계약이라 공개 모듈로 둔다.
+import asyncio
+import logging
+import time
+from collections.abc import Mapping
+from uuid import UUID
+
+from app.core.config import settings
+from app.core.metrics import VIEW_AGGREGATOR_PENDING_POSTS, VIEW_AGGREGATOR_SPILLED_VIEWS
+from app.domain.posts.post_cache import invalidate_post_detail_cache
+from app.domain.posts.repository import PostsModel
+from app.domain.posts.trending_rank import VIEW_WEIGHT, bump_trending
+from app.infra.redis import RedisLike
+
+log = logging.getLogger(__name__)
+
+
+# 버퍼는 VIEW_BUFFER_SHARDS개 해시로 나눈다(post_id로 샤드 선택). 샤드마다 해시 태그가 달라
+# 클러스터에선 슬롯·노드가 갈리고, buffer·flush 락·drain은 샤드 안에서 같은 태그를 공유한다.
+# 0번 샤드는 기존 단일 버퍼 키({v})를 그대로 써서 배포 직전 쌓인 버퍼도 이어서 drain된다.
+def view_shard_tag(shard: int) -> str:
+    return "v" if shard == 0 else f"v{shard}"
+
+
+def view_buffer_key(shard: int) -> str:
+    return f"views:{{{view_shard_tag(shard)}}}:buffer"
+
+
+def view_flush_lock_key(shard: int) -> str:
+    return f"views:{{{view_shard_tag(shard)}}}:flush:lock"
+
+
+def view_shard_for(post_id: UUID) -> int:
+    """post_id → 샤드 번호. 인스턴스·재시작과 무관하게 결정적이어야 해서 hash() 대신 정수값을 쓴다."""
+    return post_id.int % settings.VIEW_BUFFER_SHARDS
+
+
+# flush의 원자 스왑 — 버퍼가 있으면 drain 키로 RENAME. 이후 유입분은 새 버퍼에 쌓인다.
+# 카운터 버퍼(ADR 0023)도 같은 스왑·재병합을 쓴다.
+RENAME_BUFFER_TO_DRAIN_LUA = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+  return 0
+end
+redis.call('RENAME', KEYS[1], KEYS[2])
+return 1
+"""
+
+
+async def merge_drain_into_buffer(redis_client: RedisLike, drain_key: str, buffer_key: str) -> None:
+    """DB 반영이 롤백된 drain을 버퍼로 되돌린다(HINCRBY 재병합 — 그 사이 유입분과 합쳐진다)."""
+    fields = await redis_client.hgetall(drain_key)
+    if not fields:
+        await redis_client.delete(drain_key)
+        return
+    for field, cnt_raw in fields.items():
+        await redis_client.hincrby(buffer_key, field, int(cnt_raw))
+    await redis_client.delete(drain_key)
+
+
+async def write_view_deltas(deltas: Mapping[UUID, int]) -> int:
+    """{post_id: delta}를 청크 집합 UPDATE로 한 트랜잭션에 반영한다. 갱신 행 수 반환.
+
+    id 오름차순 — 동시 writer와 행 잠금 순서를 맞춰 교착을 피한다. 실패 시 전체 롤백 후 raise.
+    """
+    from app.db.session import get_connection
+
+    batch = sorted((pid, d) for pid, d in deltas.items() if d > 0)
+    chunk_size = settings.VIEW_FLUSH_BATCH_SIZE
+    updated_rows = 0
+    async with get_connection() as db:
+        async with db.begin():
+            for i in range(0, len(batch), chunk_size):
+                updated_rows += await PostsModel.increment_view_counts_bulk(
+                    batch[i : i + chunk_size], db=db
+                )
+    return updated_rows
+
+
+async def push_view_deltas(redis_client: RedisLike, deltas: Mapping[UUID, int]) -> None:
+    """{post_id: delta}를 샤드 버퍼에 HINCRBY — 비트랜잭션 파이프라인 1회 왕복. 실패 시 raise."""
+    async with redis_client.pipeline(transaction=False) as pipe:
+        for pid, delta in deltas.items():
+            pipe.hincrby(view_buffer_key(view_shard_for(pid)), str(pid), delta)
+        await pipe.execute()
+
+
+class ViewAggregator:
+    """워커 내 조회수 사전 집계기. 조회마다 HINCRBY 왕복 대신 메모리에 합산하고,
+    VIEW_AGGREGATOR_FLUSH_INTERVAL_MS마다 파이프라인 1회로 Redis 버퍼에 민다.
+
+    Redis 불능이면 버리지 않고 계속 모으다가 distinct 글 수가 VIEW_AGGREGATOR_MAX_POSTS에
+    닿거나 가장 오래된 delta가 VIEW_AGGREGATOR_SPILL_SECONDS를 넘으면 DB에 청크 UPDATE로
+    일괄 spill한다 — 장애가 조회당 DB write 폭주로 번지지 않는다. 루프가 돌지 않는 프로세스
+    (워커·테스트)에서는 ``add``가 False를 돌려 호출부가 기존 경로(버퍼 직접 → DB)를 탄다.
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[UUID, int] = {}
+        self._oldest: float | None = None
+        self._running = False
+        self._wake = asyncio.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def add(self, post_id: UUID, n: int = 1) -> bool:
+        """delta를 메모리에 합산한다. 루프 미가동이면 False(호출부 폴백)."""
+        if not self._running:
+            return False
+        if not self._pending:
+            self._oldest = time.monotonic()
+        self._pending[post_id] = self._pending.get(post_id, 0) + n
+        if len(self._pending) >= settings.VIEW_AGGREGATOR_MAX_POSTS:
+            self._wake.set()  # 상한 도달 — 다음 틱을 기다리지 않고 비운다
+        return True
+
+    def pending(self, post_id: UUID) -> int:
+        """아직 Redis·DB에 안 나간 이 워커의 delta(상세 응답 view_count 보정용)."""
+        return self._pending.get(post_id, 0)
+
+    def _restore(self, batch: dict[UUID, int], oldest: float | None) -> None:
+        for pid, delta in batch.items():
+            self._pending[pid] = self._pending.get(pid, 0) + delta
+        if oldest is not None and (self._oldest is None or oldest < self._oldest):
+            self._oldest = oldest
+
+    async def flush(self, redis_client: RedisLike | None, *, force_spill: bool = False) -> None:
+        """메모리 delta를 Redis 버퍼로 민다. 실패하면 되돌려 두고, 상한·나이·force_spill이면 DB로."""
+        if not self._pending:
+            return
+        batch, oldest = self._pending, self._oldest
+        self._pending, self._oldest = {}, None
+        try:
+            if redis_client is None:
+                raise ConnectionError("redis unavailable")
+            await push_view_deltas(redis_client, batch)
+            return
+        except Exception as e:
+            log.warning("조회수 집계기 Redis push 실패(보관, 상한·나이 초과 시 DB spill): %s", e)
+            # 비트랜잭션 파이프라인이라 일부 샤드가 반영된 채 실패했으면 재시도분이 중복될 수 있다
+            # (근사 지표 — ADR 0007 비목표 exactly-once와 같은 선).
+            self._restore(batch, oldest)
+        finally:
+            VIEW_AGGREGATOR_PENDING_POSTS.set(len(self._pending))
+        age = time.monotonic() - self._oldest if self._oldest is not None else 0.0
+        if not (
+            force_spill
+            or len(self._pending) >= settings.VIEW_AGGREGATOR_MAX_POSTS
+            or age >= settings.VIEW_AGGREGATOR_SPILL_SECONDS
+        ):
+            return
+        await self._spill(redis_client)
+
+    async def _spill(self, redis_client: RedisLike | None) -> None:
+        batch, oldest = self._pending, self._oldest
+        self._pending, self._oldest = {}, None
+        try:
+            await write_view_deltas(batch)
+        except Exception as e:
+            log.warning("조회수 집계기 DB spill 실패(보관, 다음 틱 재시도): %s", e)
+            self._restore(batch, oldest)
+            return
+        finally:
+            VIEW_AGGREGATOR_PENDING_POSTS.set(len(self._pending))
+        VIEW_AGGREGATOR_SPILLED_VIEWS.inc(sum(batch.values()))
+        # 버퍼 flush와 같은 후처리 — Redis가 아직 죽어 있으면 둘 다 fail-open으로 지나간다.
+        await invalidate_post_detail_cache(redis_client, *batch)
+        await bump_trending(redis_client, {pid: d * VIEW_WEIGHT for pid, d in batch.items()})
+
+    async def run(self, stop_event: asyncio.Event, redis_client: RedisLike | None) -> None:
+        """lifespan 루프. stop_event 후 남은 delta를 Redis(불능이면 DB)로 비우고 끝난다."""
+        interval = settings.VIEW_AGGREGATOR_FLUSH_INTERVAL_MS / 1000
+        self._running = True
+        try:
+            while not stop_event.is_set():
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=interval)
+                except TimeoutError:
+                    pass
+                self._wake.clear()
+                try:
+                    await self.flush(redis_client)
+                except Exception:
+                    log.exception("조회수 집계기 flush 실패")
+        finally:
+            # 새 조회는 폴백 경로로 돌리고 남은 분을 비운다(종료 시엔 나이·상한 무관 DB spill 허용).
+            self._running = False
+            await self.flush(redis_client, force_spill=True)
+
+    def wake(self) -> None:
+        self._wake.set()
+
+
+view_aggregator = ViewAggregator()
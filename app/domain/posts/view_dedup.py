@@ -0,0 +1,121 @@
+# 조회수 뷰어 dedup(ADR 0007) — (post, viewer)마다 키를 만드는 대신 버퍼 샤드·시간 버킷별 Bloom 비트맵.
+# 메모리는 VIEW_DEDUP_BLOOM_BITS × 샤드 수 × 살아 있는 버킷(2)으로 고정된다 — 바이럴 글의 고유 뷰어
+# 수십만 명이 키 수십만 개가 되지 않는다. 대가는 오탐(처음 본 뷰어를 본 것으로 판정 → 조회 1 누락)이며
+# 한계를 넘겨 차도 틀리는 방향은 "덜 세기"뿐이다(근사 지표라 허용).
+# 필터는 샤드의 모든 글이 함께 쓴다 — 오탐률은 글 하나가 아니라 샤드·버킷의 고유 (글, 뷰어) 쌍 수로
+# 정해진다. 크기는 예상 트래픽(VIEW_DEDUP_EXPECTED_PAIRS)에서 잡고, 포화는 BITCOUNT 샘플로 본다.
+import hashlib
+import logging
+import math
+import time
+from uuid import UUID
+
+from app.core.config import settings
+from app.core.metrics import (
+    VIEW_DEDUP_ESTIMATED_PAIRS,
+    VIEW_DEDUP_FALSE_POSITIVE_RATIO,
+    VIEW_DEDUP_MEMORY_BYTES,
+)
+from app.domain.posts.view_buffer import view_shard_tag
+from app.infra.redis import RedisLike
+
+log = logging.getLogger(__name__)
+
+# VIEW_DEDUP_EXPECTED_PAIRS로 크기를 잡을 때의 목표 오탐률. Redis 문자열 상한(512MiB) = 2^32비트.
+_TARGET_FALSE_POSITIVE_RATE = 0.01
+_MAX_BLOOM_BITS = 1 << 32
+
+
+def view_dedup_bucket(now: float | None = None) -> int:
+    """현재 시간 버킷 번호. 버킷 길이 = dedup TTL — 현재·직전 버킷을 함께 보므로 창은 TTL~2·TTL."""
+    ts = time.time() if now is None else now
+    return int(ts // settings.VIEW_CACHE_TTL_SECONDS)
+
+
+def view_dedup_key(shard: int, bucket: int) -> str:
+    # 버퍼 샤드와 같은 해시 태그 — 조회 계정 Lua가 Bloom 버킷과 버퍼를 한 슬롯에서 함께 만진다.
+    return f"view:{{{view_shard_tag(shard)}}}:seen:{bucket}"
+
+
+def view_dedup_expire_at(bucket: int) -> int:
+    """버킷이 '직전 버킷'으로 쓰이는 동안(다음 버킷 끝)까지만 살린다 — 샤드당 버킷 2개로 bounded."""
+    ttl = settings.VIEW_CACHE_TTL_SECONDS
+    return (bucket + 2) * ttl + 60
+
+
+def bloom_bits_for(pairs: int, k: int, p: float = _TARGET_FALSE_POSITIVE_RATE) -> int:
+    """원소 pairs개·해시 k개에서 오탐률 p를 맞추는 비트 수 m = −k·n / ln(1 − p^{1/k}) (8의 배수)."""
+    m = math.ceil(-k * pairs / math.log(1.0 - p ** (1.0 / k)))
+    return min(-(-m // 8) * 8, _MAX_BLOOM_BITS)
+
+
+def view_dedup_bloom_bits() -> int:
+    """샤드·버킷당 비트 수. 예상 쌍 수가 있으면 거기서 계산하고, 없으면 VIEW_DEDUP_BLOOM_BITS."""
+    pairs = settings.VIEW_DEDUP_EXPECTED_PAIRS
+    if pairs > 0:
+        return bloom_bits_for(pairs, settings.VIEW_DEDUP_BLOOM_HASHES)
+    return settings.VIEW_DEDUP_BLOOM_BITS
+
+
+def bloom_positions(post_id: UUID, viewer_key: str) -> list[int]:
+    """(post, viewer) 쌍의 Bloom 비트 위치 k개 — 128비트 해시 하나로 이중 해싱(Kirsch–Mitzenmacher)."""
+    digest = hashlib.blake2b(f"{post_id}:{viewer_key}".encode(), digest_size=16).digest()
+    h1 = int.from_bytes(digest[:8], "big")
+    h2 = int.from_bytes(digest[8:], "big") | 1
+    m = view_dedup_bloom_bits()
+    return [(h1 + i * h2) % m for i in range(settings.VIEW_DEDUP_BLOOM_HASHES)]
+
+
+def bloom_false_positive_rate(n: int, m: int, k: int) -> float:
+    """원소 n개를 넣은 m비트·해시 k개 Bloom의 이론 오탐률 (1 − e^{−kn/m})^k."""
+    return (1.0 - math.exp(-k * n / m)) ** k
+
+
+def bloom_fill_estimate(set_bits: int, m: int, k: int) -> tuple[float, int]:
+    """세트 비트 수로 본 (현재 오탐률 (X/m)^k, 넣은 원소 수 추정 −m/k·ln(1 − X/m))."""
+    fill = min(set_bits / m, 1.0)
+    if fill >= 1.0:
+        return 1.0, m
+    return fill**k, round(-m / k * math.log(1.0 - fill))
+
+
+async def sample_view_dedup_memory(redis_client: RedisLike | None) -> int:
+    """살아 있는 Bloom 버킷(샤드별 현재·직전)의 바이트 합을 게이지에 싣는다. 오류는 무시(-1)."""
+    if redis_client is None or settings.VIEW_CACHE_TTL_SECONDS <= 0:
+        return 0
+    bucket = view_dedup_bucket()
+    total = 0
+    try:
+        for shard in range(settings.VIEW_BUFFER_SHARDS):
+            for b in (bucket, bucket - 1):
+                total += int(await redis_client.strlen(view_dedup_key(shard, b)) or 0)
+    except Exception as e:
+        log.warning("조회수 dedup 메모리 샘플링 실패(무시): %s", e)
+        return -1
+    VIEW_DEDUP_MEMORY_BYTES.set(total)
+    return total
+
+
+async def sample_view_dedup_saturation(redis_client: RedisLike | None) -> float:
+    """샤드별 현재·직전 버킷을 BITCOUNT해 가장 찬 필터의 오탐률·쌍 수를 게이지에 싣는다. 오류는 -1.
+
+    직전 버킷은 다 찬 값, 현재 버킷은 차는 중인 값이다. 오탐률이 목표(1%)를 넘기 시작하면
+    VIEW_DEDUP_EXPECTED_PAIRS를 쌍 수 게이지 근처로 올리거나 VIEW_BUFFER_SHARDS를 늘린다.
+    """
+    if redis_client is None or settings.VIEW_CACHE_TTL_SECONDS <= 0:
+        return 0.0
+    m, k = view_dedup_bloom_bits(), settings.VIEW_DEDUP_BLOOM_HASHES
+    bucket = view_dedup_bucket()
+    worst_fp, worst_pairs = 0.0, 0
+    try:
+        for shard in range(settings.VIEW_BUFFER_SHARDS):
+            for b in (bucket, bucket - 1):
+                set_bits = int(await redis_client.bitcount(view_dedup_key(shard, b)) or 0)
+                fp, pairs = bloom_fill_estimate(set_bits, m, k)
+                worst_fp, worst_pairs = max(worst_fp, fp), max(worst_pairs, pairs)
+    except Exception as e:
+        log.warning("조회수 dedup 포화도 샘플링 실패(무시): %s", e)
+        return -1.0
+    VIEW_DEDUP_FALSE_POSITIVE_RATIO.set(worst_fp)
+    VIEW_DEDUP_ESTIMATED_PAIRS.set(worst_pairs)
+    return worst_fp
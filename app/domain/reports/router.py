@@ -6,6 +6,7 @@ from app.api.dependencies import CurrentUser, get_current_user, get_master_db
 from app.common import ApiCode, ApiResponse, api_response
 from app.domain.reports.schema import ReportCreateRequest, ReportSubmitData
 from app.domain.reports.service import ReportService
+from app.infra.redis import get_app_redis
 
 router = APIRouter(prefix="/reports", tags=["reports"])
 
@@ -17,5 +18,6 @@ async def create_report(
     user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_master_db),
 ):
-    result = await ReportService.submit_report(user.id, data, db=db)
+    redis = get_app_redis(request.app)
+    result = await ReportService.submit_report(user.id, data, db=db, redis=redis)
     return api_response(request, code=ApiCode.OK, data=result)
@@ -7,9 +7,13 @@ from app.common.enums import TargetType
 from app.common.exceptions import CommentNotFoundException, PostNotFoundException
 from app.core.config import settings
 from app.domain.comments.model import CommentsModel
+from app.domain.comments.page_cache import invalidate_comment_pages
+from app.domain.posts.post_cache import invalidate_post_caches
 from app.domain.posts.repository import PostsModel
+from app.domain.posts.services import HashtagService
 from app.domain.reports.model import ReportsModel
 from app.domain.reports.schema import ReportCreateRequest, ReportSubmitData
+from app.infra.redis import RedisLike
 
 
 class ReportService:
@@ -21,20 +25,23 @@ class ReportService:
         target_id: UUID,
         reason: str | None,
         db: AsyncSession,
-    ) -> bool:
+    ) -> tuple[bool, list[str] | None]:
+        """(블라인드 여부, 이번 블라인드로 비공개가 된 글의 해시태그명 — 이미 블라인드면 None)."""
         await ReportsModel.create_report(reporter_id, target_type, target_id, reason, db=db)
         if target_type == TargetType.POST:
             new_count = await PostsModel.increment_report_count(target_id, db=db)
         else:
             new_count = await CommentsModel.increment_report_count(target_id, db=db)
         blinded = False
+        hidden_tags: list[str] | None = None
         if new_count is not None and new_count >= settings.REPORT_BLIND_THRESHOLD:
             if target_type == TargetType.POST:
+                hidden_tags = await PostsModel.get_public_hashtag_names(target_id, db=db)
                 await PostsModel.set_blinded(target_id, db=db)
             else:
                 await CommentsModel.set_blinded(target_id, db=db)
             blinded = True
-        return blinded
+        return blinded, hidden_tags
 
     @classmethod
     async def submit_report(
@@ -42,22 +49,41 @@ class ReportService:
         reporter_id: UUID,
         data: ReportCreateRequest,
         db: AsyncSession,
+        redis: RedisLike | None = None,
     ) -> ReportSubmitData:
+        comment_post_id: UUID | None = None
         async with db.begin():
             if data.target_type == TargetType.POST:
                 if await PostsModel.get_post_author_id(data.target_id, db=db) is None:
                     raise PostNotFoundException()
             else:
-                if await CommentsModel.get_comment_by_id(data.target_id, db=db) is None:
+                comment = await CommentsModel.get_comment_by_id(data.target_id, db=db)
+                if comment is None:
                     raise CommentNotFoundException()
+                comment_post_id = comment.post_id
 
             # Pydantic/Config(use_enum_values 등) 조합에 따라 reason이 Enum이 아니라 str로 들어올 수 있음.
             reason_value = getattr(data.reason, "value", data.reason)
-            blinded = await cls._create_report_and_maybe_blind(
+            blinded, hidden_tags = await cls._create_report_and_maybe_blind(
                 reporter_id,
                 data.target_type,
                 data.target_id,
                 reason_value,
                 db=db,
             )
-            return ReportSubmitData(reported=True, blinded=blinded)
+            blinded_post = blinded and data.target_type == TargetType.POST
+            category_id = (
+                await PostsModel.get_post_category_id(data.target_id, db=db)
+                if blinded_post
+                else None
+            )
+        if blinded_post:
+            # 자동 블라인드는 커밋 후 상세·피드 캐시를 끊어야 TTL 동안 블라인드 글이 노출되지 않는다.
+            await invalidate_post_caches(redis, data.target_id, category_id)
+            if hidden_tags:
+                await HashtagService.record_post_hashtags(
+                    data.target_id, hidden_tags, [], redis=redis
+                )
+        elif blinded and comment_post_id is not None:
+            await invalidate_comment_pages(redis, comment_post_id)
+        return ReportSubmitData(reported=True, blinded=blinded)
@@ -0,0 +1,58 @@
+# 사용자별 차단 id 집합 캐시. 목록·상세·댓글·트렌딩 읽기가 행마다 붙이던
+# NOT EXISTS(user_blocks) 상관 서브쿼리 대신, 요청 시작에 집합을 읽어 배열 파라미터 하나
+# (`author <> ALL(:blocked)`, users.model.author_not_blocked)로 넘긴다. 대부분의 사용자는 차단이
+# 없어 필터 자체가 빠진다. L1 + Redis(get_or_compute_json), 차단 토글 커밋 후 무효화(L1 broadcast 포함).
+from uuid import UUID
+
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.users.model import UsersModel
+from app.infra.cache import get_or_compute_json, invalidate_json
+from app.infra.redis import RedisLike
+
+_CACHE_PREFIX = "cache:user_blocks:"
+# 토글은 명시적 무효화로 즉시 끊는다 — TTL은 무효화 DEL 실패·경합(커밋 직전 읽은 loader가 DEL 뒤에
+# 기록) 때 옛 집합이 남는 상한.
+USER_BLOCKS_CACHE_TTL_SECONDS = 300
+# L1은 무효화 신호 유실 시 인스턴스 간 불일치 창의 상한.
+USER_BLOCKS_L1_TTL_SECONDS = 10
+
+_ADAPTER = TypeAdapter(frozenset[UUID])
+_EMPTY: frozenset[UUID] = frozenset()
+
+
+def user_blocks_cache_key(user_id: UUID) -> str:
+    return f"{_CACHE_PREFIX}{user_id}"
+
+
+async def get_blocked_user_ids(
+    user_id: UUID | None, *, db: AsyncSession, redis: RedisLike | None
+) -> frozenset[UUID]:
+    """user가 차단한 사용자 id 집합(비로그인은 빈 집합).
+
+    미스면 자체 트랜잭션으로 읽으므로 세션 트랜잭션 밖(``db.begin()`` 전)에서 부른다.
+    """
+    if user_id is None:
+        return _EMPTY
+
+    async def loader() -> frozenset[UUID]:
+        async with db.begin():
+            return frozenset(await UsersModel.get_blocked_user_ids(user_id, db=db))
+
+    key = user_blocks_cache_key(user_id)
+    return await get_or_compute_json(
+        redis=redis,
+        key=key,
+        lock_key=f"{key}:lock",
+        ttl_seconds=USER_BLOCKS_CACHE_TTL_SECONDS,
+        adapter=_ADAPTER,
+        loader=loader,
+        cache_name="user_blocks",
+        l1_ttl_seconds=USER_BLOCKS_L1_TTL_SECONDS,
+    )
+
+
+async def invalidate_user_blocks(redis: RedisLike | None, user_id: UUID) -> None:
+    """차단 토글 커밋 후 호출."""
+    await invalidate_json(redis, user_blocks_cache_key(user_id))
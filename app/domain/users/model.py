@@ -1,18 +1,22 @@
 # 사용자 도메인 ORM(User·UserBlock)과 쿼리 클래스. 프로필 이미지는 profile_image_id(FK).
 # DogProfile·Report ORM은 각자의 도메인(dogs·reports) model.py 소유 — User.dogs 관계가
 # DogProfile 컬럼을 직접 참조하므로 여기서 런타임 임포트한다(역방향 의존 없음 → 순환 없음).
+from collections.abc import Collection
 from datetime import datetime as DateTimeType
 from datetime import timedelta
 from typing import Any
 from uuid import UUID
 
 from sqlalchemy import (
+    ARRAY,
     DateTime,
     ForeignKey,
     Integer,
     String,
+    all_,
     and_,
     delete,
+    literal,
     or_,
     select,
     update,
@@ -97,6 +101,18 @@ class UserBlock(Base):
     blocked: Mapped["User"] = relationship("User", foreign_keys=[blocked_id], lazy="raise_on_sql")
 
 
+def author_not_blocked(author_col, blocked_ids: Collection[UUID]):
+    """차단 작성자 제외 조건(차단 집합이 비면 None — 호출부가 필터를 생략한다).
+
+    집합은 block_cache가 미리 읽어 배열 파라미터 하나(`<> ALL(:blocked)`)로 넘긴다 — 행마다
+    user_blocks 상관 서브쿼리를 돌리지 않는다. 작성자 NULL(하드 삭제)은 NOT EXISTS와 같게 통과.
+    """
+    if not blocked_ids:
+        return None
+    blocked = literal(sorted(blocked_ids), ARRAY(PG_UUID))
+    return or_(author_col.is_(None), author_col != all_(blocked))
+
+
 class UsersModel:
     @classmethod
     async def create_user(
@@ -232,6 +248,14 @@ class UsersModel:
         result = await db.execute(stmt)
         return list(result.unique().scalars().all())
 
+    @classmethod
+    async def get_blocked_user_ids(cls, blocker_id: UUID, *, db: AsyncSession) -> list[UUID]:
+        """차단 집합 원천(block_cache 미스 시). 탈퇴 여부와 무관하게 차단 행 전부."""
+        result = await db.execute(
+            select(UserBlock.blocked_id).where(UserBlock.blocker_id == blocker_id)
+        )
+        return list(result.scalars().all())
+
     @classmethod
     async def block_exists(cls, blocker_id: UUID, blocked_id: UUID, db: AsyncSession) -> bool:
         result = await db.execute(
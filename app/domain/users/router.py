@@ -55,7 +55,8 @@ async def update_me(
     user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_master_db),
 ):
-    data = await UserService.update_user_profile(user.id, user_data, db=db)
+    redis = get_app_redis(request.app)
+    data = await UserService.update_user_profile(user.id, user_data, db=db, redis=redis)
     return api_response(request, code=ApiCode.OK, data=data)
 
 
@@ -80,7 +81,7 @@ async def delete_me(
 ):
     redis = get_app_redis(request.app)
     await AuthService.revoke_refresh_for_user(user.id, redis)
-    await UserService.delete_user(user.id, db=db)
+    await UserService.delete_user(user.id, db=db, redis=redis)
     await AuthService.invalidate_user_status_cache(redis, user.id)
     return api_response(request, code=ApiCode.OK, data=None)
 
@@ -107,7 +108,9 @@ async def toggle_block_user(
     db: AsyncSession = Depends(get_master_db),
 ):
     """유저 차단/차단해제 토글. 이미 차단된 경우 해제."""
-    is_blocked = await UserService.toggle_block_user(user.id, target_user_id, db=db)
+    is_blocked = await UserService.toggle_block_user(
+        user.id, target_user_id, db=db, redis=get_app_redis(request.app)
+    )
     return api_response(
         request,
         code=ApiCode.OK,
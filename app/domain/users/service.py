@@ -15,8 +15,10 @@ from app.core.security import (
     password_with_pepper,
     verify_password_with_legacy_fallback,
 )
+from app.domain.comments.page_cache import invalidate_author_comment_pages
 from app.domain.dogs.service import DogService
 from app.domain.media.model import MediaModel
+from app.domain.users.block_cache import invalidate_user_blocks
 from app.domain.users.model import UsersModel
 from app.domain.users.schema import (
     AvailabilityData,
@@ -27,6 +29,7 @@ from app.domain.users.schema import (
     UserAvailabilityQuery,
     UserProfileResponse,
 )
+from app.infra.redis import RedisLike
 
 
 class UserService:
@@ -58,6 +61,7 @@ class UserService:
         user_id: UUID,
         data: UpdateUserRequest,
         db: AsyncSession,
+        redis: RedisLike | None = None,
     ) -> UserProfileResponse:
         fields_set = data.model_fields_set
 
@@ -104,6 +108,9 @@ class UserService:
                 raise InternalServerErrorException()
             result = UserProfileResponse.model_validate(user_updated)
 
+        # 댓글 풀(ADR 0027)은 작성자 닉네임·프로필 이미지·대표견을 싣는다.
+        if updates or data.dogs is not None:
+            await invalidate_author_comment_pages(redis, user_id)
         return result
 
     @classmethod
@@ -140,27 +147,39 @@ class UserService:
 
     @classmethod
     async def toggle_block_user(
-        cls, blocker_id: UUID, target_user_id: UUID, db: AsyncSession
+        cls,
+        blocker_id: UUID,
+        target_user_id: UUID,
+        db: AsyncSession,
+        redis: RedisLike | None = None,
     ) -> bool:
-        """이미 차단되어 있으면 해제(delete), 아니면 차단(insert). 반환: 차단 여부(True=차단됨, False=해제됨)."""
+        """이미 차단되어 있으면 해제(delete), 아니면 차단(insert). 반환: 차단 여부(True=차단됨, False=해제됨).
+
+        커밋 후 blocker의 차단 집합 캐시를 끊는다 — 다음 읽기부터 바뀐 집합으로 거른다.
+        """
         if blocker_id == target_user_id:
             raise InvalidUserInfoException("자기 자신은 차단할 수 없습니다.")
         async with db.begin():
-            exists = await UsersModel.block_exists(blocker_id, target_user_id, db=db)
-            if exists:
+            blocked = not await UsersModel.block_exists(blocker_id, target_user_id, db=db)
+            if blocked:
+                await UsersModel.block_user(blocker_id, target_user_id, db=db)
+            else:
                 await UsersModel.unblock_user(blocker_id, target_user_id, db=db)
-                return False
-            await UsersModel.block_user(blocker_id, target_user_id, db=db)
-            return True
+        await invalidate_user_blocks(redis, blocker_id)
+        return blocked
 
     @classmethod
-    async def delete_user(cls, user_id: UUID, db: AsyncSession) -> None:
+    async def delete_user(
+        cls, user_id: UUID, db: AsyncSession, redis: RedisLike | None = None
+    ) -> None:
         async with db.begin():
             user = await UsersModel.get_user_by_id(user_id, db=db)
             if not user:
                 raise InternalServerErrorException()
             if not await UsersModel.delete_user(user_id, db=db):
                 raise InternalServerErrorException()
+        # 탈퇴 작성자는 댓글에서 "알수없음"으로 익명화된다 — 그 작성자가 실린 댓글 풀을 끊는다.
+        await invalidate_author_comment_pages(redis, user_id)
 
     @classmethod
     async def purge_withdrawn_users(cls, *, older_than_days: int, db: AsyncSession) -> int:
@@ -1,15 +1,27 @@
 # 읽기 폭주 경로용 캐시 헬퍼(ADR 0004). get→miss 시 분산 락으로 단일 워커만 재계산(thundering
 # herd 방지), 나머지는 짧게 대기 후 채워진 값을 읽는다. 락 해제는 값 비교 CAS(남의 락 미삭제).
 # Redis 부재·오류는 전부 fail-open으로 loader(DB) 직조회. TypeAdapter로 직렬화 계약을 고정한다.
+#
+# 선택적 L1: Redis 앞단에 프로세스 로컬 bounded LRU(디코딩된 객체, 짧은 TTL)를 둔다 — 수 분
+# 단위로만 바뀌는 값에 요청마다 Redis RTT + JSON 디코드를 치르지 않게. 무효화는 로컬 evict 후
+# pub/sub broadcast로 다른 인스턴스 L1까지 전파하고, 신호 유실은 짧은 L1 TTL이 상한을 둔다.
 import asyncio
+import json
 import logging
+import math
 import os
-from collections.abc import Awaitable, Callable
-from typing import Any, TypeVar
+import random
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Coroutine
+from typing import Any, Generic, NamedTuple, TypeVar
 
 from pydantic import TypeAdapter, ValidationError
 
+from app.core.config import settings
 from app.core.metrics import CACHE_EVENTS
+from app.infra.pubsub import publish_broadcast
+from app.infra.redis import RedisLike
 
 log = logging.getLogger(__name__)
 
@@ -20,25 +32,215 @@ _LOCK_TTL_SECONDS = 5
 _WAIT_MAX_SECONDS = 2.0
 _WAIT_INTERVAL_SECONDS = 0.1
 
+# 무효화 1회(파이프라인 DEL + broadcast)에 싣는 키 수 상한.
+_INVALIDATE_CHUNK = 500
+
 # 락 해제 CAS: 내가 건 락일 때만 삭제.
 _RELEASE_LOCK_LUA = (
     "if redis.call('GET', KEYS[1]) == ARGV[1] then return redis.call('DEL', KEYS[1]) "
     "else return 0 end"
 )
 
+# SWR 값 포맷: "swr1|{soft 만료 epoch}|{재계산 소요 초}|{json}". 헤더 없는 값(SWR 미사용·구포맷)은
+# 메타 없는 fresh 값으로 읽는다 — 롤링 배포 창에서 구버전이 쓴 값을 미스로 버리지 않게.
+_SWR_PREFIX = "swr1|"
+# XFetch beta — 1.0이 논문 기본값. 키울수록 더 일찍 갱신한다.
+_XFETCH_BETA = 1.0
+
+# 백그라운드 갱신 태스크(약한 참조 GC 방지)와 프로세스 내 진행 중 키.
+_refresh_tasks: set[asyncio.Task[Any]] = set()
+_refreshing_keys: set[str] = set()
+
+
+class _Entry(NamedTuple, Generic[T]):
+    value: T
+    soft_expires_at: float | None
+    delta: float
+
+
+# L1 무효화 신호 채널 — payload는 키 목록 JSON. 리스너는 main lifespan의 공용 pubsub 연결.
+CACHE_INVALIDATION_CHANNEL = "cache:invalidate"
+
+_MISSING = object()
+
+
+class _LocalCache:
+    """프로세스 로컬 L1. 키 → (만료 monotonic, 디코딩된 값)의 TTL 붙은 LRU.
+
+    단일 이벤트 루프에서만 접근하므로 락이 없다. 값은 요청 간 공유 객체라 호출부가
+    변경(mutate)하면 안 된다 — 필터·슬라이스는 새 리스트로 만든다."""
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return _MISSING
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl_seconds, value)
+        self._entries.move_to_end(key)
+        # settings를 직접 읽는다(테스트·런타임 재설정 반영). 초과분은 LRU부터 축출.
+        while len(self._entries) > settings.CACHE_L1_MAX_ENTRIES:
+            self._entries.popitem(last=False)
+
+    def discard(self, *keys: str) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_l1 = _LocalCache()
+
+
+def clear_local_cache() -> None:
+    """L1 전체 비우기(테스트 격리용)."""
+    _l1.clear()
+
 
-def _decode(raw: Any, adapter: TypeAdapter[T], cache_name: str) -> T | None:
+def _decode(raw: Any, adapter: TypeAdapter[T], cache_name: str) -> _Entry[T] | None:
     if not raw:
         return None
-    text: str | bytes = raw.decode("utf-8") if isinstance(raw, (bytes, bytearray)) else str(raw)
+    text: str = raw.decode("utf-8") if isinstance(raw, (bytes, bytearray)) else str(raw)
+    soft_expires_at: float | None = None
+    delta = 0.0
+    if text.startswith(_SWR_PREFIX):
+        try:
+            _, soft, delta_raw, text = text.split("|", 3)
+            soft_expires_at, delta = float(soft), float(delta_raw)
+        except ValueError:
+            log.warning("%s cache swr header corrupt (ignore)", cache_name)
+            return None
     try:
-        return adapter.validate_json(text)
+        return _Entry(adapter.validate_json(text), soft_expires_at, delta)
     except ValidationError as e:
         # 스키마 불일치·손상은 캐시 미스로 처리(정상 플로우로 폴백).
         log.warning("%s cache schema mismatch (ignore): %s", cache_name, e)
         return None
 
 
+def _encode(value: T, adapter: TypeAdapter[T], *, ttl_seconds: int, delta: float) -> str:
+    return (
+        f"{_SWR_PREFIX}{time.time() + ttl_seconds:.3f}|{delta:.4f}|"
+        f"{adapter.dump_json(value).decode('utf-8')}"
+    )
+
+
+def _should_refresh(entry: _Entry[Any], now: float) -> bool:
+    """XFetch: 만료가 가까울수록·재계산이 비쌀수록(delta) 확률적으로 일찍 갱신한다.
+
+    `now - delta * beta * ln(U) >= soft_expires_at` (U∈(0,1]). soft TTL을 넘긴 값은 항상 갱신."""
+    if entry.soft_expires_at is None:
+        return False
+    u = 1.0 - random.random()
+    return now - entry.delta * _XFETCH_BETA * math.log(u) >= entry.soft_expires_at
+
+
+async def _compute_and_store(
+    *,
+    redis: Any,
+    key: str,
+    ttl_seconds: int,
+    stale_ttl_seconds: int,
+    adapter: TypeAdapter[T],
+    loader: Callable[[], Awaitable[T]],
+    cache_name: str,
+) -> T:
+    """loader 실행 후 기록. SWR이면 soft 만료·재계산 소요(delta)를 헤더로 싣고, Redis TTL은
+    stale 창만큼 늘려 soft 만료 뒤에도 값이 남아 있게 한다. 기록 실패는 무시."""
+    started = time.monotonic()
+    result = await loader()
+    try:
+        if stale_ttl_seconds > 0:
+            delta = time.monotonic() - started
+            payload = _encode(result, adapter, ttl_seconds=ttl_seconds, delta=delta)
+            await redis.setex(key, ttl_seconds + stale_ttl_seconds, payload)
+        else:
+            await redis.setex(key, ttl_seconds, adapter.dump_json(result).decode("utf-8"))
+    except Exception as e:
+        log.warning("%s cache write failed (ignore): %s", cache_name, e)
+    return result
+
+
+async def _refresh(
+    *,
+    redis: Any,
+    key: str,
+    lock_key: str,
+    ttl_seconds: int,
+    stale_ttl_seconds: int,
+    adapter: TypeAdapter[T],
+    loader: Callable[[], Awaitable[T]],
+    cache_name: str,
+    l1_ttl_seconds: float,
+) -> T | None:
+    """SWR 갱신 1회: 락을 못 잡으면(다른 워커가 갱신 중) None으로 돌아간다 — 누구도 기다리지 않는다."""
+    lock_value = os.urandom(16).hex()
+    try:
+        if not await redis.set(lock_key, lock_value, nx=True, ex=_LOCK_TTL_SECONDS):
+            return None
+    except Exception as e:
+        log.warning("%s cache refresh lock failed (serve stale): %s", cache_name, e)
+        return None
+    try:
+        CACHE_EVENTS.labels(cache=cache_name, result="refresh").inc()
+        value = await _compute_and_store(
+            redis=redis,
+            key=key,
+            ttl_seconds=ttl_seconds,
+            stale_ttl_seconds=stale_ttl_seconds,
+            adapter=adapter,
+            loader=loader,
+            cache_name=cache_name,
+        )
+        if l1_ttl_seconds > 0:
+            _l1.set(key, value, l1_ttl_seconds)
+        return value
+    except Exception as e:
+        log.warning("%s cache refresh failed (serve stale until hard ttl): %s", cache_name, e)
+        return None
+    finally:
+        try:
+            await redis.eval(_RELEASE_LOCK_LUA, 1, lock_key, lock_value)
+        except Exception:
+            pass
+
+
+def _spawn_refresh(key: str, coro: Coroutine[Any, Any, Any]) -> None:
+    # 같은 프로세스에서 같은 키의 갱신이 이미 돌고 있으면 락 왕복조차 생략한다.
+    if key in _refreshing_keys:
+        coro.close()
+        return
+    _refreshing_keys.add(key)
+    task = asyncio.get_running_loop().create_task(coro)
+    _refresh_tasks.add(task)
+
+    def _done(t: asyncio.Task[Any]) -> None:
+        _refresh_tasks.discard(t)
+        _refreshing_keys.discard(key)
+
+    task.add_done_callback(_done)
+
+
+async def drain_refresh_tasks(timeout_seconds: float = 5.0) -> None:
+    """lifespan 셧다운용: 진행 중인 백그라운드 갱신을 짧게 기다리고 남은 건 취소한다
+    (fail-open — 값은 stale 창 동안 남아 있고 다음 인스턴스가 다시 갱신한다)."""
+    if not _refresh_tasks:
+        return
+    _, pending = await asyncio.wait(tuple(_refresh_tasks), timeout=timeout_seconds)
+    for task in pending:
+        task.cancel()
+
+
 async def get_or_compute_json(
     *,
     redis: Any | None,
@@ -48,29 +250,74 @@ async def get_or_compute_json(
     adapter: TypeAdapter[T],
     loader: Callable[[], Awaitable[T]],
     cache_name: str,
+    l1_ttl_seconds: float = 0,
+    stale_ttl_seconds: int = 0,
+    refresher: Callable[[], Awaitable[T]] | None = None,
 ) -> T:
     """캐시 히트면 즉시 반환, 미스면 분산 락 아래 loader로 재계산·기록. Redis 부재/오류는 loader 폴백.
 
     - ``adapter``: 캐시 값의 직렬화 계약(TypeAdapter).
     - ``loader``: 캐시 미스 시 실제 계산(대개 DB 조회) 코루틴.
     - ``cache_name``: `cache_events_total{cache}` 라벨(hit/miss 계측).
+    - ``l1_ttl_seconds``: 0 초과면 디코딩된 값을 L1에 이 시간만큼 둔다(``CACHE_L1_ENABLED``
+      가 꺼져 있으면 무시). L1 결과는 ``l1_hit``/``l1_miss``, Redis 결과는 ``hit``/``miss``.
+    - ``stale_ttl_seconds``: 0 초과면 stale-while-revalidate. ``ttl_seconds``는 soft TTL이 되고
+      값은 그 뒤 이 창만큼 더 남는다. soft 만료 전엔 XFetch로 확률적 조기 갱신, 만료 후엔
+      stale 값(``stale``)을 즉시 주고 락을 잡은 워커 하나만 갱신한다 — 읽기는 락을 기다리지 않는다.
+    - ``refresher``: SWR 갱신용 loader. 요청 세션에 묶이지 않아야 하며(자체 세션), 주어지면
+      갱신을 백그라운드 태스크로 돌린다. 없으면 락을 잡은 요청이 ``loader``로 인라인 갱신한다.
 
     락 대기 타임아웃도 loader 폴백이다 — 빈 값 반환은 "틀린 데이터"라 대기자 수만큼의
-    DB 쿼리(운영 봉투 내)를 감내하는 쪽을 택한다(ADR 0004).
+    DB 쿼리(운영 봉투 내)를 감내하는 쪽을 택한다(ADR 0004). 락 대기는 값이 아예 없을 때
+    (콜드 스타트·hard TTL 만료)만 남는다.
     """
     if redis is None:
         return await loader()
 
+    # L1은 Redis 앞단에만 둔다 — Redis 부재 시엔 무효화 신호도 못 받으므로 로컬에 쌓지 않는다.
+    use_l1 = l1_ttl_seconds > 0 and settings.CACHE_L1_ENABLED
+    if use_l1:
+        local = _l1.get(key)
+        if local is not _MISSING:
+            CACHE_EVENTS.labels(cache=cache_name, result="l1_hit").inc()
+            return local
+        CACHE_EVENTS.labels(cache=cache_name, result="l1_miss").inc()
+
+    def _remember(value: T) -> T:
+        if use_l1:
+            _l1.set(key, value, l1_ttl_seconds)
+        return value
+
     try:
-        decoded = _decode(await redis.get(key), adapter, cache_name)
-        if decoded is not None:
-            CACHE_EVENTS.labels(cache=cache_name, result="hit").inc()
-            return decoded
-        CACHE_EVENTS.labels(cache=cache_name, result="miss").inc()
+        entry = _decode(await redis.get(key), adapter, cache_name)
     except Exception as e:
         log.warning("%s cache read failed (fallback to loader): %s", cache_name, e)
         return await loader()
 
+    if entry is not None:
+        now = time.time()
+        stale = entry.soft_expires_at is not None and now >= entry.soft_expires_at
+        CACHE_EVENTS.labels(cache=cache_name, result="stale" if stale else "hit").inc()
+        if stale_ttl_seconds > 0 and _should_refresh(entry, now):
+            refresh = _refresh(
+                redis=redis,
+                key=key,
+                lock_key=lock_key,
+                ttl_seconds=ttl_seconds,
+                stale_ttl_seconds=stale_ttl_seconds,
+                adapter=adapter,
+                loader=refresher or loader,
+                cache_name=cache_name,
+                l1_ttl_seconds=l1_ttl_seconds if use_l1 else 0,
+            )
+            if refresher is not None:
+                _spawn_refresh(key, refresh)
+            elif (fresh := await refresh) is not None:
+                return fresh
+        # stale 값은 L1에 올리지 않는다 — 갱신 완료 전까지 매 요청이 Redis에서 새 값을 확인.
+        return entry.value if stale else _remember(entry.value)
+    CACHE_EVENTS.labels(cache=cache_name, result="miss").inc()
+
     lock_value = os.urandom(16).hex()
     try:
         acquired = bool(await redis.set(lock_key, lock_value, nx=True, ex=_LOCK_TTL_SECONDS))
@@ -84,22 +331,57 @@ async def get_or_compute_json(
             await asyncio.sleep(_WAIT_INTERVAL_SECONDS)
             waited += _WAIT_INTERVAL_SECONDS
             try:
-                decoded2 = _decode(await redis.get(key), adapter, cache_name)
-                if decoded2 is not None:
-                    return decoded2
+                entry2 = _decode(await redis.get(key), adapter, cache_name)
+                if entry2 is not None:
+                    return _remember(entry2.value)
             except Exception:
                 break
         return await loader()
 
     try:
-        result = await loader()
-        try:
-            await redis.setex(key, ttl_seconds, adapter.dump_json(result).decode("utf-8"))
-        except Exception as e:
-            log.warning("%s cache write failed (ignore): %s", cache_name, e)
-        return result
+        result = await _compute_and_store(
+            redis=redis,
+            key=key,
+            ttl_seconds=ttl_seconds,
+            stale_ttl_seconds=stale_ttl_seconds,
+            adapter=adapter,
+            loader=loader,
+            cache_name=cache_name,
+        )
+        return _remember(result)
     finally:
         try:
             await redis.eval(_RELEASE_LOCK_LUA, 1, lock_key, lock_value)
         except Exception:
             pass
+
+
+async def invalidate_json(redis: RedisLike | None, *keys: str) -> None:
+    """명시적 무효화: 로컬 L1 evict → Redis DEL → 다른 인스턴스 L1 evict 신호. 전부 fail-open.
+
+    DEL은 키마다 따로(파이프라인) 보낸다 — 다중 키 DEL은 Redis Cluster에서 슬롯이 갈리면
+    CROSSSLOT으로 거절된다. flush처럼 키가 많을 수 있어 ``_INVALIDATE_CHUNK``개씩 끊어 보내고
+    신호도 같은 단위로 나눠 한 메시지가 커지지 않게 한다.
+    DEL이 실패해도 신호는 보낸다 — 남은 L2 값은 TTL로 만료되고, L1만이라도 즉시 끊는다."""
+    if not keys:
+        return
+    _l1.discard(*keys)
+    if redis is None:
+        return
+    for i in range(0, len(keys), _INVALIDATE_CHUNK):
+        chunk = keys[i : i + _INVALIDATE_CHUNK]
+        try:
+            async with redis.pipeline(transaction=False) as pipe:
+                for key in chunk:
+                    pipe.delete(key)
+                await pipe.execute()
+        except Exception as e:
+            log.warning("cache invalidate DEL failed (ttl fallback): %s", e)
+        await publish_broadcast(redis, CACHE_INVALIDATION_CHANNEL, json.dumps(list(chunk)))
+
+
+async def handle_invalidation(payload: str) -> None:
+    """`CACHE_INVALIDATION_CHANNEL` 수신 핸들러 — 다른 인스턴스가 무효화한 키를 L1에서 evict."""
+    keys = json.loads(payload)
+    if isinstance(keys, list):
+        _l1.discard(*(k for k in keys if isinstance(k, str)))
@@ -8,6 +8,9 @@
 # 전달 규약: 발행자는 같은 인스턴스 수신자에게 로컬 매니저로 먼저 직접 전달한 뒤
 # publish한다(로컬 전달이 Redis·리스너 상태에 의존하지 않게). 리스너는 envelope의
 # origin이 자기 인스턴스면 건너뛰어 중복 전달을 막는다.
+#
+# 수신자가 없는 인스턴스 전체 신호(L1 캐시 무효화 등)는 broadcast 채널로 분리한다 —
+# 같은 구독 연결을 쓰되 envelope에 target이 없고, 핸들러는 payload만 받는다.
 
 import asyncio
 import json
@@ -49,6 +52,8 @@ def _instance_id() -> str:
 
 # (target_user_id, payload) → 로컬 전달. payload는 클라이언트에 그대로 보낼 텍스트.
 UserEnvelopeHandler = Callable[[UUID, str], Awaitable[None]]
+# payload → 인스턴스 로컬 처리(수신자 없음). 자기 발행분은 리스너가 건너뛴다.
+BroadcastHandler = Callable[[str], Awaitable[None]]
 
 
 async def publish_user_envelope(
@@ -87,6 +92,20 @@ async def publish_user_envelope(
         return False
 
 
+async def publish_broadcast(redis: RedisLike | None, channel: str, payload: str) -> bool:
+    """인스턴스 전체 신호 PUBLISH. 발행 인스턴스는 호출 전에 로컬 처리를 끝내 둔다(리스너가
+    자기 발행분을 건너뛰므로). 예외는 삼키고 성공 여부만 반환한다."""
+    if redis is None or not payload:
+        return False
+    env = json.dumps({"origin": _instance_id(), "payload": payload}, ensure_ascii=False)
+    try:
+        await redis.publish(channel, env)
+        return True
+    except Exception:
+        log.exception("pubsub broadcast 실패 channel=%s", channel)
+        return False
+
+
 def parse_user_envelope(raw: str) -> tuple[list[UUID], str, str | None] | None:
     """(target_user_ids, payload, origin). payload가 문자열이 아니면 규약 위반 — 버린다.
 
@@ -109,16 +128,43 @@ def parse_user_envelope(raw: str) -> tuple[list[UUID], str, str | None] | None:
         return None
 
 
-async def _dispatch_message(msg: Any, handlers: dict[str, UserEnvelopeHandler]) -> None:
+async def _dispatch_broadcast(channel: str, raw: str, handler: BroadcastHandler) -> None:
+    try:
+        data = json.loads(raw)
+        payload = data["payload"]
+        if not isinstance(payload, str):
+            raise ValueError("payload")
+    except Exception:
+        log.warning("pubsub broadcast invalid channel=%s", channel, exc_info=False)
+        return
+    if data.get("origin") == _instance_id():
+        return  # 자기 발행분 — 발행 시점에 로컬 처리 완료
+    try:
+        await handler(payload)
+    except Exception:
+        log.exception("broadcast 처리 실패 channel=%s", channel)
+
+
+async def _dispatch_message(
+    msg: Any,
+    handlers: dict[str, UserEnvelopeHandler],
+    broadcast_handlers: dict[str, BroadcastHandler] | None = None,
+) -> None:
     if msg.get("type") != "message":
         return
     channel = msg.get("channel")
-    handler = handlers.get(channel) if isinstance(channel, str) else None
-    if handler is None:
+    if not isinstance(channel, str):
         return
     raw = msg.get("data")
     if not isinstance(raw, str) or not raw:
         return
+    broadcast = (broadcast_handlers or {}).get(channel)
+    if broadcast is not None:
+        await _dispatch_broadcast(channel, raw, broadcast)
+        return
+    handler = handlers.get(channel)
+    if handler is None:
+        return
     parsed = parse_user_envelope(raw)
     if parsed is None:
         return
@@ -138,6 +184,7 @@ async def _listen_once(
     handlers: dict[str, UserEnvelopeHandler],
     stop_event: asyncio.Event,
     on_healthy: Callable[[], None],
+    broadcast_handlers: dict[str, BroadcastHandler] | None = None,
 ) -> None:
     """연결 1회분: 접속→구독→폴링. 연결·수신 계층 예외는 밖으로 던져 재연결을 유도하고,
     핸들러·envelope 오류는 삼킨다(메시지 1건 문제로 연결을 버리지 않는다).
@@ -148,12 +195,13 @@ async def _listen_once(
     """
     client: Any = None
     pubsub: Any = None
+    channels = [*handlers, *(broadcast_handlers or {})]
     try:
         client = Redis.from_url(redis_url, decode_responses=True)
         await client.ping()
         pubsub = client.pubsub()
-        await pubsub.subscribe(*handlers)
-        log.info("user fanout pubsub subscribed channels=%s", sorted(handlers))
+        await pubsub.subscribe(*channels)
+        log.info("user fanout pubsub subscribed channels=%s", sorted(channels))
         connected_at = time.monotonic()
         healthy_signaled = False
         while not stop_event.is_set():
@@ -166,11 +214,11 @@ async def _listen_once(
                 healthy_signaled = True
             if msg is None:
                 continue
-            await _dispatch_message(msg, handlers)
+            await _dispatch_message(msg, handlers, broadcast_handlers)
     finally:
         if pubsub is not None:
             try:
-                await pubsub.unsubscribe(*handlers)
+                await pubsub.unsubscribe(*channels)
             except Exception:
                 log.exception("pubsub unsubscribe 실패")
             try:
@@ -189,9 +237,12 @@ async def run_user_fanout_listener(
     redis_url: str,
     handlers: dict[str, UserEnvelopeHandler],
     stop_event: asyncio.Event,
+    broadcast_handlers: dict[str, BroadcastHandler] | None = None,
 ) -> None:
     """백그라운드: 전용 Redis 연결 1개로 `handlers`의 모든 채널을 구독하고,
-    수신 envelope를 채널별 핸들러로 로컬 팬아웃한다. 연결이 끊기면 백오프 재연결."""
+    수신 envelope를 채널별 핸들러로 로컬 팬아웃한다. 연결이 끊기면 백오프 재연결.
+
+    `broadcast_handlers` 채널(수신자 없는 인스턴스 신호)도 같은 연결로 구독한다."""
     if not redis_url or not handlers:
         return
     backoff = _RECONNECT_BACKOFF_INITIAL_SEC
@@ -207,6 +258,7 @@ async def run_user_fanout_listener(
                 handlers=handlers,
                 stop_event=stop_event,
                 on_healthy=_reset_backoff,
+                broadcast_handlers=broadcast_handlers,
             )
         except asyncio.CancelledError:
             raise
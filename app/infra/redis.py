@@ -33,7 +33,13 @@ class RedisLike(Protocol):
     def eval(self, script: str, numkeys: int, /, *args: Any) -> Any: ...
     def hget(self, key: str, field: str, /) -> Any: ...
     def hgetall(self, key: str, /) -> Any: ...
+    def hmget(self, key: str, fields: list[str], /) -> Any: ...
     def hincrby(self, key: str, field: str, amount: int, /) -> Any: ...
+    def hset(self, key: str, field: str, value: Any, /) -> Any: ...
+    def strlen(self, key: str, /) -> Any: ...
+    def bitcount(self, key: str, /) -> Any: ...
+    def zrevrange(self, key: str, start: int, end: int, /) -> Any: ...
+    def pipeline(self, *, transaction: bool = ...) -> Any: ...
     def publish(self, channel: str, message: str, /) -> Any: ...
     def pubsub(self) -> Any: ...
 
@@ -37,6 +37,10 @@ async def _view_buffer_flush_loop(stop_event: asyncio.Event, redis_client: Any)
     flush_log = logging.getLogger("app.view_buffer_flush")
     interval = settings.VIEW_BUFFER_FLUSH_INTERVAL_SECONDS
     from app.domain.posts.services import PostService
+    from app.domain.posts.view_dedup import (
+        sample_view_dedup_memory,
+        sample_view_dedup_saturation,
+    )
 
     while True:
         try:
@@ -50,6 +54,48 @@ async def _view_buffer_flush_loop(stop_event: asyncio.Event, redis_client: Any)
             await PostService.flush_view_counts_to_db(redis_client)
         except Exception:
             flush_log.exception("조회수 버퍼 flush 실패")
+        await sample_view_dedup_memory(redis_client)
+        await sample_view_dedup_saturation(redis_client)
+
+
+async def _counter_buffer_flush_loop(stop_event: asyncio.Event, redis_client: Any) -> None:
+    """좋아요·댓글 수 Redis 버퍼를 주기적으로 DB에 반영(ADR 0023)."""
+    flush_log = logging.getLogger("app.counter_buffer_flush")
+    interval = settings.COUNTER_BUFFER_FLUSH_INTERVAL_SECONDS
+    from app.domain.posts.counter_buffer import flush_counters_to_db
+
+    while True:
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=interval)
+            break
+        except TimeoutError:
+            pass
+        if stop_event.is_set():
+            break
+        try:
+            await flush_counters_to_db(redis_client)
+        except Exception:
+            flush_log.exception("카운터 버퍼 flush 실패")
+
+
+async def _counter_reconcile_loop(stop_event: asyncio.Event, redis_client: Any) -> None:
+    """원장으로 좋아요·댓글 수를 다시 센다(ADR 0023). 주기당 인스턴스 1대가 한 조각."""
+    reconcile_log = logging.getLogger("app.counter_reconcile")
+    interval = settings.COUNTER_RECONCILE_INTERVAL_SECONDS
+    from app.domain.posts.counter_buffer import run_counter_reconcile
+
+    while True:
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=interval)
+            break
+        except TimeoutError:
+            pass
+        if stop_event.is_set():
+            break
+        try:
+            await run_counter_reconcile(redis_client)
+        except Exception:
+            reconcile_log.exception("카운터 reconcile 실패")
 
 
 @asynccontextmanager
@@ -75,13 +121,35 @@ async def lifespan(app: FastAPI):
     stop_event = asyncio.Event()
     cleanup_task = None
     view_flush_task: asyncio.Task[None] | None = None
+    view_aggregator_task: asyncio.Task[None] | None = None
+    counter_flush_task: asyncio.Task[None] | None = None
+    counter_reconcile_task: asyncio.Task[None] | None = None
+    hashtag_index_task: asyncio.Task[None] | None = None
     fanout_listener_task: asyncio.Task[None] | None = None
     if settings.SIGNUP_IMAGE_CLEANUP_INTERVAL > 0:
         cleanup_task = asyncio.create_task(run_loop_async(stop_event, redis=redis_client))
     if redis_client is not None and settings.VIEW_BUFFER_FLUSH_INTERVAL_SECONDS > 0:
         view_flush_task = asyncio.create_task(_view_buffer_flush_loop(stop_event, redis_client))
+    if redis_client is not None and settings.COUNTER_BUFFER_FLUSH_INTERVAL_SECONDS > 0:
+        counter_flush_task = asyncio.create_task(
+            _counter_buffer_flush_loop(stop_event, redis_client)
+        )
+    if redis_client is not None and settings.COUNTER_RECONCILE_INTERVAL_SECONDS > 0:
+        counter_reconcile_task = asyncio.create_task(
+            _counter_reconcile_loop(stop_event, redis_client)
+        )
+    if settings.VIEW_AGGREGATOR_FLUSH_INTERVAL_MS > 0:
+        # Redis 부재여도 돈다 — 조회 delta를 모아 DB에 일괄 spill(조회당 writer UPDATE 방지).
+        from app.domain.posts.view_buffer import view_aggregator
+
+        view_aggregator_task = asyncio.create_task(view_aggregator.run(stop_event, redis_client))
+    if settings.HASHTAG_SUGGEST_REBUILD_INTERVAL_SECONDS > 0:
+        # 자동완성 접두사 인덱스 — 첫 스냅샷 전까지는 자동완성이 DB 접두사 검색으로 폴백.
+        from app.domain.posts.hashtag_suggest import run_hashtag_index_loop
+
+        hashtag_index_task = asyncio.create_task(run_hashtag_index_loop(stop_event))
     if settings.REDIS_URL:
-        # 인스턴스당 전용 Pub/Sub 연결 1개로 chat DM(WS)·알림(SSE) 채널을 함께 구독.
+        # 인스턴스당 전용 Pub/Sub 연결 1개로 chat DM(WS)·알림(SSE)·캐시 무효화 채널을 함께 구독.
         # app.state.redis(부팅 핑 성공)에 게이트하지 않는다 — 리스너는 자기 연결을
         # 백오프로 재시도하므로, 배포 중 Redis 순단이 크로스 인스턴스 실시간 전달을
         # 프로세스 수명 내내 비활성화해서는 안 된다.
@@ -90,6 +158,8 @@ async def lifespan(app: FastAPI):
             NOTIF_SSE_FANOUT_CHANNEL,
             notification_sse_manager,
         )
+        from app.domain.posts.hashtag_suggest import HASHTAG_INDEX_CHANNEL, handle_hashtag_usage
+        from app.infra.cache import CACHE_INVALIDATION_CHANNEL, handle_invalidation
         from app.infra.pubsub import run_user_fanout_listener
 
         fanout_listener_task = asyncio.create_task(
@@ -100,12 +170,30 @@ async def lifespan(app: FastAPI):
                     NOTIF_SSE_FANOUT_CHANNEL: notification_sse_manager.deliver,
                 },
                 stop_event=stop_event,
+                # L1 캐시 무효화·해시태그 인덱스 증감도 같은 연결로 받는다(수신자 없는 broadcast).
+                broadcast_handlers={
+                    CACHE_INVALIDATION_CHANNEL: handle_invalidation,
+                    HASHTAG_INDEX_CHANNEL: handle_hashtag_usage,
+                },
             )
         )
 
     yield
 
     stop_event.set()
+    if view_aggregator_task is not None:
+        # 워커 메모리의 조회 delta는 redis·DB close 전에 비워야 유실이 없다(run이 종료 시 drain).
+        from app.domain.posts.view_buffer import view_aggregator
+
+        view_aggregator.wake()
+        try:
+            await asyncio.wait_for(asyncio.shield(view_aggregator_task), timeout=15.0)
+        except TimeoutError:
+            view_aggregator_task.cancel()
+            try:
+                await view_aggregator_task
+            except asyncio.CancelledError:
+                pass
     if cleanup_task is not None:
         try:
             await asyncio.wait_for(asyncio.shield(cleanup_task), timeout=15.0)
@@ -124,6 +212,30 @@ async def lifespan(app: FastAPI):
                 await view_flush_task
             except asyncio.CancelledError:
                 pass
+    if counter_flush_task is not None:
+        # 버퍼는 Redis에 남아 다음 인스턴스가 이어서 flush한다 — 진행 중인 반영만 기다린다.
+        try:
+            await asyncio.wait_for(asyncio.shield(counter_flush_task), timeout=30.0)
+        except TimeoutError:
+            counter_flush_task.cancel()
+            try:
+                await counter_flush_task
+            except asyncio.CancelledError:
+                pass
+    if counter_reconcile_task is not None:
+        # 배치마다 커밋하고 커서를 남기므로 끊겨도 다음 주기에 이어서 돈다 — 기다리지 않고 취소.
+        counter_reconcile_task.cancel()
+        try:
+            await counter_reconcile_task
+        except asyncio.CancelledError:
+            pass
+    if hashtag_index_task is not None:
+        # 재빌드는 조회뿐이라 남길 상태가 없다 — 끝을 기다리지 않고 취소.
+        hashtag_index_task.cancel()
+        try:
+            await hashtag_index_task
+        except asyncio.CancelledError:
+            pass
     if fanout_listener_task is not None:
         fanout_listener_task.cancel()
         try:
@@ -133,8 +245,11 @@ async def lifespan(app: FastAPI):
     # 인라인 SNS 폴백 태스크를 redis close 전에 드레인 — publish와 멱등 마킹 사이에서
     # 끊기면 워커 재시도 시 이중 배송 창이 다시 열린다.
     from app.domain.notifications.service import drain_sns_inline_tasks
+    from app.infra.cache import drain_refresh_tasks
 
     await drain_sns_inline_tasks()
+    # 캐시 백그라운드 갱신도 redis·DB close 전에 정리(남은 건 취소 — stale 창이 값을 지킨다).
+    await drain_refresh_tasks()
     await close_redis(app)
     await close_database()
 
@@ -166,6 +281,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # 폴링 클라이언트가 ETag를 읽어 If-None-Match로 되돌려 보낼 수 있게 노출한다.
+    expose_headers=["ETag"],
 )
 if settings.TRUSTED_HOSTS != ["*"]:
     app.add_middleware(TrustedHostMiddleware, allowed_hosts=settings.TRUSTED_HOSTS)
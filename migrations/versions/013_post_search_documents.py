@@ -0,0 +1,112 @@
+"""post_search_documents: 게시글 랭킹 검색 문서(2-gram tsvector) + GIN
+
+Revision ID: 013_post_search_documents
+Revises: 012_drop_redundant_user_block_unique
+Create Date: 2026-10-17 10:00:00.000000
+
+GET /posts?q=의 토큰별 ILIKE OR 체인(제목·본문 trgm 비트맵 스캔 + 해시태그 상관 서브쿼리)을
+글당 검색 문서 1행의 tsvector @@ tsquery로 바꾼다(ADR 0015). 문서는 앱이 2-gram으로 쪼갠 term이라
+SQL만으로는 채울 수 없다 — 기존 글은 여기서 앱 토크나이저(search_document)로 배치 백필한다. 배포
+직후 ranked 검색에서 기존 글이 빠지지 않게. 롤링 배포 중 구버전 앱이 쓴 글은 cleanup 루프의 백필
+단계가 채운다.
+"""
+
+from collections.abc import Sequence
+from uuid import UUID
+
+import sqlalchemy as sa
+from alembic import op
+from app.domain.posts.search_document import search_vector
+from sqlalchemy.dialects import postgresql
+
+revision: str = "013_post_search_documents"
+down_revision: str | None = "012_drop_redundant_user_block_unique"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# 백필 배치 크기 — 배치마다 글 SELECT 1 + 해시태그 SELECT 1 + 문서 INSERT 1.
+_BACKFILL_BATCH = 1000
+
+_posts = sa.table(
+    "posts",
+    sa.column("id", postgresql.UUID(as_uuid=True)),
+    sa.column("title", sa.String),
+    sa.column("content", sa.Text),
+    sa.column("deleted_at", sa.DateTime(timezone=True)),
+)
+_post_hashtags = sa.table(
+    "post_hashtags",
+    sa.column("post_id", postgresql.UUID(as_uuid=True)),
+    sa.column("hashtag_id", sa.Integer),
+)
+_hashtags = sa.table("hashtags", sa.column("id", sa.Integer), sa.column("name", sa.String))
+_documents = sa.table(
+    "post_search_documents",
+    sa.column("post_id", postgresql.UUID(as_uuid=True)),
+    sa.column("search_vector", postgresql.TSVECTOR),
+    sa.column("updated_at", sa.DateTime(timezone=True)),
+)
+
+
+def _backfill_documents() -> None:
+    """삭제되지 않은 기존 글의 검색 문서를 id 내림차순 keyset 배치로 채운다(앱 백필과 같은 규칙)."""
+    bind = op.get_bind()
+    after: UUID | None = None
+    while True:
+        stmt = sa.select(_posts.c.id, _posts.c.title, _posts.c.content).where(
+            _posts.c.deleted_at.is_(None)
+        )
+        if after is not None:
+            stmt = stmt.where(_posts.c.id < after)
+        rows = bind.execute(stmt.order_by(_posts.c.id.desc()).limit(_BACKFILL_BATCH)).all()
+        if not rows:
+            return
+        tags_by_post: dict[UUID, list[str]] = {}
+        for pid, name in bind.execute(
+            sa.select(_post_hashtags.c.post_id, _hashtags.c.name)
+            .join(_hashtags, _hashtags.c.id == _post_hashtags.c.hashtag_id)
+            .where(_post_hashtags.c.post_id.in_([r.id for r in rows]))
+        ):
+            tags_by_post.setdefault(pid, []).append(name)
+        bind.execute(
+            postgresql.insert(_documents)
+            .values(
+                [
+                    {
+                        "post_id": r.id,
+                        "search_vector": search_vector(
+                            r.title, r.content, tags_by_post.get(r.id, [])
+                        ),
+                        "updated_at": sa.func.now(),
+                    }
+                    for r in rows
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=["post_id"])
+        )
+        after = rows[-1].id
+
+
+def upgrade() -> None:
+    op.create_table(
+        "post_search_documents",
+        sa.Column("post_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("search_vector", postgresql.TSVECTOR(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["post_id"], ["posts.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("post_id"),
+    )
+    op.create_index(
+        "idx_post_search_documents_vector_gin",
+        "post_search_documents",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_with={"fastupdate": True},
+    )
+    _backfill_documents()
+
+
+def downgrade() -> None:
+    op.drop_index("idx_post_search_documents_vector_gin", table_name="post_search_documents")
+    op.drop_table("post_search_documents")
@@ -0,0 +1,38 @@
+"""post_likes·comment_likes: (user_id, created_at DESC) 인덱스
+
+Revision ID: 014_like_user_recent_index
+Revises: 013_post_search_documents
+Create Date: 2026-10-17 12:00:00.000000
+
+사용자별 최근 좋아요 창(ADR 0020)은 로그인 사용자의 최근 좋아요 N건을 최신순으로 읽어 캐시한다.
+두 테이블의 PK는 (대상, user_id)라 user 기준 탐색이 테이블 스캔이었다 — 창 적재가 인덱스 범위
+스캔 + LIMIT로 끝나도록 사용자·시각 인덱스를 추가한다.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "014_like_user_recent_index"
+down_revision: str | None = "013_post_search_documents"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_post_likes_user_recent",
+        "post_likes",
+        ["user_id", sa.text("created_at DESC")],
+    )
+    op.create_index(
+        "idx_comment_likes_user_recent",
+        "comment_likes",
+        ["user_id", sa.text("created_at DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_comment_likes_user_recent", table_name="comment_likes")
+    op.drop_index("idx_post_likes_user_recent", table_name="post_likes")
@@ -0,0 +1,55 @@
+"""post_stats: 게시글 카운터를 좁은 1:1 테이블로 분리(fillfactor 50) + 백필
+
+Revision ID: 015_post_stats
+Revises: 014_like_user_recent_index
+Create Date: 2026-10-17 14:00:00.000000
+
+좋아요·댓글·조회 flush·신고가 posts 행(TOAST 본문, 제목·본문 trgm GIN)을 통째로 다시 쓰고,
+updated_at까지 바꿔 HOT 갱신이 안 됐다(ADR 0024). 카운터 네 개를 보조 인덱스 없는 post_stats로
+옮기고 기존 값을 그대로 백필한 뒤 posts에서 컬럼을 지운다. 앱과 함께 배포해야 한다 — 이전 버전
+앱은 posts.like_count 등을 읽는다.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "015_post_stats"
+down_revision: str | None = "014_like_user_recent_index"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_COUNTERS = ("view_count", "like_count", "comment_count", "report_count")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "post_stats",
+        sa.Column("post_id", postgresql.UUID(as_uuid=True), nullable=False),
+        *(
+            sa.Column(name, sa.Integer(), nullable=False, server_default=sa.text("0"))
+            for name in _COUNTERS
+        ),
+        sa.ForeignKeyConstraint(["post_id"], ["posts.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("post_id"),
+    )
+    # 페이지 절반을 HOT 갱신 여유로 둔다(행이 작아 공간 비용은 미미). 백필 전에 걸어야 적재부터 적용.
+    # 테이블 단위 postgresql_with는 SQLAlchemy 2.1 전용이라 고정 버전(2.0)에서도 되는 ALTER로 건다.
+    op.execute("ALTER TABLE post_stats SET (fillfactor = 50)")
+    cols = ", ".join(_COUNTERS)
+    op.execute(f"INSERT INTO post_stats (post_id, {cols}) SELECT id, {cols} FROM posts")
+    for name in _COUNTERS:
+        op.drop_column("posts", name)
+
+
+def downgrade() -> None:
+    for name in _COUNTERS:
+        op.add_column(
+            "posts",
+            sa.Column(name, sa.Integer(), nullable=False, server_default=sa.text("0")),
+        )
+    assignments = ", ".join(f"{name} = s.{name}" for name in _COUNTERS)
+    op.execute(f"UPDATE posts SET {assignments} FROM post_stats s WHERE s.post_id = posts.id")
+    op.drop_table("post_stats")
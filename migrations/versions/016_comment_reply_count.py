@@ -0,0 +1,46 @@
+"""comments.reply_count 비정규화 + (parent_id, id) 인덱스
+
+Revision ID: 016_comment_reply_count
+Revises: 015_post_stats
+Create Date: 2026-10-17 16:00:00.000000
+
+댓글 페이지가 루트마다 대댓글 앞쪽 N건만 LATERAL로 읽고, 나머지는 루트별 keyset 더보기로 읽는다
+(ADR 0026). 루트별 ORDER BY id LIMIT가 인덱스 범위 스캔으로 끝나도록 (parent_id, id) 인덱스로
+단일 컬럼 parent_id 인덱스를 대체한다. reply_count는 미삭제·미블라인드 대댓글 수로 백필한다.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "016_comment_reply_count"
+down_revision: str | None = "015_post_stats"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "comments",
+        sa.Column("reply_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+    )
+    op.execute(
+        """
+        UPDATE comments c SET reply_count = r.n
+        FROM (
+            SELECT parent_id, count(*) AS n FROM comments
+            WHERE parent_id IS NOT NULL AND deleted_at IS NULL AND is_blinded = false
+            GROUP BY parent_id
+        ) r
+        WHERE c.id = r.parent_id
+        """
+    )
+    op.create_index("ix_comments_parent_recent", "comments", ["parent_id", "id"])
+    op.drop_index("ix_comments_parent_id", table_name="comments")
+
+
+def downgrade() -> None:
+    op.create_index("ix_comments_parent_id", "comments", ["parent_id"])
+    op.drop_index("ix_comments_parent_recent", table_name="comments")
+    op.drop_column("comments", "reply_count")
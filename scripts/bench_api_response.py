@@ -0,0 +1,153 @@
+"""ApiResponse 직렬화 벤치마크 — response_model 재검증 경로 vs 사전 직렬화(api_json_response).
+
+DB·Redis 없이 돈다. 목록 모양(PostResponse × size, 작성자·첨부·해시태그 포함) 페이지 하나의 직렬화
+비용을 프로세스 안에서 잰다(ASGI·라우팅 잡음 제외).
+
+  - classic: FastAPI serialize_response와 같은 일 — response_model TypeAdapter로 재검증 후 dump_json
+  - fast   : api_json_response — 이미 만든 ApiResponse를 pydantic-core to_json 한 번
+  - cold/warm: PublicId base62 변환 LRU를 매번 비운 경우(처음 보는 id) / 채운 경우(캐시된 풀 재응답)
+
+같은 response_model을 단 두 라우트를 ASGI로 한 번씩 불러 본문이 바이트 단위로 같은지도 확인한다.
+
+사용:
+  python3 scripts/bench_api_response.py
+  python3 scripts/bench_api_response.py --sizes 10 20 100 --repeat 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import uuid
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import httpx  # noqa: E402
+from app.common import (  # noqa: E402
+    ApiCode,
+    ApiResponse,
+    CursorPage,
+    api_json_response,
+    api_response,
+)
+from app.core.ids import uuid_to_base62  # noqa: E402
+from app.domain.posts.schemas import PostResponse  # noqa: E402
+from fastapi import FastAPI, Request  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+
+
+def _page(size: int) -> CursorPage[PostResponse]:
+    now = datetime.now(UTC)
+    items = [
+        PostResponse.model_validate(
+            {
+                "id": uuid.uuid4(),
+                "title": f"산책 후기 {i}",
+                "content": "본문 " * 80,
+                "view_count": i * 7,
+                "like_count": i,
+                "comment_count": i % 5,
+                "author": {
+                    "id": uuid.uuid4(),
+                    "nickname": f"뭉치맘{i}",
+                    "profile_image_id": uuid.uuid4(),
+                    "profile_image_url": "https://cdn.invalid/profile.jpg",
+                    "representative_dog": {
+                        "name": "뭉치",
+                        "breed": "말티즈",
+                        "gender": "male",
+                        "birth_date": "2020-01-01",
+                    },
+                },
+                "files": [
+                    {
+                        "id": uuid.uuid4(),
+                        "file_url": "https://cdn.invalid/a.jpg",
+                        "image_id": uuid.uuid4(),
+                    }
+                    for _ in range(i % 3)
+                ],
+                "hashtags": ["산책", "말티즈"][: i % 3],
+                "version": 1 + i % 2,
+                "created_at": now,
+            }
+        )
+        for i in range(size)
+    ]
+    return CursorPage(items=items, has_more=True)
+
+
+def _app(page: CursorPage[PostResponse]) -> FastAPI:
+    app = FastAPI()
+    model = ApiResponse[CursorPage[PostResponse]]
+
+    @app.get("/classic", response_model=model)
+    async def classic(request: Request):
+        return api_response(request, code=ApiCode.OK, data=page)
+
+    @app.get("/fast", response_model=model)
+    async def fast(request: Request):
+        return api_json_response(request, code=ApiCode.OK, data=page)
+
+    return app
+
+
+def _serialize_us(fn: Callable[[], object], repeat: int, *, cold: bool) -> float:
+    samples: list[float] = []
+    for _ in range(repeat):
+        if cold:
+            uuid_to_base62.cache_clear()
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1e6)
+    return statistics.median(samples)
+
+
+async def _bodies_identical(page: CursorPage[PostResponse]) -> bool:
+    transport = httpx.ASGITransport(app=_app(page))
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as c:
+        return (await c.get("/classic")).content == (await c.get("/fast")).content
+
+
+async def _run(args: argparse.Namespace) -> int:
+    adapter = TypeAdapter(ApiResponse[CursorPage[PostResponse]])
+    print(
+        f"{'size':>5} {'cache':>5} {'classic µs':>11} {'fast µs':>9} {'fast/classic':>13}"
+        f" {'fast µs/item':>13}"
+    )
+    identical = True
+    for size in args.sizes:
+        page = _page(size)
+        out = ApiResponse(code=ApiCode.OK, data=page)
+        identical &= await _bodies_identical(page)
+
+        def classic(out: ApiResponse = out) -> object:
+            return adapter.dump_json(adapter.validate_python(out), by_alias=True)
+
+        def fast(out: ApiResponse = out) -> object:
+            return out.__pydantic_serializer__.to_json(out, by_alias=True)
+
+        for cold in (True, False):
+            c = _serialize_us(classic, args.repeat, cold=cold)
+            f = _serialize_us(fast, args.repeat, cold=cold)
+            label = "cold" if cold else "warm"
+            print(f"{size:>5} {label:>5} {c:>11.0f} {f:>9.0f} {f / c:>13.0%} {f / size:>13.1f}")
+    print(f"bodies byte-identical: {identical}")
+    return 0 if identical else 1
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="ApiResponse: response_model 경로 vs 사전 직렬화")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 20, 100], help="페이지 크기")
+    parser.add_argument("--repeat", type=int, default=500, help="크기·경로·캐시 상태당 반복 횟수")
+    return asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
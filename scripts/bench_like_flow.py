@@ -0,0 +1,224 @@
+"""좋아요·취소 벤치마크 — 단계별 문장 vs 데이터 변경 CTE 한 문장(ADR 0025).
+
+스크래치 PostgreSQL에 스키마(없으면)·작성자·사용자 N명·인기글 하나를 커밋으로 만들고, 동시 작업자 C개가
+각자 다른 사용자로 같은 글에 좋아요→취소를 반복한다. 카운터는 트랜잭션 안에서 갱신한다(write-behind
+꺼짐 — 행 잠금을 쥐는 시간이 곧 비교 대상). 끝나면 시드 글·사용자를 지운다(CASCADE).
+
+  - steps: 이전 서비스 순서 — 가시성 EXISTS → INSERT ON CONFLICT → UPDATE post_stats RETURNING →
+           작성자 SELECT → 알림 INSERT (취소는 가시성 → DELETE → UPDATE)
+  - cte  : PostLikesModel.like / unlike(bump_count=True) — 동작마다 한 문장
+  - 동작당 DB 왕복(BEGIN·COMMIT 제외 문장) 수, 벽시계 p50/p99, 처리량
+  - 끝난 뒤 post_stats.like_count가 원장 COUNT와 같은지 확인
+
+사용:
+  python3 scripts/bench_like_flow.py --database-url postgresql+psycopg://postgres:pw@localhost/scratch
+  python3 scripts/bench_like_flow.py --workers 32 --rounds 50 --database-url ...
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.common.enums import NotificationKind  # noqa: E402
+from app.core.ids import new_uuid7  # noqa: E402
+from app.db.base import Base  # noqa: E402
+from app.db.base_class import utc_now  # noqa: E402
+from app.domain.likes.model import PostLike, PostLikesModel  # noqa: E402
+from app.domain.notifications.model import NotificationsModel  # noqa: E402
+from app.domain.posts.model import Post, PostStats  # noqa: E402
+from app.domain.posts.repository import PostsModel  # noqa: E402
+from app.domain.users.model import User  # noqa: E402
+from sqlalchemy import delete, event, func, insert, select  # noqa: E402
+from sqlalchemy.dialects.postgresql import insert as pg_insert  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine  # noqa: E402
+
+
+async def _seed(engine: AsyncEngine, users: int) -> tuple[UUID, list[UUID], UUID]:
+    now = utc_now()
+    author = new_uuid7()
+    user_ids = [new_uuid7() for _ in range(users)]
+    post_id = new_uuid7()
+    async with engine.begin() as conn:
+        await conn.execute(
+            insert(User),
+            [
+                {
+                    "id": uid,
+                    "email": f"likebench{uid.hex}@bench.invalid",
+                    "password": "x",
+                    "nickname": f"lb{uid.hex[-10:]}",
+                    "status": "ACTIVE",
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for uid in (author, *user_ids)
+            ],
+        )
+        await conn.execute(
+            insert(Post).values(
+                id=post_id,
+                user_id=author,
+                title="like bench",
+                content="hot post",
+                created_at=now,
+                updated_at=now,
+                version=1,
+            )
+        )
+        await conn.execute(insert(PostStats).values(post_id=post_id))
+    return author, user_ids, post_id
+
+
+async def _cleanup(engine: AsyncEngine, post_id: UUID, author: UUID, user_ids: list[UUID]) -> None:
+    # post_likes·post_stats·notifications는 posts FK CASCADE로 함께 지워진다.
+    async with engine.begin() as conn:
+        await conn.execute(delete(Post).where(Post.id == post_id))
+        await conn.execute(delete(User).where(User.id.in_([author, *user_ids])))
+
+
+async def _steps_like(post_id: UUID, user_id: UUID, db: AsyncSession) -> None:
+    async with db.begin():
+        if not await PostsModel.post_is_visible(post_id, db=db):
+            raise RuntimeError("post not visible")
+        inserted = (
+            await db.execute(
+                pg_insert(PostLike)
+                .values(post_id=post_id, user_id=user_id, created_at=utc_now())
+                .on_conflict_do_nothing(index_elements=[PostLike.post_id, PostLike.user_id])
+                .returning(PostLike.post_id)
+            )
+        ).scalar_one_or_none() is not None
+        if not inserted:
+            return
+        await PostsModel.increment_like_count(post_id, db=db)
+        author_id = await PostsModel.get_post_author_id(post_id, db=db)
+        if author_id and author_id != user_id:
+            await NotificationsModel.insert(
+                user_id=author_id,
+                kind=NotificationKind.LIKE_POST,
+                actor_id=user_id,
+                post_id=post_id,
+                comment_id=None,
+                db=db,
+            )
+
+
+async def _steps_unlike(post_id: UUID, user_id: UUID, db: AsyncSession) -> None:
+    async with db.begin():
+        if not await PostsModel.post_is_visible(post_id, db=db):
+            raise RuntimeError("post not visible")
+        removed = (
+            await db.execute(
+                delete(PostLike)
+                .where(PostLike.post_id == post_id, PostLike.user_id == user_id)
+                .returning(PostLike.post_id)
+            )
+        ).scalar_one_or_none() is not None
+        if removed:
+            await PostsModel.decrement_like_count(post_id, db=db)
+
+
+async def _cte_like(post_id: UUID, user_id: UUID, db: AsyncSession) -> None:
+    async with db.begin():
+        outcome = await PostLikesModel.like(post_id, user_id, bump_count=True, db=db)
+    if not outcome.found:
+        raise RuntimeError("post not visible")
+
+
+async def _cte_unlike(post_id: UUID, user_id: UUID, db: AsyncSession) -> None:
+    async with db.begin():
+        await PostLikesModel.unlike(post_id, user_id, bump_count=True, db=db)
+
+
+_PATHS = {"steps": (_steps_like, _steps_unlike), "cte": (_cte_like, _cte_unlike)}
+
+
+async def _measure(
+    engine: AsyncEngine,
+    path: str,
+    post_id: UUID,
+    user_ids: list[UUID],
+    counter: list[int],
+    args: argparse.Namespace,
+) -> tuple[float, float, float, float]:
+    like_fn, unlike_fn = _PATHS[path]
+    walls: list[float] = []
+
+    async def _worker(user_id: UUID) -> None:
+        async with AsyncSession(bind=engine) as db:
+            for _ in range(args.rounds):
+                for fn in (like_fn, unlike_fn):
+                    started = time.perf_counter()
+                    await fn(post_id, user_id, db)
+                    walls.append((time.perf_counter() - started) * 1000)
+
+    counter[0] = 0
+    started = time.perf_counter()
+    await asyncio.gather(*(_worker(uid) for uid in user_ids[: args.workers]))
+    elapsed = time.perf_counter() - started
+    walls.sort()
+    p99 = walls[min(len(walls) - 1, int(len(walls) * 0.99))]
+    return statistics.median(walls), p99, len(walls) / elapsed, counter[0] / len(walls)
+
+
+async def _run(args: argparse.Namespace) -> int:
+    engine = create_async_engine(args.database_url, pool_size=args.workers, max_overflow=0)
+    counter = [0]
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _count(*_: Any) -> None:
+        counter[0] += 1
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    author, user_ids, post_id = await _seed(engine, args.workers)
+    consistent = True
+    try:
+        # 워밍업(문장 캐시·커넥션 풀) 후 측정.
+        async with AsyncSession(bind=engine) as db:
+            for like_fn, unlike_fn in _PATHS.values():
+                await like_fn(post_id, user_ids[0], db)
+                await unlike_fn(post_id, user_ids[0], db)
+
+        print(f"hot post, workers={args.workers}, rounds={args.rounds} (like+unlike each)")
+        print(f"{'path':<6} {'p50 ms':>8} {'p99 ms':>8} {'ops/s':>9} {'stmts/op':>9}")
+        for path in _PATHS:
+            p50, p99, ops, stmts = await _measure(engine, path, post_id, user_ids, counter, args)
+            print(f"{path:<6} {p50:>8.2f} {p99:>8.2f} {ops:>9.0f} {stmts:>9.1f}")
+
+        async with AsyncSession(bind=engine) as db:
+            stored = await db.scalar(
+                select(PostStats.like_count).where(PostStats.post_id == post_id)
+            )
+            counted = await db.scalar(
+                select(func.count()).select_from(PostLike).where(PostLike.post_id == post_id)
+            )
+        consistent = stored == counted
+        print(f"like_count {stored} == ledger {counted}: {consistent}")
+    finally:
+        await _cleanup(engine, post_id, author, user_ids)
+        await engine.dispose()
+    return 0 if consistent else 1
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="좋아요·취소: 단계별 문장 vs 한 문장 CTE")
+    parser.add_argument(
+        "--database-url", required=True, help="스크래치 PostgreSQL(시드는 끝에 삭제)"
+    )
+    parser.add_argument("--workers", type=int, default=16, help="동시 작업자(=사용자) 수")
+    parser.add_argument("--rounds", type=int, default=30, help="작업자당 좋아요→취소 반복 횟수")
+    return asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
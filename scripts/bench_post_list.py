@@ -0,0 +1,239 @@
+"""게시글 목록 하이드레이션 벤치마크 — ORM eager load vs Core 프로젝션(ADR 0018).
+
+스크래치 PostgreSQL에 한 트랜잭션으로 스키마(없으면)·시드(작성자·프로필 이미지·대표견·첨부·해시태그)를
+만들고, 같은 keyset 페이지들을 두 경로로 하이드레이션해 페이지당 비용을 비교한다. 끝나면 ROLLBACK.
+
+  - orm : PostsModel.get_all_posts + PostResponse.model_validate(...).model_copy(is_liked)
+  - core: PostsModel.get_all_post_rows + post_response_from_list_row(is_liked)
+  - 페이지당 벽시계 p50/p95, 프로세스 CPU p50(드라이버·ORM·검증 포함), DB 왕복(문장) 수
+  - 두 경로의 응답 JSON이 같은지(첫 페이지들) 확인
+
+사용:
+  python3 scripts/bench_post_list.py --database-url postgresql+psycopg://postgres:pw@localhost/scratch
+  python3 scripts/bench_post_list.py --posts 50000 --pages 20 --repeat 5 --database-url ...
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.core.ids import new_uuid7  # noqa: E402
+from app.db.base import Base  # noqa: E402
+from app.db.base_class import utc_now  # noqa: E402
+from app.domain.dogs.model import DogProfile  # noqa: E402
+from app.domain.media.model import Image  # noqa: E402
+from app.domain.posts import repository as repo  # noqa: E402
+from app.domain.posts.list_projection import post_response_from_list_row  # noqa: E402
+from app.domain.posts.model import Hashtag, Post, PostImage, PostStats, post_hashtags  # noqa: E402
+from app.domain.posts.schemas import PostResponse  # noqa: E402
+from app.domain.users.model import User  # noqa: E402
+from sqlalchemy import event, insert  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, create_async_engine  # noqa: E402
+
+_TAGS = "산책 간식 사료 훈련 미용 병원 입양 여행 캠핑 일상 질문 정보 말티즈 푸들".split()
+_BATCH = 2000
+
+
+def _image(now: Any, uploader: Any = None) -> dict[str, Any]:
+    iid = new_uuid7()
+    key = f"bench/{iid}.jpg"
+    return {
+        "id": iid,
+        "file_key": key,
+        "file_url": f"https://bench.invalid/{key}",
+        "uploader_id": uploader,
+        "created_at": now,
+    }
+
+
+async def _seed(conn: AsyncConnection, posts: int, users: int, seed: int) -> None:
+    rng = random.Random(seed)
+    now = utc_now()
+    profile_images = [_image(now) for _ in range(users)]
+    await conn.execute(insert(Image), profile_images)
+    user_rows = [
+        {
+            "id": new_uuid7(),
+            "email": f"bench{i}@bench.invalid",
+            "password": "x",
+            "nickname": f"bench{i}",
+            # 절반은 프로필 이미지, 5%는 탈퇴(익명화 분기)
+            "profile_image_id": profile_images[i]["id"] if i % 2 == 0 else None,
+            "status": "WITHDRAWN" if i % 20 == 0 else "ACTIVE",
+            "created_at": now,
+            "updated_at": now,
+        }
+        for i in range(users)
+    ]
+    await conn.execute(insert(User), user_rows)
+    await conn.execute(
+        insert(DogProfile),
+        [
+            {
+                "owner_id": u["id"],
+                "name": f"dog{i}",
+                "breed": "말티즈",
+                "gender": "male",
+                "birth_date": date(2020, 1, 1),
+                "is_representative": True,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i, u in enumerate(user_rows)
+            if i % 3 != 0
+        ],
+    )
+    tag_ids = [
+        (
+            await conn.execute(insert(Hashtag).values(name=f"bench{name}").returning(Hashtag.id))
+        ).scalar_one()
+        for name in _TAGS
+    ]
+    for lo in range(0, posts, _BATCH):
+        rows: list[dict[str, Any]] = []
+        links: list[dict[str, Any]] = []
+        images: list[dict[str, Any]] = []
+        attachments: list[dict[str, Any]] = []
+        for _ in range(lo, min(lo + _BATCH, posts)):
+            pid = new_uuid7()
+            author = rng.choice(user_rows)["id"]
+            rows.append(
+                {
+                    "id": pid,
+                    "user_id": author,
+                    "title": f"bench {pid.hex[:8]}",
+                    "content": "본문 " * rng.randint(20, 200),
+                    "created_at": now,
+                    "updated_at": now,
+                    "version": 1,
+                }
+            )
+            links.extend(
+                {"post_id": pid, "hashtag_id": hid}
+                for hid in rng.sample(tag_ids, rng.randint(0, 4))
+            )
+            for _ in range(rng.choice((0, 0, 1, 2, 3))):
+                img = _image(now, author)
+                images.append(img)
+                attachments.append(
+                    {"id": new_uuid7(), "post_id": pid, "image_id": img["id"], "created_at": now}
+                )
+        await conn.execute(insert(Post), rows)
+        await conn.execute(insert(PostStats), [{"post_id": r["id"]} for r in rows])
+        if links:
+            await conn.execute(insert(post_hashtags), links)
+        if images:
+            await conn.execute(insert(Image), images)
+            await conn.execute(insert(PostImage), attachments)
+
+
+async def _orm_page(db: AsyncSession, size: int, cursor: Any) -> list[PostResponse]:
+    fetched = await repo.PostsModel.get_all_posts(size, db=db, cursor=cursor)
+    out = [
+        PostResponse.model_validate(p).model_copy(update={"is_liked": False})
+        for p in fetched[:size]
+    ]
+    # 요청마다 새 세션인 API와 맞춘다 — identity map 재사용으로 뒤 페이지가 싸지지 않게.
+    db.expunge_all()
+    return out
+
+
+async def _core_page(db: AsyncSession, size: int, cursor: Any) -> list[PostResponse]:
+    fetched = await repo.PostsModel.get_all_post_rows(size, db=db, cursor=cursor)
+    return [post_response_from_list_row(r, is_liked=False) for r in fetched[:size]]
+
+
+async def _measure(db: AsyncSession, page_fn: Any, counter: list[int], args: argparse.Namespace):
+    walls: list[float] = []
+    cpus: list[float] = []
+    queries: list[int] = []
+    pages: list[list[dict[str, Any]]] = []
+    for rep in range(args.repeat):
+        cursor = None
+        for _ in range(args.pages):
+            counter[0] = 0
+            wall, cpu = time.perf_counter(), time.process_time()
+            page = await page_fn(db, args.size, cursor)
+            walls.append((time.perf_counter() - wall) * 1000)
+            cpus.append((time.process_time() - cpu) * 1000)
+            queries.append(counter[0])
+            if rep == 0:
+                pages.append([p.model_dump(mode="json") for p in page])
+            if not page:
+                break
+            cursor = page[-1].id
+    walls.sort()
+    p95 = walls[min(len(walls) - 1, int(len(walls) * 0.95))]
+    return statistics.median(walls), p95, statistics.median(cpus), max(queries), pages
+
+
+def _normalize(pages: list[list[dict[str, Any]]]) -> list[list[dict[str, Any]]]:
+    # 해시태그 순서는 두 경로 모두 미보장 — 집합으로 비교한다.
+    return [[{**p, "hashtags": sorted(p["hashtags"])} for p in page] for page in pages]
+
+
+async def _run(args: argparse.Namespace) -> int:
+    engine = create_async_engine(args.database_url)
+    counter = [0]
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _count(*_: Any) -> None:
+        counter[0] += 1
+
+    async with engine.connect() as conn:
+        trans = await conn.begin()
+        try:
+            await conn.run_sync(Base.metadata.create_all)
+            started = time.perf_counter()
+            await _seed(conn, args.posts, args.users, args.seed)
+            print(f"seeded posts={args.posts:,} in {time.perf_counter() - started:.1f}s")
+            for table in ("posts", "users", "images", "post_images", "post_hashtags"):
+                await conn.exec_driver_sql(f"ANALYZE {table}")
+            db = AsyncSession(bind=conn)
+            # 워밍업(문장 캐시·커넥션 상태) 후 측정.
+            await _orm_page(db, args.size, None)
+            await _core_page(db, args.size, None)
+
+            print(f"{'path':<6} {'p50 ms':>8} {'p95 ms':>8} {'cpu ms':>8} {'queries':>8}")
+            results = {}
+            for name, fn in (("orm", _orm_page), ("core", _core_page)):
+                p50, p95, cpu, queries, pages = await _measure(db, fn, counter, args)
+                results[name] = (cpu, queries, pages)
+                print(f"{name:<6} {p50:>8.2f} {p95:>8.2f} {cpu:>8.2f} {queries:>8}")
+            (orm_cpu, orm_q, orm_pages), (core_cpu, core_q, core_pages) = (
+                results["orm"],
+                results["core"],
+            )
+            print(f"core vs orm: cpu/page {core_cpu / orm_cpu:.0%}, queries/page {core_q}/{orm_q}")
+            same = _normalize(orm_pages) == _normalize(core_pages)
+            print(f"responses identical across {len(orm_pages)} pages: {same}")
+        finally:
+            await trans.rollback()
+    await engine.dispose()
+    return 0 if same else 1
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="게시글 목록: ORM eager load vs Core 프로젝션")
+    parser.add_argument("--database-url", required=True, help="스크래치 PostgreSQL(롤백됨)")
+    parser.add_argument("--posts", type=int, default=20_000, help="시드 게시글 수")
+    parser.add_argument("--users", type=int, default=500, help="시드 작성자 수")
+    parser.add_argument("--size", type=int, default=20, help="페이지 크기")
+    parser.add_argument("--pages", type=int, default=10, help="keyset으로 넘길 페이지 수")
+    parser.add_argument("--repeat", type=int, default=5, help="페이지 묶음 반복 횟수")
+    parser.add_argument("--seed", type=int, default=7)
+    return asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,188 @@
+"""게시글 검색 벤치마크 — 토큰별 ILIKE OR 체인(기존) vs 검색 문서 랭킹(ADR 0015).
+
+스크래치 PostgreSQL에 한 트랜잭션으로 스키마(없으면)·시드 코퍼스를 만들고, 검색 문서를 앱 백필
+경로로 채운 뒤 같은 검색어를 두 경로로 돌려 비교한다. 끝나면 ROLLBACK — DB에 흔적을 남기지 않는다.
+
+  - 목록 API와 같은 PostsModel.get_all_posts(eager load 포함) 지연 p50/p95
+  - id만 뽑는 핵심 쿼리의 EXPLAIN ANALYZE 실행 시간과 사용 인덱스
+  - 첫 페이지 겹침(랭킹 경로는 관련도순이라 id순 ILIKE와 순서가 다를 수 있다)
+
+사용:
+  python3 scripts/bench_post_search.py --database-url postgresql+psycopg://postgres:pw@localhost/scratch
+  python3 scripts/bench_post_search.py --posts 200000 --repeat 20 --database-url ...
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.core.ids import new_uuid7  # noqa: E402
+from app.db.base import Base  # noqa: E402
+from app.db.base_class import utc_now  # noqa: E402
+from app.domain.posts import repository as repo  # noqa: E402
+from app.domain.posts.model import Hashtag, Post, PostStats, post_hashtags  # noqa: E402
+from sqlalchemy import insert, select, text  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, create_async_engine  # noqa: E402
+
+_WORDS = (
+    "강아지 산책 말티즈 푸들 리트리버 간식 사료 추천 후기 병원 예방접종 미용 목욕 훈련 배변 "
+    "분리불안 장난감 하네스 공원 애견카페 여행 캠핑 수제간식 알레르기 슬개골 중성화 입양 "
+    "보호소 사진 자랑 질문 고민 정보 꿀팁 동네 친구 모임 카보불닭 레시피"
+).split()
+_LATIN = "puppy walk recipe review vet toy harness cafe camping training".split()
+_TAGS = "산책 간식 사료 훈련 미용 병원 입양 여행 캠핑 일상 질문 정보 말티즈 푸들".split()
+_QUERIES = ("산책", "말티즈 간식", "사료 추천", "수제간식", "puppy", "강아지 산책 공원", "슬개골")
+_BATCH = 2000
+
+
+def _sentence(rng: random.Random, n: int) -> str:
+    words = rng.choices(_WORDS, k=n)
+    if rng.random() < 0.2:
+        words.insert(rng.randrange(len(words) + 1), rng.choice(_LATIN))
+    # 절반은 조사·붙여쓰기 흉내(어절 단위 토큰화면 놓치는 부분 일치)
+    return " ".join(w + rng.choice(("", "", "을", "에서", "이랑")) for w in words)
+
+
+async def _seed(conn: AsyncConnection, posts: int, seed: int) -> None:
+    rng = random.Random(seed)
+    tag_ids = [
+        (
+            await conn.execute(insert(Hashtag).values(name=f"bench{name}").returning(Hashtag.id))
+        ).scalar_one()
+        for name in _TAGS
+    ]
+    now = utc_now()
+    for lo in range(0, posts, _BATCH):
+        rows: list[dict[str, Any]] = []
+        links: list[dict[str, Any]] = []
+        for _ in range(lo, min(lo + _BATCH, posts)):
+            pid = new_uuid7()
+            rows.append(
+                {
+                    "id": pid,
+                    "title": _sentence(rng, rng.randint(2, 6)),
+                    "content": _sentence(rng, rng.randint(20, 120)),
+                    "created_at": now,
+                    "updated_at": now,
+                    "version": 1,
+                }
+            )
+            links.extend(
+                {"post_id": pid, "hashtag_id": hid}
+                for hid in rng.sample(tag_ids, rng.randint(0, 3))
+            )
+        await conn.execute(insert(Post), rows)
+        await conn.execute(insert(PostStats), [{"post_id": r["id"]} for r in rows])
+        if links:
+            await conn.execute(insert(post_hashtags), links)
+
+
+async def _backfill(db: AsyncSession) -> float:
+    started = time.perf_counter()
+    while await repo.PostsModel.backfill_search_documents(_BATCH, db=db) == _BATCH:
+        pass
+    return time.perf_counter() - started
+
+
+async def _explain(
+    conn: AsyncConnection, q: str, ranked: bool, size: int
+) -> tuple[float, list[str]]:
+    stmt = select(Post.id).where(Post.deleted_at.is_(None), Post.is_blinded.is_(False))
+    query = repo._ranked_search_query(q) if ranked else None
+    if query is not None:
+        stmt = repo._apply_ranked_search(stmt, query, cursor=None)
+    else:
+        stmt = repo._apply_post_list_search_filter(stmt, search_q=q).order_by(Post.id.desc())
+    # 드라이버 paramstyle 그대로 보낸다(text()로 감싸면 % 이스케이프가 이중 적용된다).
+    compiled = stmt.limit(size + 1).compile(dialect=conn.dialect)
+    plan = (
+        await conn.exec_driver_sql(
+            f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {compiled}", compiled.params
+        )
+    ).scalar_one()
+    root = (json.loads(plan) if isinstance(plan, str) else plan)[0]
+    indexes: set[str] = set()
+
+    def walk(node: dict[str, Any]) -> None:
+        if "Index Name" in node:
+            indexes.add(node["Index Name"])
+        for child in node.get("Plans", []):
+            walk(child)
+
+    walk(root["Plan"])
+    return float(root["Execution Time"]), sorted(indexes)
+
+
+async def _time_list(db: AsyncSession, q: str, ranked: bool, size: int, repeat: int):
+    samples: list[float] = []
+    ids: list[Any] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        rows = await repo.PostsModel.get_all_posts(size, db=db, search_q=q, ranked_search=ranked)
+        samples.append((time.perf_counter() - started) * 1000)
+        ids = [p.id for p in rows[:size]]
+    samples.sort()
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    return statistics.median(samples), p95, ids
+
+
+async def _run(args: argparse.Namespace) -> int:
+    engine = create_async_engine(args.database_url)
+    async with engine.connect() as conn:
+        trans = await conn.begin()
+        try:
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            await conn.run_sync(Base.metadata.create_all)
+            started = time.perf_counter()
+            await _seed(conn, args.posts, args.seed)
+            print(f"seeded posts={args.posts:,} in {time.perf_counter() - started:.1f}s")
+            db = AsyncSession(bind=conn)
+            elapsed = await _backfill(db)
+            print(
+                f"backfill search documents: {elapsed:.1f}s ({args.posts / elapsed:,.0f} posts/s)"
+            )
+            await conn.execute(text("ANALYZE posts"))
+            await conn.execute(text("ANALYZE post_search_documents"))
+            await conn.execute(text("ANALYZE post_hashtags"))
+
+            print(f"{'query':<18} {'path':<7} {'p50 ms':>8} {'p95 ms':>8} {'plan ms':>8}  indexes")
+            for q in _QUERIES:
+                pages = {}
+                for name, ranked in (("ilike", False), ("ranked", True)):
+                    p50, p95, ids = await _time_list(db, q, ranked, args.size, args.repeat)
+                    plan_ms, indexes = await _explain(conn, q, ranked, args.size)
+                    pages[name] = ids
+                    print(
+                        f"{q:<18} {name:<7} {p50:>8.1f} {p95:>8.1f} {plan_ms:>8.1f}  "
+                        f"{', '.join(indexes) or '-'}"
+                    )
+                overlap = len(set(pages["ilike"]) & set(pages["ranked"]))
+                print(f"{'':<18} first-page overlap {overlap}/{args.size}")
+        finally:
+            await trans.rollback()
+    await engine.dispose()
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="게시글 검색: ILIKE OR 체인 vs 검색 문서 랭킹")
+    parser.add_argument("--database-url", required=True, help="스크래치 PostgreSQL(롤백됨)")
+    parser.add_argument("--posts", type=int, default=50_000, help="시드 게시글 수")
+    parser.add_argument("--size", type=int, default=20, help="페이지 크기")
+    parser.add_argument("--repeat", type=int, default=10, help="검색어·경로당 반복 횟수")
+    parser.add_argument("--seed", type=int, default=7)
+    return asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
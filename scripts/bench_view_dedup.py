@@ -0,0 +1,142 @@
+"""조회수 뷰어 dedup 벤치마크 — 뷰어별 SET NX 키(기존) vs 샤드·시간 버킷 Bloom 비트맵(ADR 0007).
+
+기본(오프라인): 앱과 같은 해시로 Bloom을 채워 실측 오탐률과 고정 메모리를 계산하고, 뷰어별 키
+메모리는 키당 추정치(--key-bytes)로 어림한다. Redis 없이 돈다.
+
+--redis-url: 두 방식을 실제로 써서 INFO memory의 used_memory 증가분과 처리량을 잰다. 시작·종료 시
+FLUSHDB 하므로 반드시 비어 있는 스크래치 DB를 가리킬 것(예: redis://localhost:6379/15).
+
+사용:
+  python3 scripts/bench_view_dedup.py --viewers 500000
+  python3 scripts/bench_view_dedup.py --viewers 200000 --redis-url redis://localhost:6379/15
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Any, cast
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.core.config import settings  # noqa: E402
+from app.domain.posts import view_dedup  # noqa: E402
+from app.domain.posts.view_buffer import view_buffer_key, view_shard_for  # noqa: E402
+
+_BATCH = 1000
+
+
+def _fmt_bytes(n: float) -> str:
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if abs(n) < 1024 or unit == "GiB":
+            return f"{n:,.1f} {unit}"
+        n /= 1024
+    return f"{n:,.1f} GiB"
+
+
+def _offline(post_id: uuid.UUID, viewers: int, probes: int) -> tuple[int, float]:
+    m = settings.VIEW_DEDUP_BLOOM_BITS
+    bitmap = bytearray(m // 8 + 1)
+    for i in range(viewers):
+        for p in view_dedup.bloom_positions(post_id, f"ip:{i}"):
+            bitmap[p >> 3] |= 0x80 >> (p & 7)
+    false_hits = 0
+    for i in range(probes):
+        pos = view_dedup.bloom_positions(post_id, f"probe:{i}")
+        false_hits += all(bitmap[p >> 3] & (0x80 >> (p & 7)) for p in pos)
+    used = max((i for i, b in enumerate(bitmap) if b), default=-1) + 1
+    return used, false_hits / probes
+
+
+def _redis(url: str, post_id: uuid.UUID, viewers: int) -> tuple[int, float, int, float, int]:
+    from app.domain.posts.services.post_service import _ACCOUNT_VIEW_LUA
+    from redis import Redis
+
+    r = Redis.from_url(url)
+    ttl = settings.VIEW_CACHE_TTL_SECONDS
+
+    def used_memory() -> int:
+        info = cast(dict[str, Any], r.info("memory"))
+        return int(info["used_memory"])
+
+    # 기존 방식: (post, viewer)마다 SET NX EX
+    r.flushdb()
+    base = used_memory()
+    started = time.perf_counter()
+    for lo in range(0, viewers, _BATCH):
+        pipe = r.pipeline(transaction=False)
+        for i in range(lo, min(lo + _BATCH, viewers)):
+            pipe.set(f"view:post:{post_id}:viewer:ip:{i}", "1", nx=True, ex=ttl)
+        pipe.execute()
+    keys_elapsed = time.perf_counter() - started
+    keys_bytes = used_memory() - base
+
+    # Bloom 방식: 앱과 같은 조회 계정 Lua(dedup + 버퍼 HINCRBY + pending)
+    r.flushdb()
+    base = used_memory()
+    script = r.register_script(_ACCOUNT_VIEW_LUA)
+    shard = view_shard_for(post_id)
+    bucket = view_dedup.view_dedup_bucket()
+    keys = [
+        view_dedup.view_dedup_key(shard, bucket),
+        view_buffer_key(shard),
+        view_dedup.view_dedup_key(shard, bucket - 1),
+    ]
+    expire_at = view_dedup.view_dedup_expire_at(bucket)
+    counted = 0
+    started = time.perf_counter()
+    for lo in range(0, viewers, _BATCH):
+        pipe = r.pipeline(transaction=False)
+        for i in range(lo, min(lo + _BATCH, viewers)):
+            pos = view_dedup.bloom_positions(post_id, f"ip:{i}")
+            script(keys=keys, args=[str(post_id), "1", str(expire_at), *pos], client=pipe)
+        counted += sum(int(new) for new, _ in pipe.execute())
+    bloom_elapsed = time.perf_counter() - started
+    bloom_bytes = used_memory() - base
+    r.flushdb()
+    return keys_bytes, viewers / keys_elapsed, bloom_bytes, viewers / bloom_elapsed, counted
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="조회수 뷰어 dedup: 뷰어별 키 vs Bloom 버킷")
+    parser.add_argument("--viewers", type=int, default=500_000, help="한 글의 시간당 고유 뷰어 수")
+    parser.add_argument("--probes", type=int, default=100_000, help="오탐률 측정용 새 뷰어 수")
+    parser.add_argument("--bits", type=int, default=settings.VIEW_DEDUP_BLOOM_BITS)
+    parser.add_argument("--hashes", type=int, default=settings.VIEW_DEDUP_BLOOM_HASHES)
+    parser.add_argument(
+        "--key-bytes", type=int, default=90, help="오프라인 추정용 뷰어별 키 1개의 메모리(바이트)"
+    )
+    parser.add_argument("--redis-url", help="실측용 스크래치 Redis DB(FLUSHDB 됨)")
+    args = parser.parse_args()
+
+    settings.VIEW_DEDUP_BLOOM_BITS = args.bits
+    settings.VIEW_DEDUP_EXPECTED_PAIRS = 0  # --bits 그대로 잰다
+    settings.VIEW_DEDUP_BLOOM_HASHES = args.hashes
+    if settings.VIEW_CACHE_TTL_SECONDS <= 0:
+        settings.VIEW_CACHE_TTL_SECONDS = 3600
+    post_id = uuid.uuid4()
+    n, m, k = args.viewers, args.bits, args.hashes
+    shards = settings.VIEW_BUFFER_SHARDS
+
+    used, fp = _offline(post_id, n, args.probes)
+    print(f"viewers={n:,} bits={m:,} hashes={k} shards={shards}")
+    print(f"  per-viewer keys (est.): {_fmt_bytes(n * args.key_bytes)}  (grows with viewers)")
+    print(f"  bloom bucket (this post's shard): {_fmt_bytes(used)}")
+    print(f"  bloom ceiling (all shards x 2 buckets): {_fmt_bytes(m / 8 * shards * 2)}")
+    theory = view_dedup.bloom_false_positive_rate(n, m, k)
+    print(f"  false positives: measured {fp:.4%} / theory {theory:.4%}")
+
+    if args.redis_url:
+        keys_bytes, keys_ops, bloom_bytes, bloom_ops, counted = _redis(args.redis_url, post_id, n)
+        print("redis (used_memory delta, throughput):")
+        print(f"  per-viewer keys: {_fmt_bytes(keys_bytes)}  {keys_ops:,.0f} ops/s")
+        print(f"  bloom + buffer:  {_fmt_bytes(bloom_bytes)}  {bloom_ops:,.0f} ops/s")
+        print(f"  counted as new: {counted:,} / {n:,} ({1 - counted / n:.4%} suppressed)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
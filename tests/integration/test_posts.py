@@ -75,6 +75,31 @@ async def test_search_posts_gin_index(client: AsyncClient):
     assert "불닭" in (and_items[0].get("title") or "")
 
 
+async def test_search_posts_ranked_by_relevance_with_keyset(client: AsyncClient):
+    """제목 일치(A)가 본문 일치(C)보다 앞서고, (rank, id) 커서로 넘겨도 중복·누락이 없다."""
+    headers = await setup_auth_user(client, "rank_user@example.com", "랭킹퍼피")
+    bodies = [
+        {"title": "산책 일기", "content": "오늘은 말티즈랑 공원"},
+        {"title": "말티즈 산책 코스", "content": "내용"},
+        {"title": "간식 후기", "content": "우리 말티즈가 좋아함"},
+    ]
+    for body in bodies:
+        res = await client.post(
+            "/v1/posts", json=body, headers={**headers, "X-Idempotency-Key": new_ulid_str()}
+        )
+        assert res.status_code == 201, res.text
+
+    first = await client.get("/v1/posts", params={"q": "말티즈", "size": 1})
+    page = first.json().get("data", first.json())
+    assert page["items"][0]["title"] == "말티즈 산책 코스"
+    seen = [page["items"][0]["id"]]
+    while page.get("has_more"):
+        res = await client.get("/v1/posts", params={"q": "말티즈", "size": 1, "cursor": seen[-1]})
+        page = res.json().get("data", res.json())
+        seen.extend(item["id"] for item in page["items"])
+    assert len(seen) == len(set(seen)) == 3
+
+
 async def test_get_trending_posts(client: AsyncClient):
     headers = await setup_auth_user(client, "trending_user@example.com", "트렌딩퍼피")
     idem = {"X-Idempotency-Key": new_ulid_str()}
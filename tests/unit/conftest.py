@@ -0,0 +1,20 @@
+# 단위 스위트 공용 훅. 프로세스 로컬 상태(L1 캐시·해시태그 인덱스·이름 id 캐시·댓글 캐시 인기글 집합)는 테스트 간에
+# 새지 않게 매번 비운다.
+import pytest
+from app.domain.comments.page_cache import reset_hot_posts
+from app.domain.posts.hashtag_ids import hashtag_ids
+from app.domain.posts.hashtag_suggest import hashtag_index
+from app.infra.cache import clear_local_cache
+
+
+@pytest.fixture(autouse=True)
+def _isolate_local_cache():
+    clear_local_cache()
+    hashtag_index.clear()
+    hashtag_ids.clear()
+    reset_hot_posts()
+    yield
+    clear_local_cache()
+    hashtag_index.clear()
+    hashtag_ids.clear()
+    reset_hot_posts()
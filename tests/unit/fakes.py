@@ -14,7 +14,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 class FakeRedis:
     """RedisLike 계약 전체를 갖춘 수퍼셋 가짜 — kv(get/set NX·EX/setex/delete)·
-    hash(hincrby/hget/hgetall)·publish 기록과 조회수 버퍼 Lua 2종(RENAME 스왑·CAS 해제)."""
+    hash(hincrby/hget/hmget/hgetall/hset)·비트맵(Bloom 버킷·strlen)·zset(zrevrange·zincrby·zadd·zunionstore)·
+    publish 기록과 조회수 Lua 3종(조회 계정·RENAME 스왑·CAS 해제)·파이프라인(위 명령 + set sadd/smembers,
+    expire).
+    트렌딩 ZSET Lua는 흉내내지 않는다(CAS 분기로 떨어져 0 반환)."""
 
     def __init__(
         self,
@@ -23,8 +26,12 @@ class FakeRedis:
         fail_publish: bool = False,
         fail_delete_substr: str | None = None,
     ) -> None:
-        self.kv: dict[str, str] = dict(preloaded or {})
+        # 값은 테스트가 심는 그대로 — 문자열이 기본, 바이너리 응답을 흉내낼 땐 bytes.
+        self.kv: dict[str, bytes | str] = dict(preloaded or {})
         self.hashes: dict[str, dict[str, int]] = {}
+        self.zsets: dict[str, dict[str, float]] = {}
+        self.bits: dict[str, set[int]] = {}
+        self.sets: dict[str, set[str]] = {}
         self.published: list[tuple[str, str]] = []
         self.set_calls: list[str] = []
         self.fail_publish = fail_publish
@@ -32,7 +39,9 @@ class FakeRedis:
 
     async def get(self, key):
         v = self.kv.get(key)
-        return v.encode() if v is not None else None
+        if v is None or isinstance(v, bytes):
+            return v
+        return v.encode()
 
     async def set(self, key, val, nx=False, ex=None):
         if nx and key in self.kv:
@@ -51,6 +60,9 @@ class FakeRedis:
         self.kv[key] = value
         return True
 
+    def pipeline(self, *, transaction=True):
+        return _FakePipeline(self)
+
     def pubsub(self):
         raise NotImplementedError("FakeRedis는 pubsub 컨슈머를 흉내내지 않는다")
 
@@ -61,9 +73,13 @@ class FakeRedis:
             raise ConnectionError("redis del failed")
         removed = 0
         for key in keys:
-            existed = key in self.kv or key in self.hashes
+            existed = any(key in store for store in (self.kv, self.hashes, self.zsets, self.bits))
+            existed = existed or key in self.sets
             self.kv.pop(key, None)
             self.hashes.pop(key, None)
+            self.zsets.pop(key, None)
+            self.bits.pop(key, None)
+            self.sets.pop(key, None)
             removed += 1 if existed else 0
         return removed
 
@@ -82,6 +98,57 @@ class FakeRedis:
         v = self.hashes.get(key, {}).get(self._field(field))
         return str(v).encode() if v is not None else None
 
+    async def hmget(self, key, fields):
+        h = self.hashes.get(key, {})
+        return [
+            str(v).encode() if (v := h.get(self._field(f))) is not None else None for f in fields
+        ]
+
+    async def hset(self, key, field, value):
+        h = self.hashes.setdefault(key, {})
+        f = self._field(field)
+        created = f not in h
+        h[f] = value
+        return 1 if created else 0
+
+    async def zrevrange(self, key, start, end, withscores=False):
+        ranked = sorted(
+            self.zsets.get(key, {}).items(), key=lambda kv: (kv[1], kv[0]), reverse=True
+        )
+        stop = None if end == -1 else end + 1
+        if withscores:
+            return [(m.encode(), s) for m, s in ranked[start:stop]]
+        return [m for m, _ in ranked[start:stop]]
+
+    async def zincrby(self, key, amount, member):
+        z = self.zsets.setdefault(key, {})
+        m = self._field(member)
+        z[m] = z.get(m, 0.0) + amount
+        return z[m]
+
+    async def zadd(self, key, mapping):
+        z = self.zsets.setdefault(key, {})
+        added = sum(1 for m in mapping if m not in z)
+        z.update({self._field(m): float(v) for m, v in mapping.items()})
+        return added
+
+    async def zunionstore(self, dest, keys):
+        merged: dict[str, float] = {}
+        for key in keys:
+            for m, v in self.zsets.get(key, {}).items():
+                merged[m] = merged.get(m, 0.0) + v
+        self.zsets.pop(dest, None)
+        if merged:
+            self.zsets[dest] = merged
+        return len(merged)
+
+    async def strlen(self, key):
+        bits = self.bits.get(key)
+        return max(bits) // 8 + 1 if bits else len(self.kv.get(key, ""))
+
+    async def bitcount(self, key):
+        return len(self.bits.get(key, ()))
+
     async def hgetall(self, key):
         h = self.hashes.get(key, {})
         return {k.encode(): str(v).encode() for k, v in h.items()}
@@ -101,6 +168,22 @@ class FakeRedis:
                 return 0
             self.hashes[dst] = self.hashes.pop(src)
             return 1
+        if "HINCRBY" in script:  # 조회 계정: Bloom dedup → (새 조회면) HINCRBY → pending
+            current, buffer, previous = keys
+            field, increment, _expire_at, *positions = argv
+            new = 1
+            if positions:
+                bits = {int(p) for p in positions}
+                seen = bits <= self.bits.get(current, set()) or bits <= self.bits.get(
+                    previous, set()
+                )
+                if seen:
+                    new = 0
+                else:
+                    self.bits.setdefault(current, set()).update(bits)
+            if new and increment == "1":
+                return [new, await self.hincrby(buffer, field, 1)]
+            return [new, self.hashes.get(buffer, {}).get(self._field(field), 0)]
         # CAS 해제: GET==ARGV[0] 일 때만 DEL
         k, expected = keys[0], argv[0]
         if self.kv.get(k) == expected:
@@ -109,6 +192,65 @@ class FakeRedis:
         return 0
 
 
+class _FakePipeline:
+    """큐에 쌓은 명령을 execute에서 한 번에 적용하는 파이프라인 흉내(결과는 명령 순서대로).
+    set 명령(sadd/smembers)과 expire는 여기서, 나머지는 FakeRedis의 같은 이름 메서드로 위임한다."""
+
+    _DELEGATED = ("get", "set", "delete", "hincrby", "zincrby", "zadd", "zunionstore", "zrevrange")
+
+    def __init__(self, redis: FakeRedis) -> None:
+        self._redis = redis
+        self._queued: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *a):
+        return False
+
+    def __getattr__(self, op):
+        if op not in self._DELEGATED:
+            raise AttributeError(op)
+
+        def _queue(*args, **kwargs):
+            self._queued.append((op, args, kwargs))
+            return self
+
+        return _queue
+
+    def sadd(self, key, *members):
+        self._queued.append(("sadd", (key, *members), {}))
+        return self
+
+    def smembers(self, key):
+        self._queued.append(("smembers", (key,), {}))
+        return self
+
+    def expire(self, key, seconds):
+        self._queued.append(("expire", (key, seconds), {}))
+        return self
+
+    async def execute(self):
+        queued, self._queued = self._queued, []
+        out: list[Any] = []
+        for op, args, kwargs in queued:
+            if op == "sadd":
+                key, *members = args
+                members_set = self._redis.sets.setdefault(key, set())
+                before = len(members_set)
+                members_set.update(members)
+                out.append(len(members_set) - before)
+            elif op == "smembers":
+                out.append({m.encode() for m in self._redis.sets.get(args[0], set())})
+            elif op == "expire":  # TTL은 흉내내지 않는다
+                key = args[0]
+                stores = (self._redis.sets, self._redis.zsets, self._redis.kv)
+                out.append(1 if any(key in store for store in stores) else 0)
+            else:
+                out.append(await getattr(self._redis, op)(*args, **kwargs))
+        return out
+
+
 class FakeBegin:
     async def __aenter__(self):
         return None
@@ -9,7 +9,7 @@ import inspect
 from app.common.enums import TargetType
 from app.domain.admin.service import AdminService
 from app.domain.comments.model import Comment, CommentsModel
-from app.domain.posts.model import Post
+from app.domain.posts.model import Post, PostStats
 from app.domain.posts.repository import PostsModel
 from app.domain.reports.model import Report
 from sqlalchemy import func, literal, select
@@ -29,12 +29,16 @@ def test_get_reported_posts_has_no_inmemory_pagination():
 
 def test_page_reported_targets_compiles_to_union_all_offset():
     # UNION ALL + 단일 ORDER BY + LIMIT/OFFSET, 그리고 union 위 count(*).
-    post_sel = select(
-        literal(TargetType.POST.value).label("target_type"),
-        Post.id.label("target_id"),
-        Post.report_count.label("rc"),
-        Post.created_at.label("ca"),
-    ).where(Post.deleted_at.is_(None), Post.report_count > 0, Post.user_id.isnot(None))
+    post_sel = (
+        select(
+            literal(TargetType.POST.value).label("target_type"),
+            Post.id.label("target_id"),
+            PostStats.report_count.label("rc"),
+            Post.created_at.label("ca"),
+        )
+        .join(PostStats, PostStats.post_id == Post.id)
+        .where(Post.deleted_at.is_(None), PostStats.report_count > 0, Post.user_id.isnot(None))
+    )
     comment_sel = select(
         literal(TargetType.COMMENT.value).label("target_type"),
         Comment.id.label("target_id"),
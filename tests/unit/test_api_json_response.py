@@ -0,0 +1,94 @@
+"""api_json_response(사전 직렬화 ApiResponse) 단위 테스트.
+
+같은 response_model을 단 두 라우트 — 기존 api_response(FastAPI 재검증·직렬화)와 api_json_response —
+가 바이트 단위로 같은 본문을 내고, OpenAPI 응답 스키마도 같은지, 청크·LRU base62 인코더가 자리별
+인코딩과 같은 공개 ID를 내는지 검증한다.
+"""
+
+import uuid
+from datetime import UTC, datetime
+
+import app.main as main
+import httpx
+import pytest
+from app.common import ApiCode, ApiResponse, CursorPage, api_json_response, api_response
+from app.domain.posts.schemas import PostResponse
+from fastapi import FastAPI, Request
+
+pytestmark = pytest.mark.asyncio
+
+
+def _page() -> CursorPage[PostResponse]:
+    items = [
+        PostResponse.model_validate(
+            {
+                "id": uuid.uuid4(),
+                "title": "산책 후기 🐶",
+                "content": 'c "q"',
+                "like_count": i,
+                "is_liked": i % 2 == 0,
+                "author": {"id": uuid.uuid4(), "nickname": "뭉치맘"},
+                "files": [{"id": uuid.uuid4(), "file_url": "https://f", "image_id": uuid.uuid4()}],
+                "hashtags": ["말티즈"],
+                "version": 2,
+                "created_at": datetime(2026, 1, 2, 3, 4, 5, 678000, tzinfo=UTC),
+            }
+        )
+        for i in range(3)
+    ]
+    return CursorPage(items=items, has_more=True)
+
+
+def _app(page: CursorPage[PostResponse]) -> FastAPI:
+    app = FastAPI()
+    model = ApiResponse[CursorPage[PostResponse]]
+
+    @app.get("/classic", response_model=model)
+    async def classic(request: Request):
+        return api_response(request, code=ApiCode.OK, data=page)
+
+    @app.get("/fast", response_model=model)
+    async def fast(request: Request):
+        return api_json_response(request, code=ApiCode.OK, data=page)
+
+    return app
+
+
+async def test_body_is_byte_identical_to_response_model_path():
+    app = _app(_page())
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://t") as c:
+        classic, fast = await c.get("/classic"), await c.get("/fast")
+
+    assert fast.status_code == classic.status_code == 200
+    assert fast.headers["content-type"] == classic.headers["content-type"]
+    assert fast.content == classic.content
+    assert fast.json()["data"]["items"][0]["isEdited"] is True
+
+
+async def test_openapi_response_schema_is_unchanged():
+    spec = _app(_page()).openapi()
+    schema = lambda path: spec["paths"][path]["get"]["responses"]["200"]  # noqa: E731
+    assert schema("/fast") == schema("/classic")
+
+    # 실제 앱의 채택 라우트도 데코레이터 response_model 스키마를 그대로 노출한다.
+    paths = main.app.openapi()["paths"]
+    ref = paths["/v1/posts"]["get"]["responses"]["200"]["content"]["application/json"]["schema"]
+    assert ref["$ref"].endswith("ApiResponse_CursorPage_PostResponse__")
+
+
+async def test_base62_matches_digit_by_digit_encoding_at_chunk_boundaries():
+    from app.core.ids import base62_to_uuid, uuid_to_base62
+
+    def reference(n: int) -> str:
+        digits = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+        out = ""
+        while n:
+            n, r = divmod(n, 62)
+            out = digits[r] + out
+        return out or "0"
+
+    edges = [0, 1, 61, 62, 62**8 - 1, 62**8, 62**16 - 1, 62**16, 2**128 - 1]
+    for n in edges + [uuid.uuid4().int for _ in range(200)]:
+        u = uuid.UUID(int=n)
+        assert uuid_to_base62(u) == reference(n)
+        assert base62_to_uuid(uuid_to_base62(u)) == u
@@ -0,0 +1,192 @@
+"""L1(프로세스 로컬) 캐시 계층 단위 테스트 — get_or_compute_json 앞단 LRU의 계약을 검증한다.
+
+L1 히트는 Redis를 건드리지 않고 l1_hit로 집계 · L2 히트가 L1을 채움 · 무효화는 로컬 evict +
+Redis DEL + broadcast 발행 · 다른 인스턴스 신호로 evict(자기 발행분은 스킵) · LRU 상한.
+"""
+
+import asyncio
+import json
+
+import pytest
+from app.core import metrics
+from app.core.config import settings
+from app.infra import cache as cache_mod
+from app.infra import pubsub as pubsub_mod
+from pydantic import TypeAdapter
+
+from tests.unit.fakes import FakeRedis
+
+_ADAPTER = TypeAdapter(list[int])
+
+
+def _count(result: str) -> float:
+    return metrics.CACHE_EVENTS.labels(cache="l1_test", result=result)._value.get()
+
+
+class _CountingRedis(FakeRedis):
+    def __init__(self, **kw) -> None:
+        super().__init__(**kw)
+        self.get_calls = 0
+
+    async def get(self, key):
+        self.get_calls += 1
+        return await super().get(key)
+
+
+def _call(redis, loader, *, key="cache:l1", l1_ttl=30.0):
+    return asyncio.run(
+        cache_mod.get_or_compute_json(
+            redis=redis,
+            key=key,
+            lock_key=f"{key}:lock",
+            ttl_seconds=60,
+            adapter=_ADAPTER,
+            loader=loader,
+            cache_name="l1_test",
+            l1_ttl_seconds=l1_ttl,
+        )
+    )
+
+
+async def _never() -> list[int]:
+    raise AssertionError("loader must not run")
+
+
+def test_l2_hit_fills_l1_and_next_call_skips_redis():
+    redis = _CountingRedis(preloaded={"cache:l1": "[1,2]"})
+    hit0, l1_hit0 = _count("hit"), _count("l1_hit")
+
+    assert _call(redis, _never) == [1, 2]
+    assert _call(redis, _never) == [1, 2]
+
+    assert redis.get_calls == 1  # 두 번째는 L1에서 — Redis 왕복 없음
+    assert _count("hit") - hit0 == 1
+    assert _count("l1_hit") - l1_hit0 == 1
+
+
+def test_loader_result_is_remembered_in_l1():
+    redis = _CountingRedis()
+    calls: list[int] = []
+
+    async def loader() -> list[int]:
+        calls.append(1)
+        return [9]
+
+    assert _call(redis, loader) == [9]
+    assert _call(redis, _never) == [9]
+    assert calls == [1]
+
+
+def test_l1_disabled_by_setting_or_zero_ttl(monkeypatch):
+    redis = _CountingRedis(preloaded={"cache:l1": "[1]"})
+    _call(redis, _never, l1_ttl=0)
+    _call(redis, _never, l1_ttl=0)
+    assert redis.get_calls == 2
+
+    monkeypatch.setattr(settings, "CACHE_L1_ENABLED", False)
+    _call(redis, _never)
+    _call(redis, _never)
+    assert redis.get_calls == 4
+
+
+def test_l1_expires_after_ttl(monkeypatch):
+    redis = _CountingRedis(preloaded={"cache:l1": "[1]"})
+    now = [1000.0]
+    monkeypatch.setattr(cache_mod.time, "monotonic", lambda: now[0])
+    _call(redis, _never, l1_ttl=5)
+    now[0] += 6
+    _call(redis, _never, l1_ttl=5)
+    assert redis.get_calls == 2  # 만료 후 Redis 재조회
+
+
+def test_l1_is_bounded_lru(monkeypatch):
+    monkeypatch.setattr(settings, "CACHE_L1_MAX_ENTRIES", 2)
+    redis = _CountingRedis(preloaded={"a": "[1]", "b": "[2]", "c": "[3]"})
+    _call(redis, _never, key="a")
+    _call(redis, _never, key="b")
+    _call(redis, _never, key="a")  # a 최근 사용 → b가 LRU
+    _call(redis, _never, key="c")  # b 축출
+    before = redis.get_calls
+    _call(redis, _never, key="a")
+    assert redis.get_calls == before  # a는 L1
+    _call(redis, _never, key="b")
+    assert redis.get_calls == before + 1  # b는 축출돼 Redis 재조회
+
+
+def test_invalidate_evicts_local_deletes_l2_and_broadcasts():
+    redis = _CountingRedis(preloaded={"cache:l1": "[1]"})
+    _call(redis, _never)
+
+    asyncio.run(cache_mod.invalidate_json(redis, "cache:l1"))
+
+    assert "cache:l1" not in redis.kv
+    [(channel, raw)] = redis.published
+    assert channel == cache_mod.CACHE_INVALIDATION_CHANNEL
+    env = json.loads(raw)
+    assert json.loads(env["payload"]) == ["cache:l1"]
+    assert env["origin"] == pubsub_mod._instance_id()
+
+    async def reloaded() -> list[int]:
+        return [2]
+
+    assert _call(redis, reloaded) == [2]  # L1도 비워져 재계산
+
+
+def test_invalidate_deletes_per_key_and_chunks_broadcast(monkeypatch):
+    class _DelRecordingRedis(FakeRedis):
+        def __init__(self, **kw) -> None:
+            super().__init__(**kw)
+            self.delete_calls: list[tuple[str, ...]] = []
+
+        async def delete(self, *keys):
+            self.delete_calls.append(keys)
+            return await super().delete(*keys)
+
+    monkeypatch.setattr(cache_mod, "_INVALIDATE_CHUNK", 2)
+    keys = [f"cache:k{i}" for i in range(5)]
+    redis = _DelRecordingRedis(preloaded=dict.fromkeys(keys, "[1]"))
+
+    asyncio.run(cache_mod.invalidate_json(redis, *keys))
+
+    # 다중 키 DEL은 Cluster에서 CROSSSLOT — 키마다 DEL, 신호는 청크 단위.
+    assert redis.delete_calls == [(k,) for k in keys]
+    assert not any(k in redis.kv for k in keys)
+    payloads = [json.loads(json.loads(raw)["payload"]) for _, raw in redis.published]
+    assert payloads == [keys[0:2], keys[2:4], keys[4:]]
+
+
+def test_invalidate_survives_redis_errors():
+    redis = FakeRedis(fail_publish=True, fail_delete_substr="cache:")
+    asyncio.run(cache_mod.invalidate_json(redis, "cache:l1"))  # 예외 없이 종료(fail-open)
+
+
+@pytest.mark.asyncio
+async def test_broadcast_from_other_instance_evicts_l1():
+    redis = _CountingRedis(preloaded={"cache:l1": "[1]"})
+    await cache_mod.get_or_compute_json(
+        redis=redis,
+        key="cache:l1",
+        lock_key="cache:l1:lock",
+        ttl_seconds=60,
+        adapter=_ADAPTER,
+        loader=_never,
+        cache_name="l1_test",
+        l1_ttl_seconds=30,
+    )
+    handlers: dict[str, pubsub_mod.BroadcastHandler] = {
+        cache_mod.CACHE_INVALIDATION_CHANNEL: cache_mod.handle_invalidation
+    }
+
+    def _msg(origin: str) -> dict:
+        return {
+            "type": "message",
+            "channel": cache_mod.CACHE_INVALIDATION_CHANNEL,
+            "data": json.dumps({"origin": origin, "payload": json.dumps(["cache:l1"])}),
+        }
+
+    # 자기 발행분은 스킵 — L1 유지
+    await pubsub_mod._dispatch_message(_msg(pubsub_mod._instance_id()), {}, handlers)
+    assert cache_mod._l1.get("cache:l1") == [1]
+    # 다른 인스턴스 신호 → evict
+    await pubsub_mod._dispatch_message(_msg("other-instance"), {}, handlers)
+    assert cache_mod._l1.get("cache:l1") is cache_mod._MISSING
@@ -0,0 +1,135 @@
+"""stale-while-revalidate + XFetch 조기 갱신(ADR 0004) 단위 테스트.
+
+핵심 불변식: soft TTL이 지난 값도 즉시 서빙되고(읽기는 락을 기다리지 않는다) 갱신은 락을 잡은
+한 곳에서만 돈다 · 만료가 멀면 갱신하지 않고, 가까우면 확률적으로 일찍 갱신 · 헤더 없는 구포맷
+값은 fresh로 읽는다.
+"""
+
+import asyncio
+import time
+
+import pytest
+from app.core import metrics
+from app.infra import cache as cache_mod
+from pydantic import TypeAdapter
+
+from tests.unit.fakes import FakeRedis
+
+pytestmark = pytest.mark.asyncio
+
+_ADAPTER = TypeAdapter(list[int])
+
+
+def _count(result: str) -> float:
+    return metrics.CACHE_EVENTS.labels(cache="swr_test", result=result)._value.get()
+
+
+class _TtlRedis(FakeRedis):
+    def __init__(self, **kw) -> None:
+        super().__init__(**kw)
+        self.ttls: dict[str, int] = {}
+
+    async def setex(self, key, seconds, value):
+        self.ttls[key] = seconds
+        return await super().setex(key, seconds, value)
+
+
+def _entry(values: list[int], *, soft_in: float, delta: float = 0.05) -> str:
+    return f"swr1|{time.time() + soft_in:.3f}|{delta}|{_ADAPTER.dump_json(values).decode()}"
+
+
+async def _call(redis, loader, *, refresher=None):
+    return await cache_mod.get_or_compute_json(
+        redis=redis,
+        key="cache:swr",
+        lock_key="cache:swr:lock",
+        ttl_seconds=60,
+        adapter=_ADAPTER,
+        loader=loader,
+        cache_name="swr_test",
+        stale_ttl_seconds=30,
+        refresher=refresher,
+    )
+
+
+async def _never() -> list[int]:
+    raise AssertionError("must not run")
+
+
+async def test_miss_writes_swr_header_with_extended_ttl():
+    redis = _TtlRedis()
+
+    async def loader() -> list[int]:
+        return [1]
+
+    assert await _call(redis, loader) == [1]
+    assert redis.ttls["cache:swr"] == 90  # soft 60 + stale 30
+    stored = redis.kv["cache:swr"]
+    assert isinstance(stored, str) and stored.startswith("swr1|")
+    # 다시 읽으면 헤더를 벗기고 디코딩한다
+    assert await _call(redis, _never) == [1]
+
+
+async def test_fresh_entry_far_from_expiry_is_not_refreshed(monkeypatch):
+    redis = FakeRedis(preloaded={"cache:swr": _entry([1], soft_in=60)})
+    monkeypatch.setattr(cache_mod.random, "random", lambda: 0.5)
+    assert await _call(redis, _never, refresher=_never) == [1]
+    assert not cache_mod._refresh_tasks
+
+
+async def test_stale_entry_served_immediately_and_refreshed_in_background():
+    redis = FakeRedis(preloaded={"cache:swr": _entry([1], soft_in=-1)})
+    gate = asyncio.Event()
+
+    async def refresher() -> list[int]:
+        await gate.wait()
+        return [2]
+
+    stale0, refresh0 = _count("stale"), _count("refresh")
+    assert await _call(redis, _never, refresher=refresher) == [1]  # 갱신을 기다리지 않는다
+    assert _count("stale") - stale0 == 1
+
+    gate.set()
+    await cache_mod.drain_refresh_tasks()
+    assert _count("refresh") - refresh0 == 1
+    assert await _call(redis, _never) == [2]  # 갱신된 값
+    assert "cache:swr:lock" not in redis.kv  # 갱신 락 해제
+
+
+async def test_stale_entry_with_foreign_lock_returns_without_waiting():
+    redis = FakeRedis(
+        preloaded={"cache:swr": _entry([1], soft_in=-1), "cache:swr:lock": "other-worker"}
+    )
+    started = time.monotonic()
+    assert await _call(redis, _never) == [1]  # 인라인 갱신 경로도 락 경합이면 stale 즉시 반환
+    assert time.monotonic() - started < cache_mod._WAIT_INTERVAL_SECONDS
+    assert redis.kv["cache:swr:lock"] == "other-worker"
+
+
+async def test_inline_refresh_without_refresher_returns_fresh_value():
+    redis = FakeRedis(preloaded={"cache:swr": _entry([1], soft_in=-1)})
+
+    async def loader() -> list[int]:
+        return [3]
+
+    assert await _call(redis, loader) == [3]
+
+
+async def test_xfetch_refreshes_early_near_expiry(monkeypatch):
+    # soft 만료 1초 전 + 재계산 0.5s: U가 작으면(-ln U 큼) 조기 갱신이 뽑힌다.
+    redis = FakeRedis(preloaded={"cache:swr": _entry([1], soft_in=1, delta=0.5)})
+    monkeypatch.setattr(cache_mod.random, "random", lambda: 0.99)
+
+    async def loader() -> list[int]:
+        return [4]
+
+    hit0 = _count("hit")
+    assert await _call(redis, loader) == [4]
+    assert _count("hit") - hit0 == 1  # 아직 fresh 값이었으므로 stale이 아니라 hit로 집계
+
+
+async def test_legacy_value_without_header_is_fresh(monkeypatch):
+    redis = FakeRedis(preloaded={"cache:swr": "[5]"})
+    monkeypatch.setattr(cache_mod.random, "random", lambda: 0.999999)
+    assert await _call(redis, _never, refresher=_never) == [5]
+    assert not cache_mod._refresh_tasks
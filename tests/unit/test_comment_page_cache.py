@@ -0,0 +1,211 @@
+"""인기글 댓글 첫 페이지 캐시(ADR 0027) 단위 테스트.
+
+트렌딩 상위 글만 (글, 정렬)별 차단 무관 루트 풀을 한 번 적재해 앞 페이지를 잘라내고, is_liked·차단
+필터는 요청마다 복사본에 얹으며, 풀로 확정할 수 없는 페이지(차단 작성자 대댓글·커서가 풀 밖)는 DB로
+폴백하는지, 작성자 인덱스로 프로필 변경이 풀을 끊는지 검증한다.
+"""
+
+import uuid
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+import pytest
+from app.common.exceptions import PostNotFoundException
+from app.domain.comments import page_cache as pc
+from app.domain.comments import service as cs
+from app.domain.comments.model import CommentLikesModel
+from app.domain.posts.trending_rank import trending_zset_key
+from app.domain.users.model import UsersModel
+
+from tests.unit.fakes import FakeDB, FakeRedis, as_session
+
+pytestmark = pytest.mark.asyncio
+
+_T0 = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _author(author_id: uuid.UUID):
+    return SimpleNamespace(
+        id=author_id,
+        nickname="n",
+        status="ACTIVE",
+        profile_image_id=None,
+        profile_image_url=None,
+        representative_dog=None,
+    )
+
+
+def _comment(post_id, author_id, *, parent_id=None):
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        parent_id=parent_id,
+        content="c",
+        author=_author(author_id),
+        created_at=_T0,
+        updated_at=_T0,
+        post_id=post_id,
+        like_count=0,
+        reply_count=0,
+        deleted_at=None,
+    )
+
+
+def _thread(post_id, n_roots, author_id, *, reply_author_id=None):
+    # 루트는 latest(id DESC) keyset 순서로, 첫 루트에만 대댓글 하나.
+    roots = sorted(
+        (_comment(post_id, author_id) for _ in range(n_roots)), key=lambda c: c.id, reverse=True
+    )
+    reply = _comment(post_id, reply_author_id or author_id, parent_id=roots[0].id)
+    return roots, [reply]
+
+
+def _patch_db(monkeypatch, roots, replies, *, post_author_id=None, blocked=(), liked=()):
+    calls: list[dict] = []
+
+    async def _visible(cls, post_id, *, db, blocked_ids=()):
+        return post_author_id not in blocked_ids
+
+    async def _post_author(cls, post_id, db):
+        return post_author_id
+
+    async def _roots(cls, post_id, size, *, db, cursor=None, sort="latest", blocked_ids=()):
+        calls.append({"size": size, "cursor": cursor, "blocked_ids": blocked_ids})
+        rows = [r for r in roots if cursor is None or r.id < cursor]
+        rows = [r for r in rows if r.author.id not in blocked_ids]
+        return rows[: size + 1]
+
+    async def _replies(cls, root_ids, *, db, per_root, sort="latest", blocked_ids=()):
+        return [
+            rp for rp in replies if rp.parent_id in root_ids and rp.author.id not in blocked_ids
+        ]
+
+    async def _blocked(cls, blocker_id, *, db):
+        return list(blocked)
+
+    async def _liked(cls, user_id, comment_ids, db):
+        return {cid for cid in comment_ids if cid in liked}
+
+    async def _recent(cls, user_id, limit, *, db):
+        return [(cid, _T0) for cid in liked][:limit]
+
+    monkeypatch.setattr(cs.PostsModel, "post_is_visible", classmethod(_visible))
+    monkeypatch.setattr(cs.PostsModel, "get_post_author_id", classmethod(_post_author))
+    monkeypatch.setattr(cs.CommentsModel, "get_root_comments", classmethod(_roots))
+    monkeypatch.setattr(cs.CommentsModel, "get_replies_for_roots", classmethod(_replies))
+    monkeypatch.setattr(UsersModel, "get_blocked_user_ids", classmethod(_blocked))
+    monkeypatch.setattr(CommentLikesModel, "get_liked_comment_ids_for_user", classmethod(_liked))
+    monkeypatch.setattr(CommentLikesModel, "get_recent_likes", classmethod(_recent))
+    return calls
+
+
+def _hot_redis(*post_ids) -> FakeRedis:
+    r = FakeRedis()
+    r.zsets[trending_zset_key(None)] = {str(p): float(i + 1) for i, p in enumerate(post_ids)}
+    return r
+
+
+async def _page(r, post_id, size=10, *, user_id=None, cursor=None):
+    return await cs.CommentService.get_comments(
+        post_id, size, as_session(FakeDB()), cursor=cursor, current_user_id=user_id, redis=r
+    )
+
+
+async def test_cold_post_bypasses_page_cache(monkeypatch):
+    post_id = uuid.uuid4()
+    roots, replies = _thread(post_id, 5, uuid.uuid4())
+    calls = _patch_db(monkeypatch, roots, replies)
+    r = _hot_redis(uuid.uuid4())  # 다른 글만 트렌딩
+
+    await _page(r, post_id)
+    await _page(r, post_id)
+
+    assert [c["size"] for c in calls] == [10, 10]
+    assert pc.comment_page_cache_key(post_id, "latest") not in r.kv
+
+
+async def test_hot_post_pages_served_from_single_pool_load(monkeypatch):
+    post_id = uuid.uuid4()
+    roots, replies = _thread(post_id, pc.COMMENT_PAGE_POOL_SIZE + 5, uuid.uuid4())
+    calls = _patch_db(monkeypatch, roots, replies)
+    r = _hot_redis(post_id)
+
+    first, more1 = await _page(r, post_id)
+    second, more2 = await _page(r, post_id, cursor=first[-1].id)
+
+    assert [c.id for c in first] == [c.id for c in roots[:10]]
+    assert [c.id for c in second] == [c.id for c in roots[10:20]]
+    assert first[0].replies[0].id == replies[0].id
+    assert more1 and more2
+    assert calls == [{"size": pc.COMMENT_PAGE_POOL_SIZE, "cursor": None, "blocked_ids": ()}]
+
+
+async def test_liked_overlay_does_not_mutate_shared_pool(monkeypatch):
+    post_id = uuid.uuid4()
+    roots, replies = _thread(post_id, 3, uuid.uuid4())
+    _patch_db(monkeypatch, roots, replies, liked={replies[0].id})
+    r = _hot_redis(post_id)
+
+    mine, _ = await _page(r, post_id, user_id=uuid.uuid4())
+    anon, _ = await _page(r, post_id)
+
+    assert mine[0].replies[0].is_liked is True
+    assert anon[0].replies[0].is_liked is False
+
+
+async def test_blocked_root_filtered_but_blocked_reply_falls_back_to_db(monkeypatch):
+    post_id = uuid.uuid4()
+    blocked_author = uuid.uuid4()
+    roots, replies = _thread(post_id, 3, uuid.uuid4(), reply_author_id=blocked_author)
+    roots[1].author = _author(blocked_author)
+    calls = _patch_db(monkeypatch, roots, replies, blocked={blocked_author})
+    r = _hot_redis(post_id)
+
+    page, _ = await _page(r, post_id, user_id=uuid.uuid4())
+
+    # 풀 적재(차단 무관) 뒤, 페이지에 차단 작성자 대댓글이 있어 차단 집합을 건 DB 조회로 폴백.
+    assert [c["blocked_ids"] for c in calls] == [(), frozenset({blocked_author})]
+    assert [c.id for c in page] == [roots[0].id, roots[2].id]
+    assert page[0].replies == []
+
+
+async def test_blocked_post_author_is_not_found_from_pool(monkeypatch):
+    post_id, post_author = uuid.uuid4(), uuid.uuid4()
+    roots, replies = _thread(post_id, 3, uuid.uuid4())
+    _patch_db(monkeypatch, roots, replies, post_author_id=post_author, blocked={post_author})
+    r = _hot_redis(post_id)
+    await _page(r, post_id)  # 풀 적재(비로그인)
+
+    with pytest.raises(PostNotFoundException):
+        await _page(r, post_id, user_id=uuid.uuid4())
+
+
+async def test_author_profile_change_invalidates_indexed_pools(monkeypatch):
+    post_id = uuid.uuid4()
+    author_id = uuid.uuid4()
+    roots, replies = _thread(post_id, 3, author_id)
+    _patch_db(monkeypatch, roots, replies)
+    r = _hot_redis(post_id)
+    await _page(r, post_id)
+    key = pc.comment_page_cache_key(post_id, "latest")
+    assert key in r.kv
+
+    await pc.invalidate_author_comment_pages(r, uuid.uuid4())  # 풀에 없는 작성자
+    assert key in r.kv
+
+    await pc.invalidate_author_comment_pages(r, author_id)
+    assert key not in r.kv
+    assert pc._author_index_key(author_id) not in r.sets
+
+
+async def test_hot_set_is_memoized_and_zero_disables(monkeypatch):
+    post_id = uuid.uuid4()
+    r = _hot_redis(post_id)
+
+    assert await pc.is_hot_post(r, post_id) is True
+    r.zsets.clear()
+    assert (
+        await pc.is_hot_post(r, post_id) is True
+    )  # 프로세스 memo 안에서는 ZSET을 다시 읽지 않는다
+
+    monkeypatch.setattr(pc.settings, "COMMENT_PAGE_CACHE_HOT_POSTS", 0)
+    assert await pc.is_hot_post(r, post_id) is False
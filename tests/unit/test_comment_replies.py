@@ -0,0 +1,97 @@
+"""대댓글 미리보기·더보기와 reply_count 비정규화(ADR 0026) 단위 테스트.
+
+댓글 페이지의 대댓글 로드가 루트별 LIMIT(LATERAL)로 묶이는지, 삭제 루트 판정이 차단 집합이
+없을 때 reply_count를 쓰는지, 상태 변경 문장이 부모 reply_count를 같은 문장에서 맞추는지 검증한다.
+"""
+
+import uuid
+
+import pytest
+from app.domain.comments.model import CommentsModel
+from sqlalchemy.dialects import postgresql
+
+from tests.unit.fakes import FakeDB, as_session
+
+pytestmark = pytest.mark.asyncio
+
+
+class _Result:
+    def unique(self):
+        return self
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return []
+
+    def scalar_one_or_none(self):
+        return uuid.uuid4()
+
+
+class _SqlDB(FakeDB):
+    def __init__(self) -> None:
+        self.sql: list[str] = []
+        self.params: list[dict] = []
+
+    async def execute(self, stmt):
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        self.sql.append(str(compiled))
+        self.params.append(compiled.params)
+        return _Result()
+
+
+async def test_preview_is_one_lateral_query_bounded_per_root():
+    db = _SqlDB()
+    roots = [uuid.uuid4() for _ in range(3)]
+    await CommentsModel.get_replies_for_roots(roots, db=as_session(db), per_root=3, sort="oldest")
+    (sql,) = db.sql
+    assert "JOIN LATERAL" in sql and "ORDER BY comments_1.id ASC" in sql
+    # 루트마다 per_root+1건(더보기 판정용)까지만 읽는다.
+    assert 4 in db.params[0].values()
+
+
+async def test_replies_page_keyset_follows_sort():
+    db = _SqlDB()
+    cursor = uuid.uuid4()
+    session = as_session(db)
+    await CommentsModel.get_replies_page(uuid.uuid4(), 20, db=session, cursor=cursor)
+    await CommentsModel.get_replies_page(uuid.uuid4(), 20, db=session, cursor=cursor, sort="oldest")
+    latest, oldest = db.sql
+    assert "comments.id < " in latest and "ORDER BY comments.id DESC" in latest
+    assert "comments.id > " in oldest and "ORDER BY comments.id ASC" in oldest
+
+
+async def test_deleted_root_placeholder_uses_reply_count_unless_blocks():
+    db = _SqlDB()
+    session = as_session(db)
+    await CommentsModel.get_root_comments(uuid.uuid4(), 10, db=session)
+    await CommentsModel.get_root_comments(uuid.uuid4(), 10, db=session, blocked_ids={uuid.uuid4()})
+    plain, blocked = db.sql
+    assert "comments.reply_count > " in plain and "EXISTS" not in plain
+    assert "EXISTS" in blocked
+
+
+@pytest.mark.parametrize(
+    "call",
+    [
+        lambda cid, db: CommentsModel.delete_comment(uuid.uuid4(), cid, db=db),
+        lambda cid, db: CommentsModel.set_blinded(cid, db=db),
+        lambda cid, db: CommentsModel.unblind_comment(cid, db=db),
+        lambda cid, db: CommentsModel.reset_reports(cid, db=db),
+    ],
+)
+async def test_state_changes_adjust_parent_reply_count_in_same_statement(call):
+    db = _SqlDB()
+    # 삭제는 bool, 모더레이션 경로는 댓글 페이지 캐시 무효화용 post_id를 돌려준다 — 둘 다 truthy.
+    assert await call(uuid.uuid4(), as_session(db))
+    (sql,) = db.sql
+    assert sql.startswith("WITH before AS")
+    assert "UPDATE comments SET reply_count=greatest(" in sql
+    assert "changed.is_listed IS DISTINCT FROM changed.was_listed" in sql
+
+
+async def test_reconcile_recounts_reply_count():
+    db = _SqlDB()
+    await CommentsModel.reconcile_counters([(uuid.uuid4(), 0)], db=as_session(db))
+    assert "reply_count=(SELECT count(*)" in db.sql[-1]
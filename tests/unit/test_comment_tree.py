@@ -24,6 +24,7 @@ def _row(*, parent_id=None, like_count=0, deleted=False, edited=False, content="
         updated_at=_T0 + timedelta(minutes=5) if edited else _T0,
         post_id=uuid.uuid4(),
         like_count=like_count,
+        reply_count=0,
         deleted_at=_T0 if deleted else None,
     )
 
@@ -52,6 +53,17 @@ def test_root_order_preserved_replies_sorted_by_mode():
     assert [rp.id for rp in oldest[0].replies] == ids_asc
 
 
+def test_replies_trimmed_to_preview_with_more_flag():
+    # get_replies_for_roots는 루트마다 per_root+1건까지 싣는다 — 넘친 루트만 잘리고 표시된다.
+    r1, r2 = _row(), _row()
+    many = [_row(parent_id=r1.id) for _ in range(3)]
+    few = [_row(parent_id=r2.id) for _ in range(2)]
+    tree = _build_comment_tree([r1, r2], many + few, liked_ids=set(), sort="oldest", per_root=2)
+    assert [rp.id for rp in tree[0].replies] == sorted(rp.id for rp in many)[:2]
+    assert tree[0].has_more_replies is True
+    assert len(tree[1].replies) == 2 and tree[1].has_more_replies is False
+
+
 def test_deleted_root_renders_placeholder():
     r = _row(deleted=True, content="원문")
     child = _row(parent_id=r.id, content="대댓글은 유지")
@@ -0,0 +1,399 @@
+"""좋아요·댓글 수 write-behind(ADR 0023) 단위 테스트.
+
+FakeRedis + 모델 메서드 몽키패치로 검증한다: 커밋 후 delta 적재와 응답 보정 · Redis 오류 시 DB 직접
+반영 · flush가 종류별 delta를 모아 한 번에 반영하고 상세 스냅샷을 끊음 · DB 오류 시 재병합 ·
+reconcile 커서 이어 돌기·due 마커·배치별 flush 락·pending 보정 · 댓글 페이지 pending 보정.
+"""
+
+import uuid
+
+import pytest
+from app.core.config import settings
+from app.domain.comments import service as comment_service
+from app.domain.comments.model import CommentsModel
+from app.domain.comments.page_cache import comment_page_cache_key
+from app.domain.posts import counter_buffer as cb
+from app.domain.posts.post_cache import post_detail_cache_key
+from app.domain.posts.repository import PostsModel
+
+from tests.unit.fakes import FakeDB, FakeRedis, as_session
+
+pytestmark = pytest.mark.asyncio
+
+
+class _FakeConn:
+    async def __aenter__(self):
+        return FakeDB()
+
+    async def __aexit__(self, *a):
+        return False
+
+
+@pytest.fixture(autouse=True)
+def _buffering(monkeypatch):
+    monkeypatch.setattr(settings, "COUNTER_BUFFER_FLUSH_INTERVAL_SECONDS", 10)
+    monkeypatch.setattr(settings, "COUNTER_RECONCILE_INTERVAL_SECONDS", 0)
+    monkeypatch.setattr("app.db.session.get_connection", lambda: _FakeConn())
+
+
+def _patch_bulk(
+    monkeypatch,
+    posts: list,
+    comments: list,
+    *,
+    fail: bool = False,
+    comment_posts: dict[uuid.UUID, uuid.UUID] | None = None,
+) -> None:
+    owners = comment_posts or {}
+
+    async def _posts(cls, deltas, db):
+        if fail:
+            raise RuntimeError("db down")
+        posts.extend(deltas)
+        return len(deltas)
+
+    async def _comments(cls, deltas, db):
+        comments.extend(deltas)
+        return [owners.get(cid, uuid.uuid4()) for cid, _ in deltas]
+
+    monkeypatch.setattr(PostsModel, "apply_counter_deltas_bulk", classmethod(_posts))
+    monkeypatch.setattr(CommentsModel, "apply_like_count_deltas_bulk", classmethod(_comments))
+
+
+async def test_settle_buffers_delta_and_returns_overlaid_count():
+    r = FakeRedis()
+    pid = uuid.uuid4()
+    db = as_session(FakeDB())
+
+    assert await cb.settle_counter(r, "post_like", pid, base=5, delta=1, db=db) == 6
+    assert await cb.settle_counter(r, "post_like", pid, base=5, delta=1, db=db) == 7
+    assert await cb.settle_counter(r, "post_like", pid, base=5, delta=-1, db=db) == 6
+    # delta=0(중복 좋아요)은 pending만 읽는다.
+    assert await cb.settle_counter(r, "post_like", pid, base=5, delta=0, db=db) == 6
+    assert await cb.get_post_counter_pending(r, pid) == (1, 0)
+    # 음수로 내려가지 않는다(아직 flush 안 된 취소가 스냅샷보다 많을 때).
+    assert await cb.settle_counter(r, "post_comment", pid, base=0, delta=-1, db=db) == 0
+
+
+async def test_settle_falls_back_to_db_when_redis_fails(monkeypatch):
+    class _Down(FakeRedis):
+        async def hincrby(self, key, field, n):
+            raise ConnectionError("redis down")
+
+    applied: list[uuid.UUID] = []
+
+    async def _increment(cls, comment_id, db):
+        applied.append(comment_id)
+        return 3
+
+    monkeypatch.setattr(CommentsModel, "increment_like_count", classmethod(_increment))
+    cid = uuid.uuid4()
+    got = await cb.settle_counter(
+        _Down(), "comment_like", cid, base=2, delta=1, db=as_session(FakeDB())
+    )
+    assert got == 3 and applied == [cid]
+
+
+async def test_buffering_off_without_redis_or_interval(monkeypatch):
+    assert not cb.counter_buffering(None)
+    monkeypatch.setattr(settings, "COUNTER_BUFFER_FLUSH_INTERVAL_SECONDS", 0)
+    assert not cb.counter_buffering(FakeRedis())
+    assert await cb.get_counter_pending(FakeRedis(), "comment_like", [uuid.uuid4()]) == [0]
+
+
+async def test_flush_writes_all_kinds_once_and_invalidates_detail(monkeypatch):
+    r = FakeRedis()
+    db = as_session(FakeDB())
+    p1, p2, c1 = uuid.UUID(int=2), uuid.UUID(int=1), uuid.uuid4()
+    for _ in range(3):
+        await cb.settle_counter(r, "post_like", p1, base=0, delta=1, db=db)
+    await cb.settle_counter(r, "post_comment", p1, base=0, delta=-1, db=db)
+    await cb.settle_counter(r, "post_comment", p2, base=0, delta=1, db=db)
+    await cb.settle_counter(r, "comment_like", c1, base=0, delta=1, db=db)
+    await cb.settle_counter(r, "comment_like", c1, base=0, delta=-1, db=db)  # 상쇄 — 쓰지 않음
+    r.kv[post_detail_cache_key(p1)] = b"{}"
+
+    posts: list = []
+    comments: list = []
+    _patch_bulk(monkeypatch, posts, comments)
+    flushed_before = cb.COUNTER_BUFFER_FLUSHED_DELTAS.labels(counter="post_like")._value.get()
+    await cb.flush_counters_to_db(r)
+
+    assert posts == [(p2, 0, 1), (p1, 3, -1)]  # id 오름차순, 글 하나에 두 카운터를 한 행으로
+    assert comments == []
+    assert not r.hashes.get(cb.COUNTER_BUFFER_KEY)
+    assert post_detail_cache_key(p1) not in r.kv
+    assert cb.COUNTER_FLUSH_LOCK_KEY not in r.kv
+    flushed = cb.COUNTER_BUFFER_FLUSHED_DELTAS.labels(counter="post_like")._value.get()
+    assert flushed - flushed_before == 3
+
+
+async def test_flush_invalidates_comment_pages_of_flushed_comment_likes(monkeypatch):
+    # 풀의 like_count는 적재 시 DB 값 — flush가 pending을 비운 뒤에도 남아 있으면 수가 뒤로 간다.
+    r = FakeRedis()
+    pid, cid = uuid.uuid4(), uuid.uuid4()
+    await cb.settle_counter(r, "comment_like", cid, base=0, delta=1, db=as_session(FakeDB()))
+    pool_key = comment_page_cache_key(pid, "latest")
+    r.kv[pool_key] = "{}"
+    comments: list = []
+    _patch_bulk(monkeypatch, [], comments, comment_posts={cid: pid})
+
+    await cb.flush_counters_to_db(r)
+
+    assert comments == [(cid, 1)]
+    assert pool_key not in r.kv
+
+
+async def test_flush_invalidation_never_sends_multi_key_del(monkeypatch):
+    # 상세·댓글 풀 키는 슬롯이 제각각 — 다중 키 DEL은 Redis Cluster에서 CROSSSLOT.
+    class _DelRecordingRedis(FakeRedis):
+        def __init__(self) -> None:
+            super().__init__()
+            self.delete_calls: list[tuple[str, ...]] = []
+
+        async def delete(self, *keys):
+            self.delete_calls.append(keys)
+            return await super().delete(*keys)
+
+    r = _DelRecordingRedis()
+    db = as_session(FakeDB())
+    pids = [uuid.uuid4() for _ in range(3)]
+    cids = [uuid.uuid4() for _ in range(3)]
+    for pid, cid in zip(pids, cids, strict=True):
+        await cb.settle_counter(r, "post_like", pid, base=0, delta=1, db=db)
+        await cb.settle_counter(r, "comment_like", cid, base=0, delta=1, db=db)
+    _patch_bulk(monkeypatch, [], [], comment_posts=dict(zip(cids, pids, strict=True)))
+
+    await cb.flush_counters_to_db(r)
+
+    assert r.delete_calls
+    assert all(len(keys) == 1 for keys in r.delete_calls)
+    deleted = {keys[0] for keys in r.delete_calls}
+    assert {post_detail_cache_key(p) for p in pids} <= deleted
+    assert {comment_page_cache_key(p, "latest") for p in pids} <= deleted
+
+
+async def test_flush_noop_when_lock_held(monkeypatch):
+    r = FakeRedis()
+    pid = uuid.uuid4()
+    await cb.settle_counter(r, "post_like", pid, base=0, delta=1, db=as_session(FakeDB()))
+    r.kv[cb.COUNTER_FLUSH_LOCK_KEY] = "other-worker"
+    posts: list = []
+    _patch_bulk(monkeypatch, posts, [])
+
+    await cb.flush_counters_to_db(r)
+
+    assert posts == []
+    assert await cb.get_post_counter_pending(r, pid) == (1, 0)
+    assert r.kv[cb.COUNTER_FLUSH_LOCK_KEY] == "other-worker"
+
+
+async def test_flush_merges_back_on_db_error(monkeypatch):
+    r = FakeRedis()
+    pid = uuid.uuid4()
+    for _ in range(2):
+        await cb.settle_counter(r, "post_like", pid, base=0, delta=1, db=as_session(FakeDB()))
+    _patch_bulk(monkeypatch, [], [], fail=True)
+
+    with pytest.raises(RuntimeError):
+        await cb.flush_counters_to_db(r)
+
+    assert await cb.get_post_counter_pending(r, pid) == (2, 0)  # 재병합됨
+    assert cb.COUNTER_FLUSH_LOCK_KEY not in r.kv
+
+
+def _patch_reconcile(monkeypatch, post_ids, comment_ids, *, post_counts=None, fixed=None):
+    """id 목록·원장 집계·UPDATE를 가짜로. 본 배치(after)와 UPDATE 목표값을 기록한다."""
+    seen: list[tuple[str, uuid.UUID | None]] = []
+    fixed = {} if fixed is None else fixed
+
+    def _ids(table, pool):
+        async def _f(cls, after, limit, *, db):
+            seen.append((table, after))
+            return [t for t in pool if after is None or t > after][:limit]
+
+        return _f
+
+    async def _post_counts(cls, ids, *, db):
+        if post_counts is not None:
+            return await post_counts(ids)
+        return [(t, 0, 0) for t in ids]
+
+    async def _comment_counts(cls, ids, *, db):
+        return [(t, 0) for t in ids]
+
+    def _fix(table):
+        async def _f(cls, targets, *, db):
+            fixed.setdefault(table, []).extend(targets)
+            return len(targets)
+
+        return _f
+
+    monkeypatch.setattr(PostsModel, "counter_reconcile_ids", classmethod(_ids("posts", post_ids)))
+    monkeypatch.setattr(
+        CommentsModel, "counter_reconcile_ids", classmethod(_ids("comments", comment_ids))
+    )
+    monkeypatch.setattr(PostsModel, "counter_ledger_counts", classmethod(_post_counts))
+    monkeypatch.setattr(CommentsModel, "counter_ledger_counts", classmethod(_comment_counts))
+    monkeypatch.setattr(PostsModel, "reconcile_counters", classmethod(_fix("posts")))
+    monkeypatch.setattr(CommentsModel, "reconcile_counters", classmethod(_fix("comments")))
+    return seen
+
+
+async def test_reconcile_resumes_from_cursor_and_waits_for_next_interval(monkeypatch):
+    monkeypatch.setattr(settings, "COUNTER_RECONCILE_INTERVAL_SECONDS", 3600)
+    monkeypatch.setattr(settings, "COUNTER_RECONCILE_MAX_BATCHES", 2)
+    monkeypatch.setattr(settings, "COUNTER_RECONCILE_BATCH_SIZE", 1)
+    post_ids = [uuid.UUID(int=i) for i in range(1, 4)]
+    seen = _patch_reconcile(monkeypatch, post_ids, [])
+    r = FakeRedis()
+    fixed_before = cb.COUNTER_RECONCILED_ROWS.labels(table="posts")._value.get()
+
+    await cb.run_counter_reconcile(r)  # 첫 조각: posts 2배치, comments 완료
+    assert seen == [("posts", None), ("posts", post_ids[0]), ("comments", None)]
+    assert r.kv[cb._reconcile_cursor_key("posts")] == str(post_ids[1])
+    assert cb._reconcile_cursor_key("comments") not in r.kv
+    assert cb.COUNTER_RECONCILE_LOCK_KEY not in r.kv
+    assert cb.COUNTER_FLUSH_LOCK_KEY not in r.kv  # 배치마다 잡았다 놓는다
+
+    seen.clear()
+    await cb.run_counter_reconcile(r)  # due 마커가 살아 있는 동안은 돌지 않는다
+    assert seen == []
+
+    r.kv.pop(cb._RECONCILE_DUE_KEY)  # 다음 주기
+    await cb.run_counter_reconcile(r)  # 커서에서 이어 돌아 끝낸다
+    assert seen[:2] == [("posts", post_ids[1]), ("posts", post_ids[2])]
+    assert cb._reconcile_cursor_key("posts") not in r.kv
+    assert cb.COUNTER_RECONCILED_ROWS.labels(table="posts")._value.get() - fixed_before == 3
+
+
+async def test_flush_no_longer_runs_reconcile(monkeypatch):
+    monkeypatch.setattr(settings, "COUNTER_RECONCILE_INTERVAL_SECONDS", 3600)
+    seen = _patch_reconcile(monkeypatch, [uuid.uuid4()], [])
+    _patch_bulk(monkeypatch, [], [])
+
+    await cb.flush_counters_to_db(FakeRedis())
+
+    assert seen == []
+
+
+async def test_reconcile_stops_and_keeps_cursor_when_flush_lock_is_busy(monkeypatch):
+    # drain이 도는 중에는 배치를 시작하지 않는다 — 읽은 pending을 drain이 DB로 옮기면 목표값이 모자란다.
+    monkeypatch.setattr(settings, "COUNTER_RECONCILE_INTERVAL_SECONDS", 3600)
+    monkeypatch.setattr(cb, "_FLUSH_LOCK_WAIT_SECONDS", 0)
+    seen = _patch_reconcile(monkeypatch, [uuid.uuid4()], [uuid.uuid4()])
+    r = FakeRedis()
+    cursor = uuid.UUID(int=7)
+    r.kv[cb._reconcile_cursor_key("posts")] = str(cursor)
+    r.kv[cb.COUNTER_FLUSH_LOCK_KEY] = "other-worker"
+
+    assert await cb.run_counter_reconcile(r) == 0
+
+    assert seen == []
+    assert r.kv[cb._reconcile_cursor_key("posts")] == str(cursor)
+    assert r.kv[cb.COUNTER_FLUSH_LOCK_KEY] == "other-worker"
+    assert cb.COUNTER_RECONCILE_LOCK_KEY not in r.kv
+
+
+async def test_admin_comment_delete_goes_through_buffer(monkeypatch):
+    # 작성자 삭제와 같은 경로 — 버퍼가 켜져 있으면 글 행을 직접 줄이지 않고 커밋 후 delta로 보낸다.
+    from app.domain.admin.service import AdminService
+
+    async def _get(cls, comment_id, db, include_deleted=False):
+        return object()
+
+    async def _delete(cls, post_id, comment_id, db):
+        return True
+
+    async def _direct(cls, post_id, db):
+        raise AssertionError("must not decrement post_stats in the request transaction")
+
+    monkeypatch.setattr(CommentsModel, "get_comment_by_id", classmethod(_get))
+    monkeypatch.setattr(CommentsModel, "delete_comment", classmethod(_delete))
+    monkeypatch.setattr(PostsModel, "decrement_comment_count", classmethod(_direct))
+    r = FakeRedis()
+    pid = uuid.uuid4()
+
+    await AdminService.delete_comment(pid, uuid.uuid4(), as_session(FakeDB()), redis=r)
+
+    assert await cb.get_post_counter_pending(r, pid) == (0, -1)
+
+
+async def test_comment_page_overlays_pending_like_counts():
+    r = FakeRedis()
+    db = as_session(FakeDB())
+    root_id, reply_id = uuid.uuid4(), uuid.uuid4()
+    await cb.settle_counter(r, "comment_like", reply_id, base=0, delta=1, db=db)
+    await cb.settle_counter(r, "comment_like", root_id, base=0, delta=-1, db=db)
+
+    class _C:
+        def __init__(self, cid, like_count, replies=()):
+            self.id, self.like_count, self.replies = cid, like_count, list(replies)
+
+    reply = _C(reply_id, 4)
+    root = _C(root_id, 0, [reply])
+    await comment_service._overlay_pending_like_counts([root], r)  # type: ignore[list-item]
+    assert (root.like_count, reply.like_count) == (0, 5)
+
+
+async def test_reconcile_subtracts_pending_buffer_from_ledger(monkeypatch):
+    """writer가 원장 커밋 후 락 밖에서 HINCRBY한 delta는 drain 뒤에도 버퍼에 남는다 — reconcile은
+    그 pending을 원장 수에서 빼서 써야 다음 flush가 두 번 더하지 않는다."""
+    monkeypatch.setattr(settings, "COUNTER_RECONCILE_INTERVAL_SECONDS", 3600)
+    pid, cid = uuid.uuid4(), uuid.uuid4()
+    r = FakeRedis()
+    db = as_session(FakeDB())
+
+    async def _counts(ids):
+        return [(pid, 5, 3)]
+
+    fixed: dict[str, list] = {}
+    _patch_reconcile(monkeypatch, [pid], [cid], post_counts=_counts, fixed=fixed)
+    await cb.settle_counter(r, "post_like", pid, base=0, delta=2, db=db)
+    await cb.settle_counter(r, "comment_like", cid, base=0, delta=1, db=db)
+
+    await cb.run_counter_reconcile(r)
+
+    # 댓글 원장 0 − pending 1은 음수 — 0에서 멈춘다.
+    assert fixed == {"posts": [(pid, 3, 3)], "comments": [(cid, 0)]}
+    assert await cb.get_post_counter_pending(r, pid) == (2, 0)  # 다음 flush 몫으로 그대로 남는다
+
+
+async def test_reconcile_skips_rows_whose_pending_moved_during_count(monkeypatch):
+    # 집계 중 커밋된 좋아요는 원장에 들었는지 모른다 — 그 행은 이번 바퀴에서 건너뛴다.
+    monkeypatch.setattr(settings, "COUNTER_RECONCILE_INTERVAL_SECONDS", 3600)
+    hot, quiet = uuid.UUID(int=1), uuid.UUID(int=2)
+    r = FakeRedis()
+
+    async def _counts(ids):
+        await cb.settle_counter(r, "post_like", hot, base=0, delta=1, db=as_session(FakeDB()))
+        return [(hot, 9, 0), (quiet, 4, 1)]
+
+    fixed: dict[str, list] = {}
+    _patch_reconcile(monkeypatch, [hot, quiet], [], post_counts=_counts, fixed=fixed)
+
+    await cb.run_counter_reconcile(r)
+
+    assert fixed["posts"] == [(quiet, 4, 1)]
+
+
+async def test_reconcile_statement_sets_targets_through_unnest():
+    from sqlalchemy.dialects import postgresql
+
+    class _SqlDB(FakeDB):
+        def __init__(self) -> None:
+            self.sql: list[str] = []
+
+        async def execute(self, stmt):
+            self.sql.append(str(stmt.compile(dialect=postgresql.dialect())))
+            return None
+
+    db = _SqlDB()
+    pid = uuid.uuid4()
+    await PostsModel.reconcile_counters([(pid, 3, 1)], db=as_session(db))
+    await CommentsModel.reconcile_counters([(pid, 2)], db=as_session(db))
+    await PostsModel.reconcile_counters([], db=as_session(db))  # 빈 배치는 문장 없이 0
+    posts_sql, comments_sql = db.sql
+    assert "unnest(" in posts_sql and "like_count=d.likes" in posts_sql
+    assert "comment_count=d.comments" in posts_sql
+    assert "unnest(" in comments_sql and "like_count=d.likes" in comments_sql
@@ -0,0 +1,63 @@
+"""api_etag_response(폴링 목록 ETag) 단위 테스트.
+
+ETag가 data만의 해시라 요청 ID가 달라도 같고, If-None-Match(목록·`*`·약한 비교)가 맞으면 본문 없이
+304, 데이터가 바뀌면 새 태그로 200을 내는지 검증한다.
+"""
+
+import uuid
+
+import httpx
+import pytest
+from app.common import ApiCode, CursorPage, api_etag_response
+from app.domain.notifications.schema import NotificationItem
+from fastapi import FastAPI, Request
+
+pytestmark = pytest.mark.asyncio
+
+
+def _app(state: dict) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items")
+    async def items(request: Request):
+        request.state.request_id = uuid.uuid4().hex  # 요청마다 다른 봉투 request_id
+        return api_etag_response(request, code=ApiCode.OK, data=state["page"])
+
+    return app
+
+
+def _page(n: int) -> CursorPage[NotificationItem]:
+    items = [
+        NotificationItem.model_validate(
+            {
+                "id": uuid.UUID(int=i + 1),
+                "kind": "COMMENT_ON_POST",
+                "created_at": "2026-01-01T00:00:00Z",
+            }
+        )
+        for i in range(n)
+    ]
+    return CursorPage(items=items, has_more=False)
+
+
+async def test_unchanged_data_revalidates_to_304_and_changes_get_new_tag():
+    state = {"page": _page(2)}
+    transport = httpx.ASGITransport(app=_app(state))
+    async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+        first = await c.get("/items")
+        etag = first.headers["etag"]
+        assert first.status_code == 200 and etag.startswith('W/"')
+        assert first.headers["cache-control"] == "private, no-cache"
+
+        again = await c.get("/items", headers={"If-None-Match": etag})
+        assert again.status_code == 304 and again.content == b""
+        assert again.headers["etag"] == etag
+
+        # 목록·강한 형태·`*`도 약한 비교로 일치.
+        for header in (f'"x", {etag.removeprefix("W/")}', "*"):
+            assert (await c.get("/items", headers={"If-None-Match": header})).status_code == 304
+
+        state["page"] = _page(3)
+        changed = await c.get("/items", headers={"If-None-Match": etag})
+        assert changed.status_code == 200 and changed.headers["etag"] != etag
+        assert len(changed.json()["data"]["items"]) == 3
@@ -0,0 +1,92 @@
+"""해시태그 자동완성 단위 테스트.
+
+프로세스 로컬 접두사 인덱스가 사용 수 순으로 제안하고, 글 쓰기 증감을 로컬 반영 + broadcast로
+전파하며, 스냅샷 전(콜드 스타트)에만 DB 접두사 검색으로 폴백하는지 검증한다.
+"""
+
+import json
+
+import pytest
+from app.domain.posts import hashtag_suggest as hs
+from app.domain.posts.services import hashtag_service
+
+from tests.unit.fakes import FakeDB, FakeRedis, as_session
+
+
+def test_suggest_orders_by_usage_within_prefix():
+    index = hs.HashtagPrefixIndex()
+    index.replace({"말티즈": 5, "말티푸": 9, "말랑": 2, "푸들": 50, "말티즈간식": 5, "unused": 0})
+
+    assert index.suggest("말티", 10) == [("말티푸", 9), ("말티즈", 5), ("말티즈간식", 5)]
+    assert index.suggest("말", 2) == [("말티푸", 9), ("말티즈", 5)]
+    assert index.suggest("un", 10) == []  # 사용 0은 싣지 않는다
+    assert hs.normalize_hashtag_prefix("  #Mal Ti ") == "malti"
+
+
+def test_apply_delta_inserts_and_drops_names():
+    index = hs.HashtagPrefixIndex()
+    index.replace({"산책": 1})
+    index.apply(hs.hashtag_usage_delta(["산책"], ["산책로", "산책"]))
+    assert index.suggest("산책", 10) == [("산책", 1), ("산책로", 1)]
+
+    index.apply(hs.hashtag_usage_delta(["산책", "산책로"], []))
+    assert index.suggest("산", 10) == []
+
+
+def test_short_prefix_keeps_most_used_names_past_scan_cap(monkeypatch):
+    # 이름순 상한으로 자르면 뒤쪽의 인기 태그가 빠진다 — 1–2글자 접두사는 사용 수 상위를 따로 유지.
+    monkeypatch.setattr(hs, "_MAX_SCAN", 3)
+    monkeypatch.setattr(hs, "_SHORT_TOP_K", 2)
+    index = hs.HashtagPrefixIndex()
+    index.replace({"aa": 1, "ab": 1, "ac": 1, "ad": 1, "az": 40, "ay": 30})
+
+    assert index.suggest("a", 2) == [("az", 40), ("ay", 30)]
+
+    index.apply({"ax": 50})
+    assert index.suggest("a", 2) == [("ax", 50), ("az", 40)]
+    # 상위 이름이 줄면 구간을 다시 골라 밖에 있던 이름이 올라온다.
+    index.apply({"ax": -50, "az": -39})
+    assert index.suggest("a", 2) == [("ay", 30), ("aa", 1)]
+    assert index.suggest("az", 5) == [("az", 1)]
+
+
+@pytest.mark.asyncio
+async def test_publish_applies_locally_and_broadcasts_to_other_instances():
+    hs.hashtag_index.replace({"산책": 3})
+    r = FakeRedis()
+
+    await hs.publish_hashtag_usage(r, ["산책"], ["캠핑"])
+
+    assert hs.hashtag_index.suggest("캠", 10) == [("캠핑", 1)]
+    assert hs.hashtag_index.suggest("산", 10) == [("산책", 2)]
+    [(channel, env)] = r.published
+    assert channel == hs.HASHTAG_INDEX_CHANNEL
+    payload = json.loads(env)["payload"]
+
+    # 다른 인스턴스의 수신 핸들러가 같은 증감을 반영한다.
+    hs.hashtag_index.replace({"산책": 3})
+    await hs.handle_hashtag_usage(payload)
+    await hs.handle_hashtag_usage("not json")  # 규약 위반 payload는 버린다
+    assert hs.hashtag_index.suggest("캠", 10) == [("캠핑", 1)]
+
+
+@pytest.mark.asyncio
+async def test_service_serves_from_index_and_falls_back_to_db_when_cold(monkeypatch):
+    db_calls: list[str] = []
+
+    async def _suggest(cls, prefix, limit, *, db):
+        db_calls.append(prefix)
+        return [("말티즈", 7)]
+
+    monkeypatch.setattr(hashtag_service.PostsModel, "suggest_hashtags", classmethod(_suggest))
+    db = as_session(FakeDB())
+
+    cold = await hashtag_service.HashtagService.suggest_hashtags("#말티", db=db)
+    assert [(s.name, s.count) for s in cold] == [("말티즈", 7)]
+    assert db_calls == ["말티"]
+
+    hs.hashtag_index.replace({"말티푸": 9})
+    warm = await hashtag_service.HashtagService.suggest_hashtags("말티", db=db)
+    assert [(s.name, s.count) for s in warm] == [("말티푸", 9)]
+    assert db_calls == ["말티"]  # 인덱스가 실리면 DB를 타지 않는다
+    assert await hashtag_service.HashtagService.suggest_hashtags("#  ", db=db) == []
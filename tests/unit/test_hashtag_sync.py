@@ -0,0 +1,84 @@
+"""해시태그 diff 동기화 단위 테스트(ADR 0022).
+
+바뀐 이름이 없으면 문장을 하나도 보내지 않고, 바뀌면 삭제·upsert·링크를 한 CTE 문장으로 보내는지,
+이름 → id 캐시에 있는 태그는 upsert를 건너뛰는지, 문장이 못 푼 이름만 upsert 경로로 다시 연결하는지
+검증한다.
+"""
+
+import uuid
+
+import pytest
+from app.domain.posts.hashtag_ids import hashtag_ids
+from app.domain.posts.repository import PostsModel
+from sqlalchemy.dialects import postgresql
+
+from tests.unit.fakes import FakeDB, as_session
+
+pytestmark = pytest.mark.asyncio
+
+
+class _Result:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+
+class _SqlDB(FakeDB):
+    """execute()에 온 문장을 PG 방언 SQL로 기록하고, 준비한 행을 차례로 돌려준다."""
+
+    def __init__(self, *results) -> None:
+        self.sql: list[str] = []
+        self._results = list(results)
+
+    async def execute(self, stmt):
+        self.sql.append(str(stmt.compile(dialect=postgresql.dialect())))
+        return _Result(self._results.pop(0) if self._results else [])
+
+
+async def test_unchanged_tags_send_no_statement():
+    db = _SqlDB()
+    post_id = uuid.uuid4()
+    await PostsModel.sync_post_hashtags(
+        post_id, ["산책", "말티즈"], db=as_session(db), current_names=["말티즈", "산책"]
+    )
+    await PostsModel.sync_post_hashtags(post_id, [], db=as_session(db), current_names=())
+    assert db.sql == []
+
+    # 빠지기만 하면 링크 삭제 한 문장.
+    await PostsModel.sync_post_hashtags(
+        post_id, ["산책"], db=as_session(db), current_names=["말티즈", "산책"]
+    )
+    assert len(db.sql) == 1 and db.sql[0].startswith("DELETE FROM post_hashtags")
+
+
+async def test_changes_go_in_one_statement_and_known_names_skip_upsert():
+    db = _SqlDB([(1, "산책"), (2, "간식")])
+    await PostsModel.sync_post_hashtags(
+        uuid.uuid4(), ["산책", "간식"], db=as_session(db), current_names=["말티즈"]
+    )
+    [sql] = db.sql
+    assert "WITH pruned AS" in sql and "INSERT INTO hashtags" in sql
+    assert "INSERT INTO post_hashtags" in sql
+    assert hashtag_ids.split(["산책", "간식"]) == ({"산책": 1, "간식": 2}, [])
+
+    # 다른 글이 같은 태그를 달면 upsert 없이 캐시 id를 확인·연결만 한다.
+    db = _SqlDB([(1, "산책")])
+    await PostsModel.sync_post_hashtags(uuid.uuid4(), ["산책"], db=as_session(db), current_names=())
+    [sql] = db.sql
+    assert "INSERT INTO hashtags" not in sql and "pruned" not in sql
+    assert "INSERT INTO post_hashtags" in sql
+
+
+async def test_unresolved_names_fall_back_to_upsert_path():
+    hashtag_ids.put_many({"산책": 1})
+    # 캐시 id 1이 사라졌고, "간식"은 문장 스냅샷 밖에서 커밋돼 어느 쪽에도 안 보였다.
+    db = _SqlDB([], [], [(7, "산책"), (8, "간식")])
+    await PostsModel.sync_post_hashtags(
+        uuid.uuid4(), ["산책", "간식"], db=as_session(db), current_names=()
+    )
+    assert len(db.sql) == 4
+    assert db.sql[1].startswith("INSERT INTO hashtags") and db.sql[2].startswith("SELECT")
+    assert db.sql[3].startswith("INSERT INTO post_hashtags")
+    assert hashtag_ids.split(["산책", "간식"]) == ({"산책": 7, "간식": 8}, [])
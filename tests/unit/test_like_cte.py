@@ -0,0 +1,139 @@
+"""좋아요·취소 한 문장 CTE 단위 테스트.
+
+동작마다 DB 문장이 정확히 하나이고, 그 문장에 가시성·원장·(모드에 따라) 카운터·알림이 모두 들어
+있는지, 대상이 없으면 404를, 알림 행이 생겼으면 커밋 후 발행하는지 검증한다.
+"""
+
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from app.common.exceptions import CommentNotFoundException, PostNotFoundException
+from app.core.config import settings
+from app.domain.comments.model import CommentLikesModel
+from app.domain.likes import service as like_service
+from app.domain.likes.liked_cache import liked_cache_key
+from app.domain.likes.model import LikeOutcome, PostLikesModel
+from app.domain.likes.service import LikeService
+from sqlalchemy.dialects import postgresql
+
+from tests.unit.fakes import FakeDB, FakeRedis, RecordingDB, as_session
+
+pytestmark = pytest.mark.asyncio
+
+
+class _Result:
+    def __init__(self, row) -> None:
+        self._row = row
+
+    def one(self):
+        return self._row
+
+
+class _SqlDB(RecordingDB):
+    """execute()에 온 문장을 기록하고 준비한 결과 행 하나를 돌려준다."""
+
+    def __init__(self, **row) -> None:
+        super().__init__()
+        self.sql: list[str] = []
+        self._row = SimpleNamespace(
+            **{
+                "found": True,
+                "changed": True,
+                "like_count": 1,
+                "author_id": None,
+                "post_id": None,
+                "notification_id": None,
+                **row,
+            }
+        )
+
+    async def execute(self, stmt):
+        self.sql.append(str(stmt.compile(dialect=postgresql.dialect())))
+        return _Result(self._row)
+
+
+@pytest.mark.parametrize("bump", [True, False])
+async def test_post_like_is_one_statement(bump):
+    db = _SqlDB(like_count=7)
+    outcome = await PostLikesModel.like(
+        uuid.uuid4(), uuid.uuid4(), bump_count=bump, db=as_session(db)
+    )
+    assert outcome.found and outcome.changed and outcome.like_count == 7
+    (sql,) = db.sql
+    assert sql.startswith("WITH target AS")
+    assert "INSERT INTO post_likes" in sql and "ON CONFLICT (post_id, user_id) DO NOTHING" in sql
+    assert "INSERT INTO notifications" in sql
+    # write-behind 모드(ADR 0023)는 카운터 행을 건드리지 않는다.
+    assert ("UPDATE post_stats" in sql) is bump
+
+
+async def test_unlike_and_comment_like_are_one_statement_each():
+    db = _SqlDB()
+    await PostLikesModel.unlike(uuid.uuid4(), uuid.uuid4(), bump_count=True, db=as_session(db))
+    await CommentLikesModel.like(uuid.uuid4(), uuid.uuid4(), bump_count=True, db=as_session(db))
+    await CommentLikesModel.unlike(uuid.uuid4(), uuid.uuid4(), bump_count=False, db=as_session(db))
+    unlike_post, like_comment, unlike_comment = db.sql
+    assert "DELETE FROM post_likes" in unlike_post and "greatest" in unlike_post
+    assert "notifications" not in unlike_post
+    assert "INSERT INTO comment_likes" in like_comment and "UPDATE comments" in like_comment
+    assert "INSERT INTO notifications" in like_comment
+    assert "DELETE FROM comment_likes" in unlike_comment and "UPDATE" not in unlike_comment
+
+
+async def test_missing_target_raises_not_found(monkeypatch):
+    monkeypatch.setattr(settings, "COUNTER_BUFFER_FLUSH_INTERVAL_SECONDS", 0)
+    with pytest.raises(PostNotFoundException):
+        await LikeService.like_post(uuid.uuid4(), uuid.uuid4(), as_session(_SqlDB(found=False)))
+    with pytest.raises(CommentNotFoundException):
+        await LikeService.unlike_comment(
+            uuid.uuid4(), uuid.uuid4(), as_session(_SqlDB(found=False))
+        )
+
+
+async def test_like_publishes_notification_after_commit(monkeypatch):
+    monkeypatch.setattr(settings, "COUNTER_BUFFER_FLUSH_INTERVAL_SECONDS", 0)
+    comment_id, post_id, author_id, actor_id, nid = (uuid.uuid4() for _ in range(5))
+    published: list[dict] = []
+
+    async def _like(cls, cid, uid, *, bump_count, db):
+        assert bump_count is True
+        return LikeOutcome(True, True, 3, author_id, post_id, nid)
+
+    async def _publish(cls, redis, **kwargs):
+        published.append(kwargs)
+
+    monkeypatch.setattr(CommentLikesModel, "like", classmethod(_like))
+    monkeypatch.setattr(
+        like_service.NotificationService, "publish_after_commit", classmethod(_publish)
+    )
+    db = RecordingDB()
+    got = await LikeService.like_comment(comment_id, actor_id, as_session(db), redis=FakeRedis())
+
+    assert got == (True, 3, True)
+    assert db.begin_count == 1
+    assert published == [
+        {
+            "recipient_user_id": author_id,
+            "notification_id": nid,
+            "kind": like_service.NotificationKind.LIKE_COMMENT,
+            "actor_id": actor_id,
+            "post_id": post_id,
+            "comment_id": comment_id,
+        }
+    ]
+
+
+async def test_duplicate_like_skips_notification_and_window_invalidation(monkeypatch):
+    monkeypatch.setattr(settings, "COUNTER_BUFFER_FLUSH_INTERVAL_SECONDS", 0)
+
+    async def _like(cls, pid, uid, *, bump_count, db):
+        return LikeOutcome(True, False, 5, uuid.uuid4(), pid, None)
+
+    monkeypatch.setattr(PostLikesModel, "like", classmethod(_like))
+    r = FakeRedis()
+    user_id = uuid.uuid4()
+    await r.set(liked_cache_key("post", user_id), "{}")
+    got = await LikeService.like_post(uuid.uuid4(), user_id, as_session(FakeDB()), redis=r)
+    assert got == (True, 5, False)
+    assert liked_cache_key("post", user_id) in r.kv
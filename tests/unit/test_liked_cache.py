@@ -0,0 +1,95 @@
+"""사용자별 최근 좋아요 창 단위 테스트(ADR 0020).
+
+창이 좋아요를 전부 담거나(floor=None) 대상 UUIDv7 생성 시각이 창 하한 뒤일 때만 로컬 판정하고,
+나머지 id만 IN 조회로 폴백하는지, 창이 캐시되어 재사용되고 좋아요 취소 커밋 후 끊기는지 검증한다.
+"""
+
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from app.core.ids import new_uuid7
+from app.domain.likes import liked_cache
+from app.domain.likes.liked_cache import LikeWindow
+from app.domain.likes.model import LikeOutcome, PostLikesModel
+from app.domain.likes.service import LikeService
+
+from tests.unit.fakes import FakeDB, FakeRedis, RecordingDB, as_session
+
+pytestmark = pytest.mark.asyncio
+
+
+def _uuid7_at(at: datetime) -> uuid.UUID:
+    ms = int(at.timestamp() * 1000)
+    return uuid.UUID(int=(ms << 80) | (0x7 << 76) | (0b10 << 62) | uuid.uuid4().int & (2**62 - 1))
+
+
+async def test_split_decides_locally_only_where_window_covers():
+    now = datetime.now(UTC)
+    liked, new_post, old_post, legacy = (
+        new_uuid7(),
+        new_uuid7(),
+        _uuid7_at(now - timedelta(days=3)),
+        uuid.uuid4(),
+    )
+
+    complete = LikeWindow(ids=frozenset({liked}))
+    assert complete.split([liked, new_post, old_post, legacy]) == ({liked}, [])
+
+    partial = LikeWindow(ids=frozenset({liked}), floor=now - timedelta(hours=1))
+    # 하한 뒤에 생긴 글은 창 밖이면 좋아요 없음 확정, 하한 이전·비 v7 id는 DB로.
+    assert partial.split([liked, new_post, old_post, legacy]) == ({liked}, [old_post, legacy])
+
+
+async def test_window_is_cached_and_only_undecided_ids_hit_db(monkeypatch):
+    now = datetime.now(UTC)
+    recent = [(new_uuid7(), now) for _ in range(liked_cache.LIKE_WINDOW_SIZE + 1)]
+    loads: list[int] = []
+    queried: list[list[uuid.UUID]] = []
+
+    async def _recent(cls, user_id, limit, *, db):
+        loads.append(limit)
+        return recent[:limit]
+
+    async def _in(cls, user_id, post_ids, db):
+        queried.append(list(post_ids))
+        return set()
+
+    monkeypatch.setattr(PostLikesModel, "get_recent_likes", classmethod(_recent))
+    monkeypatch.setattr(PostLikesModel, "get_liked_post_ids_for_user", classmethod(_in))
+    r, reader, user_id = FakeRedis(), RecordingDB(), uuid.uuid4()
+    old_post = _uuid7_at(now - timedelta(days=1))
+
+    window = await liked_cache.get_like_window("post", user_id, db=as_session(reader), redis=r)
+    again = await liked_cache.get_like_window("post", user_id, db=as_session(reader), redis=r)
+    assert window == again and window is not None and window.floor == now
+    assert loads == [liked_cache.LIKE_WINDOW_SIZE + 1] and reader.begin_count == 1
+
+    page = [recent[0][0], old_post]
+    liked = await liked_cache.resolve_liked_post_ids(user_id, page, window, db=as_session(FakeDB()))
+    assert liked == {recent[0][0]} and queried == [[old_post]]
+
+    # Redis 없으면 창을 만들지 않고 기존 IN 조회 그대로.
+    assert (
+        await liked_cache.get_like_window("post", user_id, db=as_session(reader), redis=None)
+        is None
+    )
+
+
+async def test_unlike_invalidates_window(monkeypatch):
+    user_id, post_id = uuid.uuid4(), new_uuid7()
+    r = FakeRedis()
+    await r.set(liked_cache.liked_cache_key("post", user_id), b"{}")
+
+    async def _unlike(cls, post_id, user_id, *, bump_count, db):
+        # 카운터 버퍼 모드: 행은 그대로(1), 취소 delta(-1)는 버퍼로 간다.
+        assert bump_count is False
+        return LikeOutcome(True, True, 1, None, post_id, None)
+
+    monkeypatch.setattr(PostLikesModel, "unlike", classmethod(_unlike))
+
+    assert await LikeService.unlike_post(post_id, user_id, as_session(FakeDB()), redis=r) == (
+        False,
+        0,
+    )
+    assert liked_cache.liked_cache_key("post", user_id) not in r.kv
@@ -0,0 +1,160 @@
+"""게시글 상세 엔티티 캐시 단위 테스트.
+
+차단 무관 스냅샷을 한 번만 적재하고, 차단·is_liked·버퍼 조회수는 요청별로 오버레이하며,
+쓰기 경로(관리자 블라인드·조회수 flush)는 커밋 후 스냅샷을 끊는지 검증한다.
+"""
+
+import uuid
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+import pytest
+from app.common.exceptions import PostNotFoundException
+from app.domain.admin.service import AdminService
+from app.domain.posts.post_cache import post_detail_cache_key
+from app.domain.posts.services import post_service as ps
+from app.domain.users.model import UsersModel
+
+from tests.unit.fakes import FakeDB, FakeRedis, RecordingDB, as_session
+
+pytestmark = pytest.mark.asyncio
+
+
+def _fake_post(pid: uuid.UUID, author_id: uuid.UUID, view_count: int = 0):
+    return SimpleNamespace(
+        id=pid,
+        title="t",
+        content="c",
+        view_count=view_count,
+        like_count=0,
+        comment_count=0,
+        author=SimpleNamespace(id=author_id, nickname="n", status="ACTIVE"),
+        files=[],
+        category_id=None,
+        hashtags=[],
+        version=1,
+        created_at=datetime.now(UTC),
+    )
+
+
+def _patch_load(monkeypatch, post) -> list[uuid.UUID | None]:
+    calls: list[uuid.UUID | None] = []
+
+    async def _load(cls, post_id, *, db, blocked_ids=()):
+        calls.append(blocked_ids or None)
+        return post
+
+    monkeypatch.setattr(ps.PostsModel, "get_post_by_id", classmethod(_load))
+    return calls
+
+
+def _patch_overlay(monkeypatch, author_id: uuid.UUID, *, blocked: bool, liked: bool) -> None:
+    async def _blocked_ids(cls, blocker_id, *, db):
+        return [author_id] if blocked else []
+
+    async def _has_like(cls, post_id, user_id, db):
+        return liked
+
+    async def _recent(cls, user_id, limit, *, db):
+        return [(uuid.uuid4(), datetime.now(UTC))] * (limit if liked else 0)
+
+    monkeypatch.setattr(UsersModel, "get_blocked_user_ids", classmethod(_blocked_ids))
+    monkeypatch.setattr(ps.PostLikesModel, "has_like", classmethod(_has_like))
+    monkeypatch.setattr(ps.PostLikesModel, "get_recent_likes", classmethod(_recent))
+
+
+async def _detail(pid, r, reader, user_id=None):
+    return await ps.PostService.get_post_detail(
+        pid, as_session(reader), user_id, viewer_key="u:1", redis_client=r
+    )
+
+
+async def test_anonymous_hit_skips_db(monkeypatch):
+    """두 번째 익명 조회는 스냅샷 히트 — 리더 트랜잭션을 열지 않는다."""
+    pid = uuid.uuid4()
+    calls = _patch_load(monkeypatch, _fake_post(pid, uuid.uuid4(), view_count=7))
+    r, reader = FakeRedis(), RecordingDB()
+
+    first = await _detail(pid, r, reader)
+    second = await _detail(pid, r, reader)
+
+    assert calls == [None]  # 스냅샷은 차단 무관(blocked_ids 없이) 1회 적재
+    assert reader.begin_count == 1
+    assert first.view_count == second.view_count == 7
+    assert post_detail_cache_key(pid) in r.kv
+
+
+async def test_logged_in_overlay_applies_like_and_block(monkeypatch):
+    """캐시 히트여도 is_liked는 요청별로 채우고, 차단한 저자의 글은 404로 가린다."""
+    pid, author_id = uuid.uuid4(), uuid.uuid4()
+    calls = _patch_load(monkeypatch, _fake_post(pid, author_id))
+    r = FakeRedis()
+    await _detail(pid, r, FakeDB())  # 스냅샷 적재
+
+    _patch_overlay(monkeypatch, author_id, blocked=False, liked=True)
+    data = await _detail(pid, r, FakeDB(), user_id=uuid.uuid4())
+    assert data.is_liked is True
+    assert calls == [None]
+
+    _patch_overlay(monkeypatch, author_id, blocked=True, liked=True)
+    with pytest.raises(PostNotFoundException):
+        await _detail(pid, r, FakeDB(), user_id=uuid.uuid4())
+
+
+async def test_missing_post_is_not_cached(monkeypatch):
+    pid = uuid.uuid4()
+    _patch_load(monkeypatch, None)
+    r = FakeRedis()
+    with pytest.raises(PostNotFoundException):
+        await _detail(pid, r, FakeDB())
+    assert post_detail_cache_key(pid) not in r.kv
+
+
+async def test_admin_blind_invalidates_snapshot(monkeypatch):
+    """블라인드 커밋 후 스냅샷 DEL + 다른 인스턴스 L1 evict 신호."""
+    pid = uuid.uuid4()
+    _patch_load(monkeypatch, _fake_post(pid, uuid.uuid4()))
+    r = FakeRedis()
+    await _detail(pid, r, FakeDB())
+
+    async def _set_blinded(cls, post_id, db):
+        return True
+
+    async def _category_id(cls, post_id, db):
+        return None
+
+    monkeypatch.setattr(ps.PostsModel, "set_blinded", classmethod(_set_blinded))
+    monkeypatch.setattr(ps.PostsModel, "get_post_category_id", classmethod(_category_id))
+    monkeypatch.setattr(ps.PostsModel, "get_public_hashtag_names", classmethod(_category_id))
+    await AdminService.blind_post(pid, db=as_session(FakeDB()), redis=r)
+
+    assert post_detail_cache_key(pid) not in r.kv
+    assert any(post_detail_cache_key(pid) in msg for _, msg in r.published)
+
+
+async def test_flush_invalidates_flushed_posts(monkeypatch):
+    """flush로 pending이 DB에 옮겨지면 스냅샷을 끊어 표시 조회수가 뒤로 가지 않게 한다."""
+    pid, other = uuid.uuid4(), uuid.uuid4()
+    _patch_load(monkeypatch, _fake_post(pid, uuid.uuid4()))
+    r = FakeRedis()
+    await _detail(pid, r, FakeDB())
+    r.kv[post_detail_cache_key(other)] = "untouched"
+    await r.hincrby(ps.view_buffer_key(ps.view_shard_for(pid)), str(pid), 1)
+
+    class _Conn:
+        async def __aenter__(self):
+            return FakeDB()
+
+        async def __aexit__(self, *a):
+            return False
+
+    async def _bulk(cls, deltas, db):
+        return len(deltas)
+
+    monkeypatch.setattr(ps.PostsModel, "increment_view_counts_bulk", classmethod(_bulk))
+    monkeypatch.setattr("app.db.session.get_connection", lambda: _Conn())
+
+    await ps.PostService.flush_view_counts_to_db(r)
+
+    assert post_detail_cache_key(pid) not in r.kv
+    assert r.kv[post_detail_cache_key(other)] == "untouched"
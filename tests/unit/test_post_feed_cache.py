@@ -0,0 +1,240 @@
+"""첫 페이지 피드 풀 캐시 단위 테스트.
+
+차단 무관 최신 글 풀을 카테고리별로 한 번 적재해 앞 페이지를 잘라내고, 차단·is_liked는
+요청별로 오버레이하며, 풀로 확정할 수 없는 페이지(커서가 풀 밖)는 DB keyset으로 폴백하는지 검증한다.
+"""
+
+import uuid
+from collections.abc import Collection
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+import pytest
+from app.domain.posts.post_cache import POST_FEED_POOL_SIZE, post_feed_cache_key
+from app.domain.posts.services import post_service as ps
+from app.domain.users.model import UsersModel
+
+from tests.unit.fakes import FakeDB, FakeRedis, as_session
+
+pytestmark = pytest.mark.asyncio
+
+
+def _fake_post(author_id: uuid.UUID):
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        title="t",
+        content="c",
+        view_count=0,
+        like_count=0,
+        comment_count=0,
+        author=SimpleNamespace(id=author_id, nickname="n", status="ACTIVE"),
+        files=[],
+        category_id=None,
+        hashtags=[],
+        version=1,
+        created_at=datetime.now(UTC),
+    )
+
+
+def _posts(n: int, author_ids: list[uuid.UUID]) -> list[SimpleNamespace]:
+    # 풀은 id DESC — 실제 keyset 순서를 흉내내 정렬해 둔다.
+    out = [_fake_post(author_ids[i % len(author_ids)]) for i in range(n)]
+    return sorted(out, key=lambda p: p.id, reverse=True)
+
+
+def _patch_db(
+    monkeypatch,
+    posts,
+    *,
+    blocked: Collection[uuid.UUID] = frozenset(),
+    liked: Collection[uuid.UUID] = frozenset(),
+):
+    calls: list[dict] = []
+
+    async def _get_all(
+        cls,
+        size=20,
+        *,
+        db,
+        cursor=None,
+        search_q=None,
+        category_id=None,
+        blocked_ids=(),
+        ranked_search=False,
+        since=None,
+    ):
+        calls.append(
+            {
+                "size": size,
+                "cursor": cursor,
+                "blocked_ids": blocked_ids,
+                "ranked_search": ranked_search,
+            }
+        )
+        rows = [p for p in posts if cursor is None or p.id < cursor]
+        rows = [p for p in rows if since is None or p.id > since]
+        return rows[: size + 1]
+
+    async def _search_ids(cls, limit, *, db, search_q, category_id=None, ranked_search=False):
+        calls.append({"search_q": search_q, "ranked_search": ranked_search})
+        return [p.id for p in posts][:limit]
+
+    async def _by_ids(cls, post_ids, *, db, blocked_ids=()):
+        return [p for p in posts if p.id in post_ids and p.author.id not in blocked_ids]
+
+    async def _blocked(cls, blocker_id, *, db):
+        return list(blocked)
+
+    async def _liked(cls, user_id, post_ids, db):
+        return {pid for pid in post_ids if pid in liked}
+
+    async def _recent(cls, user_id, limit, *, db):
+        return [(pid, datetime.now(UTC)) for pid in liked][:limit]
+
+    # 가짜 글은 Post 엔티티 모양 — ORM 하이드레이션 경로로 고정(Core 행 변환은 test_post_list_projection).
+    monkeypatch.setattr(ps.settings, "POST_LIST_HYDRATION", "orm")
+    monkeypatch.setattr(ps.PostsModel, "get_all_posts", classmethod(_get_all))
+    monkeypatch.setattr(ps.PostsModel, "get_search_post_ids", classmethod(_search_ids))
+    monkeypatch.setattr(ps.PostsModel, "get_list_posts_by_ids", classmethod(_by_ids))
+    monkeypatch.setattr(UsersModel, "get_blocked_user_ids", classmethod(_blocked))
+    monkeypatch.setattr(ps.PostLikesModel, "get_liked_post_ids_for_user", classmethod(_liked))
+    monkeypatch.setattr(ps.PostLikesModel, "get_recent_likes", classmethod(_recent))
+    return calls
+
+
+async def _page(r, size=10, *, user_id=None, cursor=None, since=None):
+    return await ps.PostService.get_posts(
+        size,
+        as_session(FakeDB()),
+        current_user_id=user_id,
+        cursor=cursor,
+        redis_client=r,
+        since=since,
+    )
+
+
+async def test_first_pages_served_from_single_pool_load(monkeypatch):
+    """첫 페이지와 풀 안쪽 커서 페이지는 풀 1회 적재로 응답(사용자 무관 키)."""
+    posts = _posts(POST_FEED_POOL_SIZE + 5, [uuid.uuid4()])
+    calls = _patch_db(monkeypatch, posts)
+    r = FakeRedis()
+
+    first, more1 = await _page(r)
+    second, more2 = await _page(r, cursor=first[-1].id)
+
+    assert [p.id for p in first] == [p.id for p in posts[:10]]
+    assert [p.id for p in second] == [p.id for p in posts[10:20]]
+    assert more1 and more2
+    assert calls == [
+        {
+            "size": POST_FEED_POOL_SIZE,
+            "cursor": None,
+            "blocked_ids": (),
+            "ranked_search": False,
+        }
+    ]
+    assert post_feed_cache_key(None) in r.kv
+
+
+async def test_cursor_beyond_pool_falls_back_to_db(monkeypatch):
+    posts = _posts(POST_FEED_POOL_SIZE + 15, [uuid.uuid4()])
+    calls = _patch_db(monkeypatch, posts)
+    r = FakeRedis()
+
+    tail_cursor = posts[POST_FEED_POOL_SIZE - 5].id
+    page, has_more = await _page(r, cursor=tail_cursor)
+
+    start = POST_FEED_POOL_SIZE - 4
+    assert [p.id for p in page] == [p.id for p in posts[start : start + 10]]
+    assert has_more is True
+    assert calls[-1]["cursor"] == tail_cursor  # 풀 뒤쪽은 DB keyset
+
+
+async def test_exhaustive_pool_answers_has_more(monkeypatch):
+    """풀이 전체 글을 담으면(exhaustive) 부족한 페이지도 풀만으로 has_more=False 확정."""
+    posts = _posts(4, [uuid.uuid4()])
+    calls = _patch_db(monkeypatch, posts)
+    r = FakeRedis()
+
+    await _page(r)
+    page, has_more = await _page(r, cursor=posts[1].id)
+
+    assert [p.id for p in page] == [p.id for p in posts[2:]]
+    assert has_more is False
+    assert len(calls) == 1
+
+
+async def test_logged_in_overlay_filters_blocked_and_marks_liked(monkeypatch):
+    blocked_author, ok_author = uuid.uuid4(), uuid.uuid4()
+    posts = _posts(20, [blocked_author, ok_author])
+    liked = {posts[1].id}
+    _patch_db(monkeypatch, posts, blocked={blocked_author}, liked=liked)
+    r = FakeRedis()
+
+    page, _ = await _page(r, size=5, user_id=uuid.uuid4())
+
+    assert page
+    for p in page:
+        assert p.author is not None and p.author.id == ok_author
+    assert [p.id for p in page if p.is_liked] == [
+        pid for pid in liked if pid in {p.id for p in page}
+    ]
+    # 공유 풀(L1·Redis) 원본은 오버레이 영향 없음
+    anon, _ = await _page(r, size=20)
+    assert not any(p.is_liked for p in anon)
+
+
+async def test_search_bypasses_pool(monkeypatch):
+    posts = _posts(3, [uuid.uuid4()])
+    calls = _patch_db(monkeypatch, posts)
+    r = FakeRedis()
+
+    await ps.PostService.get_posts(10, as_session(FakeDB()), q="강아지 산책", redis_client=r)
+
+    assert post_feed_cache_key(None) not in r.kv
+    assert calls[-1]["ranked_search"] is True  # 검색은 검색 문서 랭킹 경로(ADR 0015)
+
+
+async def test_create_invalidates_all_and_category_pool(monkeypatch):
+    r = FakeRedis(
+        preloaded={
+            post_feed_cache_key(None): "x",
+            post_feed_cache_key(3): "y",
+            post_feed_cache_key(4): "z",
+        }
+    )
+
+    async def _create(cls, *a, db, **kw):
+        return uuid.uuid4()
+
+    async def _exists(cls, category_id, *, db):
+        return True
+
+    monkeypatch.setattr(ps.PostsModel, "create_post", classmethod(_create))
+    monkeypatch.setattr(ps.PostsModel, "category_exists", classmethod(_exists))
+    data = ps.PostCreateRequest(title="t", content="c", category_id=3)
+    await ps.PostService.create_post(uuid.uuid4(), data, as_session(FakeDB()), redis=r)
+
+    assert set(r.kv) == {post_feed_cache_key(4)}
+
+
+async def test_since_poll_is_answered_from_pool_without_db(monkeypatch):
+    """풀이 since까지 내려가면 폴링은 풀만으로 확정 — 새 글이 없으면 빈 페이지, DB 왕복 없음."""
+    posts = _posts(POST_FEED_POOL_SIZE + 5, [uuid.uuid4()])
+    calls = _patch_db(monkeypatch, posts)
+    r = FakeRedis()
+
+    idle, idle_more = await _page(r, since=posts[0].id)
+    fresh, fresh_more = await _page(r, size=2, since=posts[3].id)
+
+    assert idle == [] and idle_more is False
+    assert [p.id for p in fresh] == [p.id for p in posts[:2]] and fresh_more is True
+    assert len(calls) == 1  # 풀 적재 1회뿐
+
+
+async def test_since_with_search_query_is_rejected(monkeypatch):
+    _patch_db(monkeypatch, [])
+    with pytest.raises(ps.InvalidRequestException):
+        await ps.PostService.get_posts(
+            10, as_session(FakeDB()), q="산책 후기", since=uuid.uuid4(), redis_client=FakeRedis()
+        )
@@ -0,0 +1,135 @@
+"""게시글 목록 Core 프로젝션 단위 테스트(ADR 0018).
+
+응답 컬럼만 고른 한 문장(해시태그 array_agg·첨부 json_agg)으로 컴파일되는지, 행 → 응답 변환이
+ORM 경로와 같은 모양(비활성 작성자 익명화·대표견·빈 집계)을 내는지, 목록 서비스가 core 설정에서
+프로젝션 행으로 is_liked까지 한 번에 담는지 검증한다.
+"""
+
+import uuid
+from datetime import UTC, date, datetime
+from types import SimpleNamespace
+
+import pytest
+from app.domain.posts import repository as repo
+from app.domain.posts.list_projection import post_response_from_list_row
+from app.domain.posts.services import post_service as ps
+from app.domain.users.model import UsersModel
+from sqlalchemy.dialects import postgresql
+
+from tests.unit.fakes import FakeDB, as_session
+
+
+def _row(**overrides):
+    row = {
+        "id": uuid.uuid4(),
+        "title": "t",
+        "content": "c",
+        "view_count": 3,
+        "like_count": 2,
+        "comment_count": 1,
+        "category_id": None,
+        "version": 1,
+        "created_at": datetime.now(UTC),
+        "author_id": uuid.uuid4(),
+        "author_nickname": "뭉치맘",
+        "author_status": "ACTIVE",
+        "author_profile_image_id": None,
+        "author_profile_image_key": None,
+        "dog_name": None,
+        "dog_breed": None,
+        "dog_gender": None,
+        "dog_birth_date": None,
+        "hashtags": None,
+        "files": None,
+    }
+    row.update(overrides)
+    return SimpleNamespace(**row)
+
+
+def test_projection_is_one_statement_with_aggregated_children():
+    stmt = repo._apply_post_list_filters(
+        repo._post_list_projection(),
+        cursor=uuid.uuid4(),
+        search_q=None,
+        category_id=1,
+        blocked_ids={uuid.uuid4()},
+        ranked_search=False,
+    )
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "array_agg(hashtags.name)" in sql
+    assert "json_agg(json_build_object" in sql and "ORDER BY post_images.id" in sql
+    # 카테고리 조인·엔티티 컬럼 전체 없이 응답 컬럼만.
+    assert "categories" not in sql and "post_stats.report_count" not in sql
+    # 카운터는 좁은 post_stats에서 PK 조인으로(ADR 0024).
+    assert "JOIN post_stats ON post_stats.post_id = posts.id" in sql
+    # 차단 필터는 상관 서브쿼리가 아니라 배열 파라미터 하나(ADR 0019).
+    assert "user_blocks" not in sql and "!= ALL" in sql
+
+
+def test_row_builds_response_with_author_dog_files_and_hashtags(monkeypatch):
+    monkeypatch.setattr(
+        "app.domain.posts.list_projection.build_url", lambda key: f"https://cdn/{key}"
+    )
+    image_id, post_image_id = uuid.uuid4(), uuid.uuid4()
+    row = _row(
+        author_profile_image_id=uuid.uuid4(),
+        author_profile_image_key="profile/a.png",
+        dog_name="뭉치",
+        dog_breed="말티즈",
+        dog_gender="male",
+        dog_birth_date=date(2020, 1, 1),
+        hashtags=["산책", "말티즈"],
+        # json_agg 원소는 JSON이라 UUID가 문자열로 온다.
+        files=[{"id": str(post_image_id), "file_url": "https://f", "image_id": str(image_id)}],
+    )
+
+    resp = post_response_from_list_row(row, is_liked=True)
+
+    assert resp.is_liked is True and resp.hashtags == ["산책", "말티즈"]
+    assert resp.files[0].id == post_image_id and resp.files[0].image_id == image_id
+    assert resp.author is not None and resp.author.profile_image_url == "https://cdn/profile/a.png"
+    assert resp.author.representative_dog is not None
+    assert resp.author.representative_dog.name == "뭉치"
+
+
+def test_inactive_author_is_anonymized_and_null_aggregates_are_empty():
+    row = _row(author_status="WITHDRAWN", dog_name="뭉치", author_profile_image_key="k")
+
+    resp = post_response_from_list_row(row)
+
+    assert resp.author is not None and resp.author.nickname == "알수없음"
+    assert resp.author.profile_image_url is None and resp.author.representative_dog is None
+    assert resp.files == [] and resp.hashtags == [] and resp.is_liked is False
+    assert post_response_from_list_row(_row(author_id=None)).author is None
+
+
+@pytest.mark.asyncio
+async def test_core_list_path_builds_from_rows_with_like_overlay(monkeypatch):
+    rows = [_row() for _ in range(4)]
+    liked = {rows[1].id}
+
+    async def _rows(cls, size=20, *, db, **kw):
+        return rows[: size + 1]
+
+    async def _orm(cls, *a, **kw):
+        raise AssertionError("ORM 경로를 타면 안 된다")
+
+    async def _blocked(cls, blocker_id, *, db):
+        return []
+
+    async def _liked(cls, user_id, post_ids, db):
+        return {pid for pid in post_ids if pid in liked}
+
+    monkeypatch.setattr(ps.settings, "POST_LIST_HYDRATION", "core")
+    monkeypatch.setattr(ps.PostsModel, "get_all_post_rows", classmethod(_rows))
+    monkeypatch.setattr(ps.PostsModel, "get_all_posts", classmethod(_orm))
+    monkeypatch.setattr(ps.PostLikesModel, "get_liked_post_ids_for_user", classmethod(_liked))
+    monkeypatch.setattr(UsersModel, "get_blocked_user_ids", classmethod(_blocked))
+
+    page, more = await ps.PostService.get_posts(
+        3, as_session(FakeDB()), current_user_id=uuid.uuid4()
+    )
+
+    assert more is True
+    assert [p.id for p in page] == [r.id for r in rows[:3]]
+    assert [p.is_liked for p in page] == [False, True, False]
@@ -1,10 +1,23 @@
+import importlib.util
+import uuid
+from pathlib import Path
+from types import SimpleNamespace
+
 import pytest
 from app.common.exceptions import InvalidRequestException
+from app.core.config import Settings
+from app.domain.posts.model import Post
 from app.domain.posts.repository import (
     PostsModel,
+    _apply_ranked_search,
+    _ranked_search_query,
     tokenize_search_query,
     validate_search_query,
 )
+from app.domain.posts.search_document import search_terms, search_tsquery_text
+from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
 
 
 def test_tokenize_search_query_splits_whitespace():
@@ -36,3 +49,94 @@ def test_validate_search_query_empty_returns_none():
 def test_posts_model_exposes_post_is_visible():
     assert hasattr(PostsModel, "post_is_visible")
     assert callable(PostsModel.post_is_visible)
+
+
+def test_search_terms_split_hangul_into_overlapping_bigrams():
+    assert search_terms("카보불닭 Recipe 2024!") == ["카보", "보불", "불닭", "recipe", "2024"]
+    assert search_terms("불 a_b") == ["불", "a", "b"]
+
+
+def test_search_tsquery_text_chains_bigrams_and_prefixes_words():
+    assert search_tsquery_text("불닭") == "'불닭'"
+    assert search_tsquery_text("불닭볶음 abc") == "('불닭' <-> '닭볶' <-> '볶음') & 'abc':*"
+    assert search_tsquery_text("불a") == "'불':* & 'a':*"
+    assert search_tsquery_text("!!! ???") is None
+
+
+def _compile(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def test_ranked_search_keysets_on_rank_then_id_with_uncorrelated_cursor_rank():
+    query = _ranked_search_query("불닭 레시피")
+    assert query is not None
+    sql = _compile(_apply_ranked_search(select(Post.id), query, cursor=uuid.uuid4()))
+    assert "@@ to_tsquery" in sql
+    assert "ORDER BY ts_rank_cd(post_search_documents.search_vector" in sql
+    assert sql.rstrip().endswith("DESC, posts.id DESC")
+    # 커서 rank 서브쿼리는 별칭 행에서 읽어야 한다(바깥 문서와 상관되면 FROM이 비어 버린다).
+    assert "FROM post_search_documents AS post_search_documents_1" in sql
+
+
+def test_ranked_search_skips_hashtag_and_termless_queries():
+    assert _ranked_search_query("#불닭") is None
+    assert _ranked_search_query("!!!") is None
+    assert _ranked_search_query(None) is None
+
+
+def test_search_engine_setting_rejects_typos():
+    assert Settings(POST_SEARCH_ENGINE=" ILIKE ").POST_SEARCH_ENGINE == "ilike"
+    with pytest.raises(ValidationError):
+        Settings(POST_SEARCH_ENGINE="rankd")
+
+
+class _Rows(list):
+    def all(self):
+        return list(self)
+
+
+class _MigrationBind:
+    """마이그레이션 백필 문장을 PG 방언으로 컴파일해 기록하고, 준비한 SELECT 결과를 순서대로 돌려준다."""
+
+    def __init__(self, results: list[list]) -> None:
+        self._results = results
+        self.sql: list[str] = []
+
+    def execute(self, stmt):
+        self.sql.append(str(stmt.compile(dialect=postgresql.dialect())))
+        return None if stmt.is_insert else _Rows(self._results.pop(0))
+
+
+def test_search_document_migration_backfills_existing_posts(monkeypatch):
+    # 배포 직후 ranked 검색에서 기존 글이 빠지지 않도록 마이그레이션이 문서를 채운다.
+    path = Path(__file__).resolve().parents[2] / "migrations/versions/013_post_search_documents.py"
+    spec = importlib.util.spec_from_file_location("_mig_013_post_search_documents", path)
+    assert spec is not None and spec.loader is not None
+    mig = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mig)
+    newer, older = uuid.uuid4(), uuid.uuid4()
+    posts = [
+        SimpleNamespace(id=newer, title="카보불닭", content="c"),
+        SimpleNamespace(id=older, title="t", content="c"),
+    ]
+    bind = _MigrationBind([posts, [(newer, "레시피")], []])
+    monkeypatch.setattr(mig, "_BACKFILL_BATCH", 2)
+    monkeypatch.setattr(
+        mig,
+        "op",
+        SimpleNamespace(
+            create_table=lambda *a, **kw: None,
+            create_index=lambda *a, **kw: None,
+            get_bind=lambda: bind,
+        ),
+    )
+
+    mig.upgrade()
+
+    posts_sql, tags_sql, insert_sql, next_sql = bind.sql
+    assert "posts.deleted_at IS NULL" in posts_sql and "posts.id <" not in posts_sql
+    assert "post_hashtags.post_id IN" in tags_sql
+    assert insert_sql.startswith("INSERT INTO post_search_documents")
+    assert "setweight" in insert_sql and "ON CONFLICT (post_id) DO NOTHING" in insert_sql
+    # 다음 배치는 직전 배치 마지막 id 아래로 keyset.
+    assert "posts.id < " in next_sql
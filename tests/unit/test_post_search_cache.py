@@ -0,0 +1,150 @@
+"""검색 결과 캐시 단위 테스트.
+
+정규화된 토큰 집합으로 키를 잡아 첫 페이지들의 id만 담고, 히트마다 페이지 분량만 하이드레이션하며,
+글 작성·수정·삭제는 글이 걸릴 수 있는 term에 등록된 검색어만 끊는지 검증한다.
+"""
+
+import uuid
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+import pytest
+from app.core import metrics
+from app.domain.posts import post_cache as pc
+from app.domain.posts.services import post_service as ps
+
+from tests.unit.fakes import FakeDB, FakeRedis, as_session
+
+pytestmark = pytest.mark.asyncio
+
+
+def _fake_post():
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        title="t",
+        content="c",
+        view_count=0,
+        like_count=0,
+        comment_count=0,
+        author=SimpleNamespace(id=uuid.uuid4(), nickname="n", status="ACTIVE"),
+        files=[],
+        category_id=None,
+        hashtags=[],
+        version=1,
+        created_at=datetime.now(UTC),
+    )
+
+
+def _patch_db(monkeypatch, posts):
+    calls = {"search": 0, "hydrate": [], "db_fallback": 0}
+
+    async def _search_ids(cls, limit, *, db, search_q, category_id=None, ranked_search=False):
+        calls["search"] += 1
+        return [p.id for p in posts][:limit]
+
+    async def _by_ids(cls, post_ids, *, db, blocked_ids=()):
+        calls["hydrate"].append(list(post_ids))
+        return [p for p in posts if p.id in post_ids]
+
+    async def _get_all(cls, size=20, *, db, **kw):
+        calls["db_fallback"] += 1
+        return []
+
+    # 가짜 글은 Post 엔티티 모양 — ORM 하이드레이션 경로로 고정(Core 행 변환은 test_post_list_projection).
+    monkeypatch.setattr(ps.settings, "POST_LIST_HYDRATION", "orm")
+    monkeypatch.setattr(ps.PostsModel, "get_search_post_ids", classmethod(_search_ids))
+    monkeypatch.setattr(ps.PostsModel, "get_list_posts_by_ids", classmethod(_by_ids))
+    monkeypatch.setattr(ps.PostsModel, "get_all_posts", classmethod(_get_all))
+    return calls
+
+
+async def _search(r, q, *, size=10, cursor=None):
+    return await ps.PostService.get_posts(
+        size, as_session(FakeDB()), q=q, cursor=cursor, redis_client=r
+    )
+
+
+def _hits() -> float:
+    # L1이 켜져 있으면 두 번째 조회는 l1_hit — 어느 층이든 검색을 다시 돌리지 않았으면 히트.
+    return sum(
+        metrics.CACHE_EVENTS.labels(cache="post_search", result=r)._value.get()
+        for r in ("hit", "l1_hit")
+    )
+
+
+async def test_same_token_set_hits_cached_ids_and_hydrates_page_only(monkeypatch):
+    posts = [_fake_post() for _ in range(15)]
+    calls = _patch_db(monkeypatch, posts)
+    r = FakeRedis()
+    before = _hits()
+
+    first, more = await _search(r, "산책 강아지")
+    second, _ = await _search(r, "  강아지   산책 ")  # 순서·공백만 다른 같은 토큰 집합
+
+    assert calls["search"] == 1
+    assert _hits() == before + 1
+    assert [p.id for p in first] == [p.id for p in second] == [p.id for p in posts[:10]]
+    assert more is True
+    assert all(len(ids) == 11 for ids in calls["hydrate"])  # 행이 아니라 size+1 id만 적재
+    assert pc.post_search_cache_key("ranked", None, "강아지 산책") in r.kv
+
+
+async def test_cursor_inside_pool_is_served_outside_falls_back(monkeypatch):
+    posts = [_fake_post() for _ in range(pc.POST_SEARCH_POOL_SIZE + 5)]
+    calls = _patch_db(monkeypatch, posts)
+    r = FakeRedis()
+
+    page, more = await _search(r, "산책", cursor=posts[9].id)
+    assert [p.id for p in page] == [p.id for p in posts[10:20]] and more is True
+    assert calls["db_fallback"] == 0
+
+    await _search(r, "산책", cursor=uuid.uuid4())
+    assert calls["db_fallback"] == 1
+
+
+async def test_write_invalidates_only_queries_sharing_a_term(monkeypatch):
+    _patch_db(monkeypatch, [_fake_post()])
+    r = FakeRedis()
+    await _search(r, "산책")
+    await _search(r, "사료")
+    await _search(r, "#말티즈")
+
+    async def _create(cls, *a, db, **kw):
+        return uuid.uuid4()
+
+    monkeypatch.setattr(ps.PostsModel, "create_post", classmethod(_create))
+    data = ps.PostCreateRequest(title="공원 산책 후기", content="c", hashtags=["말티즈"])
+    await ps.PostService.create_post(uuid.uuid4(), data, as_session(FakeDB()), redis=r)
+
+    assert pc.post_search_cache_key("ranked", None, "산책") not in r.kv
+    assert pc.post_search_cache_key("ranked", None, "#말티즈") not in r.kv
+    assert pc.post_search_cache_key("ranked", None, "사료") in r.kv
+
+
+async def test_write_terms_cover_every_index_term_a_matching_post_can_hit():
+    terms = pc.post_search_write_terms("카보불닭 Puppy", "본문", ["말티즈"])
+    for q in ("불닭", "카보불닭", "pupp", "puppy", "#말티즈", "말티즈", "불a"):
+        assert pc.post_search_index_term(q) in terms, q
+    assert pc.post_search_index_term("사료") not in terms
+
+
+async def test_ilike_engine_results_are_invalidated_by_any_write(monkeypatch):
+    """ILIKE는 부분 문자열 일치("uppy"→"puppy") — term 인덱스로는 못 찾으니 글 쓰기마다 통째로 끊는다."""
+    _patch_db(monkeypatch, [_fake_post()])
+    monkeypatch.setattr(ps.settings, "POST_SEARCH_ENGINE", "ilike")
+    r = FakeRedis()
+    await _search(r, "uppy")
+    await _search(r, "#말티즈")
+    assert pc.post_search_cache_key("ilike", None, "uppy") in r.kv
+
+    async def _create(cls, *a, db, **kw):
+        return uuid.uuid4()
+
+    monkeypatch.setattr(ps.PostsModel, "create_post", classmethod(_create))
+    data = ps.PostCreateRequest(title="my puppy", content="c", hashtags=[])
+    await ps.PostService.create_post(uuid.uuid4(), data, as_session(FakeDB()), redis=r)
+
+    assert pc.post_search_cache_key("ilike", None, "uppy") not in r.kv
+    assert (
+        pc.post_search_cache_key("ilike", None, "#말티즈") in r.kv
+    )  # 태그는 정확 일치 — term 인덱스
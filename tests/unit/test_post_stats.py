@@ -0,0 +1,98 @@
+"""post_stats 분리(ADR 0024) 단위 테스트.
+
+카운터가 posts에서 빠지고 보조 인덱스 없는 테이블에 있는지, 마이그레이션이 백필 전에 fillfactor를
+거는지, 카운터 갱신 문장이 post_stats만 쓰고 posts.updated_at을 건드리지 않는지, ORM Post가 카운터를
+stats 행에 위임하는지 검증한다.
+"""
+
+import importlib.util
+import uuid
+from pathlib import Path
+from types import SimpleNamespace
+from typing import cast
+
+import pytest
+from app.domain.posts.model import Post, PostStats
+from app.domain.posts.repository import PostsModel
+from sqlalchemy import Table
+from sqlalchemy.dialects import postgresql
+
+from tests.unit.fakes import FakeDB, as_session
+
+_COUNTERS = {"view_count", "like_count", "comment_count", "report_count"}
+
+
+class _Result:
+    rowcount = 1
+
+    def one_or_none(self):
+        return (1,)
+
+    def scalar_one_or_none(self):
+        return uuid.uuid4()
+
+
+class _SqlDB(FakeDB):
+    def __init__(self) -> None:
+        self.sql: list[str] = []
+
+    async def execute(self, stmt):
+        self.sql.append(str(stmt.compile(dialect=postgresql.dialect())))
+        return _Result()
+
+
+def test_counters_live_in_narrow_hot_friendly_table():
+    assert not _COUNTERS & set(Post.__table__.c.keys())
+    assert _COUNTERS <= set(PostStats.__table__.c.keys())
+    # 보조 인덱스가 없어야 카운터 UPDATE가 HOT 갱신이 될 수 있다.
+    stats_table = cast(Table, PostStats.__table__)
+    assert not stats_table.indexes
+
+
+def test_migration_sets_fillfactor_before_backfill(monkeypatch):
+    # 테이블 단위 postgresql_with는 SQLAlchemy 2.1 전용 — 고정 버전(2.0)에서도 뜨도록 ALTER로 건다.
+    path = Path(__file__).resolve().parents[2] / "migrations/versions/015_post_stats.py"
+    spec = importlib.util.spec_from_file_location("_mig_015_post_stats", path)
+    assert spec is not None and spec.loader is not None
+    mig = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mig)
+    calls: list[str] = []
+    monkeypatch.setattr(
+        mig,
+        "op",
+        SimpleNamespace(
+            create_table=lambda name, *cols, **kw: calls.append(f"create {name} {sorted(kw)}"),
+            execute=lambda sql: calls.append(str(sql)),
+            drop_column=lambda table, name: None,
+        ),
+    )
+
+    mig.upgrade()
+
+    assert calls[0] == "create post_stats []"
+    assert calls[1] == "ALTER TABLE post_stats SET (fillfactor = 50)"
+    assert calls[2].startswith("INSERT INTO post_stats")
+
+
+def test_post_delegates_counters_to_stats_row():
+    post = Post(title="t", report_count=3)
+    assert post.stats is not None and post.stats.report_count == 3
+    assert (post.like_count, post.view_count) == (0, 0)
+
+
+@pytest.mark.asyncio
+async def test_counter_updates_touch_only_post_stats():
+    db = _SqlDB()
+    pid = uuid.uuid4()
+    session = as_session(db)
+    await PostsModel.increment_like_count(pid, db=session)
+    await PostsModel.decrement_comment_count(pid, db=session)
+    await PostsModel.increment_view_counts_bulk([(pid, 2)], db=session)
+    await PostsModel.apply_counter_deltas_bulk([(pid, 1, -1)], db=session)
+    await PostsModel.increment_report_count(pid, db=session)
+
+    for sql in db.sql:
+        assert sql.startswith("UPDATE post_stats SET")
+        assert "updated_at" not in sql
+    # 삭제된 글 제외가 필요한 경로는 posts를 읽기만 한다(FROM 조인).
+    assert "FROM posts WHERE" in db.sql[-1] and "posts.deleted_at IS NULL" in db.sql[-1]
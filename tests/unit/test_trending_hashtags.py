@@ -0,0 +1,115 @@
+"""트렌딩 해시태그 시간 버킷 카운터 단위 테스트.
+
+글 작성 시각 버킷에 ±1이 쌓이고, 읽기가 창 버킷 합 상위 K개만 돌려주며, 재빌드 전·Redis 부재에는
+같은 창의 SQL로 폴백하고, 블라인드 같은 공개 상태 전이만 감소를 내는지 검증한다.
+"""
+
+import time
+import uuid
+
+import pytest
+from app.domain.admin.service import AdminService
+from app.domain.posts import trending_hashtags as th
+from app.domain.posts.services import hashtag_service
+
+from tests.unit.fakes import FakeDB, FakeRedis, as_session
+
+pytestmark = pytest.mark.asyncio
+
+NOW = 1_760_000_000.0
+
+
+def _post_at(ts: float) -> uuid.UUID:
+    """작성 시각이 ts인 UUIDv7 흉내(상위 48비트 ms)."""
+    return uuid.UUID(int=(int(ts * 1000) << 80) | (uuid.uuid4().int & ((1 << 80) - 1)))
+
+
+async def _rebuild(r, rows=()):
+    async def _load(since_hour):
+        return list(rows)
+
+    return await th.rebuild_trending_hashtags(r, _load, now=NOW)
+
+
+async def _rows_now(since_hour):
+    return [(int(time.time() // 3600), "산책", 4)]
+
+
+async def test_bumps_land_in_creation_hour_and_window_read_merges_top_k():
+    r = FakeRedis()
+    assert await th.read_trending_hashtags(r, 10, now=NOW) is None  # 재빌드 전 → SQL 폴백
+    assert await _rebuild(r)
+
+    recent, earlier = _post_at(NOW - 60), _post_at(NOW - 5 * 3600)
+    await th.bump_trending_hashtags(r, recent, {"산책": 1, "간식": 1}, now=NOW)
+    await th.bump_trending_hashtags(r, earlier, {"산책": 1, "캠핑": 1}, now=NOW)
+    await th.bump_trending_hashtags(r, earlier, {"캠핑": -1}, now=NOW)
+    # 창 밖 글의 증감은 버킷을 만들지 않는다.
+    await th.bump_trending_hashtags(r, _post_at(NOW - 3 * 86400), {"옛날": 1}, now=NOW)
+
+    assert await th.read_trending_hashtags(r, 10, now=NOW) == [("산책", 2), ("간식", 1)]
+    assert await th.read_trending_hashtags(r, 1, now=NOW) == [("산책", 2)]
+    assert not any("옛날" in z for z in r.zsets.values())
+
+
+async def test_rebuild_replaces_buckets_once_and_marks_fresh():
+    r = FakeRedis()
+    hour = int(NOW // 3600)
+    post = _post_at(NOW - 60)
+    await th.bump_trending_hashtags(r, post, {"유령": 1}, now=NOW)
+    assert not await th.trending_hashtags_fresh(r)
+
+    assert await _rebuild(r, [(hour, "산책", 3), (hour - 2, "간식", 1), (hour - 100, "창밖", 9)])
+
+    assert await th.read_trending_hashtags(r, 10, now=NOW) == [("산책", 3), ("간식", 1)]
+    assert await th.trending_hashtags_fresh(r)
+    r.kv[th._REBUILD_LOCK_KEY] = "1"  # 다른 인스턴스가 재빌드 중
+    assert not await _rebuild(r)
+
+
+async def test_service_reads_redis_when_seeded_and_windowed_sql_otherwise(monkeypatch):
+    sql_calls: list[int | None] = []
+
+    async def _sql(cls, *, db, limit=10, since_hour=None):
+        sql_calls.append(since_hour)
+        return [("sql", 1)]
+
+    monkeypatch.setattr(hashtag_service.PostsModel, "get_trending_hashtags", classmethod(_sql))
+    svc = hashtag_service.HashtagService
+
+    cold = await svc._compute_trending(as_session(FakeDB()), FakeRedis(), 10)
+    assert [t.name for t in cold] == ["sql"]
+    assert sql_calls == [th.trending_window_start_hour(time.time())]
+
+    r = FakeRedis()
+    await th.rebuild_trending_hashtags(r, _rows_now)
+    warm = await svc._compute_trending(as_session(FakeDB()), r, 10)
+    assert [(t.name, t.count) for t in warm] == [("산책", 4)]
+    assert len(sql_calls) == 1
+
+
+async def test_blind_decrements_only_on_visibility_transition(monkeypatch):
+    r = FakeRedis()
+    await th.rebuild_trending_hashtags(r, _rows_now)
+    post = _post_at(time.time())
+    public: dict[uuid.UUID, list[str]] = {post: ["산책"]}
+
+    async def _public_tags(cls, post_id, db):
+        return public.get(post_id)
+
+    async def _set_blinded(cls, post_id, db):
+        public.pop(post_id, None)
+        return True
+
+    async def _category_id(cls, post_id, db):
+        return None
+
+    posts_model = hashtag_service.PostsModel
+    monkeypatch.setattr(posts_model, "get_public_hashtag_names", classmethod(_public_tags))
+    monkeypatch.setattr(posts_model, "set_blinded", classmethod(_set_blinded))
+    monkeypatch.setattr(posts_model, "get_post_category_id", classmethod(_category_id))
+
+    await AdminService.blind_post(post, db=as_session(FakeDB()), redis=r)
+    await AdminService.blind_post(post, db=as_session(FakeDB()), redis=r)  # 이미 블라인드
+
+    assert await th.read_trending_hashtags(r, 10) == [("산책", 3)]
@@ -9,12 +9,12 @@ from typing import cast
 from uuid import uuid4
 
 from app.core import metrics
-from app.domain.posts.repository import PostsModel
 from app.domain.posts.services.trending_post_service import (
     _POOL_ADAPTER,
     TrendingPostService,
     _TrendingCacheItem,
 )
+from app.domain.users.model import UsersModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from tests.unit.fakes import FakeDB
@@ -63,9 +63,9 @@ def test_block_overlay_filters_blocked_authors(monkeypatch):
     redis = _HitRedis(_pool(*items))
 
     async def _fake_blocked(cls, blocker_id, *, db):
-        return {blocked}
+        return [blocked]
 
-    monkeypatch.setattr(PostsModel, "get_blocked_author_ids", classmethod(_fake_blocked))
+    monkeypatch.setattr(UsersModel, "get_blocked_user_ids", classmethod(_fake_blocked))
 
     result = asyncio.run(
         TrendingPostService.get_trending_posts(
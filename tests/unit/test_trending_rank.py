@@ -0,0 +1,155 @@
+"""실시간 트렌딩 ZSET 단위 테스트.
+
+Lua 본문은 실 Redis 몫이라 여기선 점수 수학(로그 공간 누적·재채점 불필요)·창 필터·Lua 인자 조립과
+TrendingPostService의 ZSET 우선 읽기 → SQL 폴백·시딩 wiring을 결정적으로 검증한다.
+"""
+
+import math
+import random
+import time
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from app.domain.posts import trending_rank as tr
+from app.domain.posts.repository import PostsModel
+from app.domain.posts.services.trending_post_service import TrendingPostService, _TrendingCacheItem
+
+from tests.unit.fakes import FakeDB, FakeRedis, as_session
+
+pytestmark = pytest.mark.asyncio
+
+
+def _uuid7_at(seconds: float) -> uuid.UUID:
+    ms = int(seconds * 1000)
+    return uuid.UUID(int=(ms << 80) | (0x7 << 76) | random.getrandbits(62))
+
+
+class _RecordingRedis(FakeRedis):
+    def __init__(self) -> None:
+        super().__init__()
+        self.evals: list[tuple[str, tuple]] = []
+
+    async def eval(self, script, numkeys, *args):
+        self.evals.append((script, args))
+        return 0
+
+
+def _lse(a: float, b: float) -> float:
+    hi = max(a, b)
+    return hi + math.log(math.exp(a - hi) + math.exp(b - hi))
+
+
+async def test_log_score_order_is_time_invariant():
+    """같은 가중치면 τ·ln2 늦은 이벤트는 2배 가중치와 동점 — 시간이 흘러도 재채점 불필요."""
+    t0 = time.time()
+    early_double = tr._log_score(2.0, t0)
+    late_single = tr._log_score(1.0, t0 - tr._DECAY_SECONDS * math.log(2))
+    assert math.isclose(early_double, tr._log_score(1.0, t0) + math.log(2))
+    assert late_single < early_double
+    # 로그 공간 누적 = ln(Σ w·e^{t/τ}) — 두 번 누적한 1은 한 번의 2와 같다
+    assert math.isclose(_lse(tr._log_score(1.0, t0), tr._log_score(1.0, t0)), early_double)
+
+
+async def test_post_created_at_reads_uuid7_timestamp():
+    now = time.time()
+    assert abs(tr.post_created_at_seconds(_uuid7_at(now)) - now) < 0.002
+
+
+async def test_bump_skips_posts_outside_window():
+    now = time.time()
+    fresh, stale = _uuid7_at(now - 60), _uuid7_at(now - tr.TRENDING_WINDOW_SECONDS - 60)
+    r = _RecordingRedis()
+
+    await tr.bump_trending(r, {fresh: tr.LIKE_WEIGHT, stale: tr.LIKE_WEIGHT}, now=now)
+
+    ((script, args),) = r.evals
+    assert script is tr._BUMP_LUA
+    assert args[:3] == (
+        tr.TRENDING_ALL_KEY,
+        tr.TRENDING_POST_CATEGORY_KEY,
+        tr.TRENDING_CATEGORY_KEY_PREFIX,
+    )
+    assert args[3:] == (str(fresh), repr(tr._log_score(tr.LIKE_WEIGHT, now)))
+
+
+async def test_bump_fails_open():
+    class _Down(FakeRedis):
+        async def eval(self, script, numkeys, *args):
+            raise ConnectionError("redis down")
+
+    await tr.bump_trending(_Down(), {_uuid7_at(time.time()): 1.0})  # 예외 전파 없음
+
+
+async def test_service_reads_zset_order_without_sql(monkeypatch):
+    now = time.time()
+    ids = [_uuid7_at(now - i) for i in range(4)]
+    r = FakeRedis()
+    r.zsets[tr.TRENDING_ALL_KEY] = {str(pid): float(10 - i) for i, pid in enumerate(ids)}
+
+    async def _by_ids(cls, post_ids, db):
+        # 반환 순서는 ZSET 순서와 무관(IN 조회) — 서비스가 점수 순으로 재정렬해야 한다.
+        return [
+            SimpleNamespace(
+                id=pid,
+                title=str(pid),
+                category_id=None,
+                comment_count=0,
+                like_count=0,
+                view_count=0,
+                user_id=None,
+            )
+            for pid in reversed(post_ids)
+            if pid != ids[1]  # 삭제·블라인드된 글은 하이드레이션에서 빠진다
+        ]
+
+    async def _sql(cls, **kw):
+        raise AssertionError("ZSET이 충분하면 SQL 재계산을 타지 않는다")
+
+    monkeypatch.setattr(PostsModel, "get_visible_posts_by_ids", classmethod(_by_ids))
+    monkeypatch.setattr(PostsModel, "get_trending_posts", classmethod(_sql))
+
+    pool = await TrendingPostService._load_pool(r, db=as_session(FakeDB()), category_id=None)
+
+    assert [it.id for it in pool] == [ids[0], ids[2], ids[3]]
+
+
+async def test_sparse_zset_falls_back_to_sql_and_seeds_window_posts(monkeypatch):
+    now = time.time()
+    fresh, old = _uuid7_at(now - 60), _uuid7_at(now - 3 * 24 * 3600)
+    items = [
+        _TrendingCacheItem(id=fresh, title="new", category_id=2, like_count=1),
+        _TrendingCacheItem(id=old, title="old", category_id=None, comment_count=5),
+    ]
+
+    async def _pool(cls, *, db, category_id):
+        return items
+
+    monkeypatch.setattr(TrendingPostService, "_compute_pool", classmethod(_pool))
+    r = _RecordingRedis()
+
+    pool = await TrendingPostService._load_pool(r, db=as_session(FakeDB()), category_id=None)
+
+    assert pool == items
+    ((script, args),) = r.evals
+    assert script is tr._SEED_LUA
+    # 24h 창 밖(7일 fallback 결과)은 시딩하지 않는다
+    assert args[3:] == (
+        str(fresh),
+        repr(tr._log_score(tr.LIKE_WEIGHT, tr.post_created_at_seconds(fresh))),
+        "2",
+    )
+
+
+async def test_compact_passes_cold_floor_and_window_cutoff():
+    now = 1_800_000_000.0
+    r = _RecordingRedis()
+
+    await tr.compact_trending(r, now=now)
+
+    ((script, args),) = r.evals
+    assert script is tr._COMPACT_LUA
+    assert args[3:] == (
+        repr(tr._log_score(tr._COLD_WEIGHT, now)),
+        str(int((now - tr.TRENDING_WINDOW_SECONDS) * 1000)),
+    )
@@ -0,0 +1,78 @@
+"""사용자별 차단 집합 캐시 단위 테스트(ADR 0019).
+
+차단 필터가 NOT EXISTS(user_blocks) 상관 서브쿼리 대신 배열 파라미터 하나(`<> ALL`)로 컴파일되고
+빈 집합이면 빠지는지, 집합이 캐시 히트로 DB 없이 재사용되는지, 차단 토글이 커밋 후 키를 끊는지 검증한다.
+"""
+
+import uuid
+
+import pytest
+from app.domain.posts.model import Post
+from app.domain.users import block_cache
+from app.domain.users.model import UsersModel, author_not_blocked
+from app.domain.users.service import UserService
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from tests.unit.fakes import FakeDB, FakeRedis, RecordingDB, as_session
+
+pytestmark = pytest.mark.asyncio
+
+
+def _patch_blocked(monkeypatch, ids: list[uuid.UUID]) -> list[uuid.UUID]:
+    calls: list[uuid.UUID] = []
+
+    async def _load(cls, blocker_id, *, db):
+        calls.append(blocker_id)
+        return list(ids)
+
+    monkeypatch.setattr(UsersModel, "get_blocked_user_ids", classmethod(_load))
+    return calls
+
+
+async def test_filter_is_array_parameter_and_dropped_when_empty():
+    assert author_not_blocked(Post.user_id, ()) is None
+
+    cond = author_not_blocked(Post.user_id, {uuid.uuid4(), uuid.uuid4()})
+    assert cond is not None
+    sql = str(select(Post.id).where(cond).compile(dialect=postgresql.dialect()))
+    assert "posts.user_id IS NULL" in sql and "!= ALL" in sql
+    assert "user_blocks" not in sql
+
+
+async def test_blocked_set_is_cached_per_user(monkeypatch):
+    blocked = [uuid.uuid4()]
+    calls = _patch_blocked(monkeypatch, blocked)
+    r, reader = FakeRedis(), RecordingDB()
+    user_id = uuid.uuid4()
+
+    first = await block_cache.get_blocked_user_ids(user_id, db=as_session(reader), redis=r)
+    second = await block_cache.get_blocked_user_ids(user_id, db=as_session(reader), redis=r)
+
+    assert first == second == frozenset(blocked)
+    assert calls == [user_id] and reader.begin_count == 1
+    assert block_cache.user_blocks_cache_key(user_id) in r.kv
+    # 비로그인은 조회 없이 빈 집합.
+    assert await block_cache.get_blocked_user_ids(None, db=as_session(reader), redis=r) == set()
+
+
+async def test_toggle_invalidates_blocker_key(monkeypatch):
+    blocker, target = uuid.uuid4(), uuid.uuid4()
+    calls = _patch_blocked(monkeypatch, [])
+    r = FakeRedis()
+    await block_cache.get_blocked_user_ids(blocker, db=as_session(FakeDB()), redis=r)
+
+    async def _exists(cls, blocker_id, blocked_id, db):
+        return False
+
+    async def _block(cls, blocker_id, blocked_id, db):
+        return None
+
+    monkeypatch.setattr(UsersModel, "block_exists", classmethod(_exists))
+    monkeypatch.setattr(UsersModel, "block_user", classmethod(_block))
+
+    assert await UserService.toggle_block_user(blocker, target, as_session(FakeDB()), redis=r)
+    assert block_cache.user_blocks_cache_key(blocker) not in r.kv
+
+    await block_cache.get_blocked_user_ids(blocker, db=as_session(FakeDB()), redis=r)
+    assert calls == [blocker, blocker]  # 무효화 후 다음 읽기는 다시 적재
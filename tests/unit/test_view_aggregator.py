@@ -0,0 +1,147 @@
+"""워커 내 조회수 사전 집계기 단위 테스트.
+
+조회는 메모리에만 합산되고 flush 틱에 파이프라인 1회로 샤드 버퍼에 나가며, Redis 불능이면
+상한·나이까지 모았다가 DB에 일괄 spill하고, 종료 시 남은 delta를 비우는지 검증한다.
+"""
+
+import asyncio
+import uuid
+
+import pytest
+from app.core.config import settings
+from app.domain.posts import view_buffer as vb
+from app.domain.posts.services import post_service as ps
+
+from tests.unit.fakes import FakeDB, FakeRedis, RecordingDB, as_session
+
+pytestmark = pytest.mark.asyncio
+
+
+class _CountingRedis(FakeRedis):
+    def __init__(self) -> None:
+        super().__init__()
+        self.hincrby_calls = 0
+        self.pipelines = 0
+
+    async def hincrby(self, key, field, n):
+        self.hincrby_calls += 1
+        return await super().hincrby(key, field, n)
+
+    def pipeline(self, *, transaction=True):
+        self.pipelines += 1
+        return super().pipeline(transaction=transaction)
+
+
+class _DownRedis(FakeRedis):
+    def pipeline(self, *, transaction=True):
+        raise ConnectionError("redis down")
+
+
+class _Conn:
+    async def __aenter__(self):
+        return FakeDB()
+
+    async def __aexit__(self, *a):
+        return False
+
+
+def _patch_db(monkeypatch) -> list[dict[uuid.UUID, int]]:
+    statements: list[dict[uuid.UUID, int]] = []
+
+    async def _bulk(cls, deltas, db):
+        statements.append(dict(deltas))
+        return len(deltas)
+
+    monkeypatch.setattr(ps.PostsModel, "increment_view_counts_bulk", classmethod(_bulk))
+    monkeypatch.setattr("app.db.session.get_connection", lambda: _Conn())
+    return statements
+
+
+def _running() -> vb.ViewAggregator:
+    agg = vb.ViewAggregator()
+    agg._running = True
+    return agg
+
+
+async def test_views_are_summed_in_memory_and_pushed_in_one_pipeline(monkeypatch):
+    monkeypatch.setattr(settings, "VIEW_CACHE_TTL_SECONDS", 0)
+    agg = _running()
+    monkeypatch.setattr(ps, "view_aggregator", agg)
+    r = _CountingRedis()
+    p1, p2 = uuid.uuid4(), uuid.uuid4()
+
+    for pid in (p1, p1, p1, p2):
+        applied_db, _ = await ps._apply_view_increment(pid, "u:1", r, as_session(RecordingDB()))
+        assert applied_db is False
+    assert r.hincrby_calls == 0  # 조회 경로는 버퍼에 쓰지 않는다(dedup·pending 읽기만)
+    assert agg.pending(p1) == 3
+
+    await agg.flush(r)
+
+    assert r.pipelines == 1 and r.hincrby_calls == 2  # 글당 1 HINCRBY, 왕복 1회
+    assert await ps._get_buffer_pending(r, p1) == 3
+    assert await ps._get_buffer_pending(r, p2) == 1
+    assert agg.pending(p1) == 0
+
+
+async def test_redis_outage_accumulates_then_spills_once_at_bound(monkeypatch):
+    """Redis 불능이면 버리지 않고 보관 — 상한 전엔 DB 무접촉, 상한 도달 시 청크 UPDATE 1회."""
+    monkeypatch.setattr(settings, "VIEW_AGGREGATOR_MAX_POSTS", 3)
+    monkeypatch.setattr(settings, "VIEW_AGGREGATOR_SPILL_SECONDS", 3600)
+    statements = _patch_db(monkeypatch)
+    agg = _running()
+    r = _DownRedis()
+    pids = [uuid.uuid4() for _ in range(3)]
+
+    agg.add(pids[0])
+    agg.add(pids[0])
+    agg.add(pids[1])
+    await agg.flush(r)
+    assert statements == []
+    assert agg.pending(pids[0]) == 2  # push 실패분이 되돌아왔다
+
+    agg.add(pids[2])
+    await agg.flush(r)
+
+    assert statements == [{pids[0]: 2, pids[1]: 1, pids[2]: 1}]
+    assert all(agg.pending(pid) == 0 for pid in pids)
+
+
+async def test_spill_triggers_on_age_and_keeps_deltas_when_db_fails(monkeypatch):
+    monkeypatch.setattr(settings, "VIEW_AGGREGATOR_SPILL_SECONDS", 1)
+    agg = _running()
+    pid = uuid.uuid4()
+    agg.add(pid)
+    assert agg._oldest is not None
+    agg._oldest -= 5  # 5초 묵은 delta
+
+    async def _boom(cls, deltas, db):
+        raise RuntimeError("db down")
+
+    monkeypatch.setattr(ps.PostsModel, "increment_view_counts_bulk", classmethod(_boom))
+    monkeypatch.setattr("app.db.session.get_connection", lambda: _Conn())
+    await agg.flush(None)
+    assert agg.pending(pid) == 1  # DB도 실패면 유실 없이 다음 틱으로
+
+    statements = _patch_db(monkeypatch)
+    await agg.flush(None)
+    assert statements == [{pid: 1}]
+
+
+async def test_run_drains_pending_on_shutdown(monkeypatch):
+    """stop 후 남은 delta를 비우고, 이후 조회는 폴백 경로(add False)로 돌린다."""
+    monkeypatch.setattr(settings, "VIEW_AGGREGATOR_FLUSH_INTERVAL_MS", 60_000)
+    statements = _patch_db(monkeypatch)
+    agg = vb.ViewAggregator()
+    stop = asyncio.Event()
+    task = asyncio.create_task(agg.run(stop, None))
+    await asyncio.sleep(0)
+    pid = uuid.uuid4()
+    assert agg.add(pid) is True
+
+    stop.set()
+    agg.wake()
+    await task
+
+    assert statements == [{pid: 1}]  # Redis 없음 → 나이·상한 무관 DB spill
+    assert agg.add(pid) is False
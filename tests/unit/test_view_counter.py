@@ -29,13 +29,24 @@ def _fake_get_connection():
     return _FakeConn()
 
 
+async def _buffer_view(post_id: uuid.UUID, r: FakeRedis) -> None:
+    """버퍼에 조회 1건을 직접 쌓는다(flush 테스트 준비용)."""
+    await r.hincrby(ps.view_buffer_key(ps.view_shard_for(post_id)), str(post_id), 1)
+
+
+def _lock_key(post_id: uuid.UUID) -> str:
+    return ps.view_flush_lock_key(ps.view_shard_for(post_id))
+
+
 def _patch_db(monkeypatch, on_delta):
     """flush_view_counts_to_db의 DB 쓰기 경로를 가로챈다."""
 
-    async def _delta(cls, post_id, delta, db):
-        return await on_delta(post_id, delta)
+    async def _bulk(cls, deltas, db):
+        for post_id, delta in deltas:
+            await on_delta(post_id, delta)
+        return len(deltas)
 
-    monkeypatch.setattr(ps.PostsModel, "increment_view_count_delta", classmethod(_delta))
+    monkeypatch.setattr(ps.PostsModel, "increment_view_counts_bulk", classmethod(_bulk))
     monkeypatch.setattr("app.db.session.get_connection", _fake_get_connection)
 
 
@@ -46,10 +57,10 @@ async def test_dedup_blocks_repeat_viewer(monkeypatch):
     )  # 환경(.env TTL 0) 무관하게 dedup 켬
     r = FakeRedis()
     pid = uuid.uuid4()
-    assert await ps._consume_view_if_new_redis(pid, "u:1", r) is True
-    assert await ps._consume_view_if_new_redis(pid, "u:1", r) is False
+    assert await ps._account_view_redis(pid, "u:1", r, increment=True) == (True, True, 1)
+    assert await ps._account_view_redis(pid, "u:1", r, increment=True) == (False, False, 1)
     # 다른 viewer는 독립적으로 허용
-    assert await ps._consume_view_if_new_redis(pid, "u:2", r) is True
+    assert await ps._account_view_redis(pid, "u:2", r, increment=True) == (True, True, 2)
 
 
 async def test_dedup_disabled_when_ttl_zero(monkeypatch):
@@ -57,31 +68,39 @@ async def test_dedup_disabled_when_ttl_zero(monkeypatch):
     monkeypatch.setattr(settings, "VIEW_CACHE_TTL_SECONDS", 0)
     r = FakeRedis()
     pid = uuid.uuid4()
-    assert await ps._consume_view_if_new_redis(pid, "u:1", r) is True
-    assert await ps._consume_view_if_new_redis(pid, "u:1", r) is True
+    assert await ps._account_view_redis(pid, "u:1", r, increment=True) == (True, True, 1)
+    assert await ps._account_view_redis(pid, "u:1", r, increment=True) == (True, True, 2)
     assert r.kv == {}  # dedup 키를 만들지 않는다(Redis 무접촉)
 
 
-async def test_buffer_accumulates_pending():
+async def test_account_without_increment_only_dedups_and_reads_pending(monkeypatch):
+    """집계기 모드(increment=False): 버퍼는 건드리지 않고 현재 pending만 돌려준다."""
+    monkeypatch.setattr(settings, "VIEW_CACHE_TTL_SECONDS", 3600)
     r = FakeRedis()
     pid = uuid.uuid4()
-    assert await ps._try_view_increment_in_buffer(pid, r) is True
-    assert await ps._try_view_increment_in_buffer(pid, r) is True
-    assert await ps._get_buffer_pending(r, pid) == 2
+    await _buffer_view(pid, r)
+    assert await ps._account_view_redis(pid, "u:1", r, increment=False) == (True, False, 1)
+    assert await ps._get_buffer_pending(r, pid) == 1
 
 
-async def test_buffer_increment_fails_open_when_redis_down():
-    """redis_client None이면 버퍼 증가는 False(→ 호출부가 DB 직접 증가로 폴백)."""
+async def test_account_fails_open_when_redis_down():
+    """Redis 부재·오류면 (새 조회, 버퍼 미흡수, pending 0) → 호출부가 DB 직접 증가로 폴백."""
+
+    class _Down(FakeRedis):
+        async def eval(self, script, numkeys, *args):
+            raise ConnectionError("redis down")
+
     pid = uuid.uuid4()
-    assert await ps._try_view_increment_in_buffer(pid, None) is False
+    assert await ps._account_view_redis(pid, "u:1", None, increment=True) == (True, False, 0)
+    assert await ps._account_view_redis(pid, "u:1", _Down(), increment=True) == (True, False, 0)
 
 
 async def test_flush_applies_deltas_and_releases_lock(monkeypatch):
     r = FakeRedis()
     p1, p2 = uuid.uuid4(), uuid.uuid4()
-    await ps._try_view_increment_in_buffer(p1, r)
-    await ps._try_view_increment_in_buffer(p1, r)  # p1 = 2
-    await ps._try_view_increment_in_buffer(p2, r)  # p2 = 1
+    await _buffer_view(p1, r)
+    await _buffer_view(p1, r)  # p1 = 2
+    await _buffer_view(p2, r)  # p2 = 1
 
     recorded: dict[uuid.UUID, int] = {}
 
@@ -96,7 +115,7 @@ async def test_flush_applies_deltas_and_releases_lock(monkeypatch):
     assert recorded == {p1: 2, p2: 1}
     assert await ps._get_buffer_pending(r, p1) == 0  # 버퍼 비워짐
     assert await ps._get_buffer_pending(r, p2) == 0
-    assert ps.VIEW_FLUSH_LOCK_KEY not in r.kv  # 자기 락 해제됨
+    assert _lock_key(p1) not in r.kv  # 자기 락 해제됨
     # 커밋된 view 합(p1 2 + p2 1)이 메트릭에 반영됐다.
     assert ps.VIEW_BUFFER_FLUSHED_VIEWS._value.get() - flushed_before == 3
 
@@ -105,22 +124,22 @@ async def test_flush_noop_when_lock_held():
     """다른 워커가 락을 보유 중이면 flush는 아무 것도 하지 않고 즉시 반환."""
     r = FakeRedis()
     p1 = uuid.uuid4()
-    await ps._try_view_increment_in_buffer(p1, r)
-    r.kv[ps.VIEW_FLUSH_LOCK_KEY] = "other-worker"  # 선점
+    await _buffer_view(p1, r)
+    r.kv[_lock_key(p1)] = "other-worker"  # 선점
 
     await ps.PostService.flush_view_counts_to_db(r)
 
     # 버퍼는 그대로 남고, 남의 락도 건드리지 않는다.
     assert await ps._get_buffer_pending(r, p1) == 1
-    assert r.kv.get(ps.VIEW_FLUSH_LOCK_KEY) == "other-worker"
+    assert r.kv.get(_lock_key(p1)) == "other-worker"
 
 
 async def test_flush_merges_back_on_db_error(monkeypatch):
     """flush 중 DB 오류면 drain을 버퍼로 되돌리고(유실 방지) 예외를 올린다."""
     r = FakeRedis()
     p1 = uuid.uuid4()
-    await ps._try_view_increment_in_buffer(p1, r)
-    await ps._try_view_increment_in_buffer(p1, r)  # 2
+    await _buffer_view(p1, r)
+    await _buffer_view(p1, r)  # 2
 
     async def boom(post_id, delta):
         raise RuntimeError("db down")
@@ -130,15 +149,15 @@ async def test_flush_merges_back_on_db_error(monkeypatch):
         await ps.PostService.flush_view_counts_to_db(r)
 
     assert await ps._get_buffer_pending(r, p1) == 2  # 재병합됨
-    assert ps.VIEW_FLUSH_LOCK_KEY not in r.kv  # finally에서 자기 락 해제
+    assert _lock_key(p1) not in r.kv  # finally에서 자기 락 해제
 
 
 async def test_flush_no_double_count_when_drain_delete_fails(monkeypatch):
     """커밋 성공 후 drain 삭제만 실패해도 재병합하지 않는다(이미 반영된 delta 이중 집계 방지)."""
     r = FakeRedis(fail_delete_substr=":drain:")
     p1 = uuid.uuid4()
-    await ps._try_view_increment_in_buffer(p1, r)
-    await ps._try_view_increment_in_buffer(p1, r)  # 2
+    await _buffer_view(p1, r)
+    await _buffer_view(p1, r)  # 2
 
     calls: list[int] = []
 
@@ -152,25 +171,49 @@ async def test_flush_no_double_count_when_drain_delete_fails(monkeypatch):
 
     assert calls == [2]  # delta는 정확히 한 번만 반영
     assert await ps._get_buffer_pending(r, p1) == 0  # 버퍼로 되돌리지 않음(이중 집계 없음)
-    assert ps.VIEW_FLUSH_LOCK_KEY not in r.kv  # 락은 정상 해제
+    assert _lock_key(p1) not in r.kv  # 락은 정상 해제
 
 
 async def test_flush_does_not_release_foreign_lock(monkeypatch):
     """락 TTL 만료 후 다른 워커가 재획득한 상황: 우리 finally의 CAS는 남의 락을 지우면 안 된다(#2)."""
     r = FakeRedis()
     p1 = uuid.uuid4()
-    await ps._try_view_increment_in_buffer(p1, r)
+    await _buffer_view(p1, r)
 
     async def steal_then_write(post_id, delta):
         # 우리가 DB에 쓰는 사이 락이 만료돼 다른 워커가 재획득한 상황 재현
-        r.kv[ps.VIEW_FLUSH_LOCK_KEY] = "other-worker"
+        r.kv[_lock_key(p1)] = "other-worker"
         return True
 
     _patch_db(monkeypatch, steal_then_write)
     await ps.PostService.flush_view_counts_to_db(r)
 
     # 값이 다르므로 CAS DEL은 0을 반환하고 남의 락은 살아 있어야 한다.
-    assert r.kv.get(ps.VIEW_FLUSH_LOCK_KEY) == "other-worker"
+    assert r.kv.get(_lock_key(p1)) == "other-worker"
+
+
+async def test_flush_drains_each_shard_independently(monkeypatch):
+    """글은 post_id로 샤드 해시에 흩어지고, 한 샤드가 락 선점 중이어도 나머지 샤드는 flush된다."""
+    monkeypatch.setattr(settings, "VIEW_BUFFER_SHARDS", 4)
+    r = FakeRedis()
+    by_shard = {s: uuid.UUID(int=(1 << 100) + s) for s in range(4)}
+    for pid in by_shard.values():
+        await _buffer_view(pid, r)
+    assert {ps.view_shard_for(pid) for pid in by_shard.values()} == {0, 1, 2, 3}
+    assert len({ps.view_buffer_key(s) for s in range(4)} & r.hashes.keys()) == 4
+    r.kv[ps.view_flush_lock_key(2)] = "other-worker"
+
+    recorded: dict[uuid.UUID, int] = {}
+
+    async def on_delta(post_id, delta):
+        recorded[post_id] = delta
+        return True
+
+    _patch_db(monkeypatch, on_delta)
+    await ps.PostService.flush_view_counts_to_db(r)
+
+    assert recorded == {by_shard[s]: 1 for s in (0, 1, 3)}
+    assert await ps._get_buffer_pending(r, by_shard[2]) == 1  # 선점된 샤드만 남는다
 
 
 # ---- 조회수 증가 안무(_apply_view_increment) + GET 상세 경로 ----
@@ -202,7 +245,8 @@ def _patch_detail_load(monkeypatch, post):
 
 
 async def test_apply_view_increment_contract(monkeypatch):
-    """안무 계약: dedup 차단→False, 버퍼 흡수→False(DB 무접촉), 버퍼 실패→True(writer 직접)."""
+    """안무 계약(반환 = (writer 직접 증가, pending)): dedup 차단·버퍼 흡수→False(DB 무접촉),
+    버퍼 실패→True(writer 직접)."""
     monkeypatch.setattr(
         settings, "VIEW_CACHE_TTL_SECONDS", 3600
     )  # 환경(.env TTL 0) 무관하게 dedup 켬
@@ -218,14 +262,13 @@ async def test_apply_view_increment_contract(monkeypatch):
 
     writer = RecordingDB()
     # 첫 조회: 버퍼가 흡수 → DB 직접 증가 없음(False)
-    assert await ps._apply_view_increment(pid, "u:1", r, as_session(writer)) is False
-    assert await ps._get_buffer_pending(r, pid) == 1
-    # 같은 viewer 재조회: dedup 차단 → 버퍼도 DB도 무접촉(False)
-    assert await ps._apply_view_increment(pid, "u:1", r, as_session(writer)) is False
+    assert await ps._apply_view_increment(pid, "u:1", r, as_session(writer)) == (False, 1)
+    # 같은 viewer 재조회: dedup 차단 → 버퍼도 DB도 무접촉(False), pending은 그대로 읽힌다
+    assert await ps._apply_view_increment(pid, "u:1", r, as_session(writer)) == (False, 1)
     assert await ps._get_buffer_pending(r, pid) == 1
     assert writer.begin_count == 0 and incremented == []
     # Redis 불능: dedup fail-open + 버퍼 실패 → writer 직접 증가(True)
-    assert await ps._apply_view_increment(pid, "u:2", None, as_session(writer)) is True
+    assert await ps._apply_view_increment(pid, "u:2", None, as_session(writer)) == (True, 0)
     assert incremented == [pid]
     assert writer.begin_count == 1
 
@@ -281,3 +324,77 @@ async def test_get_post_detail_reflects_buffer_pending(monkeypatch):
     assert await ps._get_buffer_pending(r, pid) == 1
     assert writer.begin_count == 0  # 버퍼가 흡수 — writer 무접촉
     assert data.view_count == 11  # base 10 + pending 1
+
+
+async def test_get_post_detail_accounts_view_in_one_redis_round_trip(monkeypatch):
+    """스냅샷 히트 후 조회 계정(dedup·증가·pending)은 Redis 명령 1회(Lua)로 끝난다."""
+    pid = uuid.uuid4()
+    _patch_detail_load(monkeypatch, _fake_post(pid, view_count=10))
+
+    class _Counting(FakeRedis):
+        """클라이언트가 보낸 명령만 센다(FakeRedis의 Lua 흉내가 내부에서 부르는 명령은 제외)."""
+
+        def __init__(self) -> None:
+            super().__init__()
+            self.calls: list[str] = []
+            self._in_script = False
+
+        async def eval(self, script, numkeys, *args):
+            self.calls.append("eval")
+            self._in_script = True
+            try:
+                return await super().eval(script, numkeys, *args)
+            finally:
+                self._in_script = False
+
+        async def hget(self, key, field):
+            self.calls.append("hget")
+            return await super().hget(key, field)
+
+        async def hincrby(self, key, field, n):
+            if not self._in_script:
+                self.calls.append("hincrby")
+            return await super().hincrby(key, field, n)
+
+    r = _Counting()
+    await ps.PostService.get_post_detail(
+        pid, as_session(RecordingDB()), viewer_key="u:0", redis_client=r
+    )  # 스냅샷 적재
+    r.calls.clear()
+
+    data = await ps.PostService.get_post_detail(
+        pid,
+        as_session(RecordingDB()),
+        viewer_key="u:1",
+        redis_client=r,
+        writer_db=as_session(RecordingDB()),
+    )
+
+    assert r.calls == ["eval"]
+    assert data.view_count == 11
+
+
+async def test_flush_uses_chunked_set_based_updates(monkeypatch):
+    """flush는 글마다 UPDATE가 아니라 id 오름차순 청크당 집합 UPDATE 1문장."""
+    monkeypatch.setattr(settings, "VIEW_FLUSH_BATCH_SIZE", 2)
+    monkeypatch.setattr(settings, "VIEW_BUFFER_SHARDS", 1)  # 한 샤드 안의 청크 분할만 본다
+    r = FakeRedis()
+    pids = [uuid.uuid4() for _ in range(5)]
+    for pid in pids:
+        await _buffer_view(pid, r)
+
+    statements: list[list[uuid.UUID]] = []
+
+    async def _bulk(cls, deltas, db):
+        statements.append([pid for pid, _ in deltas])
+        return len(deltas) - 1  # 1건은 그사이 삭제된 글(행 미갱신)
+
+    monkeypatch.setattr(ps.PostsModel, "increment_view_counts_bulk", classmethod(_bulk))
+    monkeypatch.setattr("app.db.session.get_connection", _fake_get_connection)
+    rows_before = ps.VIEW_BUFFER_FLUSHED_ROWS._value.get()
+
+    await ps.PostService.flush_view_counts_to_db(r)
+
+    assert [len(s) for s in statements] == [2, 2, 1]  # ceil(5 / 2) 문장
+    assert [pid for s in statements for pid in s] == sorted(pids)  # 잠금 순서 고정
+    assert ps.VIEW_BUFFER_FLUSHED_ROWS._value.get() - rows_before == 1 + 1 + 0
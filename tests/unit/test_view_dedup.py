@@ -0,0 +1,141 @@
+"""조회수 뷰어 dedup Bloom 버킷 단위 테스트.
+
+Lua 본문은 실 Redis 몫이라 여기선 비트 위치·오탐률 수학, 시간 버킷 창(현재·직전), 버퍼와 같은
+슬롯의 키 조립, 뷰어 수와 무관한 메모리 상한을 FakeRedis의 비트맵 흉내로 검증한다.
+"""
+
+import uuid
+
+import pytest
+from app.core.config import settings
+from app.core.metrics import (
+    VIEW_DEDUP_ESTIMATED_PAIRS,
+    VIEW_DEDUP_FALSE_POSITIVE_RATIO,
+    VIEW_DEDUP_MEMORY_BYTES,
+)
+from app.domain.posts import view_dedup as vd
+from app.domain.posts.services import post_service as ps
+
+from tests.unit.fakes import FakeRedis
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture(autouse=True)
+def _dedup_on(monkeypatch):
+    monkeypatch.setattr(settings, "VIEW_CACHE_TTL_SECONDS", 3600)  # 환경(.env TTL 0) 무관
+
+
+async def test_positions_are_deterministic_and_in_range(monkeypatch):
+    monkeypatch.setattr(settings, "VIEW_DEDUP_BLOOM_BITS", 4096)
+    pid = uuid.uuid4()
+    pos = vd.bloom_positions(pid, "u:1")
+    assert pos == vd.bloom_positions(pid, "u:1")
+    assert len(pos) == settings.VIEW_DEDUP_BLOOM_HASHES
+    assert all(0 <= p < 4096 for p in pos)
+    assert pos != vd.bloom_positions(pid, "u:2")
+
+
+async def test_empirical_false_positive_rate_tracks_theory(monkeypatch):
+    """m=2^16비트·k=7에 n=6800(비트/원소 ≈ 9.6)을 넣으면 이론 오탐 ≈ 1% — 실측이 그 근처에 머문다."""
+    m, n = 1 << 16, 6800
+    monkeypatch.setattr(settings, "VIEW_DEDUP_BLOOM_BITS", m)
+    pid = uuid.uuid4()
+    bits: set[int] = set()
+    for i in range(n):
+        bits.update(vd.bloom_positions(pid, f"u:{i}"))
+    probes = 20000
+    false_hits = sum(set(vd.bloom_positions(pid, f"x:{i}")) <= bits for i in range(probes))
+    theory = vd.bloom_false_positive_rate(n, m, settings.VIEW_DEDUP_BLOOM_HASHES)
+    assert 0.005 < theory < 0.02
+    assert false_hits / probes < theory * 2
+
+
+async def test_window_spans_current_and_previous_bucket(monkeypatch):
+    r = FakeRedis()
+    pid = uuid.uuid4()
+    bucket = [100]
+    monkeypatch.setattr(ps, "view_dedup_bucket", lambda: bucket[0])
+
+    assert (await ps._account_view_redis(pid, "u:1", r, increment=True))[0] is True
+    bucket[0] = 101  # 다음 버킷 — 직전 버킷에 남아 있어 여전히 본 뷰어
+    assert (await ps._account_view_redis(pid, "u:1", r, increment=True))[0] is False
+    bucket[0] = 102  # 두 버킷 뒤 — 창을 벗어나 다시 집계
+    assert (await ps._account_view_redis(pid, "u:1", r, increment=True))[0] is True
+
+
+async def test_keys_share_buffer_slot_and_expire_with_next_bucket(monkeypatch):
+    """Bloom 두 버킷·버퍼가 같은 해시 태그(한 슬롯) — Lua 1회로 함께 만질 수 있다."""
+
+    class _Recording(FakeRedis):
+        def __init__(self) -> None:
+            super().__init__()
+            self.args: tuple = ()
+
+        async def eval(self, script, numkeys, *args):
+            self.args = (numkeys, *args)
+            return await super().eval(script, numkeys, *args)
+
+    monkeypatch.setattr(ps, "view_dedup_bucket", lambda: 7)
+    r = _Recording()
+    pid = uuid.uuid4()
+    await ps._account_view_redis(pid, "u:1", r, increment=True)
+
+    numkeys, cur, buf, prev, _field, _inc, expire_at, *positions = r.args
+    tag = "{" + ps.view_shard_tag(ps.view_shard_for(pid)) + "}"
+    assert numkeys == 3 and all(tag in k for k in (cur, buf, prev))
+    assert (cur, prev) == (
+        vd.view_dedup_key(ps.view_shard_for(pid), 7),
+        vd.view_dedup_key(ps.view_shard_for(pid), 6),
+    )
+    assert int(expire_at) == 9 * 3600 + 60
+    assert [int(p) for p in positions] == vd.bloom_positions(pid, "u:1")
+
+
+async def test_memory_is_bounded_regardless_of_viewer_count(monkeypatch):
+    """고유 뷰어 수천 명에도 뷰어별 키는 0개, 비트맵 합은 bits/8 × 샤드 × 2 이하."""
+    monkeypatch.setattr(settings, "VIEW_DEDUP_BLOOM_BITS", 1 << 14)
+    monkeypatch.setattr(settings, "VIEW_BUFFER_SHARDS", 2)
+    r = FakeRedis()
+    pid = uuid.uuid4()
+    for i in range(3000):
+        await ps._account_view_redis(pid, f"ip:{i}", r, increment=True)
+
+    assert r.kv == {}
+    used = await vd.sample_view_dedup_memory(r)
+    assert 0 < used <= (1 << 14) // 8 * 2 * 2
+    assert VIEW_DEDUP_MEMORY_BYTES._value.get() == used
+
+
+async def test_expected_pairs_size_the_filter_for_one_percent(monkeypatch):
+    """샤드·버킷당 예상 쌍 수를 주면 그 n에서 오탐 1%가 되는 비트 수를 쓴다 — 기본 2^23비트의 ~87만과 맞물린다."""
+    monkeypatch.setattr(settings, "VIEW_DEDUP_EXPECTED_PAIRS", 0)
+    assert vd.view_dedup_bloom_bits() == settings.VIEW_DEDUP_BLOOM_BITS
+
+    monkeypatch.setattr(settings, "VIEW_DEDUP_EXPECTED_PAIRS", 2_000_000)
+    m, k = vd.view_dedup_bloom_bits(), settings.VIEW_DEDUP_BLOOM_HASHES
+    assert m % 8 == 0
+    assert vd.bloom_false_positive_rate(2_000_000, m, k) == pytest.approx(0.01, rel=0.01)
+    assert all(0 <= p < m for p in vd.bloom_positions(uuid.uuid4(), "u:1"))
+    assert vd.bloom_bits_for(870_000, 7) <= 1 << 23
+
+
+async def test_saturation_gauges_track_fullest_filter(monkeypatch):
+    """BITCOUNT로 본 채움률에서 오탐률·든 쌍 수를 추정한다 — 가장 찬 샤드·버킷 값이 실린다."""
+    m = 1 << 16
+    monkeypatch.setattr(settings, "VIEW_DEDUP_BLOOM_BITS", m)
+    monkeypatch.setattr(settings, "VIEW_DEDUP_EXPECTED_PAIRS", 0)
+    monkeypatch.setattr(settings, "VIEW_BUFFER_SHARDS", 2)
+    r = FakeRedis()
+    pid = uuid.uuid4()
+    n = 6800
+    for i in range(n):
+        await ps._account_view_redis(pid, f"ip:{i}", r, increment=True)
+
+    fp = await vd.sample_view_dedup_saturation(r)
+
+    k = settings.VIEW_DEDUP_BLOOM_HASHES
+    assert fp == pytest.approx(vd.bloom_false_positive_rate(n, m, k), rel=0.15)
+    assert VIEW_DEDUP_FALSE_POSITIVE_RATIO._value.get() == fp
+    assert VIEW_DEDUP_ESTIMATED_PAIRS._value.get() == pytest.approx(n, rel=0.05)
+    assert await vd.sample_view_dedup_saturation(None) == 0.0